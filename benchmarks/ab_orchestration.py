@@ -0,0 +1,70 @@
+"""
+Benchmark: A/B orchestration overhead per applicant.
+
+Runs the same applicants through ``ABTestEngine.run_single_comparison``
+against a zero-latency stub LLM server in two ways. The first rebuilds
+the engine and its three default variants for every applicant, which is
+what each comparison used to do. The second uses one engine whose
+variant registry is built once. Orchestration overhead is the wall time
+per applicant minus the time the underwriting engines spent evaluating.
+
+    python -m benchmarks.ab_orchestration --applicants 200
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import time
+
+from benchmarks.packed_prompts import make_applicants
+from underwriting.core.engine import LLM_BASE_URL_ENV_VAR
+from underwriting.testing.ab_engine import ABTestEngine
+from underwriting.testing.results_store import SQLiteResultsBackend
+from underwriting.testing.stub_llm import LatencyModel, StubLLMConfig, StubLLMServer
+
+
+def run(applicants, variant_a: str, variant_b: str, reinitialise: bool):
+    """Return ``(wall seconds, seconds spent inside the engines)``."""
+    results = SQLiteResultsBackend()
+    ab_engine = ABTestEngine(results)
+    evaluation_ms = 0.0
+
+    start = time.perf_counter()
+    for applicant in applicants:
+        if reinitialise:
+            ab_engine = ABTestEngine(results, ab_engine.run_id)
+        result_a, result_b = ab_engine.run_single_comparison(applicant, variant_a, variant_b)
+        evaluation_ms += result_a.processing_time_ms + result_b.processing_time_ms
+    return time.perf_counter() - start, evaluation_ms / 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--applicants", type=int, default=200)
+    parser.add_argument("--variant-a", default="standard")
+    parser.add_argument("--variant-b", default="conservative")
+    args = parser.parse_args()
+
+    applicants = make_applicants(args.applicants)
+    config = StubLLMConfig(latency=LatencyModel("fixed", 0.0, 0.0, chunk_delay_ms=0.0), seed=1)
+
+    with StubLLMServer(config) as server:
+        os.environ[LLM_BASE_URL_ENV_VAR] = server.base_url
+        os.environ.setdefault("OPENAI_API_KEY", "stub")
+
+        # Warm the rules registry and HTTP client before timing either arm
+        with contextlib.redirect_stdout(io.StringIO()):
+            run(applicants[:2], args.variant_a, args.variant_b, reinitialise=False)
+
+        print(f"{'arm':<24} {'ms/applicant':>13} {'overhead ms':>12}")
+        for name, reinitialise in (("re-initialised", True), ("persistent registry", False)):
+            with contextlib.redirect_stdout(io.StringIO()):
+                wall, evaluating = run(applicants, args.variant_a, args.variant_b, reinitialise)
+            per_applicant = wall / len(applicants) * 1000
+            overhead = (wall - evaluating) / len(applicants) * 1000
+            print(f"{name:<24} {per_applicant:>13.2f} {overhead:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark: bulk applicant loading vs one model_validate call per record.
+
+Writes ``--applicants`` applicants (the samples cloned under unique IDs)
+to JSONL and CSV, then loads them with each method in a fresh process and
+reports model objects built per second (applicants, drivers, vehicles,
+violations and claims) and the process's peak RSS.
+
+    python -m benchmarks.bulk_loading --applicants 100000
+"""
+
+import argparse
+import multiprocessing
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.packed_prompts import make_applicants
+from underwriting.core.models import Applicant
+from underwriting.data.loader import iter_applicant_chunks, load_applicants, write_applicants
+
+ARMS = {
+    "per-record jsonl": "jsonl",
+    "bulk jsonl": "jsonl",
+    "bulk csv": "csv",
+    "streamed jsonl": "jsonl",
+}
+
+
+def object_count(applicant: Applicant) -> int:
+    drivers = applicant.all_drivers
+    return (1 + len(drivers) + len(applicant.vehicles)
+            + sum(len(driver.violations) + len(driver.claims) for driver in drivers))
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    scale = 1 if sys.platform == "darwin" else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale / 2 ** 20
+
+
+def write_files(count: int, paths) -> None:
+    applicants = make_applicants(count)
+    for path in paths:
+        write_applicants(applicants, path)
+
+
+def run_arm(arm: str, path: str):
+    """Load ``path`` with one method; runs in its own process for a clean RSS peak."""
+    start = time.perf_counter()
+    objects = 0
+    if arm == "per-record jsonl":
+        # What the CLIs did before the bulk loader
+        with open(path, encoding="utf-8") as handle:
+            applicants = [Applicant.model_validate_json(line) for line in handle if line.strip()]
+        objects = sum(object_count(applicant) for applicant in applicants)
+    elif arm == "streamed jsonl":
+        for chunk in iter_applicant_chunks(path):
+            objects += sum(object_count(applicant) for applicant in chunk)
+    else:
+        objects = sum(object_count(applicant) for applicant in load_applicants(path))
+    return objects, time.perf_counter() - start, peak_rss_mb()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--applicants", type=int, default=100000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = {suffix: str(Path(directory) / f"applicants.{suffix}") for suffix in ("jsonl", "csv")}
+        # Every step runs in a fresh process: ru_maxrss survives fork and exec,
+        # so the parent must never hold the applicants itself
+        context = multiprocessing.get_context("spawn")
+        with context.Pool(1) as pool:
+            pool.apply(write_files, (args.applicants, list(paths.values())))
+
+        print(f"{'method':<18} {'objects':>9} {'seconds':>8} {'objects/s':>11} {'peak RSS MB':>12}")
+        for arm, suffix in ARMS.items():
+            with context.Pool(1) as pool:
+                objects, seconds, rss = pool.apply(run_arm, (arm, paths[suffix]))
+            print(f"{arm:<18} {objects:>9} {seconds:>8.2f} {objects / seconds:>11,.0f} {rss:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
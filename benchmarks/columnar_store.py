@@ -0,0 +1,77 @@
+"""
+Benchmark: columnar applicant store vs a list of Applicant objects.
+
+Builds ``--applicants`` applicants (the samples cloned under unique IDs)
+and reports memory per applicant for the object list and the store's
+columns, then computes the same population statistics (mean age, share
+with a major violation in 3 years, at-fault claims in 5 years) from
+``ApplicantFeatures`` per object and from the memory-mapped store.
+
+    python -m benchmarks.columnar_store --applicants 50000
+"""
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+from datetime import date
+
+from benchmarks.packed_prompts import make_applicants
+from underwriting.core.features import DEFAULT_MAJOR_VIOLATIONS, ApplicantFeatures
+from underwriting.data.columnar import ApplicantStore
+
+
+def object_statistics(applicants, as_of):
+    features = [ApplicantFeatures(applicant, as_of) for applicant in applicants]
+    major = frozenset(DEFAULT_MAJOR_VIOLATIONS)
+    return (
+        sum(f.age for f in features) / len(features),
+        sum(f.violation_count(major, 3) > 0 for f in features) / len(features),
+        sum(f.claim_count("at_fault", 5) for f in features),
+    )
+
+
+def store_statistics(store, as_of):
+    return (
+        float(store.ages(as_of).mean()),
+        float((store.violation_counts(3, DEFAULT_MAJOR_VIOLATIONS, as_of=as_of) > 0).mean()),
+        int(store.claim_counts("at_fault", 5, as_of=as_of).sum()),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--applicants", type=int, default=50000)
+    args = parser.parse_args()
+    as_of = date.today()
+
+    tracemalloc.start()
+    applicants = make_applicants(args.applicants)
+    object_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    store = ApplicantStore.from_applicants(applicants)
+    record_bytes = store.columns["records"].nbytes + store.columns["record_offsets"].nbytes
+    print(f"Objects:        {object_bytes / len(applicants):>8,.0f} bytes/applicant")
+    print(f"Store columns:  {(store.nbytes - record_bytes) / len(store):>8,.0f} bytes/applicant "
+          f"(+{record_bytes / len(store):,.0f} of JSON for on-demand materialisation, memory-mapped)")
+
+    with tempfile.TemporaryDirectory() as directory:
+        store.save(directory)
+        mapped = ApplicantStore.open(directory)
+
+        start = time.perf_counter()
+        expected = object_statistics(applicants, as_of)
+        object_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        actual = store_statistics(mapped, as_of)
+        store_seconds = time.perf_counter() - start
+
+    assert abs(expected[0] - actual[0]) < 1e-9 and expected[1:] == actual[1:], (expected, actual)
+    print(f"Statistics:     objects {object_seconds * 1000:,.0f} ms, "
+          f"store {store_seconds * 1000:,.1f} ms ({object_seconds / store_seconds:,.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark: tiered model routing vs the large model for every applicant.
+
+Runs the same applicants through the stub LLM server twice: once on the
+large model only, and once with a RoutingPolicy that tries the small
+model first. The stub imitates the small model as faster but less
+reliable (``--small-latency-scale``, ``--small-adjudicate-rate``,
+``--small-wrong-rate``). Reports large-model calls, mean time to decision,
+escalations, the audit agreement rate and accuracy against the rules'
+own decision.
+
+    python -m benchmarks.model_routing --applicants 120 --latency-ms 300
+"""
+
+import argparse
+import os
+from statistics import mean
+
+from benchmarks.packed_prompts import make_applicants
+from underwriting.core.engine import LLM_BASE_URL_ENV_VAR, UnderwritingEngine
+from underwriting.core.models import UnderwritingDecision
+from underwriting.core.routing import RoutingPolicy
+from underwriting.testing.stub_llm import LatencyModel, ModelProfile, StubLLMConfig, StubLLMServer
+
+
+def accuracy(engine: UnderwritingEngine, applicants, results) -> float:
+    """Share of results matching the decision implied by the rules."""
+    correct = 0
+    for applicant, result in zip(applicants, results):
+        expected = engine.evaluate_rules(applicant).decision or UnderwritingDecision.ADJUDICATE
+        correct += result.decision == expected
+    return correct / len(results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--applicants", type=int, default=120)
+    parser.add_argument("--latency-ms", type=float, default=300.0, help="Large-model median latency")
+    parser.add_argument("--small-model", default="gpt-4o-mini")
+    parser.add_argument("--large-model", default="gpt-4")
+    parser.add_argument("--small-latency-scale", type=float, default=0.3)
+    parser.add_argument("--small-adjudicate-rate", type=float, default=0.05)
+    parser.add_argument("--small-wrong-rate", type=float, default=0.05)
+    parser.add_argument("--audit-rate", type=float, default=0.1)
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+
+    config = StubLLMConfig(
+        latency=LatencyModel("lognormal", args.latency_ms, 0.3),
+        models={args.small_model: ModelProfile(latency_scale=args.small_latency_scale,
+                                               adjudicate_rate=args.small_adjudicate_rate,
+                                               wrong_decision_rate=args.small_wrong_rate)},
+        seed=args.seed
+    )
+    applicants = make_applicants(args.applicants)
+
+    with StubLLMServer(config) as server:
+        os.environ[LLM_BASE_URL_ENV_VAR] = server.base_url
+        os.environ.setdefault("OPENAI_API_KEY", "stub")
+
+        policy = RoutingPolicy(first_model=args.small_model, escalation_model=args.large_model,
+                               audit_rate=args.audit_rate, seed=args.seed)
+        arms = {
+            "large only": UnderwritingEngine(rule_precheck=False),
+            "routed": UnderwritingEngine(rule_precheck=False, routing=policy),
+        }
+
+        print(f"{'arm':<11} {'large calls':>11} {'small calls':>11} {'ms/decision':>12} "
+              f"{'escalated':>10} {'agreement':>10} {'accuracy':>9}")
+        for name, engine in arms.items():
+            results = engine.evaluate_batch(applicants)
+            ms = mean(result.time_to_decision_ms for result in results)
+            if engine.router is None:
+                large, small, escalated, agreement = len(results), 0, "-", "-"
+            else:
+                engine.router.wait_for_audits()
+                stats = engine.router.stats
+                large = stats.tiers.get(args.large_model).calls if args.large_model in stats.tiers else 0
+                small = stats.tiers[args.small_model].calls
+                escalated = f"{stats.escalation_rate:.1%}"
+                agreement = f"{stats.agreement_rate:.1%}" if stats.agreement_rate is not None else "-"
+            print(f"{name:<11} {large:>11} {small:>11} {ms:>12.0f} {escalated:>10} {agreement:>10} "
+                  f"{accuracy(engine, applicants, results):>8.1%}")
+
+        routed = arms["routed"].router.stats
+        print(f"\nEscalation reasons: {dict(routed.escalations)}")
+
+
+if __name__ == "__main__":
+    main()
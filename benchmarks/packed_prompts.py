@@ -0,0 +1,92 @@
+"""
+Benchmark: packed multi-applicant prompts vs one prompt per applicant.
+
+For each pack size, renders the prompts needed to evaluate the sample
+applicants (cloned up to ``--applicants``) and reports LLM round trips and
+input tokens per decision. With ``--stub`` the batch is also run against
+the local stub LLM server to report wall time and decisions that had to be
+retried individually.
+
+    python -m benchmarks.packed_prompts --applicants 200 --pack-sizes 1 4 8 16 --stub
+"""
+
+import argparse
+import copy
+import os
+import time
+from typing import List
+
+from benchmarks.rule_pruning import token_counter
+from underwriting.core.engine import LLM_BASE_URL_ENV_VAR, UnderwritingEngine
+from underwriting.core.models import Applicant
+from underwriting.data.sample_generator import create_sample_applicants
+
+
+def make_applicants(count: int) -> List[Applicant]:
+    """Clone the sample applicants under unique IDs."""
+    samples = create_sample_applicants()
+    applicants = []
+    for index in range(count):
+        applicant = copy.deepcopy(samples[index % len(samples)])
+        applicant.applicant_id = f"BENCH{index:06d}"
+        applicants.append(applicant)
+    return applicants
+
+
+def prompts_for(engine: UnderwritingEngine, applicants: List[Applicant], pack_size: int) -> List[str]:
+    if pack_size == 1:
+        return [engine._build_prompt(applicant) for applicant in applicants]
+    packs = engine._split_packs(applicants, range(len(applicants)), pack_size)
+    return [engine._build_packed_prompt([applicants[index] for index in pack]) for pack in packs]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--applicants", type=int, default=200)
+    parser.add_argument("--pack-sizes", type=int, nargs="+", default=[1, 4, 8, 16])
+    parser.add_argument("--rules", default="underwriting_rules_standard.json")
+    parser.add_argument("--structured", action="store_true", help="Use the JSON response format")
+    parser.add_argument("--stub", action="store_true", help="Also run the batch against the stub LLM server")
+    parser.add_argument("--stub-latency-ms", type=float, default=400.0)
+    args = parser.parse_args()
+
+    applicants = make_applicants(args.applicants)
+    count = token_counter()
+
+    server = None
+    if args.stub:
+        from underwriting.testing import LatencyModel, StubLLMConfig, StubLLMServer
+        server = StubLLMServer(StubLLMConfig(latency=LatencyModel("fixed", args.stub_latency_ms))).start()
+        os.environ[LLM_BASE_URL_ENV_VAR] = server.base_url
+        os.environ.setdefault("OPENAI_API_KEY", "stub")
+
+    try:
+        print(f"{'pack':>5} {'calls':>6} {'tokens/decision':>16} {'saved':>7}"
+              + (f" {'wall s':>7} {'stub calls':>11} {'retried':>8}" if server else ""))
+        baseline = None
+        for pack_size in args.pack_sizes:
+            # Precheck off so every applicant reaches the model in both arms
+            engine = UnderwritingEngine(args.rules, rule_precheck=False, structured_output=args.structured)
+            prompts = prompts_for(engine, applicants, pack_size)
+            per_decision = sum(count(prompt) for prompt in prompts) / len(applicants)
+            baseline = baseline or per_decision
+            line = (f"{pack_size:>5} {len(prompts):>6} {per_decision:>16.0f} "
+                    f"{1 - per_decision / baseline:>6.1%}")
+
+            if server:
+                before = server.stats_dict()["requests"]
+                start = time.perf_counter()
+                if pack_size == 1:
+                    engine.evaluate_batch(applicants)
+                else:
+                    engine.evaluate_packed(applicants, pack_size=pack_size)
+                calls = server.stats_dict()["requests"] - before
+                line += f" {time.perf_counter() - start:>7.2f} {calls:>11} {calls - len(prompts):>8}"
+            print(line)
+    finally:
+        if server:
+            server.stop()
+
+
+if __name__ == "__main__":
+    main()
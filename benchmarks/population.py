@@ -0,0 +1,88 @@
+"""
+Synthetic applicant populations for the population-scale benchmarks.
+
+``random_applicant_records`` yields applicant records (plain dicts in the
+Applicant JSON schema) with a spread of ages, credit, lapses, vehicles,
+violations and claims wide enough that every standard rule fires for some
+applicants. Records are validated in chunks with the bulk loader.
+"""
+
+import random
+from datetime import date, timedelta
+from typing import Any, Dict, Iterator, List, Optional
+
+from underwriting.core.models import Applicant, ClaimType, VehicleCategory, ViolationType
+from underwriting.data.loader import validate_applicants
+
+LICENSE_STATUSES = (["valid"] * 96) + ["suspended", "revoked", "expired", "invalid"]
+TERRITORIES = ("Urban", "Suburban", "Rural")
+STATES = ("CA", "TX", "NY", "FL", "WA", "IL", "OH", "GA")
+VEHICLE_TYPES = [category.value for category in VehicleCategory]
+VEHICLE_WEIGHTS = [30, 25, 10, 15, 4, 3, 3, 4, 3, 1, 1, 1]
+VIOLATION_TYPES = [violation.value for violation in ViolationType]
+VIOLATION_WEIGHTS = [3, 2, 1, 0.2, 15, 25, 8, 8, 12, 26]
+CLAIM_TYPES = [claim.value for claim in ClaimType]
+
+
+def _days_ago(rng: random.Random, as_of: date, max_years: float) -> str:
+    return (as_of - timedelta(days=rng.randint(1, int(max_years * 365)))).isoformat()
+
+
+def random_applicant_record(rng: random.Random, index: int, as_of: date) -> Dict[str, Any]:
+    age = rng.randint(17, 85)
+    date_of_birth = as_of - timedelta(days=age * 365 + rng.randint(0, 364))
+    licensed_years = rng.randint(0, max(0, age - 16))
+    violations = [{
+        "violation_type": rng.choices(VIOLATION_TYPES, VIOLATION_WEIGHTS)[0],
+        "violation_date": _days_ago(rng, as_of, 10),
+    } for _ in range(rng.choices((0, 1, 2, 3), (70, 18, 8, 4))[0])]
+    claims = [{
+        "claim_type": rng.choice(CLAIM_TYPES),
+        "claim_date": _days_ago(rng, as_of, 8),
+        "claim_amount": round(rng.uniform(500, 40000), 2),
+    } for _ in range(rng.choices((0, 1, 2, 3), (75, 17, 6, 2))[0])]
+    vehicles = []
+    for number in range(rng.choices((1, 2, 3), (70, 25, 5))[0]):
+        vehicle_type = rng.choices(VEHICLE_TYPES, VEHICLE_WEIGHTS)[0]
+        vehicles.append({
+            "vin": f"VIN{index:010d}{number}",
+            "year": rng.randint(as_of.year - 20, as_of.year),
+            "make": "Make",
+            "model": "Model",
+            "category": vehicle_type,
+            "vehicle_type": vehicle_type,
+            "value": round(rng.lognormvariate(10, 0.6), 2),
+        })
+
+    return {
+        "applicant_id": f"POP{index:08d}",
+        "primary_driver": {
+            "driver_id": f"DRV{index:08d}",
+            "first_name": "Pat",
+            "last_name": "Doe",
+            "date_of_birth": date_of_birth.isoformat(),
+            "license_number": f"L{index:09d}",
+            "license_state": rng.choice(STATES),
+            "license_status": rng.choice(LICENSE_STATUSES),
+            "license_issue_date": (as_of - timedelta(days=licensed_years * 365 + rng.randint(0, 364))).isoformat(),
+            "license_expiration_date": (as_of + timedelta(days=rng.randint(-60, 6 * 365))).isoformat(),
+            "violations": violations,
+            "claims": claims,
+        },
+        "vehicles": vehicles,
+        "credit_score": None if rng.random() < 0.02 else max(300, min(850, int(rng.gauss(700, 70)))),
+        "prior_insurance_lapse_days": rng.choices((0, rng.randint(1, 59), rng.randint(60, 400)), (85, 11, 4))[0],
+        "fraud_history": rng.random() < 0.003,
+        "territory": rng.choice(TERRITORIES),
+        "coverage_requested": ["Liability", "Collision"],
+    }
+
+
+def random_applicant_chunks(count: int, chunk_size: int = 10000, seed: int = 7,
+                            as_of: Optional[date] = None) -> Iterator[List[Applicant]]:
+    """Yield ``count`` reproducible random applicants in validated chunks."""
+    rng = random.Random(seed)
+    as_of = as_of or date.today()
+    for start in range(0, count, chunk_size):
+        end = min(start + chunk_size, count)
+        yield validate_applicants(random_applicant_record(rng, index, as_of) for index in range(start, end))
@@ -0,0 +1,151 @@
+"""
+Benchmark: line-oriented vs structured (JSON) response parsing.
+
+Renders the same synthetic decisions in the formatting variations models
+actually produce, parses them with the engine's line parser and with the
+structured parser, and reports parse cost and the share of responses
+whose decision, reason or rule list was not recovered.
+
+    python -m benchmarks.response_parsing --responses 5000
+"""
+
+import argparse
+import json
+import random
+import time
+from typing import Callable, Dict, List, Tuple
+
+from underwriting.core.engine import UnderwritingEngine
+from underwriting.core.exceptions import LLMError
+from underwriting.core.models import UnderwritingDecision
+from underwriting.core.responses import parse_structured_response
+
+REASONS = [
+    "Clean driving record with stable coverage history",
+    "Multiple at-fault claims within the lookback period",
+    "Young driver with a recent moving violation",
+    "Coverage lapse exceeds the acceptable threshold",
+]
+RISK_FACTORS = ["Young driver", "Recent speeding ticket", "Poor credit", "High-performance vehicle"]
+
+
+def _line_canonical(d: Dict) -> str:
+    return (f"Decision: {d['decision']}\nPrimary Reason: {d['reason']}\n"
+            f"Triggered Rules: {', '.join(d['triggered_rules']) or 'None'}\n"
+            f"Risk Factors: {', '.join(d['risk_factors']) or 'None'}\n"
+            f"Additional Notes: None")
+
+
+def _line_markdown(d: Dict) -> str:
+    return "\n".join(f"**{line.replace(': ', ':** ', 1)}" for line in _line_canonical(d).split("\n"))
+
+
+def _line_bullets(d: Dict) -> str:
+    return "\n".join(f"- {line}" for line in _line_canonical(d).split("\n"))
+
+
+def _line_wrapped_reason(d: Dict) -> str:
+    return _line_canonical(d).replace(f"Primary Reason: {d['reason']}", f"Primary Reason:\n{d['reason']}")
+
+
+def _json_compact(d: Dict) -> str:
+    return json.dumps(d, separators=(",", ":"))
+
+
+def _json_pretty(d: Dict) -> str:
+    return json.dumps(d, indent=2)
+
+
+def _json_fenced(d: Dict) -> str:
+    return f"```json\n{json.dumps(d)}\n```"
+
+
+def _json_preamble(d: Dict) -> str:
+    return f"Here is my evaluation:\n{json.dumps(d)}"
+
+
+LINE_STYLES: Dict[str, Callable[[Dict], str]] = {
+    "canonical": _line_canonical,
+    "markdown": _line_markdown,
+    "bullets": _line_bullets,
+    "wrapped_reason": _line_wrapped_reason,
+}
+JSON_STYLES: Dict[str, Callable[[Dict], str]] = {
+    "compact": _json_compact,
+    "pretty": _json_pretty,
+    "fenced": _json_fenced,
+    "preamble": _json_preamble,
+}
+
+
+def make_decisions(count: int, rule_ids: List[str], seed: int) -> List[Dict]:
+    """Generate ground-truth decisions citing real rule IDs."""
+    rng = random.Random(seed)
+    return [
+        {
+            "decision": rng.choice(["ACCEPT", "DENY", "ADJUDICATE"]),
+            "reason": rng.choice(REASONS),
+            "triggered_rules": rng.sample(rule_ids, rng.randint(0, 3)),
+            "risk_factors": rng.sample(RISK_FACTORS, rng.randint(0, 2)),
+        }
+        for _ in range(count)
+    ]
+
+
+def _recovered(result_decision, reason, rules, truth: Dict) -> bool:
+    return (result_decision == UnderwritingDecision(truth["decision"].lower())
+            and reason == truth["reason"]
+            and rules == truth["triggered_rules"])
+
+
+def bench_line(engine: UnderwritingEngine, texts: List[str], truths: List[Dict]) -> Tuple[float, int]:
+    start = time.perf_counter()
+    results = [engine._parse_llm_response(text, "BENCH") for text in texts]
+    elapsed = time.perf_counter() - start
+    failures = sum(
+        not _recovered(r.decision, r.reason, r.triggered_rules, t) for r, t in zip(results, truths)
+    )
+    return elapsed, failures
+
+
+def bench_json(rule_ids: List[str], texts: List[str], truths: List[Dict]) -> Tuple[float, int]:
+    valid = frozenset(rule_ids)
+    parsed = []
+    start = time.perf_counter()
+    for text in texts:
+        try:
+            parsed.append(parse_structured_response(text, valid))
+        except LLMError:
+            parsed.append(None)
+    elapsed = time.perf_counter() - start
+    failures = sum(
+        p is None or not _recovered(p.decision, p.reason, p.triggered_rules, t)
+        for p, t in zip(parsed, truths)
+    )
+    return elapsed, failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--responses", type=int, default=5000, help="Responses per style")
+    parser.add_argument("--rules", default="underwriting_rules_standard.json")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    engine = UnderwritingEngine(rules_file=args.rules)
+    rule_ids = list(engine.rules_snapshot.rules_by_id)
+    truths = make_decisions(args.responses, rule_ids, args.seed)
+
+    print(f"{'parser':<8} {'style':<16} {'us/response':>12} {'failure rate':>13}")
+    for label, styles, run in (
+        ("line", LINE_STYLES, lambda texts: bench_line(engine, texts, truths)),
+        ("json", JSON_STYLES, lambda texts: bench_json(rule_ids, texts, truths)),
+    ):
+        for style, render in styles.items():
+            elapsed, failures = run([render(t) for t in truths])
+            print(f"{label:<8} {style:<16} {elapsed / len(truths) * 1e6:>12.2f} "
+                  f"{failures / len(truths):>12.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark: prompt size with applicant-aware rule pruning.
+
+For every rules variant and prompt variant, renders the rules block for
+the sample applicants with and without pruning and reports prompt tokens
+and prompt build time. The applicant data section is identical in both
+arms and is excluded.
+
+Model latency is not measured: the last column is only the saved token
+count multiplied by ``--prefill-ms-per-1k-tokens``, an assumed rate. The
+stub server's latency does not depend on prompt length, so timing against
+it would not show the difference either; measure against a real model.
+
+    python -m benchmarks.rule_pruning --prefill-ms-per-1k-tokens 30
+"""
+
+import argparse
+import time
+from statistics import mean
+from typing import Callable, List
+
+from underwriting.ai.prompts import PromptTemplateFactory, PromptVariant
+from underwriting.core.engine import UnderwritingEngine
+from underwriting.data.sample_generator import create_sample_applicants
+
+RULES_VARIANTS = {
+    "standard": "underwriting_rules_standard.json",
+    "conservative": "underwriting_rules_conservative.json",
+    "liberal": "underwriting_rules_liberal.json",
+}
+
+
+def token_counter() -> Callable[[str], int]:
+    """Return a GPT-4 token counter, or a 4-characters-per-token estimate offline."""
+    try:
+        import tiktoken
+        encoding = tiktoken.encoding_for_model("gpt-4")
+        return lambda text: len(encoding.encode(text))
+    except Exception:
+        return lambda text: (len(text) + 3) // 4
+
+
+def prompt_tokens(engine: UnderwritingEngine, applicants: List, count: Callable[[str], int]) -> float:
+    return mean(
+        count(engine.prompt_template.format(rules=engine._format_rules(a), applicant_data=""))
+        for a in applicants
+    )
+
+
+def build_time_us(engine: UnderwritingEngine, applicants: List, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for applicant in applicants:
+            engine._format_rules(applicant)
+    return (time.perf_counter() - start) / (repeat * len(applicants)) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--prefill-ms-per-1k-tokens", type=float, default=30.0,
+                        help="Assumed prefill cost; the ms column is saved tokens times this rate, "
+                             "not a measurement")
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    applicants = create_sample_applicants()
+    count = token_counter()
+
+    print(f"{'rules':<13} {'prompt':<13} {'tokens full':>11} {'pruned':>7} {'saved':>7} "
+          f"{'build us':>9} {'ms @ rate*':>11}")
+    for rules_name, rules_file in RULES_VARIANTS.items():
+        for variant in PromptVariant:
+            template = PromptTemplateFactory.get_prompt_template(variant)
+            full = UnderwritingEngine(rules_file, prompt_template=template)
+            pruned = UnderwritingEngine(rules_file, prompt_template=template, prune_rules=True)
+
+            full_tokens = prompt_tokens(full, applicants, count)
+            pruned_tokens = prompt_tokens(pruned, applicants, count)
+            saved = full_tokens - pruned_tokens
+            build = build_time_us(pruned, applicants, args.repeat)
+
+            print(f"{rules_name:<13} {variant.value:<13} {full_tokens:>11.0f} {pruned_tokens:>7.0f} "
+                  f"{saved / full_tokens:>6.1%} {build:>9.1f} "
+                  f"{saved / 1000 * args.prefill_ms_per_1k_tokens:>11.1f}")
+    print(f"\n* estimate from token counts at an assumed {args.prefill_ms_per_1k_tokens:g} ms per 1k prompt "
+          f"tokens, not measured latency")
+
+
+if __name__ == "__main__":
+    main()
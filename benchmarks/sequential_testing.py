@@ -0,0 +1,74 @@
+"""
+Benchmark: error rates and applicants used by the sequential A/B test.
+
+Simulates paired comparisons without calling an LLM. Each applicant is
+discordant (exactly one variant accepts) with probability
+``--discordance``, and a discordant applicant favours variant A with the
+probability the scenario's odds ratio implies. For each scenario it
+reports how often ``SequentialTest`` stops as significant or futile, how
+often it runs out of applicants, and the mean share of the batch it
+evaluates before stopping. Under the null scenario the significant share
+is the type I error rate, which should stay within ``1 - confidence``.
+
+    python -m benchmarks.sequential_testing --applicants 1000 --trials 2000
+"""
+
+import argparse
+import random
+from types import SimpleNamespace
+
+from underwriting.core.models import UnderwritingDecision
+from underwriting.testing.sequential import SequentialOutcome, SequentialTest
+
+ACCEPT = SimpleNamespace(decision=UnderwritingDecision.ACCEPT, error=None)
+DENY = SimpleNamespace(decision=UnderwritingDecision.DENY, error=None)
+
+
+def trial(rng: random.Random, applicants: int, discordance: float, true_odds_ratio: float, args):
+    """Return ``(outcome, applicants evaluated)`` for one simulated run."""
+    test = SequentialTest(args.confidence, args.power, "accept", args.min_odds_ratio)
+    favour_a = true_odds_ratio / (1 + true_odds_ratio)
+    for evaluated in range(1, applicants + 1):
+        if rng.random() < discordance:
+            pair = (ACCEPT, DENY) if rng.random() < favour_a else (DENY, ACCEPT)
+        else:
+            pair = (ACCEPT, ACCEPT)
+        if test.add_pair(*pair) is not SequentialOutcome.CONTINUE:
+            return test.outcome, evaluated
+    return test.outcome, applicants
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--applicants", type=int, default=1000)
+    parser.add_argument("--trials", type=int, default=2000)
+    parser.add_argument("--discordance", type=float, default=0.2)
+    parser.add_argument("--confidence", type=float, default=0.95)
+    parser.add_argument("--power", type=float, default=0.8)
+    parser.add_argument("--min-odds-ratio", type=float, default=2.0)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    scenarios = (
+        ("null (odds ratio 1)", 1.0),
+        ("half the target effect", (1 + args.min_odds_ratio) / 2),
+        (f"target (odds ratio {args.min_odds_ratio:g})", args.min_odds_ratio),
+        ("B favoured at target", 1 / args.min_odds_ratio),
+    )
+
+    print(f"{'scenario':<28} {'significant':>12} {'futile':>8} {'exhausted':>10} {'applicants used':>16}")
+    for name, true_odds_ratio in scenarios:
+        outcomes = {outcome: 0 for outcome in SequentialOutcome}
+        used = 0
+        for _ in range(args.trials):
+            outcome, evaluated = trial(rng, args.applicants, args.discordance, true_odds_ratio, args)
+            outcomes[outcome] += 1
+            used += evaluated
+        share = {outcome: count / args.trials for outcome, count in outcomes.items()}
+        print(f"{name:<28} {share[SequentialOutcome.SIGNIFICANT]:>12.1%} {share[SequentialOutcome.FUTILE]:>8.1%} "
+              f"{share[SequentialOutcome.CONTINUE]:>10.1%} {used / args.trials / args.applicants:>16.1%}")
+
+
+if __name__ == "__main__":
+    main()
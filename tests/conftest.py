@@ -57,6 +57,73 @@ Risk Factors: None
 Additional Notes: Excellent credit score and driving history"""
 
 
+@pytest.fixture
+def stub_llm_server(monkeypatch):
+    """Run a local stub LLM server and point engines at it."""
+    from underwriting.core.engine import LLM_BASE_URL_ENV_VAR
+    from underwriting.testing.stub_llm import LatencyModel, StubLLMConfig, StubLLMServer
+    
+    config = StubLLMConfig(latency=LatencyModel(distribution="fixed", median_ms=0, chunk_delay_ms=0), seed=0)
+    with StubLLMServer(config) as server:
+        monkeypatch.setenv(LLM_BASE_URL_ENV_VAR, server.base_url)
+        monkeypatch.setenv("OPENAI_API_KEY", "stub")
+        yield server
+
+
+@pytest.fixture
+def make_applicants():
+    """Return a factory cloning the sample applicants under unique IDs."""
+    import copy
+    from underwriting.data.sample_generator import create_sample_applicants
+    
+    samples = create_sample_applicants()
+    
+    def make(count):
+        applicants = []
+        for index in range(count):
+            applicant = copy.deepcopy(samples[index % len(samples)])
+            applicant.applicant_id = f"TEST{index:05d}"
+            applicants.append(applicant)
+        return applicants
+    
+    return make
+
+
+class ScriptedLLM:
+    """Chat model stand-in returning queued replies and recording prompts.
+    
+    A reply may be a string or a callable taking the prompt text.
+    """
+    
+    def __init__(self, replies):
+        self.replies = list(replies)
+        self.prompts = []
+    
+    @property
+    def calls(self):
+        return len(self.prompts)
+    
+    def _reply(self, messages):
+        from langchain.schema import AIMessage
+        
+        prompt = messages[-1].content
+        self.prompts.append(prompt)
+        reply = self.replies.pop(0)
+        return AIMessage(content=reply(prompt) if callable(reply) else reply)
+    
+    def invoke(self, messages, **kwargs):
+        return self._reply(messages)
+    
+    async def ainvoke(self, messages, **kwargs):
+        return self._reply(messages)
+
+
+@pytest.fixture
+def scripted_llm():
+    """Return a factory for chat models that answer with queued replies."""
+    return lambda *replies: ScriptedLLM(replies)
+
+
 # Test data directory
 TEST_DATA_DIR = Path(__file__).parent / "fixtures"
 
@@ -0,0 +1,74 @@
+"""Tests for the columnar applicant store."""
+
+import json
+from datetime import date
+
+import numpy as np
+import pytest
+
+from underwriting.core.features import ApplicantFeatures
+from underwriting.core.models import ClaimType
+from underwriting.data.columnar import STORE_METADATA_FILE, ApplicantStore
+
+AS_OF = date(2025, 6, 1)
+MAJOR = ("DUI", "reckless_driving", "hit_and_run")
+
+
+@pytest.fixture
+def applicants(make_applicants):
+    applicants = make_applicants(8)
+    applicants[1].credit_score = None
+    return applicants
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_save_and_open_round_trip(applicants, tmp_path, mmap):
+    ApplicantStore.from_applicants(applicants).save(tmp_path / "store")
+
+    store = ApplicantStore.open(tmp_path / "store", mmap=mmap)
+
+    assert len(store) == len(applicants)
+    assert list(store) == applicants
+    assert list(store.applicant_ids) == [a.applicant_id for a in applicants]
+    assert isinstance(store.columns["credit_score"], np.memmap) is mmap
+    assert store.columns["credit_score"][1] == -1
+
+
+def test_unknown_store_version_is_rejected(applicants, tmp_path):
+    ApplicantStore.from_applicants(applicants).save(tmp_path)
+    metadata_path = tmp_path / STORE_METADATA_FILE
+    metadata = json.loads(metadata_path.read_text())
+    metadata["version"] = 99
+    metadata_path.write_text(json.dumps(metadata))
+
+    with pytest.raises(ValueError, match="version"):
+        ApplicantStore.open(tmp_path)
+
+
+def test_population_counts_match_applicant_features(applicants, tmp_path):
+    ApplicantStore.from_applicants(applicants).save(tmp_path)
+    population = ApplicantStore.open(tmp_path).features(AS_OF)
+    features = [ApplicantFeatures(a, AS_OF) for a in applicants]
+
+    assert list(population.age) == [f.age for f in features]
+    assert list(population.violation_count(None, 5)) == [f.violation_count(None, 5) for f in features]
+    assert list(population.violation_count(MAJOR, 3)) == \
+        [f.violation_count(frozenset(MAJOR), 3) for f in features]
+    assert list(population.violation_count(MAJOR, 3, exclude=True)) == \
+        [f.violation_count(frozenset(MAJOR), 3, exclude=True) for f in features]
+    assert list(population.claim_count(ClaimType.AT_FAULT.value, 5)) == \
+        [f.claim_count(ClaimType.AT_FAULT.value, 5) for f in features]
+
+
+def test_vehicle_counts_by_type_and_value(applicants):
+    population = ApplicantStore.from_applicants(applicants).features(AS_OF)
+    vehicles = [a.vehicles for a in applicants]
+    value = applicants[0].vehicles[0].value
+
+    assert list(population.vehicle_count()) == [len(v) for v in vehicles]
+    assert list(population.vehicle_count(value_min=value)) == \
+        [sum(x.value is not None and x.value >= value for x in v) for v in vehicles]
+    assert list(population.vehicle_count(value_min=value, strict=True)) == \
+        [sum(x.value is not None and x.value > value for x in v) for v in vehicles]
+    assert list(population.vehicle_count(["sedan"])) == \
+        [sum(x.vehicle_type.value == "sedan" for x in v) for v in vehicles]
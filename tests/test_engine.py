@@ -0,0 +1,117 @@
+"""Tests for async and batch evaluation in UnderwritingEngine."""
+
+import asyncio
+import re
+
+import pytest
+from langchain.schema import AIMessage
+
+from underwriting.core.engine import UnderwritingEngine
+from underwriting.core.models import UnderwritingDecision
+from underwriting.core.rules_registry import NO_APPLICABLE_RULES
+
+SCORE_PATTERN = re.compile(r"CREDIT SCORE: (\d+)")
+
+
+class ConcurrencyLLM:
+    """Echoes the prompt's credit score back as the reason and tracks calls in flight."""
+
+    def __init__(self, fail_scores=()):
+        self.fail_scores = set(fail_scores)
+        self.in_flight = 0
+        self.peak = 0
+
+    async def ainvoke(self, messages, **kwargs):
+        score = int(SCORE_PATTERN.search(messages[-1].content).group(1))
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.in_flight -= 1
+        if score in self.fail_scores:
+            raise RuntimeError("model unavailable")
+        return AIMessage(content=f"Decision: ACCEPT\nPrimary Reason: {score}\n"
+                                 "Triggered Rules: None\nRisk Factors: None")
+
+
+def scored_applicants(make_applicants, count):
+    """Applicants told apart in the prompt by their credit score."""
+    applicants = make_applicants(count)
+    for index, applicant in enumerate(applicants):
+        applicant.credit_score = 700 + index
+    return applicants
+
+
+def llm_engine(llm):
+    return UnderwritingEngine(rule_precheck=False, llm_factory=lambda: llm)
+
+
+def test_single_evaluation_parses_the_reply(scripted_llm, make_applicants):
+    llm = scripted_llm("Decision: DENY\nPrimary Reason: Too risky\nTriggered Rules: HS001\nRisk Factors: DUI")
+    applicant = make_applicants(1)[0]
+
+    result = llm_engine(llm).evaluate_applicant(applicant)
+
+    assert result.applicant_id == applicant.applicant_id
+    assert result.decision == UnderwritingDecision.DENY
+    assert result.triggered_rules == ["HS001"]
+    assert result.time_to_decision_ms > 0
+    assert llm.calls == 1
+
+
+def test_batch_returns_results_in_input_order_within_the_limit(make_applicants):
+    llm = ConcurrencyLLM()
+    applicants = scored_applicants(make_applicants, 12)
+
+    results = llm_engine(llm).evaluate_batch(applicants, max_concurrency=3)
+
+    assert [r.applicant_id for r in results] == [a.applicant_id for a in applicants]
+    assert [r.reason for r in results] == [str(a.credit_score) for a in applicants]
+    assert llm.peak == 3
+
+
+def test_failed_call_becomes_an_error_result(make_applicants):
+    applicants = scored_applicants(make_applicants, 3)
+    llm = ConcurrencyLLM(fail_scores={applicants[1].credit_score})
+
+    results = asyncio.run(llm_engine(llm).aevaluate_batch(applicants, max_concurrency=2))
+
+    assert [r.error is None for r in results] == [True, False, True]
+    assert results[1].decision == UnderwritingDecision.ADJUDICATE
+    assert "model unavailable" in results[1].error
+
+
+def test_concurrency_must_be_positive(make_applicants):
+    engine = UnderwritingEngine(rule_precheck=False)
+
+    with pytest.raises(ValueError):
+        engine.evaluate_batch(make_applicants(1), max_concurrency=0)
+
+
+def test_pruned_prompt_leaves_out_rules_that_cannot_apply(make_applicants):
+    applicant = make_applicants(1)[0]
+    applicant.credit_score = 800
+    full = UnderwritingEngine(rule_precheck=False)._build_prompt(applicant)
+    engine = UnderwritingEngine(rule_precheck=False, prune_rules=True)
+
+    pruned = engine._build_prompt(applicant)
+
+    # ADJ006: credit score below 550
+    assert "- ADJ006:" in full
+    assert "- ADJ006:" not in pruned
+    assert "- ACC001:" in pruned
+    assert len(pruned) < len(full)
+    # Rendered once per set of relevant rules
+    engine._build_prompt(applicant)
+    assert len(engine._pruned_rules_text) == 1
+
+
+def test_fully_pruned_section_says_so():
+    engine = UnderwritingEngine(rule_precheck=False, prune_rules=True)
+    snapshot = engine.rules_snapshot
+    acceptance = {rule["rule_id"] for rule in snapshot.rules["acceptance_criteria"]["rules"]}
+
+    text = engine._pruned_rules(snapshot, acceptance)
+
+    assert text.count(NO_APPLICABLE_RULES) == 2
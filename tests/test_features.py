@@ -0,0 +1,107 @@
+"""Tests for precomputed applicant features."""
+
+from datetime import date
+
+import pytest
+
+from underwriting.core.features import ApplicantFeatures, full_years_between, years_before
+from underwriting.core.models import Claim, ClaimType, Violation, ViolationType
+from underwriting.data.columnar import ApplicantStore
+
+AS_OF = date(2025, 6, 1)
+
+
+@pytest.fixture
+def applicant(make_applicants):
+    applicant = make_applicants(1)[0]
+    driver = applicant.primary_driver
+    driver.date_of_birth = date(1985, 6, 2)
+    driver.license_issue_date = date(2005, 6, 1)
+    driver.years_licensed = None
+    driver.violations = [
+        Violation(violation_type=ViolationType.DUI, violation_date=date(2021, 6, 1)),
+        Violation(violation_type=ViolationType.SPEEDING_15_OVER, violation_date=date(2023, 1, 15)),
+        Violation(violation_type=ViolationType.PARKING_VIOLATION, violation_date=date(2017, 3, 1)),
+    ]
+    driver.claims = [
+        Claim(claim_type=ClaimType.AT_FAULT, claim_date=date(2024, 2, 1), claim_amount=5000),
+        Claim(claim_type=ClaimType.AT_FAULT, claim_date=date(2019, 2, 1), claim_amount=8000),
+    ]
+    return applicant
+
+
+def test_ages_are_measured_at_the_as_of_date(applicant):
+    features = ApplicantFeatures(applicant, AS_OF)
+
+    # The birthday is a day after the as-of date
+    assert features.age == 39
+    assert ApplicantFeatures(applicant, date(2025, 6, 2)).age == 40
+    assert features.years_licensed == 20
+    assert features.as_of == AS_OF
+
+
+def test_entered_years_licensed_is_kept(applicant):
+    applicant.primary_driver.years_licensed = 7
+
+    assert ApplicantFeatures(applicant, AS_OF).years_licensed == 7
+
+
+def test_violation_counts_respect_lookback_and_type(applicant):
+    features = ApplicantFeatures(applicant, AS_OF)
+    majors = frozenset({"DUI", "reckless_driving"})
+
+    assert features.violation_count(None, 5) == 2
+    assert features.violation_count(None, 10) == 3
+    assert features.violation_count(majors, 5) == 1
+    assert features.violation_count(majors, 5, exclude=True) == 1
+    # The DUI is exactly four years old and falls inside a four-year window
+    assert features.violation_count(majors, 4) == 1
+    assert features.violation_count(majors, 3) == 0
+
+
+def test_claim_counts_respect_lookback(applicant):
+    features = ApplicantFeatures(applicant, AS_OF)
+
+    assert features.claim_count(ClaimType.AT_FAULT.value, 3) == 1
+    assert features.claim_count(ClaimType.AT_FAULT.value, 10) == 2
+    assert features.claim_count(ClaimType.NOT_AT_FAULT.value, 10) == 0
+
+
+def test_summary_reports_severity_counts(applicant):
+    summary = ApplicantFeatures(applicant, AS_OF).summary()
+
+    assert summary["as_of"] == "2025-06-01"
+    assert summary["major_violations_5y"] == 1
+    assert summary["moderate_violations_3y"] == 1
+    assert summary["minor_violations_5y"] == 0
+    assert summary["at_fault_claims_5y"] == 1
+
+
+def test_of_reuses_an_existing_record(applicant):
+    features = ApplicantFeatures(applicant, AS_OF)
+
+    assert ApplicantFeatures.of(features) is features
+    assert ApplicantFeatures.of(applicant, AS_OF).as_of == AS_OF
+
+
+@pytest.mark.parametrize("start, as_of, years", [
+    (date(2000, 3, 1), date(2025, 2, 28), 24),
+    (date(2000, 3, 1), date(2025, 3, 1), 25),
+    (date(2000, 2, 29), date(2025, 2, 28), 24),
+])
+def test_full_years_between(start, as_of, years):
+    assert full_years_between(start, as_of) == years
+
+
+def test_years_before_clamps_leap_day():
+    assert years_before(date(2024, 2, 29), 1) == date(2023, 2, 28)
+
+
+def test_columnar_store_matches_features(applicant, make_applicants):
+    entered = make_applicants(2)[1]
+    entered.primary_driver.years_licensed = 3
+    applicants = [applicant, entered]
+    store = ApplicantStore.from_applicants(applicants)
+
+    assert list(store.years_licensed(AS_OF)) == [ApplicantFeatures(a, AS_OF).years_licensed for a in applicants]
+    assert list(store.ages(AS_OF)) == [ApplicantFeatures(a, AS_OF).age for a in applicants]
@@ -0,0 +1,74 @@
+"""Tests for resumable file-to-file evaluation."""
+
+import json
+
+import pytest
+
+from underwriting.core.engine import UnderwritingEngine
+from underwriting.core.exceptions import ConfigurationError
+from underwriting.core.file_evaluation import EvaluationCheckpoint, default_checkpoint_path, evaluate_file
+from underwriting.core.resilience import ResilientLLMCaller, RetryPolicy
+
+
+@pytest.fixture
+def input_file(tmp_path, make_applicants):
+    path = tmp_path / "applicants.jsonl"
+    with open(path, "w") as handle:
+        for applicant in make_applicants(40):
+            handle.write(applicant.model_dump_json() + "\n")
+    return path
+
+
+def make_engine(**kwargs):
+    return UnderwritingEngine(rule_precheck=False, resilience=ResilientLLMCaller(retry=RetryPolicy(max_attempts=1)),
+                              **kwargs)
+
+
+def output_ids(path):
+    with open(path) as handle:
+        return [json.loads(line)["applicant_id"] for line in handle]
+
+
+def test_resume_after_interruption_evaluates_each_applicant_once(stub_llm_server, input_file, tmp_path):
+    output = tmp_path / "results.jsonl"
+
+    def interrupt(checkpoint):
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        evaluate_file(make_engine(), input_file, output, checkpoint_every=10, max_concurrency=2,
+                      progress=interrupt)
+    checkpoint = EvaluationCheckpoint.load(default_checkpoint_path(output))
+    assert checkpoint.results == 10
+
+    summary = evaluate_file(make_engine(), input_file, output, checkpoint_every=10)
+
+    ids = output_ids(output)
+    assert summary.resumed_from == 10
+    assert summary.total == 40
+    assert len(ids) == len(set(ids)) == 40
+
+
+def test_failed_evaluations_are_retried_on_resume(stub_llm_server, input_file, tmp_path):
+    output = tmp_path / "results.jsonl"
+    stub_llm_server.config.error_rate = 0.5
+
+    first = evaluate_file(make_engine(), input_file, output, checkpoint_every=7)
+    assert first.errors > 0
+    assert len(output_ids(output)) == 40 - first.errors
+
+    stub_llm_server.config.error_rate = 0.0
+    second = evaluate_file(make_engine(), input_file, output, checkpoint_every=7)
+
+    ids = output_ids(output)
+    assert second.evaluated == first.errors
+    assert second.errors == 0
+    assert len(ids) == len(set(ids)) == 40
+
+
+def test_resume_rejects_a_different_configuration(stub_llm_server, input_file, tmp_path):
+    output = tmp_path / "results.jsonl"
+    evaluate_file(make_engine(), input_file, output)
+
+    with pytest.raises(ConfigurationError):
+        evaluate_file(make_engine(prune_rules=True), input_file, output)
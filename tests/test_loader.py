@@ -0,0 +1,86 @@
+"""Tests for bulk applicant loading."""
+
+import csv
+import json
+
+import pytest
+
+from underwriting.core.exceptions import ApplicantValidationError
+from underwriting.data.loader import iter_applicant_chunks, load_applicants, write_applicants
+
+
+@pytest.fixture(params=[".json", ".jsonl", ".csv"])
+def suffix(request):
+    return request.param
+
+
+def test_round_trip_preserves_applicants(tmp_path, make_applicants, suffix):
+    applicants = make_applicants(5)
+    path = tmp_path / f"applicants{suffix}"
+
+    assert write_applicants(applicants, path) == 5
+    assert load_applicants(path, chunk_size=2) == applicants
+
+
+def test_chunks_and_skip(tmp_path, make_applicants, suffix):
+    applicants = make_applicants(5)
+    path = tmp_path / f"applicants{suffix}"
+    write_applicants(applicants, path)
+
+    chunks = list(iter_applicant_chunks(path, chunk_size=2, skip=3))
+
+    assert [len(chunk) for chunk in chunks] == [1, 1]
+    assert [a.applicant_id for chunk in chunks for a in chunk] == [a.applicant_id for a in applicants[3:]]
+
+
+def corrupt_jsonl(path, applicants):
+    lines = [a.model_dump_json() for a in applicants]
+    record = json.loads(lines[2])
+    record["credit_score"] = "excellent"
+    lines[2] = json.dumps(record)
+    # A blank line still counts towards line numbers
+    path.write_text(lines[0] + "\n\n" + "\n".join(lines[1:]) + "\n")
+
+
+def test_invalid_jsonl_record_is_reported_with_its_line(tmp_path, make_applicants):
+    applicants = make_applicants(4)
+    path = tmp_path / "applicants.jsonl"
+    corrupt_jsonl(path, applicants)
+
+    with pytest.raises(ApplicantValidationError) as excinfo:
+        load_applicants(path, chunk_size=10)
+
+    assert f"{path}:4:" in str(excinfo.value)
+    assert excinfo.value.details == {"applicant_id": applicants[2].applicant_id, "field_name": "credit_score"}
+
+
+def test_invalid_records_can_be_skipped(tmp_path, make_applicants):
+    applicants = make_applicants(4)
+    path = tmp_path / "applicants.jsonl"
+    corrupt_jsonl(path, applicants)
+
+    loaded = load_applicants(path, chunk_size=10, skip_invalid=True)
+
+    assert [a.applicant_id for a in loaded] == [applicants[i].applicant_id for i in (0, 1, 3)]
+
+
+def test_invalid_csv_row_is_reported_with_its_line(tmp_path, make_applicants):
+    path = tmp_path / "applicants.csv"
+    write_applicants(make_applicants(3), path)
+    with open(path, newline="") as handle:
+        rows = list(csv.reader(handle))
+    # Break the vehicles JSON cell on the second data row (line 3)
+    rows[2][rows[0].index("vehicles")] = "[{"
+    with open(path, "w", newline="") as handle:
+        csv.writer(handle).writerows(rows)
+
+    with pytest.raises(ApplicantValidationError, match=f"{path}:3:"):
+        load_applicants(path)
+
+
+def test_json_file_must_hold_an_array(tmp_path):
+    path = tmp_path / "applicants.json"
+    path.write_text('{"applicant_id": "A1"}')
+
+    with pytest.raises(ApplicantValidationError, match="expected a JSON array"):
+        load_applicants(path)
@@ -0,0 +1,91 @@
+"""Tests for offline batch-job export and ingest."""
+
+import json
+
+import pytest
+
+from underwriting.core.engine import UnderwritingEngine
+from underwriting.core.models import LicenseStatus, UnderwritingDecision, UnderwritingResult
+from underwriting.core.offline_batch import (
+    CHAT_COMPLETIONS_URL, applicant_id_from_custom_id, batch_custom_id, parse_batch_result_line,
+    read_batch_results, write_batch_requests
+)
+
+COMPLETION = "Decision: DENY\nPrimary Reason: Test reason\nTriggered Rules: HS002\nRisk Factors: DUI"
+
+
+@pytest.fixture
+def engine():
+    return UnderwritingEngine()
+
+
+def result_line(custom_id, content=COMPLETION, status_code=200, error=None):
+    body = {"choices": [{"message": {"role": "assistant", "content": content}}]}
+    return {"custom_id": custom_id, "error": error, "response": {"status_code": status_code, "body": body}}
+
+
+def test_custom_id_is_stable_and_keeps_the_applicant_id():
+    custom_id = batch_custom_id("APP-001", "prompt")
+
+    assert custom_id == batch_custom_id("APP-001", "prompt")
+    assert custom_id != batch_custom_id("APP-001", "other prompt")
+    assert applicant_id_from_custom_id(custom_id) == "APP-001"
+
+
+def test_export_writes_one_request_per_distinct_prompt(engine, make_applicants, tmp_path):
+    applicants = make_applicants(3)
+    requests_path = tmp_path / "requests.jsonl"
+
+    summary = write_batch_requests(engine, applicants + applicants[:1], requests_path)
+
+    lines = [json.loads(line) for line in requests_path.read_text().splitlines()]
+    assert (summary.requests, summary.duplicates) == (3, 1)
+    assert [applicant_id_from_custom_id(line["custom_id"]) for line in lines] == \
+        [a.applicant_id for a in applicants]
+    assert lines[0]["url"] == CHAT_COMPLETIONS_URL
+    assert lines[0]["body"]["model"] == engine.llm_settings["model"]
+    assert lines[0]["body"]["messages"][0]["content"] == engine._build_prompt(applicants[0])
+
+
+def test_export_decides_clear_hard_stops_locally(engine, make_applicants, tmp_path):
+    applicants = make_applicants(2)
+    applicants[0].primary_driver.license_status = LicenseStatus.SUSPENDED
+    requests_path, decided_path = tmp_path / "requests.jsonl", tmp_path / "decided.jsonl"
+
+    summary = write_batch_requests(engine, applicants, requests_path, decided_path)
+
+    assert (summary.requests, summary.prechecked) == (1, 1)
+    [decided] = [UnderwritingResult.model_validate_json(line) for line in decided_path.read_text().splitlines()]
+    assert decided.applicant_id == applicants[0].applicant_id
+    assert decided.decision == UnderwritingDecision.DENY
+
+
+def test_result_line_is_parsed_with_the_engines_parser(engine):
+    result = parse_batch_result_line(engine, json.dumps(result_line("APP-001-abcd")))
+
+    assert result.applicant_id == "APP-001"
+    assert result.decision == UnderwritingDecision.DENY
+    assert result.triggered_rules == ["HS002"]
+    assert result.error is None
+
+
+@pytest.mark.parametrize("line, message", [
+    (result_line("A-1", status_code=500), "Batch request failed"),
+    (result_line("A-1", error={"message": "expired"}), "expired"),
+    ({"custom_id": "A-1", "response": {"status_code": 200, "body": {"choices": []}}}, "no completion"),
+])
+def test_failed_requests_become_error_results(engine, line, message):
+    result = parse_batch_result_line(engine, line)
+
+    assert result.decision == UnderwritingDecision.ADJUDICATE
+    assert message in result.error
+
+
+def test_read_results_skips_blank_lines(engine, tmp_path):
+    path = tmp_path / "results.jsonl"
+    path.write_text(json.dumps(result_line("A-1")) + "\n\n" + json.dumps(result_line("B-2")) + "\n")
+
+    results = list(read_batch_results(engine, path))
+
+    assert [custom_id for custom_id, _ in results] == ["A-1", "B-2"]
+    assert [result.applicant_id for _, result in results] == ["A", "B"]
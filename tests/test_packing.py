@@ -0,0 +1,80 @@
+"""Tests for packed multi-applicant prompts."""
+
+from underwriting.ai.packing import APPLICANT_HEADER_PATTERN, split_packed_response
+from underwriting.core.engine import UNPARSED_REASON, UnderwritingEngine
+from underwriting.core.models import UnderwritingDecision
+
+
+def block(applicant_id, decision="DENY", reason="Test reason"):
+    lines = [f"Applicant ID: {applicant_id}", f"Decision: {decision}"]
+    if reason:
+        lines.append(f"Primary Reason: {reason}")
+    lines += ["Triggered Rules: None", "Risk Factors: None"]
+    return "\n".join(lines)
+
+
+def test_split_keys_blocks_by_applicant_id():
+    text = "\n\n".join([block("A1", "ACCEPT"), block("A2", "DENY")])
+    blocks = split_packed_response(text)
+
+    assert list(blocks) == ["A1", "A2"]
+    assert "ACCEPT" in blocks["A1"]
+    assert "DENY" in blocks["A2"]
+
+
+def test_split_tolerates_markdown_decoration():
+    text = "**Applicant ID:** A1\nDecision: ACCEPT\n\n- Applicant ID: A2\nDecision: DENY"
+    assert list(split_packed_response(text)) == ["A1", "A2"]
+
+
+def test_split_drops_blocks_without_decision_and_repeated_ids():
+    text = "\n\n".join([
+        "Applicant ID: A1\nPrimary Reason: no decision",
+        block("A2", "ACCEPT"),
+        block("A2", "DENY"),
+    ])
+    blocks = split_packed_response(text)
+
+    assert list(blocks) == ["A2"]
+    assert "ACCEPT" in blocks["A2"]
+
+
+def test_packed_prompt_has_one_header_per_applicant(make_applicants):
+    engine = UnderwritingEngine(rule_precheck=False)
+    applicants = make_applicants(3)
+
+    prompt = engine._build_packed_prompt(applicants)
+
+    assert APPLICANT_HEADER_PATTERN.findall(prompt) == [a.applicant_id for a in applicants]
+    assert prompt.count("- HS001:") == 1
+
+
+def test_missing_and_malformed_decisions_are_retried_individually(scripted_llm, make_applicants):
+    applicants = make_applicants(3)
+    first, second, third = (a.applicant_id for a in applicants)
+    packed_reply = "\n\n".join([
+        block(first, "ACCEPT"),
+        # A decision without a reason is malformed
+        block(second, "DENY", reason=None),
+    ])
+    llm = scripted_llm(packed_reply, block(second, "ADJUDICATE"), block(third, "DENY"))
+    engine = UnderwritingEngine(rule_precheck=False, llm_factory=lambda: llm)
+
+    results = engine.evaluate_packed(applicants, pack_size=3)
+
+    assert [r.applicant_id for r in results] == [first, second, third]
+    assert [r.decision for r in results] == [UnderwritingDecision.ACCEPT, UnderwritingDecision.ADJUDICATE,
+                                            UnderwritingDecision.DENY]
+    assert all(r.reason != UNPARSED_REASON for r in results)
+    assert llm.calls == 3
+
+
+def test_packed_evaluation_against_stub(stub_llm_server, make_applicants):
+    engine = UnderwritingEngine(rule_precheck=False)
+    applicants = make_applicants(8)
+
+    results = engine.evaluate_packed(applicants, pack_size=4)
+
+    assert [r.applicant_id for r in results] == [a.applicant_id for a in applicants]
+    assert all(r.error is None for r in results)
+    assert stub_llm_server.stats.completions == 2
@@ -0,0 +1,125 @@
+"""Tests for the RPM/TPM token-bucket rate limiter."""
+
+import asyncio
+import threading
+
+import pytest
+
+import underwriting.core.rate_limit as rate_limit
+from underwriting.core.engine import UnderwritingEngine
+from underwriting.core.rate_limit import FileBucketBackend, RateLimiter, Reservation, estimate_tokens
+from underwriting.core.resilience import ResilientLLMCaller, RetryPolicy
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Freeze the limiter's clock and record sleeps instead of sleeping."""
+    now = [1000.0]
+    sleeps = []
+    monkeypatch.setattr(rate_limit.time, "time", lambda: now[0])
+    monkeypatch.setattr(rate_limit.time, "sleep", sleeps.append)
+    return now, sleeps
+
+
+def token_level(limiter):
+    """Current token bucket level, refilled to the frozen clock."""
+    return limiter.backend.update(lambda state: (state, limiter._refill(state, rate_limit.time.time())[1]))
+
+
+def test_bucket_starts_full_and_waits_off_a_deficit(clock):
+    _, sleeps = clock
+    limiter = RateLimiter(requests_per_minute=60, tokens_per_minute=6000)
+
+    assert limiter.acquire(6000).wait_seconds == 0
+    reservation = limiter.acquire(300)
+
+    # 300 tokens at 100 tokens a second
+    assert reservation.wait_seconds == pytest.approx(3.0)
+    assert sleeps == [pytest.approx(3.0)]
+
+
+def test_request_budget_limits_independently(clock):
+    limiter = RateLimiter(requests_per_minute=2)
+
+    assert limiter.acquire(10).wait_seconds == 0
+    assert limiter.acquire(10).wait_seconds == 0
+    assert limiter.acquire(10).wait_seconds == pytest.approx(30.0)
+
+
+def test_buckets_refill_over_time(clock):
+    now, _ = clock
+    limiter = RateLimiter(tokens_per_minute=600)
+    limiter.acquire(600)
+
+    now[0] += 30
+    assert token_level(limiter) == pytest.approx(300)
+    now[0] += 600
+    assert token_level(limiter) == pytest.approx(600)
+
+
+def test_reconcile_returns_unused_tokens(clock):
+    limiter = RateLimiter(tokens_per_minute=1000)
+    reservation = limiter.acquire(800)
+
+    limiter.reconcile(reservation, 300)
+    assert token_level(limiter) == pytest.approx(700)
+
+    limiter.reconcile(Reservation(tokens=100, wait_seconds=0), 400)
+    assert token_level(limiter) == pytest.approx(400)
+
+
+def test_file_backend_is_shared_between_limiters(clock, tmp_path):
+    path = tmp_path / "bucket.json"
+    first = RateLimiter(tokens_per_minute=600, backend=FileBucketBackend(path))
+    second = RateLimiter(tokens_per_minute=600, backend=FileBucketBackend(path))
+
+    first.acquire(600)
+    assert second.acquire(60).wait_seconds == pytest.approx(6.0)
+
+
+def test_async_file_updates_run_off_the_event_loop(clock, tmp_path):
+    backend = FileBucketBackend(tmp_path / "bucket.json")
+    limiter = RateLimiter(tokens_per_minute=600, backend=backend)
+    threads = []
+    update = backend.update
+
+    def recording_update(apply):
+        threads.append(threading.get_ident())
+        return update(apply)
+
+    backend.update = recording_update
+
+    async def run():
+        reservation = await limiter.aacquire(100)
+        await limiter.areconcile(reservation, 50)
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(run())
+    assert len(threads) == 2
+    assert loop_thread not in threads
+
+
+class FailingLLM:
+    def invoke(self, messages, **kwargs):
+        raise ConnectionError("connection reset")
+
+    async def ainvoke(self, messages, **kwargs):
+        raise ConnectionError("connection reset")
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_failed_calls_give_back_their_completion_allowance(clock, make_applicants, use_async):
+    limiter = RateLimiter(tokens_per_minute=100000)
+    engine = UnderwritingEngine(rule_precheck=False, rate_limiter=limiter, llm_factory=FailingLLM,
+                                resilience=ResilientLLMCaller(retry=RetryPolicy(max_attempts=3, base_delay=0.0)))
+    applicant = make_applicants(1)[0]
+    prompt = engine._build_prompt(applicant)
+
+    if use_async:
+        result = asyncio.run(engine.aevaluate_applicant(applicant))
+    else:
+        result = engine.evaluate_applicant(applicant)
+
+    assert result.error is not None
+    # Three attempts are each charged for their prompt only
+    assert token_level(limiter) == pytest.approx(100000 - 3 * estimate_tokens(prompt))
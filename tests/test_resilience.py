@@ -0,0 +1,101 @@
+"""Tests for LLM call retries and the circuit breaker."""
+
+import pytest
+
+from underwriting.core.engine import UnderwritingEngine
+from underwriting.core.exceptions import LLMError
+from underwriting.core.resilience import CircuitBreaker, ResilientLLMCaller, RetryPolicy
+
+NO_BACKOFF = RetryPolicy(max_attempts=3, base_delay=0.0)
+
+
+class Flaky:
+    """Callable failing with ``error`` for its first ``failures`` calls."""
+
+    def __init__(self, failures, error=None):
+        self.failures = failures
+        self.error = error or ConnectionError("connection reset")
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise self.error
+        return "ok"
+
+
+def test_transient_failures_are_retried():
+    caller = ResilientLLMCaller(retry=NO_BACKOFF)
+    flaky = Flaky(failures=2)
+
+    assert caller.call(flaky) == "ok"
+    assert flaky.calls == 3
+    assert caller.stats.retries == 2
+
+
+def test_retries_stop_after_max_attempts():
+    caller = ResilientLLMCaller(retry=NO_BACKOFF)
+    flaky = Flaky(failures=5)
+
+    with pytest.raises(LLMError) as excinfo:
+        caller.call(flaky)
+    assert excinfo.value.kind == "connection"
+    assert flaky.calls == 3
+    assert caller.stats.failures == 1
+
+
+def test_client_errors_are_not_retried():
+    caller = ResilientLLMCaller(retry=NO_BACKOFF)
+    flaky = Flaky(failures=1, error=LLMError("bad request", kind="client", status_code=400))
+
+    with pytest.raises(LLMError):
+        caller.call(flaky)
+    assert flaky.calls == 1
+
+
+def test_breaker_opens_and_short_circuits():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+    caller = ResilientLLMCaller(retry=RetryPolicy(max_attempts=1), breaker=breaker)
+    flaky = Flaky(failures=10)
+
+    for _ in range(2):
+        with pytest.raises(LLMError):
+            caller.call(flaky)
+    assert breaker.state == CircuitBreaker.OPEN
+
+    with pytest.raises(LLMError) as excinfo:
+        caller.call(flaky)
+    assert excinfo.value.kind == "circuit_open"
+    assert flaky.calls == 2
+    assert caller.stats.short_circuits == 1
+
+
+def test_half_open_probe_closes_the_breaker():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    caller = ResilientLLMCaller(retry=RetryPolicy(max_attempts=1), breaker=breaker)
+
+    with pytest.raises(LLMError):
+        caller.call(Flaky(failures=1))
+    assert breaker.state == CircuitBreaker.OPEN
+
+    assert caller.call(Flaky(failures=0)) == "ok"
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_rate_limits_are_not_outages():
+    breaker = CircuitBreaker(failure_threshold=1)
+    breaker.record_failure(LLMError("slow down", kind="rate_limit", status_code=429))
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_engine_retries_server_errors_against_stub(stub_llm_server, make_applicants):
+    stub_llm_server.config.error_rate = 1.0
+    engine = UnderwritingEngine(rule_precheck=False, resilience=ResilientLLMCaller(retry=NO_BACKOFF))
+
+    result = engine.evaluate_applicant(make_applicants(1)[0])
+
+    assert result.error is not None
+    assert stub_llm_server.stats.server_errors == 3
+
+    stub_llm_server.config.error_rate = 0.0
+    assert engine.evaluate_applicant(make_applicants(1)[0]).error is None
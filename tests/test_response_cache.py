@@ -0,0 +1,91 @@
+"""Tests for the LLM response cache and how the engine uses it."""
+
+from underwriting.ai.cache import ResponseCache
+from underwriting.core.engine import UNPARSED_REASON, UnderwritingEngine
+from underwriting.core.models import UnderwritingDecision
+
+VALID_RESPONSE = """Decision: DENY
+Primary Reason: Test reason
+Triggered Rules: None
+Risk Factors: None"""
+
+
+def test_second_evaluation_is_a_cache_hit(stub_llm_server, make_applicants):
+    cache = ResponseCache()
+    engine = UnderwritingEngine(response_cache=cache, rule_precheck=False)
+    applicant = make_applicants(1)[0]
+
+    first = engine.evaluate_applicant(applicant)
+    second = engine.evaluate_applicant(applicant)
+
+    assert first.error is None
+    assert second.decision == first.decision
+    assert stub_llm_server.stats.completions == 1
+    assert cache.stats.misses == 1
+    assert cache.stats.memory_hits == 1
+
+
+def test_bypass_cache_calls_the_model(stub_llm_server, make_applicants):
+    cache = ResponseCache()
+    engine = UnderwritingEngine(response_cache=cache, rule_precheck=False)
+    applicant = make_applicants(1)[0]
+
+    engine.evaluate_applicant(applicant)
+    engine.evaluate_applicant(applicant, bypass_cache=True)
+
+    assert stub_llm_server.stats.completions == 2
+    assert cache.stats.bypassed == 1
+
+
+def test_disk_tier_survives_a_new_cache(tmp_path):
+    path = tmp_path / "responses.db"
+    cache = ResponseCache(path)
+    cache.set("key", "response")
+    cache.close()
+
+    reopened = ResponseCache(path)
+    assert reopened.get("key") == "response"
+    assert reopened.stats.disk_hits == 1
+    assert reopened.get("missing") is None
+
+
+def test_memory_tier_evicts_least_recently_used():
+    cache = ResponseCache(max_memory_entries=2)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    cache.get("a")
+    cache.set("c", "3")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    assert cache.stats.evictions == 1
+
+
+def test_expired_entries_are_misses(monkeypatch):
+    import underwriting.ai.cache as cache_module
+
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "time", lambda: now[0])
+    cache = ResponseCache(ttl_seconds=10)
+    cache.set("key", "response")
+
+    now[0] += 5
+    assert cache.get("key") == "response"
+    now[0] += 10
+    assert cache.get("key") is None
+
+
+def test_unparsed_completion_is_not_cached(scripted_llm, make_applicants):
+    cache = ResponseCache()
+    llm = scripted_llm("garbled", VALID_RESPONSE)
+    engine = UnderwritingEngine(response_cache=cache, rule_precheck=False, llm_factory=lambda: llm)
+    applicant = make_applicants(1)[0]
+
+    first = engine.evaluate_applicant(applicant)
+    assert first.reason == UNPARSED_REASON
+    assert len(cache) == 0
+
+    second = engine.evaluate_applicant(applicant)
+    assert second.decision == UnderwritingDecision.DENY
+    assert llm.calls == 2
+    assert len(cache) == 1
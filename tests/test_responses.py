@@ -0,0 +1,94 @@
+"""Tests for structured (JSON) response validation."""
+
+import pytest
+
+from underwriting.ai.cache import ResponseCache
+from underwriting.core.engine import UnderwritingEngine
+from underwriting.core.exceptions import LLMError
+from underwriting.core.models import UnderwritingDecision
+from underwriting.core.responses import parse_packed_structured_response, parse_structured_response
+
+RULE_IDS = {"HS001", "ADJ001"}
+DENY_JSON = '{"decision": "DENY", "reason": "Test", "triggered_rules": ["HS001"], "risk_factors": []}'
+
+
+def test_parses_an_object_inside_code_fences():
+    decision = parse_structured_response(f"```json\n{DENY_JSON}\n```", RULE_IDS)
+
+    assert decision.decision == UnderwritingDecision.DENY
+    assert decision.triggered_rules == ["HS001"]
+
+
+def test_decision_is_case_insensitive():
+    decision = parse_structured_response('{"decision": " Accept ", "reason": "Clean"}')
+    assert decision.decision == UnderwritingDecision.ACCEPT
+
+
+@pytest.mark.parametrize("text", [
+    "Decision: DENY",
+    '{"decision": "maybe", "reason": "Test"}',
+    '{"decision": "DENY"}',
+    '{"decision": "DENY", "reason": "Test", "triggered_rules": ["HS999"]}',
+])
+def test_invalid_responses_raise(text):
+    with pytest.raises(LLMError):
+        parse_structured_response(text, RULE_IDS)
+
+
+def test_packed_response_drops_invalid_and_repeated_entries():
+    text = """[
+        {"applicant_id": "A1", "decision": "ACCEPT", "reason": "Clean"},
+        {"applicant_id": "A2", "decision": "maybe", "reason": "Test"},
+        {"applicant_id": "A3", "decision": "DENY", "reason": "Test", "triggered_rules": ["HS999"]},
+        {"applicant_id": "A1", "decision": "DENY", "reason": "Repeat"}
+    ]"""
+    decisions = parse_packed_structured_response(text, RULE_IDS)
+
+    assert list(decisions) == ["A1"]
+    assert decisions["A1"].decision == UnderwritingDecision.ACCEPT
+
+
+def test_packed_response_without_an_array_raises():
+    with pytest.raises(LLMError):
+        parse_packed_structured_response(DENY_JSON)
+
+
+def structured_engine(llm, cache=None):
+    return UnderwritingEngine(rule_precheck=False, structured_output=True, llm_factory=lambda: llm,
+                              response_cache=cache)
+
+
+def test_engine_requests_and_parses_json(scripted_llm, make_applicants):
+    llm = scripted_llm(DENY_JSON)
+
+    result = structured_engine(llm).evaluate_applicant(make_applicants(1)[0])
+
+    assert result.error is None
+    assert result.decision == UnderwritingDecision.DENY
+    assert "single compact JSON object" in llm.prompts[0]
+    assert "Primary Reason:" not in llm.prompts[0]
+
+
+def test_malformed_json_is_an_error_result(scripted_llm, make_applicants):
+    result = structured_engine(scripted_llm('{"decision": "maybe"}')).evaluate_applicant(make_applicants(1)[0])
+
+    assert result.error is not None
+    assert result.decision == UnderwritingDecision.ADJUDICATE
+
+
+def test_invalid_cached_completion_is_discarded(scripted_llm, make_applicants):
+    cache = ResponseCache()
+    llm = scripted_llm(DENY_JSON)
+    engine = structured_engine(llm, cache)
+    applicant = make_applicants(1)[0]
+
+    # An entry cached before completions were validated
+    key = ResponseCache.make_key(engine._build_prompt(applicant), engine.llm_settings)
+    cache.set(key, '{"decision": "maybe"}')
+
+    result = engine.evaluate_applicant(applicant)
+
+    assert result.error is None
+    assert result.decision == UnderwritingDecision.DENY
+    assert llm.calls == 1
+    assert cache.get(key) == DENY_JSON
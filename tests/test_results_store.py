@@ -0,0 +1,126 @@
+"""Tests for the SQLite A/B results backend."""
+
+import json
+import threading
+from datetime import datetime
+
+import pytest
+
+from underwriting.core.models import UnderwritingDecision
+from underwriting.testing import ab_engine
+from underwriting.testing.results_store import SQLiteResultsBackend
+
+ACCEPT, DENY, ADJUDICATE = UnderwritingDecision.ACCEPT, UnderwritingDecision.DENY, UnderwritingDecision.ADJUDICATE
+
+
+def result(variant_id, applicant_id, decision, error=None, processing_time_ms=10.0, fingerprint="abc"):
+    # Imported as a module attribute so pytest does not collect TestResult
+    return ab_engine.TestResult(
+        applicant_id=applicant_id, variant_id=variant_id, decision=decision, reason=f"{decision.value} reason",
+        triggered_rules=["HS001"] if decision == DENY else [], risk_factors=[],
+        processing_time_ms=processing_time_ms, timestamp=datetime(2025, 6, 1, 12, 0), error=error,
+        time_to_decision_ms=processing_time_ms, config_fingerprint=fingerprint
+    )
+
+
+@pytest.fixture
+def store():
+    store = SQLiteResultsBackend(batch_size=4)
+    decisions = {"a": [ACCEPT, DENY, ACCEPT, ADJUDICATE], "b": [ACCEPT, ACCEPT, ACCEPT, DENY]}
+    for variant_id, variant_decisions in decisions.items():
+        for index, decision in enumerate(variant_decisions):
+            store.add("run1", result(variant_id, f"APP{index}", decision, processing_time_ms=10.0 * (index + 1)))
+    # A failed evaluation and a result from another run
+    store.add("run1", result("a", "APP4", ADJUDICATE, error="timeout"))
+    store.add("run2", result("a", "APP0", DENY, fingerprint="def"))
+    yield store
+    store.close()
+
+
+def test_buffered_results_are_visible_to_queries(store):
+    assert len(store) == 10
+    assert [r.applicant_id for r in store.results(run_id="run1", variant_id="b")] == \
+        ["APP0", "APP1", "APP2", "APP3"]
+
+
+def test_results_round_trip(store):
+    [stored] = store.results(run_id="run2")
+
+    assert stored == result("a", "APP0", DENY, fingerprint="def")
+    assert [r.run_id for r in store.history() if r.config_fingerprint == "def"] == ["run2"]
+
+
+def test_variant_summary_counts_errors_apart(store):
+    summary = store.variant_summary("run1", "a")
+
+    assert (summary.results, summary.errors) == (5, 1)
+    assert (summary.accept, summary.deny, summary.adjudicate) == (2, 1, 1)
+    assert summary.accept_rate == pytest.approx(50.0)
+    assert summary.error_rate == pytest.approx(20.0)
+
+
+def test_summary_can_be_limited_to_common_applicants(store):
+    assert store.variant_summary("run1", "a", common_with="b").results == 4
+
+
+def test_agreement_uses_each_applicants_latest_result(store):
+    assert store.agreement("run1", "a", "b") == (4, 2)
+
+    store.add("run1", result("a", "APP1", ACCEPT))
+    assert store.agreement("run1", "a", "b") == (4, 3)
+    assert [row[0] for row in store.disagreements("run1", "a", "b")] == ["APP3"]
+
+
+def test_agreement_matrix_is_symmetric(store):
+    for index, decision in enumerate([ACCEPT, DENY, DENY, DENY]):
+        store.add("run1", result("c", f"APP{index}", decision))
+
+    matrix = store.agreement_matrix("run1", ["a", "b", "c"])
+
+    assert matrix["a", "b"] == matrix["b", "a"] == (4, 2)
+    assert matrix["a", "c"] == (4, 2)
+    assert matrix["b", "c"] == (4, 2)
+
+
+def test_export_rows_are_json(store):
+    rows = [json.loads(row) for row in store.export_rows(run_id="run1")]
+
+    assert len(rows) == 9
+    assert rows[1]["triggered_rules"] == ["HS001"]
+    assert rows[-1]["error"] == "timeout"
+
+
+def test_history_lists_latest_runs_first(store):
+    history = store.history()
+
+    assert [(h.run_id, h.variant_id) for h in history] == [("run2", "a"), ("run1", "a"), ("run1", "b")]
+    assert history[1].applicants == 5
+    assert len(store.history(limit=1)) == 1
+
+
+def test_file_store_persists_across_connections(tmp_path):
+    path = tmp_path / "results" / "ab.db"
+    first = SQLiteResultsBackend(path)
+    first.add("run1", result("a", "APP0", ACCEPT))
+    first.close()
+
+    second = SQLiteResultsBackend(path)
+    assert second.persistent
+    assert len(second) == 1
+    second.close()
+
+
+def test_concurrent_writers_and_readers(store):
+    def write(variant_id):
+        for index in range(200):
+            store.add("run3", result(variant_id, f"APP{index}", ACCEPT))
+
+    threads = [threading.Thread(target=write, args=(variant_id,)) for variant_id in "xyz"]
+    for thread in threads:
+        thread.start()
+    while any(thread.is_alive() for thread in threads):
+        list(store.results(run_id="run3"))
+    for thread in threads:
+        thread.join()
+
+    assert sum(1 for _ in store.results(run_id="run3")) == 600
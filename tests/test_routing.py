@@ -0,0 +1,114 @@
+"""Tests for tiered model routing."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from langchain.schema import AIMessage
+
+from underwriting.core.engine import UnderwritingEngine
+from underwriting.core.models import UnderwritingDecision
+from underwriting.core.routing import (
+    ESCALATE_ADJUDICATE, ESCALATE_CONFLICT, ESCALATE_PARSE_FAILURE, RoutingPolicy
+)
+
+SMALL, LARGE = "small", "large"
+
+
+def reply(decision, rules="None"):
+    return (f"Decision: {decision}\nPrimary Reason: Test reason\n"
+            f"Triggered Rules: {rules}\nRisk Factors: None")
+
+
+class TieredLLM:
+    """Answers per requested model; calls to ``slow_model`` wait for ``release``."""
+
+    def __init__(self, replies, slow_model=None):
+        self.replies = replies
+        self.slow_model = slow_model
+        self.release = threading.Event()
+        self.calls = []
+
+    def invoke(self, messages, model=None, **kwargs):
+        self.calls.append(model)
+        if model == self.slow_model:
+            self.release.wait(5)
+        return AIMessage(content=self.replies[model])
+
+    async def ainvoke(self, messages, model=None, **kwargs):
+        self.calls.append(model)
+        if model == self.slow_model:
+            await asyncio.to_thread(self.release.wait, 5)
+        return AIMessage(content=self.replies[model])
+
+
+def routed_engine(llm, **policy):
+    policy = RoutingPolicy(first_model=SMALL, escalation_model=LARGE, **{"audit_rate": 0.0, **policy})
+    return UnderwritingEngine(rule_precheck=False, routing=policy, llm_factory=lambda: llm)
+
+
+def test_clear_decision_stays_on_the_first_tier(make_applicants):
+    llm = TieredLLM({SMALL: reply("ACCEPT"), LARGE: reply("DENY")})
+    engine = routed_engine(llm)
+
+    result = engine.evaluate_applicant(make_applicants(1)[0])
+
+    assert result.decision == UnderwritingDecision.ACCEPT
+    assert result.model == SMALL
+    assert llm.calls == [SMALL]
+    assert engine.router.stats.escalation_rate == 0
+
+
+@pytest.mark.parametrize("first_reply, reason", [
+    (reply("ADJUDICATE"), ESCALATE_ADJUDICATE),
+    ("garbled", ESCALATE_PARSE_FAILURE),
+    (reply("ACCEPT", rules="HS001"), ESCALATE_CONFLICT),
+])
+def test_escalates_when_the_first_answer_cannot_be_acted_on(make_applicants, first_reply, reason):
+    llm = TieredLLM({SMALL: first_reply, LARGE: reply("DENY")})
+    engine = routed_engine(llm)
+
+    result = engine.evaluate_applicant(make_applicants(1)[0])
+
+    assert result.decision == UnderwritingDecision.DENY
+    assert result.model == LARGE
+    assert engine.router.stats.escalations == {reason: 1}
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_audit_runs_after_the_decision_is_returned(make_applicants, use_async):
+    llm = TieredLLM({SMALL: reply("ACCEPT"), LARGE: reply("DENY")}, slow_model=LARGE)
+    engine = routed_engine(llm, audit_rate=1.0)
+    applicant = make_applicants(1)[0]
+
+    start = time.perf_counter()
+    if use_async:
+        result = asyncio.run(engine.aevaluate_applicant(applicant))
+    else:
+        result = engine.evaluate_applicant(applicant)
+
+    # Returned while the audit call is still blocked
+    assert time.perf_counter() - start < 2
+    assert result.decision == UnderwritingDecision.ACCEPT
+    assert engine.router.pending_audits == 1
+    assert not engine.router.stats.audits
+
+    llm.release.set()
+    assert engine.router.wait_for_audits(timeout=5)
+    [audit] = engine.router.stats.audits
+    assert (audit.first_decision, audit.escalation_decision) == (UnderwritingDecision.ACCEPT,
+                                                                 UnderwritingDecision.DENY)
+    assert engine.router.stats.agreement_rate == 0.0
+    assert engine.router.stats.tiers[LARGE].calls == 1
+
+
+def test_failed_audit_is_not_recorded(make_applicants):
+    llm = TieredLLM({SMALL: reply("ACCEPT")})
+    engine = routed_engine(llm, audit_rate=1.0)
+
+    engine.evaluate_applicant(make_applicants(1)[0])
+
+    assert engine.router.wait_for_audits(timeout=5)
+    assert not engine.router.stats.audits
+    assert engine.router.stats.tiers[LARGE].errors == 1
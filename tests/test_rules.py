@@ -0,0 +1,125 @@
+"""Tests for the compiled rule evaluator."""
+
+from datetime import date
+
+import pytest
+
+from underwriting.core.features import years_before
+from underwriting.core.models import UnderwritingDecision, Violation, ViolationType
+from underwriting.core.rules import compile_rules
+from underwriting.core.rules_registry import get_rules_registry
+
+AS_OF = date(2025, 6, 1)
+
+
+@pytest.fixture
+def applicant(make_applicants):
+    """A sample applicant with a clean 40-year-old primary driver."""
+    applicant = make_applicants(1)[0]
+    driver = applicant.primary_driver
+    driver.date_of_birth = years_before(AS_OF, 40)
+    driver.violations = []
+    driver.claims = []
+    applicant.credit_score = 750
+    applicant.prior_insurance_lapse_days = 0
+    for vehicle in applicant.vehicles:
+        vehicle.value = 20000
+    return applicant
+
+
+def compiled(variant):
+    return get_rules_registry().get(f"underwriting_rules_{variant}.json").compiled
+
+
+def triggered(variant, applicant):
+    return compiled(variant).triggered_rule_ids(applicant, AS_OF)
+
+
+@pytest.mark.parametrize("score, fires", [(499, True), (500, False), (501, False)])
+def test_hard_stop_credit_bound_is_strict(applicant, score, fires):
+    # HS007: "Credit score below 500"
+    applicant.credit_score = score
+    evaluation = compiled("conservative").evaluate(applicant, AS_OF)
+
+    assert ("HS007" in evaluation.exact_hard_stops) is fires
+    assert (evaluation.to_hard_stop_result() is not None) is fires
+
+
+@pytest.mark.parametrize("score, fires", [(649, True), (650, False)])
+def test_adjudication_credit_bound_is_strict(applicant, score, fires):
+    # ADJ005: "Credit score below 650"
+    applicant.credit_score = score
+    assert ("ADJ005" in triggered("conservative", applicant)) is fires
+
+
+@pytest.mark.parametrize("age, fires", [(70, False), (71, True)])
+def test_driver_age_over_limit_is_strict(applicant, age, fires):
+    # ADJ007: "Drivers over 70 require review"
+    applicant.primary_driver.date_of_birth = years_before(AS_OF, age)
+    assert ("ADJ007" in triggered("conservative", applicant)) is fires
+
+
+@pytest.mark.parametrize("value, fires", [(40000, False), (40001, True)])
+def test_vehicle_value_over_limit_is_strict(applicant, value, fires):
+    # ADJ008: "Vehicles valued over $40,000"
+    applicant.vehicles[0].value = value
+    assert ("ADJ008" in triggered("conservative", applicant)) is fires
+
+
+@pytest.mark.parametrize("age, fires", [(22, True), (23, False)])
+def test_driver_age_under_limit(applicant, age, fires):
+    # HS008: "Drivers under 23 with any major violations"
+    driver = applicant.primary_driver
+    driver.date_of_birth = years_before(AS_OF, age)
+    driver.violations = [Violation(violation_type=ViolationType.RECKLESS_DRIVING,
+                                   violation_date=years_before(AS_OF, 1))]
+    assert ("HS008" in triggered("conservative", applicant)) is fires
+
+
+@pytest.mark.parametrize("days, fires", [(0, False), (1, True), (59, True), (60, False)])
+def test_lapse_range_covers_its_stated_days(applicant, days, fires):
+    # ADJ006: a coverage lapse of 1 to 59 days
+    applicant.prior_insurance_lapse_days = days
+    assert ("ADJ006" in triggered("conservative", applicant)) is fires
+
+
+@pytest.mark.parametrize("age, fires", [(29, False), (30, True), (65, True), (66, False)])
+def test_acceptance_bounds_are_inclusive(applicant, age, fires):
+    # ACC001: drivers aged 30 to 65 with a credit score of at least 700
+    applicant.primary_driver.date_of_birth = years_before(AS_OF, age)
+    applicant.credit_score = 700
+    assert ("ACC001" in triggered("conservative", applicant)) is fires
+
+
+def test_missing_credit_score_triggers_no_credit_rule(applicant):
+    applicant.credit_score = None
+    ids = triggered("conservative", applicant)
+    assert "HS007" not in ids
+    assert "ADJ005" not in ids
+
+
+def test_unsupported_criteria_are_not_exact():
+    rules = {"hard_stops": {"rules": [
+        {"rule_id": "HS900", "name": "Test", "description": "Test rule",
+         "criteria": {"credit_score_max": 500, "moon_phase": "full"}},
+    ]}}
+    rule = compile_rules(rules).rules["HS900"]
+
+    assert rule.unsupported_criteria == ("moon_phase",)
+    assert not rule.is_exact
+
+
+def test_decision_follows_most_severe_section(applicant):
+    rule_set = compiled("conservative")
+    applicant.credit_score = 600
+
+    assert rule_set.evaluate(applicant, AS_OF).decision == UnderwritingDecision.ADJUDICATE
+    assert rule_set.decision_for(["ACC001", "HS007"]) == UnderwritingDecision.DENY
+
+
+def test_pruning_keeps_acceptance_criteria(applicant):
+    rule_set = compiled("conservative")
+    relevant = rule_set.relevant_rule_ids(applicant, AS_OF)
+
+    assert "HS007" not in relevant
+    assert {rule.rule_id for rule in rule_set.rules_by_section["acceptance_criteria"]} <= relevant
@@ -0,0 +1,97 @@
+"""Tests for the process-wide rules registry."""
+
+import json
+import os
+import shutil
+
+import pytest
+
+from underwriting.core.engine import UnderwritingEngine
+from underwriting.core.exceptions import RuleValidationError
+from underwriting.core.rules_registry import PROJECT_ROOT, RULES_DIR, RulesRegistry
+
+
+@pytest.fixture
+def rules_path(tmp_path):
+    """A private copy of the standard rules file."""
+    path = tmp_path / "rules.json"
+    shutil.copy(PROJECT_ROOT / RULES_DIR / "underwriting_rules_standard.json", path)
+    return path
+
+
+def bump_mtime(path):
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_snapshot_is_shared_until_the_file_changes(rules_path):
+    registry = RulesRegistry()
+    first = registry.get(str(rules_path))
+
+    assert registry.get(str(rules_path)) is first
+    assert registry.loads == 1
+
+    data = json.loads(rules_path.read_text())
+    data["underwriting_rules"]["version"] = "test"
+    rules_path.write_text(json.dumps(data))
+    bump_mtime(rules_path)
+
+    second = registry.get(str(rules_path))
+    assert second.version == "test"
+    assert second.content_hash != first.content_hash
+    assert registry.loads == 2
+
+
+def test_touched_file_keeps_its_compiled_rules(rules_path):
+    registry = RulesRegistry()
+    first = registry.get(str(rules_path))
+
+    bump_mtime(rules_path)
+    second = registry.get(str(rules_path))
+
+    assert second.mtime_ns != first.mtime_ns
+    assert second.compiled is first.compiled
+    assert registry.loads == 1
+
+
+def test_snapshot_is_read_only(rules_path):
+    snapshot = RulesRegistry().get(str(rules_path))
+
+    with pytest.raises(TypeError):
+        snapshot.rules["hard_stops"] = {}
+    assert "HS001" in snapshot.rules_by_id
+    assert "- HS001:" in snapshot.rules_text
+
+
+def test_bare_names_and_aliases_share_one_snapshot():
+    registry = RulesRegistry()
+
+    assert registry.get("underwriting_rules.json") is registry.get("config/rules/underwriting_rules_standard.json")
+    assert len(registry.cached_paths()) == 1
+
+
+@pytest.mark.parametrize("content, error", [
+    ("not json", ValueError),
+    ('{"underwriting_rules": []}', RuleValidationError),
+    ('{"underwriting_rules": {"hard_stops": {"rules": "HS001"}}}', RuleValidationError),
+])
+def test_malformed_files_are_rejected(tmp_path, content, error):
+    path = tmp_path / "rules.json"
+    path.write_text(content)
+
+    with pytest.raises(error):
+        RulesRegistry().get(str(path))
+
+
+def test_refresh_swaps_an_engines_rules(rules_path):
+    engine = UnderwritingEngine(rules_file=str(rules_path), rule_precheck=False)
+    before = engine.rules_snapshot
+
+    data = json.loads(rules_path.read_text())
+    data["underwriting_rules"]["version"] = "refreshed"
+    rules_path.write_text(json.dumps(data))
+    bump_mtime(rules_path)
+    engine.refresh_rules()
+
+    assert engine.rules_snapshot is not before
+    assert engine.rules_snapshot.version == "refreshed"
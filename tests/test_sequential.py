@@ -0,0 +1,83 @@
+"""Tests for the sequential A/B test and early-stopping comparisons."""
+
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from underwriting.core.models import UnderwritingDecision
+from underwriting.testing.ab_engine import ABTestEngine
+from underwriting.testing.sequential import SequentialOutcome, SequentialTest
+
+ACCEPT = SimpleNamespace(decision=UnderwritingDecision.ACCEPT, error=None)
+DENY = SimpleNamespace(decision=UnderwritingDecision.DENY, error=None)
+FAILED = SimpleNamespace(decision=UnderwritingDecision.ADJUDICATE, error="timeout")
+
+
+def feed(test, pairs):
+    for pair in pairs:
+        if test.add_pair(*pair) is not SequentialOutcome.CONTINUE:
+            break
+    return test.outcome
+
+
+def test_consistent_difference_is_significant():
+    test = SequentialTest()
+    assert feed(test, [(ACCEPT, DENY)] * 100) is SequentialOutcome.SIGNIFICANT
+    assert test.higher_variant == "A"
+    assert test.p_value <= 1 - test.confidence_level
+    assert test.discordant < 100
+
+
+def test_balanced_discordance_is_futile():
+    test = SequentialTest()
+    assert feed(test, [(ACCEPT, DENY), (DENY, ACCEPT)] * 100) is SequentialOutcome.FUTILE
+    assert test.p_value == 1.0
+
+
+def test_concordant_pairs_and_failures_carry_no_evidence():
+    test = SequentialTest()
+    assert feed(test, [(ACCEPT, ACCEPT), (DENY, DENY), (FAILED, ACCEPT)] * 50) is SequentialOutcome.CONTINUE
+    assert test.discordant == 0
+    assert test.skipped == 50
+
+
+def test_outcome_is_final_once_reached():
+    test = SequentialTest()
+    feed(test, [(DENY, ACCEPT)] * 100)
+    assert test.add_pair(ACCEPT, DENY) is SequentialOutcome.SIGNIFICANT
+    assert test.higher_variant == "B"
+
+
+@pytest.mark.parametrize("kwargs", [{"confidence_level": 1.0}, {"power": 0.0}, {"odds_ratio": 1.0},
+                                    {"decision_type": "maybe"}])
+def test_invalid_parameters(kwargs):
+    with pytest.raises(ValueError):
+        SequentialTest(**kwargs)
+
+
+def test_false_positive_rate_stays_within_alpha():
+    rng = random.Random(7)
+    trials = 400
+    false_positives = 0
+    for _ in range(trials):
+        test = SequentialTest(confidence_level=0.9)
+        pairs = ((ACCEPT, DENY) if rng.random() < 0.5 else (DENY, ACCEPT) for _ in range(500))
+        false_positives += feed(test, pairs) is SequentialOutcome.SIGNIFICANT
+    # Ville's bound gives at most 10%; allow for sampling noise
+    assert false_positives / trials < 0.13
+
+
+def test_sequential_comparison_stops_early(stub_llm_server, make_applicants):
+    ab_engine = ABTestEngine()
+    applicants = make_applicants(200)
+    test = SequentialTest(decision_type="deny")
+
+    pairs = ab_engine.run_sequential_comparison(applicants, "standard", "conservative", test, max_concurrency=4)
+
+    assert test.outcome is not SequentialOutcome.CONTINUE
+    assert len(pairs) < len(applicants)
+    # Evaluations still queued when the test stopped were cancelled
+    assert stub_llm_server.stats.completions < 2 * len(applicants)
+    metrics = ab_engine.calculate_comparison_metrics("standard", "conservative")
+    assert metrics.total_tests >= len(pairs)
@@ -0,0 +1,97 @@
+"""Tests for incremental parsing of streamed responses."""
+
+import asyncio
+
+import pytest
+
+from underwriting.ai.streaming import DecisionStreamParser
+from underwriting.core.engine import UnderwritingEngine
+from underwriting.core.models import UnderwritingDecision
+
+RESPONSE = ("Decision: DENY\nPrimary Reason: Multiple DUIs\nTriggered Rules: HS002\n"
+            "Risk Factors: DUI\nAdditional Notes: " + "padding " * 50)
+
+
+def chunks(text, size=7):
+    return [text[start:start + size] for start in range(0, len(text), size)]
+
+
+def test_complete_once_every_field_line_has_ended():
+    parser = DecisionStreamParser()
+
+    assert not parser.feed("Decision: ACCEPT\nPrimary Reason: Clean\nTriggered Rules: None\n")
+    # The last field's line is not known to be whole until its newline arrives
+    assert not parser.feed("Risk Factors: No")
+    assert parser.feed("ne\n")
+    assert parser.text.startswith("Decision: ACCEPT")
+
+
+def test_concise_labels_count_as_the_same_fields():
+    parser = DecisionStreamParser()
+    assert parser.feed("Decision: ACCEPT\nReason: Clean\nRules: None\nFactors: None\n")
+
+
+def test_close_reads_an_unterminated_last_line():
+    parser = DecisionStreamParser()
+    parser.feed("Decision: ACCEPT\nPrimary Reason: Clean\nTriggered Rules: None\nRisk Factors: None")
+
+    assert not parser.complete
+    assert parser.close().endswith("Risk Factors: None")
+    assert parser.complete
+
+
+def test_json_object_completes_at_its_closing_brace():
+    parser = DecisionStreamParser(json_object=True)
+
+    assert not parser.feed('Here you go: {"decision": "DENY", "reason": "a } in a string",')
+    assert not parser.feed(' "rules": {"hard": ["HS002"]}')
+    assert parser.feed('}\ntrailing text')
+
+
+def test_empty_chunks_are_ignored():
+    parser = DecisionStreamParser()
+    assert not parser.feed("")
+    assert not parser.feed(None)
+    assert parser.chunks_received == 0
+
+
+class StreamingLLM:
+    """Streams a fixed response in small chunks and counts chunks consumed."""
+
+    def __init__(self, text):
+        self.pieces = chunks(text)
+        self.sent = 0
+        self.closed = False
+
+    def stream(self, messages, **kwargs):
+        try:
+            for piece in self.pieces:
+                self.sent += 1
+                yield piece
+        finally:
+            self.closed = True
+
+    async def astream(self, messages, **kwargs):
+        try:
+            for piece in self.pieces:
+                self.sent += 1
+                yield piece
+        finally:
+            self.closed = True
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_engine_stops_reading_after_the_decision_block(make_applicants, use_async):
+    llm = StreamingLLM(RESPONSE)
+    engine = UnderwritingEngine(rule_precheck=False, streaming=True, llm_factory=lambda: llm)
+    applicant = make_applicants(1)[0]
+
+    if use_async:
+        result = asyncio.run(engine.aevaluate_applicant(applicant))
+    else:
+        result = engine.evaluate_applicant(applicant)
+
+    assert result.decision == UnderwritingDecision.DENY
+    assert result.triggered_rules == ["HS002"]
+    assert llm.sent < len(llm.pieces) // 2
+    assert llm.closed
@@ -0,0 +1,59 @@
+"""Tests for vectorized rule evaluation."""
+
+from datetime import date
+
+import pytest
+
+from benchmarks.population import random_applicant_chunks
+from underwriting.core.features import years_before
+from underwriting.core.rules_registry import get_rules_registry
+from underwriting.core.vector_rules import NO_DECISION, compile_vector_rules
+from underwriting.data.columnar import ApplicantStore
+
+AS_OF = date(2025, 6, 1)
+VARIANTS = ("conservative", "standard", "liberal")
+
+
+@pytest.fixture(scope="module")
+def population():
+    applicants = [a for chunk in random_applicant_chunks(2000, seed=11, as_of=AS_OF) for a in chunk]
+    return applicants, ApplicantStore.from_applicants(applicants)
+
+
+def snapshot(variant):
+    return get_rules_registry().get(f"underwriting_rules_{variant}.json")
+
+
+@pytest.mark.parametrize("variant", VARIANTS)
+def test_matches_the_scalar_evaluator(population, variant):
+    applicants, store = population
+    rules = snapshot(variant)
+    vector = compile_vector_rules(rules.rules).evaluate(store, AS_OF)
+
+    for index, applicant in enumerate(applicants):
+        expected = rules.compiled.evaluate(applicant, AS_OF)
+        assert vector.triggered_rules(index) == expected.triggered_rules, applicant.applicant_id
+        assert vector.decision(index) == expected.decision, applicant.applicant_id
+        assert bool(vector.exact_hard_stops[index]) == bool(expected.exact_hard_stops)
+
+
+@pytest.mark.parametrize("score", [None, 499, 500, 501, 649, 650])
+def test_credit_bounds_match_at_the_boundary(make_applicants, score):
+    applicants = make_applicants(1)
+    applicants[0].credit_score = score
+    applicants[0].primary_driver.date_of_birth = years_before(AS_OF, 40)
+    rules = snapshot("conservative")
+
+    vector = compile_vector_rules(rules.rules).evaluate(ApplicantStore.from_applicants(applicants), AS_OF)
+
+    assert vector.triggered_rules(0) == rules.compiled.evaluate(applicants[0], AS_OF).triggered_rules
+
+
+def test_summaries_count_every_applicant(population):
+    _, store = population
+    vector = compile_vector_rules(snapshot("standard").rules).evaluate(store, AS_OF)
+
+    assert sum(vector.decision_counts().values()) == len(store)
+    assert vector.decision_counts()["none"] == int((vector.decisions == NO_DECISION).sum())
+    assert set(vector.trigger_rates()) == set(vector.rule_ids)
+    assert all(0.0 <= rate <= 1.0 for rate in vector.trigger_rates().values())
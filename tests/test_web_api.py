@@ -0,0 +1,119 @@
+"""Tests for the JSON evaluation API."""
+
+import gc
+import importlib.util
+import json
+import sys
+import types
+from pathlib import Path
+
+import pytest
+from flask import Flask
+
+from underwriting.core.pool import EnginePool
+
+WEB_DIR = Path(__file__).resolve().parents[1] / "web"
+
+
+@pytest.fixture(scope="module")
+def routes():
+    """Load web/routes.py without web/__init__.py, which builds the whole app."""
+    package = types.ModuleType("web")
+    package.__path__ = [str(WEB_DIR)]
+    saved = {name: sys.modules.get(name) for name in ("web", "web.routes")}
+    sys.modules["web"] = package
+    try:
+        spec = importlib.util.spec_from_file_location("web.routes", WEB_DIR / "routes.py")
+        module = importlib.util.module_from_spec(spec)
+        sys.modules["web.routes"] = module
+        spec.loader.exec_module(module)
+    finally:
+        for name, previous in saved.items():
+            if previous is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = previous
+    return module
+
+
+@pytest.fixture
+def pool():
+    return EnginePool()
+
+
+@pytest.fixture
+def client(routes, pool):
+    app = Flask(__name__)
+    app.register_blueprint(routes.api_bp, url_prefix="/api")
+    app.extensions["engine_pool"] = pool
+    return app.test_client()
+
+
+@pytest.fixture
+def body(make_applicants):
+    data = json.loads(make_applicants(1)[0].model_dump_json())
+    data["driver"] = data.pop("primary_driver")
+    return data
+
+
+def test_evaluates_with_a_bundled_rules_file(stub_llm_server, client, pool, body):
+    for rules_file in ("underwriting_rules_liberal.json", "config/rules/underwriting_rules_liberal.json"):
+        response = client.post("/api/evaluate", json={**body, "rules_file": rules_file})
+        assert response.status_code == 200
+        assert response.get_json()["applicant_id"] == body["applicant_id"]
+
+    # Both spellings share one warm engine
+    assert len(pool._engines) == 1
+
+
+@pytest.mark.parametrize("rules_file", [
+    "/etc/passwd",
+    "../requirements.txt",
+    "config/rules/../../requirements.txt",
+    "web/routes.py",
+    "missing.json",
+    "",
+])
+def test_rules_file_outside_rules_dir_is_rejected(client, pool, body, rules_file):
+    response = client.post("/api/evaluate", json={**body, "rules_file": rules_file})
+
+    assert response.status_code == 400
+    assert not pool._engines
+
+
+@pytest.mark.parametrize("content", ["not json", "[1, 2]", '{"underwriting_rules": {"hard_stops": []}}'])
+def test_invalid_rules_content_is_a_client_error(client, body, tmp_path, monkeypatch, content):
+    rules_dir = tmp_path / "config" / "rules"
+    rules_dir.mkdir(parents=True)
+    (rules_dir / "broken.json").write_text(content)
+    monkeypatch.chdir(tmp_path)
+
+    response = client.post("/api/evaluate", json={**body, "rules_file": "broken.json"})
+
+    assert response.status_code == 400
+    assert "Invalid rules file" in response.get_json()["error"]
+
+
+def test_unknown_prompt_variant_is_rejected(client, body):
+    response = client.post("/api/evaluate", json={**body, "prompt_variant": "verbose"})
+
+    assert response.status_code == 400
+    assert "concise" in response.get_json()["allowed"]
+
+
+def test_invalid_applicant_is_rejected(client, body):
+    body["credit_score"] = "excellent"
+    response = client.post("/api/evaluate", json=body)
+
+    assert response.status_code == 400
+    assert response.get_json()["error"] == "Invalid applicant"
+
+
+def test_single_applicant_leaves_the_collector_running(routes, body, monkeypatch):
+    # gc.disable is process-wide, so a request must not toggle it under other threads
+    monkeypatch.setattr(gc, "disable", lambda: pytest.fail("collector paused for one applicant"))
+
+    applicant = routes.create_applicant_from_json(body)
+
+    assert applicant.applicant_id == body["applicant_id"]
+    assert applicant.primary_driver.driver_id == body["driver"]["driver_id"]
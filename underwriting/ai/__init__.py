@@ -16,9 +16,22 @@ from .prompts import (
     PromptTestConfiguration
 )
 
+from .cache import ResponseCache, CacheStats
+from .client import create_chat_model, create_http_client
+from .packing import use_packed_format
+from .streaming import DecisionStreamParser
+from .structured import use_structured_format
+
 __all__ = [
     "PromptVariant",
     "PromptTemplateFactory", 
-    "PromptTestConfiguration"
+    "PromptTestConfiguration",
+    "ResponseCache",
+    "CacheStats",
+    "create_chat_model",
+    "create_http_client",
+    "DecisionStreamParser",
+    "use_packed_format",
+    "use_structured_format"
 ]
 
@@ -0,0 +1,224 @@
+"""
+LLM response caching.
+
+Re-running the same applicants through the same rules and prompt produces
+the same rendered prompt, so the raw completion can be reused instead of
+paying for another model call. Entries are keyed on a hash of the fully
+rendered prompt plus the model settings used to produce it.
+
+The cache has two tiers: an in-memory LRU for the current process and an
+optional on-disk SQLite file that survives restarts and can be shared by
+the CLI, the Streamlit pages and CI runs.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+# Environment variable naming the SQLite file for the default cache
+CACHE_PATH_ENV_VAR = "UNDERWRITING_LLM_CACHE"
+
+# Number of disk writes between TTL/size pruning passes
+PRUNE_INTERVAL = 64
+
+
+@dataclass
+class CacheStats:
+    """Hit and miss counters for a ResponseCache."""
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    bypassed: int = 0
+    evictions: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.disk_hits
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ResponseCache:
+    """Two-tier (memory LRU + SQLite) cache of raw LLM responses."""
+
+    def __init__(self, path: Optional[Union[str, Path]] = None,
+                 max_memory_entries: int = 1024,
+                 max_disk_entries: Optional[int] = 100_000,
+                 ttl_seconds: Optional[float] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            path: SQLite file for the persistent tier; memory only when None
+            max_memory_entries: Capacity of the in-memory LRU tier
+            max_disk_entries: Capacity of the SQLite tier, unbounded when None
+            ttl_seconds: Entry lifetime in seconds, no expiry when None
+        """
+        self.path = str(path) if path else None
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_entries = max_disk_entries
+        self.ttl_seconds = ttl_seconds
+        self.stats = CacheStats()
+
+        self._memory: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._writes_since_prune = 0
+
+        if self.path:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS llm_responses ("
+                " key TEXT PRIMARY KEY,"
+                " response TEXT NOT NULL,"
+                " created_at REAL NOT NULL,"
+                " last_access REAL NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS idx_llm_responses_last_access"
+                " ON llm_responses (last_access)"
+            )
+            self._connection.commit()
+
+    @classmethod
+    def from_env(cls) -> Optional["ResponseCache"]:
+        """Create a persistent cache at the path in UNDERWRITING_LLM_CACHE, if set."""
+        path = os.getenv(CACHE_PATH_ENV_VAR)
+        return cls(path=path) if path else None
+
+    @staticmethod
+    def make_key(prompt: str, model_settings: Dict[str, Any]) -> str:
+        """Hash a rendered prompt together with the model settings."""
+        payload = json.dumps({"prompt": prompt, "model": model_settings},
+                             sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _expired(self, created_at: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - created_at > self.ttl_seconds
+
+    def _remember(self, key: str, response: str, created_at: float) -> None:
+        """Insert into the memory tier, evicting least recently used entries."""
+        self._memory[key] = (response, created_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+            self.stats.evictions += 1
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for a key, or None on a miss."""
+        now = time.time()
+
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if not self._expired(entry[1], now):
+                    self._memory.move_to_end(key)
+                    self.stats.memory_hits += 1
+                    return entry[0]
+                del self._memory[key]
+
+            if self._connection is not None:
+                row = self._connection.execute(
+                    "SELECT response, created_at FROM llm_responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    response, created_at = row
+                    if not self._expired(created_at, now):
+                        self._connection.execute(
+                            "UPDATE llm_responses SET last_access = ? WHERE key = ?", (now, key)
+                        )
+                        self._connection.commit()
+                        self._remember(key, response, created_at)
+                        self.stats.disk_hits += 1
+                        return response
+                    self._connection.execute("DELETE FROM llm_responses WHERE key = ?", (key,))
+                    self._connection.commit()
+
+            self.stats.misses += 1
+            return None
+
+    def set(self, key: str, response: str) -> None:
+        """Store a response in both tiers."""
+        now = time.time()
+
+        with self._lock:
+            self._remember(key, response, now)
+
+            if self._connection is not None:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO llm_responses (key, response, created_at, last_access)"
+                    " VALUES (?, ?, ?, ?)",
+                    (key, response, now, now)
+                )
+                self._writes_since_prune += 1
+                if self._writes_since_prune >= PRUNE_INTERVAL:
+                    self._prune_disk(now)
+                self._connection.commit()
+
+    def discard(self, key: str) -> None:
+        """Remove one entry from both tiers, e.g. a response that no longer parses."""
+        with self._lock:
+            self._memory.pop(key, None)
+            if self._connection is not None:
+                self._connection.execute("DELETE FROM llm_responses WHERE key = ?", (key,))
+                self._connection.commit()
+
+    def record_bypass(self) -> None:
+        """Count a lookup that was deliberately skipped."""
+        with self._lock:
+            self.stats.bypassed += 1
+
+    def _prune_disk(self, now: float) -> None:
+        """Apply TTL and size limits to the SQLite tier (lock must be held)."""
+        self._writes_since_prune = 0
+
+        if self.ttl_seconds is not None:
+            cursor = self._connection.execute(
+                "DELETE FROM llm_responses WHERE created_at < ?", (now - self.ttl_seconds,)
+            )
+            self.stats.evictions += max(cursor.rowcount, 0)
+
+        if self.max_disk_entries is not None:
+            (count,) = self._connection.execute("SELECT COUNT(*) FROM llm_responses").fetchone()
+            overflow = count - self.max_disk_entries
+            if overflow > 0:
+                self._connection.execute(
+                    "DELETE FROM llm_responses WHERE key IN ("
+                    " SELECT key FROM llm_responses ORDER BY last_access ASC LIMIT ?)",
+                    (overflow,)
+                )
+                self.stats.evictions += overflow
+
+    def clear(self) -> None:
+        """Remove every entry from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            if self._connection is not None:
+                self._connection.execute("DELETE FROM llm_responses")
+                self._connection.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            if self._connection is not None:
+                (count,) = self._connection.execute("SELECT COUNT(*) FROM llm_responses").fetchone()
+                return count
+            return len(self._memory)
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
@@ -0,0 +1,57 @@
+"""
+Chat model client construction.
+
+Building a ``ChatOpenAI`` instance creates a new OpenAI client, and without
+an explicit HTTP client each one may open its own connections. These
+helpers build a single keep-alive connection pool that many engines and
+threads can share.
+"""
+
+from typing import Any, Dict, Optional
+
+import httpx
+from langchain_openai import ChatOpenAI
+
+# Connection pool defaults for a shared client
+DEFAULT_MAX_CONNECTIONS = 32
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 16
+DEFAULT_KEEPALIVE_EXPIRY_SECONDS = 60.0
+DEFAULT_TIMEOUT_SECONDS = 60.0
+
+
+def create_http_client(max_connections: int = DEFAULT_MAX_CONNECTIONS,
+                       max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+                       keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY_SECONDS,
+                       timeout: float = DEFAULT_TIMEOUT_SECONDS) -> httpx.Client:
+    """Create a thread-safe HTTP client with a keep-alive connection pool."""
+    return httpx.Client(
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        ),
+        timeout=timeout
+    )
+
+
+def create_chat_model(settings: Dict[str, Any], api_key: Optional[str] = None,
+                      http_client: Optional[httpx.Client] = None,
+                      max_retries: Optional[int] = None) -> ChatOpenAI:
+    """
+    Create a chat model from engine LLM settings.
+
+    Args:
+        settings: Model settings such as model, temperature and max_tokens
+        api_key: OpenAI API key; read from the environment when None
+        http_client: Shared HTTP client for synchronous calls
+        max_retries: Retries inside the OpenAI client; pass 0 when the caller
+            retries itself (see ``underwriting.core.resilience``)
+    """
+    kwargs: Dict[str, Any] = dict(settings)
+    if api_key is not None:
+        kwargs["openai_api_key"] = api_key
+    if http_client is not None:
+        kwargs["http_client"] = http_client
+    if max_retries is not None:
+        kwargs["max_retries"] = max_retries
+    return ChatOpenAI(**kwargs)
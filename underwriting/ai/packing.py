@@ -0,0 +1,71 @@
+"""
+Packed multi-applicant prompts.
+
+The rules block and instructions are identical for every applicant
+evaluated under a variant. A packed prompt renders them once followed by
+several applicant blocks, each headed by its applicant ID, and asks for
+one decision per applicant tagged with the same ID. This trades a longer
+completion for far fewer round trips and input tokens per decision.
+"""
+
+import re
+from typing import Dict, Iterable, Tuple
+
+from langchain.prompts import PromptTemplate
+
+from .structured import replace_response_format
+
+# Header introducing each applicant block in a packed prompt
+APPLICANT_HEADER = "=== APPLICANT {applicant_id} ==="
+APPLICANT_HEADER_PATTERN = re.compile(r"^=== APPLICANT (\S+) ===$", re.MULTILINE)
+
+# Response format blocks for packed prompts (braces escaped for PromptTemplate)
+PACKED_LINE_FORMAT = """RESPONSE FORMAT:
+Evaluate each applicant independently. For every applicant, in the order given, respond with:
+Applicant ID: [Applicant ID from the applicant header]
+Decision: [ACCEPT/DENY/ADJUDICATE]
+Primary Reason: [Brief explanation of the main factor driving the decision]
+Triggered Rules: [List specific rule IDs that influenced the decision]
+Risk Factors: [List key risk factors identified]
+"""
+
+PACKED_JSON_FORMAT = """RESPONSE FORMAT:
+Evaluate each applicant independently. Respond with a single compact JSON array and no other text, one object per applicant in the order given:
+[{{"applicant_id": "<applicant id>", "decision": "ACCEPT|DENY|ADJUDICATE", "reason": "<primary reason>", "triggered_rules": ["<rule id>"], "risk_factors": ["<risk factor>"]}}]
+Use only rule IDs that appear in the underwriting rules.
+"""
+
+# Start of a decision block in a packed line-format response; tolerates
+# the markdown emphasis and bullets models like to add
+_APPLICANT_ID_LINE = re.compile(r"^[\s*#>-]*Applicant ID\s*:[\s*]*([^\s*]+)", re.MULTILINE)
+_DECISION_LINE = re.compile(r"^\s*Decision:\s*(ACCEPT|DENY|ADJUDICATE)\b", re.MULTILINE | re.IGNORECASE)
+
+
+def use_packed_format(template: PromptTemplate, structured: bool = False) -> PromptTemplate:
+    """Return a copy of a prompt template that requests one decision per packed applicant."""
+    return replace_response_format(template, PACKED_JSON_FORMAT if structured else PACKED_LINE_FORMAT)
+
+
+def format_packed_applicants(blocks: Iterable[Tuple[str, str]]) -> str:
+    """Join ``(applicant_id, applicant_data)`` pairs into the packed applicant section."""
+    return "\n\n".join(
+        f"{APPLICANT_HEADER.format(applicant_id=applicant_id)}{applicant_data.rstrip()}"
+        for applicant_id, applicant_data in blocks
+    )
+
+
+def split_packed_response(response_text: str) -> Dict[str, str]:
+    """Split a packed line-format response into decision blocks keyed by applicant ID.
+
+    Blocks without a recognisable ``Decision:`` line are dropped, as is any
+    repeated ID after its first block, so callers can retry exactly the
+    applicants that are missing from the result.
+    """
+    blocks: Dict[str, str] = {}
+    matches = list(_APPLICANT_ID_LINE.finditer(response_text))
+    for match, following in zip(matches, matches[1:] + [None]):
+        applicant_id = match.group(1)
+        block = response_text[match.end():following.start() if following else len(response_text)]
+        if applicant_id not in blocks and _DECISION_LINE.search(block):
+            blocks[applicant_id] = block
+    return blocks
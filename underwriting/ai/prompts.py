@@ -2,6 +2,8 @@ from langchain.prompts import PromptTemplate
 from typing import Dict, Any, List, Tuple
 from enum import Enum
 
+from .structured import use_structured_format
+
 class PromptVariant(str, Enum):
     """Prompt template variants for A/B testing."""
     CONSERVATIVE = "conservative"
@@ -51,7 +53,7 @@ Decision: [ACCEPT/DENY/ADJUDICATE]
 Primary Reason: [Conservative risk-focused explanation]
 Triggered Rules: [List specific rule IDs]
 Risk Factors: [Comprehensive list of all identified risks]
-Conservative Notes: [Additional risk considerations and concerns]
+Conservative Notes: [Optional: additional risk considerations and concerns]
 
 Evaluate this applicant with a conservative, risk-averse approach:"""
 
@@ -89,7 +91,7 @@ Decision: [ACCEPT/DENY/ADJUDICATE]
 Primary Reason: [Brief explanation of the main factor driving the decision]
 Triggered Rules: [List specific rule IDs that influenced the decision]
 Risk Factors: [List key risk factors identified]
-Additional Notes: [Any other relevant observations]
+Additional Notes: [Optional: any other relevant observations]
 
 Please evaluate the applicant now:"""
 
@@ -136,7 +138,7 @@ Decision: [ACCEPT/DENY/ADJUDICATE]
 Primary Reason: [Growth-focused explanation emphasizing positive aspects]
 Triggered Rules: [List specific rule IDs]
 Risk Factors: [Balanced view of risks and mitigating factors]
-Liberal Notes: [Opportunities for acceptance and risk mitigation]
+Liberal Notes: [Optional: opportunities for acceptance and risk mitigation]
 
 Evaluate this applicant with a growth-oriented, inclusive approach:"""
 
@@ -200,7 +202,7 @@ Decision: [ACCEPT/DENY/ADJUDICATE]
 Primary Reason: [Detailed explanation with supporting analysis]
 Triggered Rules: [Complete list of applicable rules with explanations]
 Risk Factors: [Comprehensive risk factor analysis with severity ratings]
-Detailed Analysis: [In-depth discussion of risk interactions and considerations]
+Detailed Analysis: [Optional: in-depth discussion of risk interactions and considerations]
 Recommendations: [Specific suggestions for risk mitigation or monitoring]
 
 Provide a comprehensive, detailed evaluation of this applicant:"""
@@ -244,8 +246,12 @@ Evaluate quickly and decisively:"""
         )
     
     @staticmethod
-    def get_prompt_template(variant: PromptVariant) -> PromptTemplate:
-        """Get a prompt template by variant type."""
+    def get_prompt_template(variant: PromptVariant, structured: bool = False) -> PromptTemplate:
+        """Get a prompt template by variant type.
+        
+        With ``structured`` the template asks for a JSON response instead
+        of the line-oriented format.
+        """
         
         factory_methods = {
             PromptVariant.CONSERVATIVE: PromptTemplateFactory.create_conservative_prompt,
@@ -258,7 +264,8 @@ Evaluate quickly and decisively:"""
         if variant not in factory_methods:
             raise ValueError(f"Unknown prompt variant: {variant}")
         
-        return factory_methods[variant]()
+        template = factory_methods[variant]()
+        return use_structured_format(template) if structured else template
     
     @staticmethod
     def get_all_variants() -> Dict[str, PromptTemplate]:
@@ -0,0 +1,126 @@
+"""
+Incremental parsing of streamed LLM responses.
+
+The response format puts the fields needed for a decision first
+(``Decision``, ``Primary Reason``, ``Triggered Rules``, ``Risk Factors``)
+and free-form notes last. ``DecisionStreamParser`` consumes completion
+chunks as they arrive and reports when every required field has been
+received on a complete line, so the caller can close the stream instead
+of waiting for the notes and the rest of ``max_tokens``. The CONCISE
+prompt's shorter labels (``Reason``, ``Rules``, ``Factors``) count as the
+same fields. In structured mode the answer is one JSON object, and the
+block is complete once that object's closing brace arrives.
+"""
+
+from typing import Optional, Tuple
+
+# Response fields that must be present before a decision can be parsed
+REQUIRED_FIELDS: Tuple[str, ...] = (
+    "Decision",
+    "Primary Reason",
+    "Triggered Rules",
+    "Risk Factors",
+)
+
+# Shorter labels some prompt variants (CONCISE) use for the same fields
+FIELD_ALIASES = {
+    "Primary Reason": ("Reason",),
+    "Triggered Rules": ("Rules",),
+    "Risk Factors": ("Factors",),
+}
+
+
+class DecisionStreamParser:
+    """Accumulate streamed text and detect when the decision block is complete.
+
+    With ``json_object`` set the response is expected to be a single JSON
+    object (structured mode) instead of labelled lines.
+    """
+
+    def __init__(self, required_fields: Tuple[str, ...] = REQUIRED_FIELDS, json_object: bool = False):
+        self.required_fields = required_fields
+        self.json_object = json_object
+        self._prefixes = tuple(
+            tuple(f"{label}:" for label in (field, *FIELD_ALIASES.get(field, ())))
+            for field in required_fields
+        )
+        self._seen = set()
+        # JSON scanning state: brace depth, inside a string, after a backslash, object closed
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._closed = False
+        self._chunks = []
+        self._pending = ""
+        self.chunks_received = 0
+
+    @property
+    def text(self) -> str:
+        """All text received so far."""
+        return "".join(self._chunks)
+
+    @property
+    def complete(self) -> bool:
+        """True once every required field has arrived on a finished line, or the JSON object has closed."""
+        if self.json_object:
+            return self._closed
+        return len(self._seen) == len(self._prefixes)
+
+    def feed(self, chunk: str) -> bool:
+        """Add a chunk of streamed text; return True once the decision block is complete."""
+        if not chunk:
+            return self.complete
+
+        self.chunks_received += 1
+        self._chunks.append(chunk)
+        if self.json_object:
+            self._scan_json(chunk)
+            return self.complete
+        self._pending += chunk
+
+        # Only lines terminated by a newline are known to be whole
+        *lines, self._pending = self._pending.split("\n")
+        for line in lines:
+            self._observe(line)
+
+        return self.complete
+
+    def close(self) -> str:
+        """Process any unterminated final line and return the full text."""
+        if self._pending:
+            self._observe(self._pending)
+            self._pending = ""
+        return self.text
+
+    def _scan_json(self, chunk: str) -> None:
+        """Track brace depth outside strings until the first top-level object closes."""
+        for char in chunk:
+            if self._closed:
+                return
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = self._depth > 0
+            elif char == "{":
+                self._depth += 1
+            elif char == "}" and self._depth:
+                self._depth -= 1
+                self._closed = not self._depth
+
+    def _observe(self, line: str) -> None:
+        line = line.strip()
+        for index, prefix in enumerate(self._prefixes):
+            if line.startswith(prefix):
+                self._seen.add(index)
+                break
+
+
+def chunk_text(chunk) -> Optional[str]:
+    """Extract the text content of a streamed message chunk."""
+    content = getattr(chunk, "content", chunk)
+    return content if isinstance(content, str) else None
@@ -0,0 +1,36 @@
+"""
+Structured (JSON) response prompts.
+
+The default response format is a set of ``Field: value`` lines that the
+engine scans with ``startswith``; markdown emphasis, bullets or a reason
+wrapped over several lines make that scan miss fields. In structured mode
+the prompt asks for one compact JSON object instead, which the engine
+validates with ``underwriting.core.responses``.
+"""
+
+import re
+
+from langchain.prompts import PromptTemplate
+
+# Response format block for structured prompts (braces escaped for PromptTemplate)
+JSON_RESPONSE_FORMAT = """RESPONSE FORMAT:
+Respond with a single compact JSON object and no other text:
+{{"decision": "ACCEPT|DENY|ADJUDICATE", "reason": "<primary reason>", "triggered_rules": ["<rule id>"], "risk_factors": ["<risk factor>"]}}
+Use only rule IDs that appear in the underwriting rules.
+"""
+
+# Matches the response format block of the line-oriented templates
+_FORMAT_BLOCK = re.compile(r"^(?:RESPONSE )?FORMAT:\n(?:[^\n]+\n)+", re.MULTILINE)
+
+
+def replace_response_format(template: PromptTemplate, response_format: str) -> PromptTemplate:
+    """Return a copy of a prompt template with its response format block replaced."""
+    text, count = _FORMAT_BLOCK.subn(response_format, template.template, count=1)
+    if not count:
+        text = f"{template.template.rstrip()}\n\n{response_format}"
+    return PromptTemplate(input_variables=list(template.input_variables), template=text)
+
+
+def use_structured_format(template: PromptTemplate) -> PromptTemplate:
+    """Return a copy of a prompt template that requests the JSON response format."""
+    return replace_response_format(template, JSON_RESPONSE_FORMAT)
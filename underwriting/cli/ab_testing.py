@@ -9,8 +9,10 @@ import sys
 import argparse
 import json
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from itertools import combinations
+from typing import List, Dict, Any, Optional, Tuple
 
+from underwriting.core.engine import DEFAULT_MAX_CONCURRENCY
 from underwriting.testing.ab_engine import ABTestEngine, TestConfiguration
 from underwriting.testing.statistical_analysis import StatisticalAnalyzer, BusinessImpactCalculator
 from underwriting.ai.prompts import PromptTemplateFactory, PromptTestConfiguration, PromptVariant
@@ -20,9 +22,18 @@ from underwriting.core.models import Applicant
 class ABTestRunner:
     """Main A/B testing framework runner."""
     
-    def __init__(self):
-        """Initialize the A/B test runner."""
+    def __init__(self, max_concurrency: Optional[int] = None, sequential: Optional[str] = None,
+                 min_odds_ratio: float = 2.0):
+        """Initialize the A/B test runner.
+        
+        Comparisons run concurrently when ``max_concurrency`` is set. When
+        ``sequential`` names a decision type, two-variant comparisons stop
+        early once a sequential test on that decision's rate concludes.
+        """
         self.ab_engine = ABTestEngine()
+        self.max_concurrency = max_concurrency
+        self.sequential = sequential
+        self.min_odds_ratio = min_odds_ratio
         self.statistical_analyzer = StatisticalAnalyzer()
         self.business_calculator = BusinessImpactCalculator()
         self.applicants = create_sample_applicants()
@@ -86,17 +97,41 @@ class ABTestRunner:
         print(f"Sample Size: {len(applicants)} applicants")
         
         # Run comparison
-        batch_results = self.ab_engine.run_batch_comparison(applicants, variant_a, variant_b)
+        sequential_test = None
+        if self.sequential:
+            sequential_test = self.statistical_analyzer.sequential_test(self.sequential,
+                                                                        odds_ratio=self.min_odds_ratio)
+            batch_results = self.ab_engine.run_sequential_comparison(
+                applicants, variant_a, variant_b, sequential_test,
+                max_concurrency=self.max_concurrency or DEFAULT_MAX_CONCURRENCY
+            )
+        else:
+            batch_results = self.ab_engine.run_batch_comparison(applicants, variant_a, variant_b,
+                                                                max_concurrency=self.max_concurrency)
         
         # Calculate metrics
         metrics = self.ab_engine.calculate_comparison_metrics(variant_a, variant_b)
         
+        analysis = self._analyse_comparison(metrics)
+        analysis['batch_results'] = batch_results
+        
+        if sequential_test is not None:
+            # Fixed-horizon p-values above assume the sample size was set in advance
+            sequential_result = self.statistical_analyzer.sequential_result(sequential_test)
+            print(f"\n{sequential_result.test_name} (valid under early stopping):")
+            print(f"  {sequential_result.interpretation}")
+            analysis['statistical_tests'].insert(0, sequential_result)
+        return analysis
+    
+    def _analyse_comparison(self, metrics) -> Dict[str, Any]:
+        """Print the report, statistical tests and business impact for one compared pair."""
+        
         # Print comparison report
         self.ab_engine.print_comparison_report(metrics)
         
         # Statistical analysis
-        results_a = [r for r in self.ab_engine.test_results if r.variant_id == variant_a]
-        results_b = [r for r in self.ab_engine.test_results if r.variant_id == variant_b]
+        results_a = self.ab_engine.variant_results(metrics.variant_a_id)
+        results_b = self.ab_engine.variant_results(metrics.variant_b_id)
         
         print(f"\n{'-'*50}")
         print("STATISTICAL ANALYSIS")
@@ -125,8 +160,7 @@ class ABTestRunner:
         return {
             'metrics': metrics,
             'statistical_tests': [chi_square_test, time_test],
-            'business_impact': business_impact,
-            'batch_results': batch_results
+            'business_impact': business_impact
         }
     
     def run_prompt_comparison(self, variant_a: str, variant_b: str,
@@ -141,54 +175,65 @@ class ABTestRunner:
         
         return self.run_rule_comparison(variant_a, variant_b, applicants)
     
+    def run_nway_comparison(self, variants: List[str], pairs: Optional[List[Tuple[str, str]]] = None,
+                            applicants: Optional[List[Applicant]] = None) -> Dict[str, Any]:
+        """Evaluate every variant once per applicant, then analyse each pair from those results.
+        
+        Args:
+            variants: Variant IDs or aliases to evaluate
+            pairs: Pairs to analyse in detail (default: every pair of ``variants``)
+            applicants: Applicants to evaluate (default: the sample applicants)
+        """
+        
+        if applicants is None:
+            applicants = self.applicants
+        
+        comparison = self.ab_engine.run_nway_comparison(
+            applicants, variants, max_concurrency=self.max_concurrency or DEFAULT_MAX_CONCURRENCY
+        )
+        self.ab_engine.print_agreement_matrix(comparison)
+        
+        if pairs is None:
+            pairs = list(combinations(variants, 2))
+        return {
+            f"{variant_a}_vs_{variant_b}": self._analyse_comparison(comparison.metrics(
+                self.ab_engine.resolve_variant(variant_a), self.ab_engine.resolve_variant(variant_b)
+            ))
+            for variant_a, variant_b in pairs
+        }
+    
     def run_comprehensive_test_suite(self) -> Dict[str, Any]:
-        """Run a comprehensive suite of A/B tests."""
+        """Run a comprehensive suite of A/B tests.
+        
+        Every variant taking part in any of the suite's comparisons is
+        evaluated once per applicant in a single N-way pass; each
+        comparison is then derived from that one result set.
+        """
         
         print(f"\n{'='*80}")
         print(f"COMPREHENSIVE A/B TEST SUITE")
         print(f"{'='*80}")
         
-        results = {}
-        
-        # Rule comparison tests
         rule_comparisons = [
             ("standard", "conservative"),
             ("standard", "liberal"),
             ("conservative", "liberal")
         ]
-        
-        print(f"\n{'-'*60}")
-        print("RULE COMPARISON TESTS")
-        print(f"{'-'*60}")
-        
-        for variant_a, variant_b in rule_comparisons:
-            print(f"\nRunning: {variant_a} vs {variant_b}")
-            test_key = f"rules_{variant_a}_vs_{variant_b}"
-            results[test_key] = self.run_rule_comparison(variant_a, variant_b)
-            
-            # Clear results between tests
-            self.ab_engine.clear_results()
-        
-        # Prompt comparison tests
         prompt_comparisons = [
             ("conservative", "liberal"),
             ("balanced", "detailed"),
             ("detailed", "concise")
         ]
         
-        print(f"\n{'-'*60}")
-        print("PROMPT TEMPLATE TESTS")
-        print(f"{'-'*60}")
-        
-        for variant_a, variant_b in prompt_comparisons:
-            print(f"\nRunning: {variant_a} vs {variant_b} prompts")
-            test_key = f"prompts_{variant_a}_vs_{variant_b}"
-            results[test_key] = self.run_prompt_comparison(variant_a, variant_b)
-            
-            # Clear results between tests
-            self.ab_engine.clear_results()
+        pairs = {f"rules_{variant_a}_vs_{variant_b}": (variant_a, variant_b)
+                 for variant_a, variant_b in rule_comparisons}
+        pairs.update({f"prompts_{variant_a}_vs_{variant_b}": (f"prompt_{variant_a}", f"prompt_{variant_b}")
+                      for variant_a, variant_b in prompt_comparisons})
+        variants = list(dict.fromkeys(variant for pair in pairs.values() for variant in pair))
         
-        return results
+        analyses = self.run_nway_comparison(variants, list(pairs.values()))
+        return {test_key: analyses[f"{variant_a}_vs_{variant_b}"]
+                for test_key, (variant_a, variant_b) in pairs.items()}
     
     def run_single_variant_analysis(self, variant_id: str,
                                    applicants: Optional[List[Applicant]] = None) -> Dict[str, Any]:
@@ -359,9 +404,15 @@ Examples:
   # Run prompt comparison  
   python ab_test_runner.py --prompt-comparison balanced liberal
   
+  # Stop a rule comparison early once the accept-rate difference is settled
+  python ab_test_runner.py --rule-comparison standard conservative --sequential --concurrency 8
+  
   # Run comprehensive test suite
   python ab_test_runner.py --comprehensive
   
+  # Compare several variants in a single pass
+  python ab_test_runner.py --nway standard conservative liberal prompt_balanced
+  
   # Analyze single variant
   python ab_test_runner.py --single-variant conservative
   
@@ -377,6 +428,8 @@ Examples:
                        help='Compare two prompt templates')
     parser.add_argument('--comprehensive', action='store_true',
                        help='Run comprehensive test suite')
+    parser.add_argument('--nway', nargs='+', metavar='VARIANT',
+                       help='Evaluate several variants in one pass and compare every pair')
     parser.add_argument('--single-variant', metavar='VARIANT',
                        help='Analyze single variant behavior')
     
@@ -391,6 +444,17 @@ Examples:
                        help='Statistical confidence level (default: 0.95)')
     parser.add_argument('--monthly-applications', type=int, default=10000,
                        help='Estimated monthly applications for business impact (default: 10000)')
+    parser.add_argument('--concurrency', type=int, metavar='N',
+                       help='Evaluate applicants and both variants concurrently, N calls at a time '
+                            '(default: one at a time)')
+    parser.add_argument('--sequential', nargs='?', const='accept', choices=['accept', 'deny', 'adjudicate'],
+                       metavar='DECISION',
+                       help='Stop a two-variant comparison early once a sequential test on this '
+                            "decision's rate concludes (default decision: accept)")
+    parser.add_argument('--min-odds-ratio', type=float, default=2.0,
+                       help='Smallest effect the sequential test should detect, as the ratio of '
+                            'applicants only one variant or only the other reaches the decision on '
+                            '(default: 2.0)')
     
     args = parser.parse_args()
     
@@ -401,7 +465,8 @@ Examples:
         sys.exit(1)
     
     # Initialize runner
-    runner = ABTestRunner()
+    runner = ABTestRunner(max_concurrency=args.concurrency, sequential=args.sequential,
+                          min_odds_ratio=args.min_odds_ratio)
     runner.statistical_analyzer.confidence_level = args.confidence_level
     runner.business_calculator.monthly_applications = args.monthly_applications
     
@@ -440,6 +505,11 @@ Examples:
     elif args.comprehensive:
         results = runner.run_comprehensive_test_suite()
     
+    elif args.nway:
+        if len(args.nway) < 2:
+            parser.error("--nway needs at least two variants")
+        results = runner.run_nway_comparison(args.nway)
+    
     elif args.single_variant:
         variant = args.single_variant
         result = runner.run_single_variant_analysis(variant)
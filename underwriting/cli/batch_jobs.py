@@ -0,0 +1,151 @@
+"""
+Offline batch-job command-line interface.
+
+Renders applicants into a chat-completion request JSONL for a provider
+batch job, and ingests the provider's result JSONL back into underwriting
+results. ``simulate`` answers a request file locally with the stub LLM so
+the round trip can be tested without a provider:
+
+    python -m underwriting.cli.batch_jobs export --sample --output batch_requests.jsonl
+    python -m underwriting.cli.batch_jobs simulate batch_requests.jsonl --output batch_results.jsonl
+    python -m underwriting.cli.batch_jobs ingest batch_results.jsonl --output underwriting_results.jsonl
+"""
+
+import argparse
+import sys
+from collections import Counter
+from datetime import date
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from underwriting.ai.prompts import PromptTemplateFactory, PromptVariant
+from underwriting.core.engine import UnderwritingEngine
+from underwriting.core.models import UnderwritingResult
+from underwriting.core.offline_batch import read_batch_results, write_batch_requests
+from underwriting.data.loader import iter_applicants
+from underwriting.data.sample_generator import create_sample_applicants
+
+
+def _create_engine(args) -> UnderwritingEngine:
+    """Create the engine whose prompts and parser the batch uses.
+
+    Ingest must use the same rules, prompt variant, response format and
+    as-of date as the export that produced the requests.
+    """
+    prompt_template = (PromptTemplateFactory.get_prompt_template(PromptVariant(args.prompt_variant))
+                       if args.prompt_variant else None)
+    return UnderwritingEngine(
+        rules_file=args.rules,
+        prompt_template=prompt_template,
+        structured_output=args.structured,
+        prune_rules=args.prune_rules,
+        as_of=args.as_of
+    )
+
+
+def export_command(args) -> None:
+    engine = _create_engine(args)
+    applicants = create_sample_applicants() if args.sample else iter_applicants(args.applicants)
+    summary = write_batch_requests(engine, applicants, args.output,
+                                   decided_path=args.decided if args.precheck else None)
+
+    print(f"Wrote {summary.requests} requests to {args.output}")
+    if args.precheck:
+        print(f"Decided {summary.prechecked} applicants by rule precheck -> {args.decided}")
+    if summary.duplicates:
+        print(f"Skipped {summary.duplicates} duplicate applicants")
+
+
+def ingest_command(args) -> None:
+    engine = _create_engine(args)
+    decisions = Counter()
+    errors = 0
+
+    with open(args.output, "w", encoding="utf-8") as output:
+        # Precheck decisions from the export are merged into the output
+        for path in [args.decided] if args.decided and Path(args.decided).exists() else []:
+            with open(path, encoding="utf-8") as decided:
+                for line in decided:
+                    if line.strip():
+                        result = UnderwritingResult.model_validate_json(line)
+                        decisions[result.decision.value] += 1
+                        output.write(line if line.endswith("\n") else line + "\n")
+
+        for _, result in read_batch_results(engine, args.results):
+            decisions[result.decision.value] += 1
+            errors += result.error is not None
+            output.write(result.model_dump_json() + "\n")
+
+    print(f"Wrote {sum(decisions.values())} results to {args.output}")
+    for decision, count in sorted(decisions.items()):
+        print(f"  {decision.upper():<12} {count}")
+    if errors:
+        print(f"  ({errors} failed or unparseable; included as ADJUDICATE with an error)")
+
+
+def simulate_command(args) -> None:
+    from underwriting.testing.stub_llm import StubLLMConfig, complete_batch_file
+
+    stats = complete_batch_file(args.requests, args.output,
+                                StubLLMConfig(error_rate=args.error_rate, seed=args.seed))
+    print(f"Completed {stats.completions} of {stats.requests} requests -> {args.output}")
+
+
+def main():
+    """Main entry point for the batch-job CLI."""
+
+    parser = argparse.ArgumentParser(
+        description="Export and ingest offline (file-based) LLM batch jobs"
+    )
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    engine_options = argparse.ArgumentParser(add_help=False)
+    engine_options.add_argument('--rules', default='underwriting_rules_standard.json',
+                                help='Rules file (default: underwriting_rules_standard.json)')
+    engine_options.add_argument('--prompt-variant', choices=[v.value for v in PromptVariant],
+                                help='Prompt template variant (default: engine default prompt)')
+    engine_options.add_argument('--structured', action='store_true', help='Use the JSON response format')
+    engine_options.add_argument('--prune-rules', action='store_true',
+                                help='Leave rules that cannot apply to an applicant out of its prompt')
+    engine_options.add_argument('--as-of', type=date.fromisoformat,
+                                help='Evaluation date as YYYY-MM-DD (default: today)')
+
+    export_parser = subparsers.add_parser('export', parents=[engine_options],
+                                          help='Render applicants into a batch request JSONL')
+    source = export_parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--applicants', help='Applicants as a JSON array, JSONL or CSV file')
+    source.add_argument('--sample', action='store_true', help='Use the bundled sample applicants')
+    export_parser.add_argument('--output', default='batch_requests.jsonl',
+                               help='Request JSONL to write (default: batch_requests.jsonl)')
+    export_parser.add_argument('--precheck', action='store_true',
+                               help='Decide clear hard stops locally instead of sending them')
+    export_parser.add_argument('--decided', default='batch_decided.jsonl',
+                               help='Where precheck decisions are written (default: batch_decided.jsonl)')
+    export_parser.set_defaults(handler=export_command)
+
+    ingest_parser = subparsers.add_parser('ingest', parents=[engine_options],
+                                          help='Parse a provider result JSONL into underwriting results')
+    ingest_parser.add_argument('results', help='Provider result JSONL')
+    ingest_parser.add_argument('--output', default='underwriting_results.jsonl',
+                               help='Result JSONL to write (default: underwriting_results.jsonl)')
+    ingest_parser.add_argument('--decided', help='Precheck decisions from export to merge into the output')
+    ingest_parser.set_defaults(handler=ingest_command)
+
+    simulate_parser = subparsers.add_parser('simulate', help='Answer a request JSONL locally with the stub LLM')
+    simulate_parser.add_argument('requests', help='Batch request JSONL')
+    simulate_parser.add_argument('--output', default='batch_results.jsonl',
+                                 help='Result JSONL to write (default: batch_results.jsonl)')
+    simulate_parser.add_argument('--error-rate', type=float, default=0.0,
+                                 help='Fraction of requests that fail')
+    simulate_parser.add_argument('--seed', type=int, help='Random seed for reproducible runs')
+    simulate_parser.set_defaults(handler=simulate_command)
+
+    args = parser.parse_args()
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+File-to-file evaluation command-line interface.
+
+Streams applicants from a JSON, JSONL or CSV file through the engine with
+concurrent LLM calls and appends results to a JSONL file as they
+complete. Progress is checkpointed next to the output, so re-running the
+same command after a crash or Ctrl-C resumes where it stopped. Failed
+evaluations are left out of the output and retried on every resume:
+
+    python -m underwriting.cli.evaluate_file applicants.jsonl results.jsonl --concurrency 16
+"""
+
+import argparse
+import sys
+import time
+from datetime import date
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from underwriting.ai.prompts import PromptTemplateFactory, PromptVariant
+from underwriting.core.engine import DEFAULT_MAX_CONCURRENCY, UnderwritingEngine
+from underwriting.core.exceptions import ApplicantValidationError, ConfigurationError
+from underwriting.core.file_evaluation import (
+    DEFAULT_CHECKPOINT_EVERY,
+    EvaluationCheckpoint,
+    default_checkpoint_path,
+    evaluate_file
+)
+from underwriting.data.loader import DEFAULT_CHUNK_SIZE
+
+
+def _create_engine(args) -> UnderwritingEngine:
+    """Create the engine; resuming requires the same options as the interrupted run."""
+    prompt_template = (PromptTemplateFactory.get_prompt_template(PromptVariant(args.prompt_variant))
+                       if args.prompt_variant else None)
+    return UnderwritingEngine(
+        rules_file=args.rules,
+        prompt_template=prompt_template,
+        structured_output=args.structured,
+        prune_rules=args.prune_rules,
+        as_of=args.as_of
+    )
+
+
+def main(argv=None):
+    """Main entry point for the evaluate-file CLI."""
+
+    parser = argparse.ArgumentParser(
+        prog="evaluate-file",
+        description="Evaluate every applicant in a file into a JSONL of results, resumably",
+        epilog="Applicants whose evaluation fails (e.g. rate limits or an open circuit breaker) are "
+               "not written to the output; they are recorded in the checkpoint and retried each "
+               "time the same command is re-run."
+    )
+    parser.add_argument('input', help='Applicants as a JSON array, JSONL or CSV file')
+    parser.add_argument('output', help='Result JSONL to write (appended to when resuming)')
+    parser.add_argument('--rules', default='underwriting_rules_standard.json',
+                        help='Rules file (default: underwriting_rules_standard.json)')
+    parser.add_argument('--prompt-variant', choices=[v.value for v in PromptVariant],
+                        help='Prompt template variant (default: engine default prompt)')
+    parser.add_argument('--structured', action='store_true', help='Use the JSON response format')
+    parser.add_argument('--prune-rules', action='store_true',
+                        help='Leave rules that cannot apply to an applicant out of its prompt')
+    parser.add_argument('--as-of', type=date.fromisoformat,
+                        help='Evaluation date as YYYY-MM-DD (default: today); pin it for long runs')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_MAX_CONCURRENCY,
+                        help=f'Evaluations in flight at once (default: {DEFAULT_MAX_CONCURRENCY})')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f'Input records read and validated at a time (default: {DEFAULT_CHUNK_SIZE})')
+    parser.add_argument('--checkpoint', help='Checkpoint file (default: OUTPUT.checkpoint)')
+    parser.add_argument('--checkpoint-every', type=int, default=DEFAULT_CHECKPOINT_EVERY,
+                        help=f'Results between checkpoints (default: {DEFAULT_CHECKPOINT_EVERY})')
+    parser.add_argument('--restart', action='store_true',
+                        help='Ignore an existing checkpoint and overwrite the output')
+    args = parser.parse_args(argv)
+
+    engine = _create_engine(args)
+    checkpoint_path = args.checkpoint or default_checkpoint_path(args.output)
+    resumed_from = 0
+    start = time.perf_counter()
+
+    def progress(checkpoint):
+        rate = (checkpoint.results - resumed_from) / max(time.perf_counter() - start, 1e-9)
+        print(f"\r{checkpoint.results:,} done ({rate:,.1f}/s, {checkpoint.errors} failed)",
+              end="", flush=True)
+
+    try:
+        previous = None if args.restart else EvaluationCheckpoint.load(checkpoint_path)
+        resumed_from = previous.results if previous else 0
+        summary = evaluate_file(
+            engine, args.input, args.output,
+            checkpoint_path=checkpoint_path,
+            max_concurrency=args.concurrency,
+            chunk_size=args.chunk_size,
+            checkpoint_every=args.checkpoint_every,
+            restart=args.restart,
+            progress=progress
+        )
+    except KeyboardInterrupt:
+        print(f"\nInterrupted; re-run the same command to resume from {checkpoint_path}")
+        sys.exit(130)
+    except (ApplicantValidationError, ConfigurationError) as e:
+        print(f"\nError: {e}")
+        sys.exit(1)
+
+    print()
+    if summary.resumed_from:
+        print(f"Resumed after {summary.resumed_from:,} results")
+    print(f"Evaluated {summary.evaluated:,} applicants in {summary.elapsed_seconds:.1f}s; "
+          f"{summary.total:,} results in {args.output}")
+    for decision, count in sorted(summary.decisions.items()):
+        print(f"  {decision.upper():<12} {count:,}")
+    if summary.errors:
+        print(f"{summary.errors:,} applicants failed and are not in the output; "
+              f"re-run the same command to retry them")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Stub LLM server command-line interface for load and throughput testing.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from underwriting.core.engine import LLM_BASE_URL_ENV_VAR
+from underwriting.testing.stub_llm import LatencyModel, StubLLMConfig, StubLLMServer
+
+
+def main():
+    """Main entry point for the stub LLM server CLI."""
+    
+    parser = argparse.ArgumentParser(
+        description="Start a local OpenAI-compatible stub LLM server"
+    )
+    
+    parser.add_argument('--host', default='127.0.0.1', help='Host to bind to (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8099, help='Port to bind to (default: 8099)')
+    parser.add_argument(
+        '--latency-distribution',
+        choices=['fixed', 'uniform', 'lognormal'],
+        default='lognormal',
+        help='Response latency distribution (default: lognormal)'
+    )
+    parser.add_argument('--latency-ms', type=float, default=400.0, help='Median response latency in ms (default: 400)')
+    parser.add_argument(
+        '--latency-spread',
+        type=float,
+        default=0.5,
+        help='Lognormal shape, or +/- ms for uniform (default: 0.5)'
+    )
+    parser.add_argument('--chunk-delay-ms', type=float, default=5.0, help='Delay between streamed chunks in ms (default: 5)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests answered with HTTP 500')
+    parser.add_argument('--rate-limit-rate', type=float, default=0.0, help='Fraction of requests answered with HTTP 429')
+    parser.add_argument('--retry-after', type=float, default=1.0, help='Retry-After seconds sent with 429 responses')
+    parser.add_argument(
+        '--decision',
+        choices=['rules', 'accept', 'deny', 'adjudicate'],
+        default='rules',
+        help='Decide from the rules or always return one decision (default: rules)'
+    )
+    parser.add_argument('--seed', type=int, help='Random seed for reproducible runs')
+    
+    args = parser.parse_args()
+    
+    config = StubLLMConfig(
+        latency=LatencyModel(
+            distribution=args.latency_distribution,
+            median_ms=args.latency_ms,
+            spread=args.latency_spread,
+            chunk_delay_ms=args.chunk_delay_ms
+        ),
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after_seconds=args.retry_after,
+        decision=args.decision,
+        seed=args.seed
+    )
+    server = StubLLMServer(config, host=args.host, port=args.port)
+    
+    print("Starting stub LLM server...")
+    print(f"Server will be available at: {server.base_url}")
+    print("Point the engine at it with:")
+    print(f"  export {LLM_BASE_URL_ENV_VAR}={server.base_url}")
+    print("  export OPENAI_API_KEY=stub")
+    print("\nPress Ctrl+C to stop the server")
+    
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print(f"\nServer stopped by user ({server.stats_dict()})")
+    
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
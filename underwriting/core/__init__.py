@@ -22,6 +22,41 @@ from .models import (
 )
 
 from .engine import UnderwritingEngine
+from .features import ApplicantFeatures
+from .file_evaluation import EvaluationCheckpoint, FileEvaluationSummary, evaluate_file
+from .offline_batch import (
+    BatchExportSummary,
+    read_batch_results,
+    write_batch_requests
+)
+from .pool import EnginePool
+from .rules import (
+    RuleCompiler,
+    CompiledRuleSet,
+    RuleEvaluation,
+    compile_rules
+)
+from .rate_limit import (
+    FileBucketBackend,
+    MemoryBucketBackend,
+    RateLimiter,
+    get_rate_limiter
+)
+from .resilience import (
+    CircuitBreaker,
+    HedgePolicy,
+    ResilientLLMCaller,
+    RetryPolicy,
+    classify_llm_error
+)
+from .vector_rules import VectorEvaluation, VectorRuleSet, compile_vector_rules
+from .routing import ModelRouter, RoutingPolicy, RoutingStats
+from .responses import StructuredDecision, parse_packed_structured_response, parse_structured_response
+from .rules_registry import (
+    RulesRegistry,
+    RulesSnapshot,
+    get_rules_registry
+)
 from .exceptions import (
     UnderwritingError,
     RuleValidationError,
@@ -39,8 +74,57 @@ __all__ = [
     "UnderwritingResult",
     "UnderwritingDecision",
     
+    # Features
+    "ApplicantFeatures",
+    
     # Engine
     "UnderwritingEngine",
+    "EnginePool",
+    
+    # Offline batch jobs
+    "BatchExportSummary",
+    "read_batch_results",
+    "write_batch_requests",
+    
+    # File evaluation
+    "EvaluationCheckpoint",
+    "FileEvaluationSummary",
+    "evaluate_file",
+    
+    # Rules
+    "RuleCompiler",
+    "CompiledRuleSet",
+    "RuleEvaluation",
+    "compile_rules",
+    "RulesRegistry",
+    "RulesSnapshot",
+    "get_rules_registry",
+    "VectorEvaluation",
+    "VectorRuleSet",
+    "compile_vector_rules",
+    
+    # Rate limiting
+    "FileBucketBackend",
+    "MemoryBucketBackend",
+    "RateLimiter",
+    "get_rate_limiter",
+    
+    # Resilience
+    "CircuitBreaker",
+    "HedgePolicy",
+    "ResilientLLMCaller",
+    "RetryPolicy",
+    "classify_llm_error",
+    
+    # Routing
+    "ModelRouter",
+    "RoutingPolicy",
+    "RoutingStats",
+    
+    # Responses
+    "StructuredDecision",
+    "parse_packed_structured_response",
+    "parse_structured_response",
     
     # Exceptions
     "UnderwritingError",
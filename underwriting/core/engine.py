@@ -1,47 +1,215 @@
 # Update the underwriting engine to support custom rules files and prompt templates
 
+import asyncio
+import concurrent.futures
+import hashlib
 import json
 import os
-from typing import Dict, List, Any, Optional
-from datetime import datetime
+import threading
+import time
+from dataclasses import asdict
+from typing import AbstractSet, Callable, Dict, Iterable, Iterator, List, Any, Mapping, Optional, Tuple, TypeVar, Union
+from datetime import date, datetime
 
 from langchain.prompts import PromptTemplate
-from langchain_openai import ChatOpenAI
 from langchain.schema import HumanMessage
 
 from .models import Applicant, Driver, Vehicle, Violation, Claim, UnderwritingResult, UnderwritingDecision
+from .features import ApplicantFeatures
+from .rules import CompiledRuleSet, RuleEvaluation
+from .rate_limit import RateLimiter, estimate_tokens, get_rate_limiter
+from .resilience import ResilientLLMCaller, RetryPolicy, get_circuit_breaker
+from .exceptions import LLMError
+from .routing import ESCALATE_ERROR, ESCALATE_PARSE_FAILURE, ModelRouter, RoutingPolicy
+from .responses import parse_packed_structured_response, parse_structured_response
+from .rules_registry import RulesSnapshot, format_rules_text, get_rules_registry
+from ..ai.cache import ResponseCache
+from ..ai.client import create_chat_model
+from ..ai.packing import format_packed_applicants, split_packed_response, use_packed_format
+from ..ai.streaming import DecisionStreamParser, chunk_text
+from ..ai.structured import use_structured_format
+
+# Default number of concurrent LLM requests for batch evaluation
+DEFAULT_MAX_CONCURRENCY = 8
+
+# Upper bound on distinct pruned rule texts kept per engine
+MAX_PRUNED_RULE_TEXTS = 256
+
+# Default number of applicants per packed prompt, and the completion
+# tokens allowed for each packed decision
+DEFAULT_PACK_SIZE = 8
+PACKED_TOKENS_PER_APPLICANT = 200
+
+# Default chat model settings; these also form part of the response cache key
+DEFAULT_LLM_SETTINGS = {
+    "model": "gpt-4",
+    "temperature": 0.1,
+    "max_tokens": 1000
+}
+
+# Reason given when a line-format response has no recognisable fields
+UNPARSED_REASON = "Unable to parse LLM response"
+
+# Parsed form of a completion, e.g. one result or packed results by applicant
+Parsed = TypeVar("Parsed")
+
+# Environment variable pointing the chat model at an OpenAI-compatible
+# endpoint, e.g. the stub server in underwriting.testing.stub_llm
+LLM_BASE_URL_ENV_VAR = "UNDERWRITING_LLM_BASE_URL"
+
+
+def default_llm_settings() -> Dict[str, Any]:
+    """Return the default chat model settings, honouring UNDERWRITING_LLM_BASE_URL."""
+    settings = dict(DEFAULT_LLM_SETTINGS)
+    base_url = os.getenv(LLM_BASE_URL_ENV_VAR)
+    if base_url:
+        settings["base_url"] = base_url
+    return settings
+
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_loop_lock = threading.Lock()
+
+
+def submit_coroutine(coro) -> concurrent.futures.Future:
+    """Schedule a coroutine on the shared background event loop and return its future.
+    
+    Coroutines run on one long-lived background event loop rather than a
+    fresh ``asyncio.run`` loop per call: the async HTTP clients keep pooled
+    connections bound to the loop that opened them, so they would fail
+    with connection errors on every batch after the first.
+    """
+    global _background_loop
+    with _background_loop_lock:
+        if _background_loop is None:
+            _background_loop = asyncio.new_event_loop()
+            threading.Thread(target=_background_loop.run_forever, name="underwriting-loop",
+                             daemon=True).start()
+    return asyncio.run_coroutine_threadsafe(coro, _background_loop)
+
+
+def run_coroutine(coro):
+    """Run a coroutine to completion from synchronous code; see ``submit_coroutine``."""
+    return submit_coroutine(coro).result()
+
 
 class UnderwritingEngine:
     """Enhanced underwriting engine with A/B testing support."""
     
-    def __init__(self, rules_file: str = "underwriting_rules_standard.json", prompt_template: Optional[PromptTemplate] = None):
-        """Initialize the underwriting engine with configurable rules and prompts."""
+    def __init__(self, rules_file: str = "underwriting_rules_standard.json", prompt_template: Optional[PromptTemplate] = None,
+                 rule_precheck: bool = True, response_cache: Optional[ResponseCache] = None,
+                 llm_factory: Optional[Callable[[], Any]] = None, streaming: bool = False,
+                 structured_output: bool = False, prune_rules: bool = False,
+                 resilience: Optional[ResilientLLMCaller] = None,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 routing: Optional[RoutingPolicy] = None,
+                 as_of: Optional[date] = None):
+        """Initialize the underwriting engine with configurable rules and prompts.
+        
+        When ``rule_precheck`` is enabled, hard stops whose criteria can be
+        evaluated exactly are decided in-process without calling the LLM.
+        LLM responses are cached in ``response_cache`` when one is given, or
+        in the cache named by UNDERWRITING_LLM_CACHE when that is set.
+        ``llm_factory`` supplies a shared chat model (see ``EnginePool``)
+        instead of the engine creating its own client. With ``streaming``
+        the completion is streamed and closed as soon as the decision block
+        has been received, skipping the free-form notes. With
+        ``structured_output`` the prompt requests a JSON object that is
+        validated against the loaded rule IDs. With ``prune_rules`` hard
+        stops and adjudication triggers that cannot apply to the applicant
+        are left out of the prompt.
+        
+        LLM calls go through ``resilience``, by default retrying transient
+        failures with backoff behind the endpoint's shared circuit breaker.
+        Every attempt draws from ``rate_limiter``, by default the process-wide
+        limiter configured by UNDERWRITING_LLM_RPM / UNDERWRITING_LLM_TPM.
+        
+        With a ``routing`` policy each applicant is first evaluated by the
+        policy's small model and only escalated to the large one when that
+        answer cannot be acted on; ``router.stats`` records per-tier calls,
+        latencies, escalations and an agreement audit sample. Audits run
+        on the background loop after the decision is returned; call
+        ``router.wait_for_audits()`` before reading the sample. Packed
+        evaluation always uses the engine's configured model.
         
-        # Load underwriting rules from specified JSON file
-        self.rules_file = ".\\config\\rules\\" + rules_file
-        self.rules = self._load_rules()
-        #print(f"Loaded underwriting rules from {self.rules_file}")
+        Ages, tenure and lookback windows are computed once per evaluation
+        in an ``ApplicantFeatures`` record as of ``as_of``; pinning it makes
+        prompts, rule results and cached responses reproducible, while None
+        uses the date of each evaluation.
+        """
+        
+        # Load underwriting rules from the shared registry, which parses,
+        # formats and compiles each rules file once per process
+        self.rules_file = rules_file
+        self.rules_snapshot = self._load_rules()
+        self.rule_precheck = rule_precheck
+        self.streaming = streaming
+        self.structured_output = structured_output
+        self.prune_rules = prune_rules
+        self.as_of = as_of
+        self._pruned_rules_text: Dict[Any, str] = {}
 
         # Initialize OpenAI client (lazy initialization to avoid API key issues during config listing)
         self.llm = None
+        self.llm_factory = llm_factory
+        self.llm_settings = default_llm_settings()
+        self.resilience = resilience if resilience is not None else ResilientLLMCaller(
+            retry=RetryPolicy(),
+            breaker=get_circuit_breaker(self.llm_settings.get("base_url")),
+            model=self.llm_settings["model"]
+        )
+        self.rate_limiter = rate_limiter if rate_limiter is not None else get_rate_limiter()
+        self.router = ModelRouter(routing) if routing is not None else None
+        self.response_cache = response_cache if response_cache is not None else ResponseCache.from_env()
         
         # Set prompt template
         if prompt_template:
             self.prompt_template = prompt_template
         else:
             self.prompt_template = self._create_default_prompt_template()
+        if structured_output:
+            self.prompt_template = use_structured_format(self.prompt_template)
+        self._packed_prompt_template: Optional[PromptTemplate] = None
+    
+    def _load_rules(self) -> RulesSnapshot:
+        """Fetch the current rules snapshot from the shared rules registry."""
+        return get_rules_registry().get(self.rules_file)
     
-    def _load_rules(self) -> Dict[str, Any]:
-        """Load underwriting rules from JSON file."""
+    def refresh_rules(self) -> None:
+        """Pick up a newer version of the rules file if it has changed on disk.
         
-        try:
-            with open(self.rules_file, 'r') as f:
-                data = json.load(f)
-                return data.get('underwriting_rules', {})
-        except FileNotFoundError:
-            raise FileNotFoundError(f"Rules file not found: {self.rules_file}")
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid JSON in rules file {self.rules_file}: {e}")
+        The snapshot is swapped in one assignment, so a request running
+        concurrently on a pooled engine sees either the old rules or the new
+        ones, never a mix. Code needing several parts of the rules in one
+        step should read ``rules_snapshot`` once and use that.
+        """
+        self.rules_snapshot = self._load_rules()
+    
+    @property
+    def rules(self) -> Mapping[str, Any]:
+        return self.rules_snapshot.rules
+    
+    @property
+    def compiled_rules(self) -> CompiledRuleSet:
+        return self.rules_snapshot.compiled
+    
+    def config_fingerprint(self) -> str:
+        """Hash of everything that shapes a decision: rules content, prompt, model settings and options.
+        
+        Two engines with the same fingerprint render the same prompts and
+        make the same calls, so their results are interchangeable.
+        """
+        settings = {name: value for name, value in self.llm_settings.items() if name != "base_url"}
+        config = {
+            "rules": self.rules_snapshot.content_hash,
+            "prompt": self.prompt_template.template,
+            "llm": settings,
+            "rule_precheck": self.rule_precheck,
+            "structured_output": self.structured_output,
+            "prune_rules": self.prune_rules,
+            "routing": asdict(self.router.policy) if self.router else None,
+            "as_of": self.as_of.isoformat() if self.as_of else None,
+        }
+        return hashlib.sha256(json.dumps(config, sort_keys=True, default=str).encode()).hexdigest()[:16]
     
     def _create_default_prompt_template(self) -> PromptTemplate:
         """Create the default balanced prompt template."""
@@ -71,7 +239,7 @@ Decision: [ACCEPT/DENY/ADJUDICATE]
 Primary Reason: [Brief explanation of the main factor driving the decision]
 Triggered Rules: [List specific rule IDs that influenced the decision]
 Risk Factors: [List key risk factors identified]
-Additional Notes: [Any other relevant observations]
+Additional Notes: [Optional: any other relevant observations]
 
 Please evaluate the applicant now:"""
 
@@ -80,76 +248,76 @@ Please evaluate the applicant now:"""
             template=template
         )
     
-    def _format_applicant_data(self, applicant: Applicant) -> str:
+    def extract_features(self, applicant: Applicant) -> ApplicantFeatures:
+        """Extract the applicant's features as of the engine's evaluation date."""
+        return ApplicantFeatures(applicant, self.as_of)
+    
+    def _format_applicant_data(self, applicant: Applicant,
+                               features: Optional[ApplicantFeatures] = None) -> str:
         """Format applicant data for the prompt."""
         
+        features = features or self.extract_features(applicant)
+        
         # Primary driver info
         driver = applicant.primary_driver
         driver_info = f"""
 PRIMARY DRIVER:
 - Name: {driver.first_name} {driver.last_name}
-- Age: {driver.age}
-- License Status: {driver.license_status}
-- License State: {driver.license_state}
-- Years Licensed: {driver.years_licensed}"""
+- Age: {features.age}
+- License Status: {features.license_status}
+- License State: {features.license_state}
+- Years Licensed: {features.years_licensed}"""
         
         # Violations
         violations_info = ""
-        if driver.violations:
+        if features.violations:
             violations_info = "\nVIOLATIONS:"
-            for violation in driver.violations:
-                years_ago = (datetime.now().date() - violation.date).days // 365
-                violations_info += f"\n- {violation.violation_type} ({years_ago} years ago)"
+            for violation_type, _, years_ago in features.violations:
+                violations_info += f"\n- {violation_type} ({years_ago} years ago)"
         else:
             violations_info = "\nVIOLATIONS: None"
         
         # Claims
         claims_info = ""
-        if driver.claims:
+        if features.claims:
             claims_info = "\nCLAIMS HISTORY:"
-            for claim in driver.claims:
-                years_ago = (datetime.now().date() - claim.date).days // 365
-                claims_info += f"\n- {claim.claim_type}: ${claim.amount:,} ({years_ago} years ago)"
+            for claim_type, _, amount, years_ago in features.claims:
+                claims_info += f"\n- {claim_type}: ${amount:,.0f} ({years_ago} years ago)"
         else:
             claims_info = "\nCLAIMS HISTORY: None"
         
         # Vehicles
         vehicles_info = "\nVEHICLES:"
         for vehicle in applicant.vehicles:
-            vehicles_info += f"\n- {vehicle.year} {vehicle.make} {vehicle.model} ({vehicle.vehicle_type})"
+            vehicles_info += f"\n- {vehicle.year} {vehicle.make} {vehicle.model} ({vehicle.vehicle_type.value})"
         
         # Other info
         other_info = f"""
-CREDIT SCORE: {applicant.credit_score}
-COVERAGE LAPSE: {applicant.prior_insurance_lapse_days} days
-TERRITORY: {applicant.territory}
+CREDIT SCORE: {features.credit_score}
+COVERAGE LAPSE: {features.lapse_days} days
+TERRITORY: {features.territory}
 REQUESTED COVERAGE: {applicant.coverage_requested}"""
         
         return driver_info + violations_info + claims_info + vehicles_info + other_info
     
-    def _format_rules(self) -> str:
-        """Format rules for the prompt."""
-        
-        rules_text = ""
-        
-        # Hard stops
-        if 'hard_stops' in self.rules:
-            rules_text += "HARD STOPS (Automatic Denial):\n"
-            for rule in self.rules['hard_stops'].get('rules', []):
-                rules_text += f"- {rule['rule_id']}: {rule['name']} - {rule['description']}\n"
-        
-        # Adjudication triggers
-        if 'adjudication_triggers' in self.rules:
-            rules_text += "\nADJUDICATION TRIGGERS (Manual Review Required):\n"
-            for rule in self.rules['adjudication_triggers'].get('rules', []):
-                rules_text += f"- {rule['rule_id']}: {rule['name']} - {rule['description']}\n"
-        
-        # Acceptance criteria
-        if 'acceptance_criteria' in self.rules:
-            rules_text += "\nACCEPTANCE CRITERIA (Automatic Approval):\n"
-            for rule in self.rules['acceptance_criteria'].get('rules', []):
-                rules_text += f"- {rule['rule_id']}: {rule['name']} - {rule['description']}\n"
+    def _format_rules(self, applicant: Optional[Union[Applicant, ApplicantFeatures]] = None) -> str:
+        """Format rules for the prompt, pruned to the applicant when enabled."""
+        snapshot = self.rules_snapshot
+        if not self.prune_rules or applicant is None:
+            return snapshot.rules_text
+        return self._pruned_rules(snapshot, snapshot.compiled.relevant_rule_ids(applicant, self.as_of))
+    
+    def _pruned_rules(self, snapshot: RulesSnapshot, rule_ids: AbstractSet[str]) -> str:
+        """Render ``snapshot``'s rules text limited to ``rule_ids`` in the prunable sections."""
         
+        # Applicants tend to share a few relevant-rule sets; render each once
+        key = (snapshot.content_hash, frozenset(rule_ids))
+        rules_text = self._pruned_rules_text.get(key)
+        if rules_text is None:
+            if len(self._pruned_rules_text) >= MAX_PRUNED_RULE_TEXTS:
+                self._pruned_rules_text.clear()
+            rules_text = format_rules_text(snapshot.rules, include=key[1])
+            self._pruned_rules_text[key] = rules_text
         return rules_text
     
     def _parse_llm_response(self, response_text: str, applicant_id: str) -> UnderwritingResult:
@@ -159,7 +327,7 @@ REQUESTED COVERAGE: {applicant.coverage_requested}"""
         
         # Initialize default values
         decision = UnderwritingDecision.ADJUDICATE
-        reason = "Unable to parse LLM response"
+        reason = UNPARSED_REASON
         triggered_rules = []
         risk_factors = []
         
@@ -176,15 +344,15 @@ REQUESTED COVERAGE: {applicant.coverage_requested}"""
                 elif 'ADJUDICATE' in decision_text:
                     decision = UnderwritingDecision.ADJUDICATE
             
-            elif line.startswith('Primary Reason:'):
+            elif line.startswith(('Primary Reason:', 'Reason:')):
                 reason = line.split(':', 1)[1].strip()
             
-            elif line.startswith('Triggered Rules:'):
+            elif line.startswith(('Triggered Rules:', 'Rules:')):
                 rules_text = line.split(':', 1)[1].strip()
                 if rules_text and rules_text != 'None':
                     triggered_rules = [r.strip() for r in rules_text.split(',')]
             
-            elif line.startswith('Risk Factors:'):
+            elif line.startswith(('Risk Factors:', 'Factors:')):
                 factors_text = line.split(':', 1)[1].strip()
                 if factors_text and factors_text != 'None':
                     risk_factors = [f.strip() for f in factors_text.split(',')]
@@ -198,49 +366,613 @@ REQUESTED COVERAGE: {applicant.coverage_requested}"""
             timestamp=datetime.now()
         )
     
+    def _parse_structured_response(self, response_text: str, applicant_id: str) -> UnderwritingResult:
+        """Parse a JSON response; raises LLMError if it is malformed or cites unknown rules."""
+        
+        parsed = parse_structured_response(response_text, self.rules_snapshot.rules_by_id)
+        return UnderwritingResult(
+            applicant_id=applicant_id,
+            decision=parsed.decision,
+            reason=parsed.reason,
+            triggered_rules=parsed.triggered_rules,
+            risk_factors=parsed.risk_factors,
+            timestamp=datetime.now()
+        )
+    
+    def _parse_response(self, response_text: str, applicant_id: str) -> UnderwritingResult:
+        """Parse a completion in the engine's configured response format."""
+        if self.structured_output:
+            return self._parse_structured_response(response_text, applicant_id)
+        return self._parse_llm_response(response_text, applicant_id)
+    
     def _get_llm(self):
         """Get LLM client with lazy initialization."""
         if self.llm is None:
-            self.llm = ChatOpenAI(
-                model="gpt-4",
-                temperature=0.1,
-                max_tokens=1000,
-                openai_api_key=os.getenv("OPENAI_API_KEY")
-            )
+            if self.llm_factory is not None:
+                self.llm = self.llm_factory()
+            else:
+                # Retries are handled by self.resilience
+                self.llm = create_chat_model(self.llm_settings, api_key=os.getenv("OPENAI_API_KEY"),
+                                             max_retries=0)
         return self.llm
     
-    def evaluate_applicant(self, applicant: Applicant) -> UnderwritingResult:
-        """Evaluate an applicant using the LLM and return the result."""
+    def _cache_lookup(self, prompt: str, bypass_cache: bool, overrides: Optional[Dict[str, Any]] = None):
+        """Return ``(key, cached_text)`` for a prompt; key is None when not caching."""
+        if self.response_cache is None:
+            return None, None
+        if bypass_cache:
+            self.response_cache.record_bypass()
+            return None, None
+        
+        settings = {**self.llm_settings, **overrides} if overrides else self.llm_settings
+        key = ResponseCache.make_key(prompt, settings)
+        return key, self.response_cache.get(key)
+    
+    def _stream_complete(self, messages: List[HumanMessage], overrides: Optional[Dict[str, Any]] = None) -> str:
+        """Stream a completion and stop reading once the decision block is parsed."""
+        parser = DecisionStreamParser(json_object=self.structured_output)
+        stream = self._get_llm().stream(messages, **(overrides or {}))
+        try:
+            for chunk in stream:
+                if parser.feed(chunk_text(chunk)):
+                    break
+        finally:
+            # Closing the generator closes the underlying HTTP stream
+            stream.close()
+        return parser.close()
+    
+    async def _astream_complete(self, messages: List[HumanMessage],
+                                overrides: Optional[Dict[str, Any]] = None) -> str:
+        """Async counterpart of ``_stream_complete``."""
+        parser = DecisionStreamParser(json_object=self.structured_output)
+        stream = self._get_llm().astream(messages, **(overrides or {}))
+        try:
+            async for chunk in stream:
+                if parser.feed(chunk_text(chunk)):
+                    break
+        finally:
+            await stream.aclose()
+        return parser.close()
+    
+    def _estimate_call_tokens(self, prompt: str, overrides: Optional[Dict[str, Any]] = None) -> int:
+        """Tokens to reserve for a call: the prompt plus the completion allowance."""
+        max_tokens = (overrides or {}).get("max_tokens", self.llm_settings.get("max_tokens", 0))
+        return estimate_tokens(prompt) + max_tokens
+    
+    @staticmethod
+    def _actual_tokens(prompt: str, response) -> int:
+        """Tokens a call used; a failed call (``response`` None) used no completion tokens."""
+        usage = getattr(response, "usage_metadata", None)
+        if usage and usage.get("total_tokens"):
+            return usage["total_tokens"]
+        if response is None:
+            return estimate_tokens(prompt)
+        # Streamed responses carry no usage; estimate from the text
+        text = response if isinstance(response, str) else response.content
+        return estimate_tokens(prompt) + estimate_tokens(text)
+    
+    def _should_stream(self, overrides: Optional[Dict[str, Any]]) -> bool:
+        # Calls with their own completion allowance (packed prompts) carry
+        # several decision blocks, and the stream parser stops after one
+        return self.streaming and "max_tokens" not in (overrides or {})
+    
+    def _call_llm(self, messages: List[HumanMessage], overrides: Optional[Dict[str, Any]] = None) -> str:
+        """Make one rate-limited LLM call and return the completion text.
+        
+        ``overrides`` replaces chat model settings such as ``model`` or
+        ``max_tokens`` for this call only.
+        """
+        prompt = messages[-1].content
+        reservation = (self.rate_limiter.acquire(self._estimate_call_tokens(prompt, overrides))
+                       if self.rate_limiter else None)
+        
+        response = None
+        try:
+            if self._should_stream(overrides):
+                response = self._stream_complete(messages, overrides)
+            else:
+                response = self._get_llm().invoke(messages, **(overrides or {}))
+        finally:
+            # Failed calls give back the completion allowance they reserved
+            if reservation is not None:
+                self.rate_limiter.reconcile(reservation, self._actual_tokens(prompt, response))
+        return response if isinstance(response, str) else response.content
+    
+    async def _acall_llm(self, messages: List[HumanMessage], overrides: Optional[Dict[str, Any]] = None) -> str:
+        """Async counterpart of ``_call_llm``."""
+        prompt = messages[-1].content
+        reservation = (await self.rate_limiter.aacquire(self._estimate_call_tokens(prompt, overrides))
+                       if self.rate_limiter else None)
+        
+        response = None
+        try:
+            if self._should_stream(overrides):
+                response = await self._astream_complete(messages, overrides)
+            else:
+                response = await self._get_llm().ainvoke(messages, **(overrides or {}))
+        finally:
+            if reservation is not None:
+                await self.rate_limiter.areconcile(reservation, self._actual_tokens(prompt, response))
+        return response if isinstance(response, str) else response.content
+    
+    def _parse_checked(self, response_text: str, applicant_id: str) -> Tuple[UnderwritingResult, bool]:
+        """Parse a single-applicant completion; the flag is False when no decision block was found."""
+        result = self._parse_response(response_text, applicant_id)
+        return result, result.reason != UNPARSED_REASON
+    
+    def _parse_cached(self, key: str, cached: str,
+                      parse: Callable[[str], Tuple[Parsed, bool]]) -> Optional[Tuple[Parsed, bool]]:
+        """Parse a cache hit, discarding it and returning None if it does not parse fully."""
+        try:
+            hit = parse(cached)
+        except LLMError:
+            hit = None
+        if hit is None or not hit[1]:
+            self.response_cache.discard(key)
+            return None
+        return hit
+    
+    def _complete(self, prompt: str, parse: Callable[[str], Tuple[Parsed, bool]], bypass_cache: bool = False,
+                  overrides: Optional[Dict[str, Any]] = None) -> Parsed:
+        """Return the parsed LLM completion for a prompt, using the response cache.
+        
+        ``parse`` returns the parsed completion and whether it parsed fully.
+        Only fully parsed completions are cached, so a truncated or malformed
+        answer is requested again next time instead of being replayed; one
+        that makes ``parse`` raise, such as a JSON answer failing schema
+        validation, is not cached either. A cached completion that no longer
+        parses fully is discarded and requested again.
+        """
+        key, cached = self._cache_lookup(prompt, bypass_cache, overrides)
+        if cached is not None:
+            hit = self._parse_cached(key, cached, parse)
+            if hit is not None:
+                return hit[0]
+        
+        messages = [HumanMessage(content=prompt)]
+        response_text = self.resilience.call(lambda: self._call_llm(messages, overrides))
+        parsed, complete = parse(response_text)
+        if key is not None and complete:
+            self.response_cache.set(key, response_text)
+        return parsed
+    
+    async def _acomplete(self, prompt: str, parse: Callable[[str], Tuple[Parsed, bool]],
+                         bypass_cache: bool = False, overrides: Optional[Dict[str, Any]] = None) -> Parsed:
+        """Async counterpart of ``_complete``."""
+        key, cached = self._cache_lookup(prompt, bypass_cache, overrides)
+        if cached is not None:
+            hit = self._parse_cached(key, cached, parse)
+            if hit is not None:
+                return hit[0]
+        
+        messages = [HumanMessage(content=prompt)]
+        response_text = await self.resilience.acall(lambda: self._acall_llm(messages, overrides))
+        parsed, complete = parse(response_text)
+        if key is not None and complete:
+            self.response_cache.set(key, response_text)
+        return parsed
+    
+    def _call_tier(self, prompt: str, applicant_id: str, model: str,
+                   bypass_cache: bool = False) -> UnderwritingResult:
+        """Evaluate a prompt on one routing tier's model, recording its latency."""
+        start = time.perf_counter()
+        try:
+            result = self._complete(prompt, lambda text: self._parse_checked(text, applicant_id), bypass_cache,
+                                    {"model": model})
+        except Exception:
+            self.router.record_call(model, (time.perf_counter() - start) * 1000, failed=True)
+            raise
+        self.router.record_call(model, (time.perf_counter() - start) * 1000)
+        result.model = model
+        return result
+    
+    async def _acall_tier(self, prompt: str, applicant_id: str, model: str,
+                          bypass_cache: bool = False) -> UnderwritingResult:
+        """Async counterpart of ``_call_tier``."""
+        start = time.perf_counter()
+        try:
+            result = await self._acomplete(prompt, lambda text: self._parse_checked(text, applicant_id),
+                                           bypass_cache, {"model": model})
+        except Exception:
+            self.router.record_call(model, (time.perf_counter() - start) * 1000, failed=True)
+            raise
+        self.router.record_call(model, (time.perf_counter() - start) * 1000)
+        result.model = model
+        return result
+    
+    def _escalation_reason(self, first: Optional[UnderwritingResult],
+                           error: Optional[Exception] = None) -> Optional[str]:
+        """Why a first-tier outcome needs the escalation model; re-raises errors that do not."""
+        policy = self.router.policy
+        if error is not None:
+            parse_failure = isinstance(error, LLMError) and error.kind == "invalid_response"
+            if parse_failure and policy.escalate_on_parse_failure:
+                return ESCALATE_PARSE_FAILURE
+            if not parse_failure and policy.escalate_on_error:
+                return ESCALATE_ERROR
+            raise error
+        if first.reason == UNPARSED_REASON and policy.escalate_on_parse_failure:
+            return ESCALATE_PARSE_FAILURE
+        return policy.escalation_reason(first, self.compiled_rules)
+    
+    async def _aaudit(self, prompt: str, first: UnderwritingResult, bypass_cache: bool) -> None:
+        """Re-evaluate a first-tier decision on the escalation model and record the agreement audit."""
+        try:
+            audit = await self._acall_tier(prompt, first.applicant_id, self.router.policy.escalation_model,
+                                           bypass_cache)
+        except Exception:
+            return
+        self.router.record_audit(first, audit)
+    
+    def _start_audit(self, prompt: str, first: UnderwritingResult, bypass_cache: bool) -> None:
+        """Sample a non-escalated decision for the audit, run on the background loop after it is returned."""
+        if self.router.should_audit():
+            # A copy, as callers may update the returned result
+            coro = self._aaudit(prompt, first.model_copy(deep=True), bypass_cache)
+            self.router.track_audit(submit_coroutine(coro))
+    
+    def _decide(self, prompt: str, applicant_id: str, bypass_cache: bool = False) -> UnderwritingResult:
+        """Get the decision for a rendered prompt, routing between model tiers when configured."""
+        if self.router is None:
+            return self._complete(prompt, lambda text: self._parse_checked(text, applicant_id), bypass_cache)
+        
+        policy = self.router.policy
+        try:
+            first = self._call_tier(prompt, applicant_id, policy.first_model, bypass_cache)
+            reason = self._escalation_reason(first)
+        except Exception as e:
+            first, reason = None, self._escalation_reason(None, e)
+        self.router.record_decision(reason)
+        if reason is not None:
+            return self._call_tier(prompt, applicant_id, policy.escalation_model, bypass_cache)
+        
+        self._start_audit(prompt, first, bypass_cache)
+        return first
+    
+    async def _adecide(self, prompt: str, applicant_id: str, bypass_cache: bool = False) -> UnderwritingResult:
+        """Async counterpart of ``_decide``."""
+        if self.router is None:
+            return await self._acomplete(prompt, lambda text: self._parse_checked(text, applicant_id), bypass_cache)
+        
+        policy = self.router.policy
+        try:
+            first = await self._acall_tier(prompt, applicant_id, policy.first_model, bypass_cache)
+            reason = self._escalation_reason(first)
+        except Exception as e:
+            first, reason = None, self._escalation_reason(None, e)
+        self.router.record_decision(reason)
+        if reason is not None:
+            return await self._acall_tier(prompt, applicant_id, policy.escalation_model, bypass_cache)
+        
+        self._start_audit(prompt, first, bypass_cache)
+        return first
+    
+    def evaluate_rules(self, applicant: Union[Applicant, ApplicantFeatures]) -> RuleEvaluation:
+        """Evaluate the compiled rule criteria against an applicant without the LLM."""
+        return self.compiled_rules.evaluate(applicant, self.as_of)
+    
+    def _precheck_rules(self, applicant: Union[Applicant, ApplicantFeatures]) -> Optional[UnderwritingResult]:
+        """Return a DENY result when a clear hard stop fires, otherwise None."""
+        if not self.rule_precheck:
+            return None
+        return self.evaluate_rules(applicant).to_hard_stop_result()
+    
+    def _build_prompt(self, applicant: Applicant, features: Optional[ApplicantFeatures] = None,
+                      applicant_data: Optional[str] = None) -> str:
+        """Render the full prompt for an applicant, reusing an already formatted data block if given."""
+        
+        # Format data for prompt
+        features = features or self.extract_features(applicant)
+        rules_text = self._format_rules(features)
+        applicant_data = applicant_data or self._format_applicant_data(applicant, features)
+        
+        # Create prompt
+        return self.prompt_template.format(
+            rules=rules_text,
+            applicant_data=applicant_data
+        )
+    
+    def _build_packed_prompt(self, applicants: List[Applicant]) -> str:
+        """Render one prompt carrying the rules once and a block per applicant."""
+        
+        if self._packed_prompt_template is None:
+            self._packed_prompt_template = use_packed_format(self.prompt_template, self.structured_output)
+        
+        features = [self.extract_features(applicant) for applicant in applicants]
+        
+        # A pruned packed prompt keeps every rule relevant to any packed applicant
+        snapshot = self.rules_snapshot
+        if self.prune_rules:
+            rules_text = self._pruned_rules(snapshot, frozenset().union(
+                *(snapshot.compiled.relevant_rule_ids(f) for f in features)
+            ))
+        else:
+            rules_text = snapshot.rules_text
+        
+        applicant_data = format_packed_applicants(
+            (applicant.applicant_id, self._format_applicant_data(applicant, f))
+            for applicant, f in zip(applicants, features)
+        )
+        return self._packed_prompt_template.format(rules=rules_text, applicant_data=applicant_data)
+    
+    def _parse_packed_response(self, response_text: str) -> Dict[str, UnderwritingResult]:
+        """Parse a packed completion into results keyed by applicant ID.
+        
+        Decisions that are missing or malformed are absent from the result.
+        """
+        
+        if self.structured_output:
+            return {
+                applicant_id: UnderwritingResult(
+                    applicant_id=applicant_id,
+                    decision=parsed.decision,
+                    reason=parsed.reason,
+                    triggered_rules=parsed.triggered_rules,
+                    risk_factors=parsed.risk_factors,
+                    timestamp=datetime.now()
+                )
+                for applicant_id, parsed in parse_packed_structured_response(
+                    response_text, self.rules_snapshot.rules_by_id).items()
+            }
+        return {
+            applicant_id: self._parse_llm_response(block, applicant_id)
+            for applicant_id, block in split_packed_response(response_text).items()
+        }
+    
+    def _error_result(self, applicant: Applicant, error: Exception) -> UnderwritingResult:
+        """Build the ADJUDICATE result returned when evaluation fails.
         
+        The result carries ``error`` so callers can tell a failed evaluation
+        from a genuine ADJUDICATE decision.
+        """
+        return UnderwritingResult(
+            applicant_id=applicant.applicant_id,
+            decision=UnderwritingDecision.ADJUDICATE,
+            reason=f"System error: {str(error)}",
+            triggered_rules=[],
+            risk_factors=["System Error"],
+            timestamp=datetime.now(),
+            error=str(error)
+        )
+    
+    @staticmethod
+    def _record_time_to_decision(result: UnderwritingResult, start: float) -> UnderwritingResult:
+        """Stamp a result with the time elapsed since ``start`` (perf_counter)."""
+        result.time_to_decision_ms = (time.perf_counter() - start) * 1000
+        return result
+    
+    def evaluate_applicant(self, applicant: Applicant, bypass_cache: bool = False,
+                           features: Optional[ApplicantFeatures] = None,
+                           applicant_data: Optional[str] = None) -> UnderwritingResult:
+        """Evaluate an applicant using the LLM and return the result.
+        
+        Set ``bypass_cache`` to force a fresh model call, e.g. when measuring
+        response variance. The result's ``time_to_decision_ms`` records how
+        long it took to reach the decision. Callers evaluating one applicant
+        with several engines can pass the ``features`` (extracted as of this
+        engine's date) and formatted ``applicant_data`` they share.
+        """
+        
+        start = time.perf_counter()
         try:
-            # Format data for prompt
-            rules_text = self._format_rules()
-            applicant_data = self._format_applicant_data(applicant)
+            # One feature pass serves the precheck, rule pruning and the prompt
+            features = features or self.extract_features(applicant)
             
-            # Create prompt
-            prompt = self.prompt_template.format(
-                rules=rules_text,
-                applicant_data=applicant_data
-            )
+            # Clear hard stops are decided without an LLM round trip
+            result = self._precheck_rules(features)
+            if result is None:
+                prompt = self._build_prompt(applicant, features, applicant_data)
+                
+                # Call LLM and parse response
+                result = self._decide(prompt, applicant.applicant_id, bypass_cache)
             
-            # Call LLM
-            llm = self._get_llm()
-            response = llm.invoke([HumanMessage(content=prompt)])
-            response_text = response.content
+        except Exception as e:
+            # Return error result
+            result = self._error_result(applicant, e)
+        
+        return self._record_time_to_decision(result, start)
+    
+    async def aevaluate_applicant(self, applicant: Applicant, bypass_cache: bool = False,
+                                  features: Optional[ApplicantFeatures] = None,
+                                  applicant_data: Optional[str] = None) -> UnderwritingResult:
+        """Evaluate an applicant using the chat model's async interface; see ``evaluate_applicant``."""
+        
+        start = time.perf_counter()
+        try:
+            features = features or self.extract_features(applicant)
+            result = self._precheck_rules(features)
+            if result is None:
+                prompt = self._build_prompt(applicant, features, applicant_data)
+                
+                result = await self._adecide(prompt, applicant.applicant_id, bypass_cache)
             
-            # Parse response
-            result = self._parse_llm_response(response_text, applicant.applicant_id)
+        except Exception as e:
+            result = self._error_result(applicant, e)
+        
+        return self._record_time_to_decision(result, start)
+    
+    async def _aevaluate_pack(self, applicants: List[Applicant],
+                              bypass_cache: bool = False) -> List[UnderwritingResult]:
+        """Evaluate applicants with one packed LLM call, retrying gaps individually."""
+        
+        if len(applicants) == 1:
+            return [await self.aevaluate_applicant(applicants[0], bypass_cache)]
+        
+        start = time.perf_counter()
+        try:
+            prompt = self._build_packed_prompt(applicants)
             
-            return result
+            def parse(text: str) -> Tuple[Dict[str, UnderwritingResult], bool]:
+                # A pack missing any applicant's decision is not worth replaying
+                packed = self._parse_packed_response(text)
+                return packed, all(applicant.applicant_id in packed
+                                   and packed[applicant.applicant_id].reason != UNPARSED_REASON
+                                   for applicant in applicants)
             
-        except Exception as e:
-            # Return error result
-            return UnderwritingResult(
-                applicant_id=applicant.applicant_id,
-                decision=UnderwritingDecision.ADJUDICATE,
-                reason=f"System error: {str(e)}",
-                triggered_rules=[],
-                risk_factors=["System Error"],
-                timestamp=datetime.now()
+            parsed = await self._acomplete(
+                prompt, parse, bypass_cache, {"max_tokens": PACKED_TOKENS_PER_APPLICANT * len(applicants)}
             )
-
+        except Exception:
+            # Every applicant in a failed pack gets its own attempt below
+            parsed = {}
+        
+        results = []
+        for applicant in applicants:
+            result = parsed.get(applicant.applicant_id)
+            if result is None or result.reason == UNPARSED_REASON:
+                # Retried one at a time so the pack stays one call in flight
+                result = await self.aevaluate_applicant(applicant, bypass_cache)
+            else:
+                result = self._record_time_to_decision(result, start)
+            results.append(result)
+        return results
+    
+    @staticmethod
+    def _split_packs(applicants: List[Applicant], indices: Iterable[int], pack_size: int) -> List[List[int]]:
+        """Group applicant indices into packs of at most ``pack_size`` with unique applicant IDs."""
+        packs: List[List[int]] = []
+        pack: List[int] = []
+        pack_ids = set()
+        for index in indices:
+            applicant_id = applicants[index].applicant_id
+            if len(pack) == pack_size or applicant_id in pack_ids:
+                packs.append(pack)
+                pack, pack_ids = [], set()
+            pack.append(index)
+            pack_ids.add(applicant_id)
+        if pack:
+            packs.append(pack)
+        return packs
+    
+    async def aevaluate_packed(self, applicants: Iterable[Applicant],
+                               pack_size: int = DEFAULT_PACK_SIZE,
+                               max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                               bypass_cache: bool = False) -> List[UnderwritingResult]:
+        """Evaluate applicants ``pack_size`` at a time in packed prompts.
+        
+        Each packed prompt carries the rules once and one block per
+        applicant, and the model returns one decision per applicant ID.
+        Hard stops are decided by the precheck before packing, and any
+        applicant whose decision is missing or malformed is re-evaluated on
+        its own. Results are returned in input order, with at most
+        ``max_concurrency`` packs in flight.
+        """
+        
+        if pack_size < 1:
+            raise ValueError("pack_size must be at least 1")
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        
+        applicants = list(applicants)
+        results: List[Optional[UnderwritingResult]] = [None] * len(applicants)
+        
+        # Clear hard stops never reach the model
+        remaining = []
+        for index, applicant in enumerate(applicants):
+            start = time.perf_counter()
+            try:
+                result = self._precheck_rules(applicant)
+            except Exception as e:
+                result = self._error_result(applicant, e)
+            if result is None:
+                remaining.append(index)
+            else:
+                results[index] = self._record_time_to_decision(result, start)
+        
+        packs = self._split_packs(applicants, remaining, pack_size)
+        pending = iter(packs)
+        
+        async def worker():
+            for pack in pending:
+                pack_results = await self._aevaluate_pack([applicants[index] for index in pack], bypass_cache)
+                for index, result in zip(pack, pack_results):
+                    results[index] = result
+        
+        workers = min(max_concurrency, len(packs))
+        await asyncio.gather(*(worker() for _ in range(workers)))
+        
+        return results
+    
+    def evaluate_packed(self, applicants: Iterable[Applicant],
+                        pack_size: int = DEFAULT_PACK_SIZE,
+                        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                        bypass_cache: bool = False) -> List[UnderwritingResult]:
+        """Evaluate a batch of applicants in packed prompts; see ``aevaluate_packed``."""
+        return run_coroutine(self.aevaluate_packed(applicants, pack_size, max_concurrency, bypass_cache))
+    
+    async def aevaluate_batch(self, applicants: Iterable[Applicant],
+                              max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                              bypass_cache: bool = False) -> List[UnderwritingResult]:
+        """Evaluate applicants with at most ``max_concurrency`` LLM calls in flight.
+        
+        Results are returned in input order. Only ``max_concurrency`` worker
+        tasks are created regardless of batch size.
+        """
+        
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        
+        applicants = list(applicants)
+        results: List[Optional[UnderwritingResult]] = [None] * len(applicants)
+        pending = iter(enumerate(applicants))
+        
+        async def worker():
+            # Workers share one iterator, so each index is claimed exactly once
+            for index, applicant in pending:
+                results[index] = await self.aevaluate_applicant(applicant, bypass_cache)
+        
+        workers = min(max_concurrency, len(applicants))
+        await asyncio.gather(*(worker() for _ in range(workers)))
+        
+        return results
+    
+    def evaluate_batch(self, applicants: Iterable[Applicant],
+                       max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                       bypass_cache: bool = False) -> List[UnderwritingResult]:
+        """Evaluate a batch of applicants concurrently and return results in input order.
+        
+        This blocks on the shared background event loop; code that is
+        already async should await ``aevaluate_batch`` instead.
+        """
+        return run_coroutine(self.aevaluate_batch(applicants, max_concurrency, bypass_cache))
+    
+    def evaluate_stream(self, applicants: Iterable[Applicant],
+                        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                        bypass_cache: bool = False) -> Iterator[Tuple[int, UnderwritingResult]]:
+        """Evaluate applicants concurrently, yielding ``(input index, result)`` as each completes.
+        
+        Applicants are pulled from the iterable only as evaluation slots
+        free up, and a new one is not started until the caller has taken
+        a finished result. At most ``max_concurrency`` applicants are held
+        at once, however long the input is.
+        """
+        
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        
+        inputs = enumerate(applicants)
+        pending: Dict[concurrent.futures.Future, Tuple[int, Applicant]] = {}
+        
+        def submit_next() -> None:
+            item = next(inputs, None)
+            if item is not None:
+                index, applicant = item
+                pending[submit_coroutine(self.aevaluate_applicant(applicant, bypass_cache))] = (index, applicant)
+        
+        try:
+            for _ in range(max_concurrency):
+                submit_next()
+            while pending:
+                done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    index, applicant = pending.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        result = self._error_result(applicant, e)
+                    yield index, result
+                    submit_next()
+        finally:
+            # Abandoned early (e.g. the caller stopped iterating): drop in-flight calls
+            for future in pending:
+                future.cancel()
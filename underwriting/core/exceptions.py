@@ -59,8 +59,12 @@ class RuleValidationError(UnderwritingError):
 class LLMError(UnderwritingError):
     """Raised when LLM operations fail or return invalid responses."""
     
+    # Error kinds worth retrying: the provider may succeed on a later attempt
+    RETRYABLE_KINDS = frozenset({"rate_limit", "timeout", "connection", "server"})
+    
     def __init__(self, message: str, provider: str = None, model: str = None, 
-                 response_text: str = None):
+                 response_text: str = None, kind: str = "unknown",
+                 status_code: int = None, retry_after: float = None):
         """
         Initialize LLM error.
         
@@ -69,12 +73,18 @@ class LLMError(UnderwritingError):
             provider: LLM provider (e.g., "openai")
             model: Model name (e.g., "gpt-4")
             response_text: Raw LLM response that caused the error
+            kind: Error category (rate_limit, timeout, connection, server,
+                client, invalid_response, circuit_open or unknown)
+            status_code: HTTP status returned by the provider, if any
+            retry_after: Seconds the provider asked us to wait, if any
         """
-        details = {}
+        details = {"kind": kind}
         if provider:
             details["provider"] = provider
         if model:
             details["model"] = model
+        if status_code:
+            details["status_code"] = status_code
         if response_text:
             details["response_text"] = response_text[:500]  # Truncate for logging
             
@@ -86,6 +96,14 @@ class LLMError(UnderwritingError):
         self.provider = provider
         self.model = model
         self.response_text = response_text
+        self.kind = kind
+        self.status_code = status_code
+        self.retry_after = retry_after
+    
+    @property
+    def retryable(self) -> bool:
+        """True when the same request may succeed if retried."""
+        return self.kind in self.RETRYABLE_KINDS
 
 
 class ConfigurationError(UnderwritingError):
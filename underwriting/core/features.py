@@ -0,0 +1,157 @@
+"""
+Precomputed applicant features.
+
+``ApplicantFeatures`` is a compact ``__slots__`` record extracted from an
+applicant in one pass against an explicit as-of date: age, licence
+tenure, dated violations and claims with their age in years, lapse,
+credit and vehicle class. Rule evaluation, rule pruning, prompt rendering
+and summaries all read from the same record, so one evaluation never
+mixes "today"s and a pinned as-of date makes prompts, and therefore
+cached responses, reproducible.
+"""
+
+from datetime import date
+from typing import Any, Dict, FrozenSet, Iterable, Mapping, Optional, Sequence, Tuple, Union
+
+from .models import Applicant, ClaimType
+
+# Violation severity and vehicle classes used when the rules do not define them
+DEFAULT_VIOLATION_SEVERITY: Mapping[str, Tuple[str, ...]] = {
+    "major": ("DUI", "reckless_driving", "hit_and_run", "vehicular_homicide"),
+    "moderate": ("speeding_15_over", "improper_passing", "following_too_close"),
+    "minor": ("speeding_10_under", "improper_turn", "parking_violation"),
+}
+DEFAULT_MAJOR_VIOLATIONS = DEFAULT_VIOLATION_SEVERITY["major"]
+
+# Vehicle classes from most to least risky
+VEHICLE_CLASSES: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("high_performance", ("supercar", "racing", "modified")),
+    ("sports_car", ("sports_car", "convertible", "performance")),
+    ("luxury", ("luxury_sedan", "luxury_suv")),
+    ("standard", ("sedan", "suv", "minivan", "pickup")),
+)
+
+# Lookback windows reported by ApplicantFeatures.summary
+SUMMARY_LOOKBACK_YEARS = (3, 5)
+
+
+def years_before(as_of: date, years: int) -> date:
+    """Return the date ``years`` calendar years before ``as_of``."""
+    try:
+        return as_of.replace(year=as_of.year - years)
+    except ValueError:
+        # 29 February in a non-leap target year
+        return as_of.replace(year=as_of.year - years, day=28)
+
+
+def full_years_between(start: date, as_of: date) -> int:
+    """Whole calendar years from ``start`` to ``as_of``."""
+    return as_of.year - start.year - ((as_of.month, as_of.day) < (start.month, start.day))
+
+
+def vehicle_class(vehicle_types: Iterable[str]) -> Optional[str]:
+    """Riskiest vehicle class among the given vehicle types, or None without vehicles."""
+    types = set(vehicle_types)
+    for name, members in VEHICLE_CLASSES:
+        if not types.isdisjoint(members):
+            return name
+    return None
+
+
+class ApplicantFeatures:
+    """Features of an applicant's primary driver as of one date, with memoised window counts."""
+
+    __slots__ = ("applicant_id", "as_of", "age", "years_licensed", "license_status", "license_state",
+                 "credit_score", "lapse_days", "fraud_history", "territory", "vehicle_types",
+                 "vehicle_values", "vehicle_class", "violations", "claims", "_counts")
+
+    def __init__(self, applicant: Applicant, as_of: Optional[date] = None):
+        driver = applicant.primary_driver
+        as_of = as_of or date.today()
+        self.applicant_id = applicant.applicant_id
+        self.as_of = as_of
+
+        self.age = full_years_between(driver.date_of_birth, as_of)
+        # An entered tenure wins over the one implied by the issue date
+        self.years_licensed = (driver.years_licensed if driver.years_licensed is not None
+                               else full_years_between(driver.license_issue_date, as_of))
+        self.license_status = driver.license_status.value
+        self.license_state = driver.license_state
+        self.credit_score = applicant.credit_score
+        self.lapse_days = applicant.prior_insurance_lapse_days
+        self.fraud_history = applicant.fraud_history
+        self.territory = applicant.territory
+
+        self.vehicle_types = frozenset(v.vehicle_type.value for v in applicant.vehicles)
+        self.vehicle_values = [v.value for v in applicant.vehicles if v.value is not None]
+        self.vehicle_class = vehicle_class(self.vehicle_types)
+
+        # (type, date, years ago) and (type, date, amount, years ago), oldest first
+        self.violations: Tuple[Tuple[str, date, int], ...] = tuple(sorted(
+            ((v.violation_type.value, v.violation_date, full_years_between(v.violation_date, as_of))
+             for v in driver.violations),
+            key=lambda violation: violation[1]
+        ))
+        self.claims: Tuple[Tuple[str, date, float, int], ...] = tuple(sorted(
+            ((c.claim_type.value, c.claim_date, c.claim_amount, full_years_between(c.claim_date, as_of))
+             for c in driver.claims),
+            key=lambda claim: claim[1]
+        ))
+        self._counts: Dict[Tuple[str, Any, int], int] = {}
+
+    @classmethod
+    def of(cls, applicant: Union[Applicant, "ApplicantFeatures"],
+           as_of: Optional[date] = None) -> "ApplicantFeatures":
+        """Return ``applicant`` if it already is a features record, else extract one."""
+        if isinstance(applicant, cls):
+            return applicant
+        return cls(applicant, as_of)
+
+    def violation_count(self, types: Optional[FrozenSet[str]], lookback_years: int,
+                        exclude: bool = False) -> int:
+        """Count violations within the lookback window, optionally filtered by type."""
+        key = ("violations", (types, exclude), lookback_years)
+        if key not in self._counts:
+            cutoff = years_before(self.as_of, lookback_years)
+            self._counts[key] = sum(
+                1 for vtype, vdate, _ in self.violations
+                if vdate >= cutoff and (types is None or ((vtype in types) != exclude))
+            )
+        return self._counts[key]
+
+    def claim_count(self, claim_type: str, lookback_years: int) -> int:
+        """Count claims of one type within the lookback window."""
+        key = ("claims", claim_type, lookback_years)
+        if key not in self._counts:
+            cutoff = years_before(self.as_of, lookback_years)
+            self._counts[key] = sum(
+                1 for ctype, cdate, _, _ in self.claims
+                if ctype == claim_type and cdate >= cutoff
+            )
+        return self._counts[key]
+
+    def violations_by_severity(self, lookback_years: int,
+                               severity: Mapping[str, Sequence[str]] = DEFAULT_VIOLATION_SEVERITY
+                               ) -> Dict[str, int]:
+        """Violation counts per severity level within the lookback window."""
+        return {level: self.violation_count(frozenset(types), lookback_years)
+                for level, types in severity.items()}
+
+    def summary(self, lookbacks: Iterable[int] = SUMMARY_LOOKBACK_YEARS) -> Dict[str, Any]:
+        """Flat feature dictionary for statistics and reporting."""
+        summary: Dict[str, Any] = {
+            "applicant_id": self.applicant_id,
+            "as_of": self.as_of.isoformat(),
+            "age": self.age,
+            "years_licensed": self.years_licensed,
+            "license_status": self.license_status,
+            "credit_score": self.credit_score,
+            "lapse_days": self.lapse_days,
+            "fraud_history": self.fraud_history,
+            "vehicle_class": self.vehicle_class,
+        }
+        for years in lookbacks:
+            for level, count in self.violations_by_severity(years).items():
+                summary[f"{level}_violations_{years}y"] = count
+            summary[f"at_fault_claims_{years}y"] = self.claim_count(ClaimType.AT_FAULT.value, years)
+        return summary
@@ -0,0 +1,244 @@
+"""
+Streaming file-to-file evaluation with resumable checkpoints.
+
+``evaluate_file`` reads applicants from a JSON, JSONL or CSV file in
+chunks, evaluates them concurrently with ``UnderwritingEngine.evaluate_stream``
+and appends one result per line to a JSONL output as each completes.
+Memory stays bounded by the read chunk and the number of calls in
+flight, not the size of the input.
+
+Progress is saved to a checkpoint file next to the output. Because
+results complete out of order, it records a watermark (every input
+record before it is done), the indices completed beyond it, and the
+output length covering exactly those results. On resume the output is
+truncated to that length and reading restarts at the watermark, so only
+applicants finished after the last checkpoint are evaluated again.
+
+Failed evaluations (``result.error`` set, e.g. after a rate-limit storm
+or with the circuit breaker open) are not written as final decisions.
+Their indices are kept in the checkpoint and retried on every resume
+until they succeed.
+"""
+
+import json
+import os
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Optional, Set, Union
+
+from ..data.loader import DEFAULT_CHUNK_SIZE, iter_applicants
+from .engine import DEFAULT_MAX_CONCURRENCY, UnderwritingEngine
+from .exceptions import ConfigurationError
+
+CHECKPOINT_VERSION = 2
+CHECKPOINT_SUFFIX = ".checkpoint"
+
+# Results written between checkpoints
+DEFAULT_CHECKPOINT_EVERY = 100
+
+
+@dataclass
+class EvaluationCheckpoint:
+    """Resumable progress of one input file into one output file.
+
+    Every input record before ``watermark`` and every index in
+    ``completed`` has been attempted. Those not in ``failed`` have their
+    result within the first ``output_bytes`` bytes of the output.
+    """
+    input_path: str
+    output_path: str
+    fingerprint: str
+    watermark: int = 0
+    completed: Set[int] = field(default_factory=set)
+    output_bytes: int = 0
+    decisions: Counter = field(default_factory=Counter)
+    failed: Set[int] = field(default_factory=set)
+
+    @property
+    def results(self) -> int:
+        """Applicants with a result in the output."""
+        return self.watermark + len(self.completed) - len(self.failed)
+
+    @property
+    def errors(self) -> int:
+        """Applicants whose evaluation failed and awaits a retry."""
+        return len(self.failed)
+
+    def is_done(self, index: int) -> bool:
+        return index < self.watermark or index in self.completed
+
+    def mark_done(self, index: int) -> None:
+        if self.is_done(index):
+            return
+        self.completed.add(index)
+        while self.watermark in self.completed:
+            self.completed.remove(self.watermark)
+            self.watermark += 1
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the checkpoint atomically (temp file, fsync, rename)."""
+        data = {
+            "version": CHECKPOINT_VERSION,
+            "input_path": self.input_path,
+            "output_path": self.output_path,
+            "fingerprint": self.fingerprint,
+            "watermark": self.watermark,
+            "completed": sorted(self.completed),
+            "output_bytes": self.output_bytes,
+            "decisions": dict(self.decisions),
+            "failed": sorted(self.failed),
+        }
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as handle:
+            json.dump(data, handle)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> Optional["EvaluationCheckpoint"]:
+        if not Path(path).exists():
+            return None
+        with open(path, encoding="utf-8") as handle:
+            data = json.load(handle)
+        # Version 1 wrote failed evaluations to the output; they stay there
+        if data.get("version") not in (1, CHECKPOINT_VERSION):
+            raise ConfigurationError(f"Unsupported checkpoint version: {data.get('version')}",
+                                     config_file=str(path))
+        return cls(
+            input_path=data["input_path"],
+            output_path=data["output_path"],
+            fingerprint=data["fingerprint"],
+            watermark=data["watermark"],
+            completed=set(data["completed"]),
+            output_bytes=data["output_bytes"],
+            decisions=Counter(data["decisions"]),
+            failed=set(data.get("failed", ()))
+        )
+
+
+@dataclass
+class FileEvaluationSummary:
+    """Outcome of an ``evaluate_file`` run.
+
+    ``evaluated`` counts evaluations this run, including retries and
+    failures; ``errors`` counts applicants still failed and left out of
+    the output.
+    """
+    evaluated: int
+    resumed_from: int
+    decisions: Dict[str, int]
+    errors: int
+    elapsed_seconds: float
+    # Applicants with a result in the output, from this run and earlier ones
+    total: int = 0
+
+
+def default_checkpoint_path(output_path: Union[str, Path]) -> str:
+    return f"{output_path}{CHECKPOINT_SUFFIX}"
+
+
+def evaluate_file(engine: UnderwritingEngine, input_path: Union[str, Path], output_path: Union[str, Path],
+                  checkpoint_path: Optional[Union[str, Path]] = None,
+                  max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                  chunk_size: int = DEFAULT_CHUNK_SIZE,
+                  checkpoint_every: int = DEFAULT_CHECKPOINT_EVERY,
+                  restart: bool = False,
+                  progress: Optional[Callable[[EvaluationCheckpoint], None]] = None) -> FileEvaluationSummary:
+    """Evaluate every applicant in ``input_path`` into a JSONL of results.
+
+    Args:
+        engine: Engine to evaluate with; resuming requires the same configuration fingerprint
+        input_path: Applicants as JSON, JSONL or CSV
+        output_path: Result JSONL, one UnderwritingResult per line in completion order
+        checkpoint_path: Checkpoint file (default: output path + ".checkpoint")
+        max_concurrency: Evaluations in flight at once
+        chunk_size: Input records validated per read
+        checkpoint_every: Results between checkpoints
+        restart: Ignore an existing checkpoint and start from the beginning
+        progress: Called with the checkpoint each time one is saved
+
+    Raises:
+        ConfigurationError: The checkpoint belongs to different files or an engine configuration
+        ApplicantValidationError: An input record is invalid; the run can be resumed once it is fixed
+    """
+    checkpoint_path = str(checkpoint_path or default_checkpoint_path(output_path))
+    fingerprint = engine.config_fingerprint()
+    checkpoint = None if restart else EvaluationCheckpoint.load(checkpoint_path)
+
+    if checkpoint is not None:
+        if checkpoint.fingerprint != fingerprint:
+            raise ConfigurationError(
+                "Checkpoint was written with a different engine configuration; "
+                "use the same options or restart", config_file=checkpoint_path
+            )
+        if Path(checkpoint.input_path).resolve() != Path(input_path).resolve():
+            raise ConfigurationError(f"Checkpoint is for input {checkpoint.input_path}",
+                                     config_file=checkpoint_path)
+        if not Path(output_path).exists() or os.path.getsize(output_path) < checkpoint.output_bytes:
+            raise ConfigurationError("Output file is missing or shorter than its checkpoint",
+                                     config_file=checkpoint_path)
+    else:
+        checkpoint = EvaluationCheckpoint(str(input_path), str(output_path), fingerprint)
+
+    resumed_from = checkpoint.results
+    already_done = set(checkpoint.completed)
+    retry = set(checkpoint.failed)
+    start = time.perf_counter()
+    evaluated = 0
+
+    mode = "r+b" if resumed_from else "wb"
+    with open(output_path, mode) as output:
+        # Drop results written after the last checkpoint; they are redone
+        output.truncate(checkpoint.output_bytes)
+        output.seek(checkpoint.output_bytes)
+
+        # evaluate_stream numbers what it is given; map its positions back to
+        # input indices, holding only the applicants still in flight
+        positions: Dict[int, int] = {}
+
+        def remaining():
+            # Failed applicants before the watermark are read again for their retry
+            start_index = min(retry, default=checkpoint.watermark)
+            start_index = min(start_index, checkpoint.watermark)
+            records = iter_applicants(input_path, chunk_size, skip=start_index)
+            position = 0
+            for index, applicant in enumerate(records, start_index):
+                if index in retry or (index >= checkpoint.watermark and index not in already_done):
+                    positions[position] = index
+                    position += 1
+                    yield applicant
+
+        def save() -> None:
+            output.flush()
+            os.fsync(output.fileno())
+            checkpoint.output_bytes = output.tell()
+            checkpoint.save(checkpoint_path)
+            if progress:
+                progress(checkpoint)
+
+        for position, result in engine.evaluate_stream(remaining(), max_concurrency):
+            index = positions.pop(position)
+            if result.error is not None:
+                checkpoint.failed.add(index)
+            else:
+                output.write(result.model_dump_json().encode() + b"\n")
+                checkpoint.decisions[result.decision.value] += 1
+                checkpoint.failed.discard(index)
+            checkpoint.mark_done(index)
+            evaluated += 1
+            if evaluated % checkpoint_every == 0:
+                save()
+        if evaluated % checkpoint_every or not evaluated:
+            save()
+
+    return FileEvaluationSummary(
+        evaluated=evaluated,
+        resumed_from=resumed_from,
+        decisions=dict(checkpoint.decisions),
+        errors=checkpoint.errors,
+        elapsed_seconds=time.perf_counter() - start,
+        total=checkpoint.results
+    )
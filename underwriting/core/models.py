@@ -65,6 +65,7 @@ class Vehicle(BaseModel):
     model: str
     category: VehicleCategory
     vehicle_type: VehicleCategory
+    value: Optional[float] = None
 
 class Driver(BaseModel):
     driver_id: str
@@ -84,7 +85,9 @@ class Driver(BaseModel):
         today = date.today()
         return today.year - self.license_issue_date.year - ((today.month, today.day) < (self.license_issue_date.month, self.license_issue_date.day))
     
-    years_licensed: int = years_licensed_calc
+    # As entered; None when only license_issue_date is known, and
+    # ApplicantFeatures then derives it at its as-of date
+    years_licensed: Optional[int] = None
 
     @property
     def age(self) -> int:
@@ -113,4 +116,8 @@ class UnderwritingResult(BaseModel):
     triggered_rules: List[str] = Field(default_factory=list)
     risk_factors: List[str] = Field(default_factory=list)
     timestamp: datetime = Field(default_factory=datetime.now)
+    time_to_decision_ms: Optional[float] = None
+    error: Optional[str] = None
+    # Model that made the decision when tiered routing is enabled
+    model: Optional[str] = None
 
@@ -0,0 +1,160 @@
+"""
+File-based (offline) batch jobs.
+
+Overnight re-underwriting does not need interactive latency, and batch
+APIs such as OpenAI's Batch API process a JSONL file of chat-completion
+requests within a completion window at half the price of synchronous
+calls. ``write_batch_requests`` renders the engine's prompt for each
+applicant into one request line with a stable ``custom_id``;
+``read_batch_results`` turns the provider's result JSONL back into
+``UnderwritingResult`` objects with the engine's own response parser.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+from .engine import UnderwritingEngine
+from .exceptions import LLMError
+from .models import Applicant, UnderwritingDecision, UnderwritingResult
+
+# Endpoint every request line targets
+CHAT_COMPLETIONS_URL = "/v1/chat/completions"
+
+# Hex digits of the prompt hash kept in a custom_id
+CUSTOM_ID_HASH_LENGTH = 16
+
+
+def batch_custom_id(applicant_id: str, prompt: str) -> str:
+    """Stable request ID: the applicant ID plus a hash of the exact prompt.
+
+    Re-exporting the same applicants under the same rules, prompt and model
+    yields the same IDs, while a changed prompt yields a new one.
+    """
+    digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:CUSTOM_ID_HASH_LENGTH]
+    return f"{applicant_id}-{digest}"
+
+
+def applicant_id_from_custom_id(custom_id: str) -> str:
+    """Recover the applicant ID from a ``batch_custom_id``."""
+    return custom_id.rpartition("-")[0] or custom_id
+
+
+def build_batch_request(engine: UnderwritingEngine, applicant: Applicant) -> Dict[str, Any]:
+    """Render one chat-completion batch request line for an applicant."""
+    prompt = engine._build_prompt(applicant)
+    settings = engine.llm_settings
+    return {
+        "custom_id": batch_custom_id(applicant.applicant_id, prompt),
+        "method": "POST",
+        "url": CHAT_COMPLETIONS_URL,
+        "body": {
+            "model": settings["model"],
+            "temperature": settings["temperature"],
+            "max_tokens": settings["max_tokens"],
+            "messages": [{"role": "user", "content": prompt}]
+        }
+    }
+
+
+@dataclass
+class BatchExportSummary:
+    """Counts from writing a batch request file."""
+    requests: int = 0
+    prechecked: int = 0
+    duplicates: int = 0
+
+
+def write_batch_requests(engine: UnderwritingEngine, applicants: Iterable[Applicant],
+                         requests_path: Union[str, Path],
+                         decided_path: Optional[Union[str, Path]] = None) -> BatchExportSummary:
+    """
+    Write batch request JSONL for applicants.
+
+    Args:
+        engine: Engine whose rules, prompt template and model settings are used
+        applicants: Applicants to render, streamed one at a time
+        requests_path: Request JSONL to write
+        decided_path: When given, applicants decided by the rule precheck are
+            written here as result JSONL instead of being sent to the model
+
+    Returns:
+        Counts of requests written, prechecked applicants and skipped
+        duplicates (same applicant and prompt, hence the same custom_id)
+    """
+    summary = BatchExportSummary()
+    seen = set()
+    decided: Optional[IO[str]] = open(decided_path, "w", encoding="utf-8") if decided_path else None
+    try:
+        with open(requests_path, "w", encoding="utf-8") as requests_file:
+            for applicant in applicants:
+                if decided is not None:
+                    result = engine._precheck_rules(applicant)
+                    if result is not None:
+                        decided.write(result.model_dump_json() + "\n")
+                        summary.prechecked += 1
+                        continue
+
+                request = build_batch_request(engine, applicant)
+                if request["custom_id"] in seen:
+                    summary.duplicates += 1
+                    continue
+                seen.add(request["custom_id"])
+                requests_file.write(json.dumps(request, separators=(",", ":")) + "\n")
+                summary.requests += 1
+    finally:
+        if decided is not None:
+            decided.close()
+    return summary
+
+
+def _result_error(applicant_id: str, message: str) -> UnderwritingResult:
+    return UnderwritingResult(
+        applicant_id=applicant_id,
+        decision=UnderwritingDecision.ADJUDICATE,
+        reason=f"System error: {message}",
+        triggered_rules=[],
+        risk_factors=["System Error"],
+        timestamp=datetime.now(),
+        error=message
+    )
+
+
+def parse_batch_result_line(engine: UnderwritingEngine, line: Union[str, Dict[str, Any]]) -> UnderwritingResult:
+    """Convert one provider result line into an UnderwritingResult.
+
+    Failed requests and unparseable completions become ADJUDICATE results
+    carrying ``error``, as in interactive evaluation.
+    """
+    record = json.loads(line) if isinstance(line, str) else line
+    applicant_id = applicant_id_from_custom_id(record.get("custom_id", ""))
+
+    error = record.get("error")
+    response = record.get("response") or {}
+    if error or response.get("status_code", 200) != 200:
+        detail = error or (response.get("body") or {}).get("error") or {}
+        message = detail.get("message", "unknown error") if isinstance(detail, dict) else str(detail)
+        return _result_error(applicant_id, f"Batch request failed: {message}")
+
+    try:
+        content = response["body"]["choices"][0]["message"]["content"]
+    except (KeyError, IndexError, TypeError):
+        return _result_error(applicant_id, "Batch result has no completion")
+
+    try:
+        return engine._parse_response(content, applicant_id)
+    except LLMError as e:
+        return _result_error(applicant_id, str(e))
+
+
+def read_batch_results(engine: UnderwritingEngine,
+                       results_path: Union[str, Path]) -> Iterator[Tuple[str, UnderwritingResult]]:
+    """Yield ``(custom_id, result)`` for every line of a provider result JSONL."""
+    with open(results_path, encoding="utf-8") as results_file:
+        for line in results_file:
+            if line.strip():
+                record = json.loads(line)
+                yield record.get("custom_id", ""), parse_batch_result_line(engine, record)
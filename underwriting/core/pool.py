@@ -0,0 +1,133 @@
+"""
+Application-scoped pool of warm underwriting engines.
+
+Web requests and worker threads ask the pool for an engine by rules file
+and prompt variant instead of constructing one. Engines are created once
+per key and every engine in the pool shares a single chat model client,
+so requests reuse open keep-alive connections rather than paying for a new
+client, connection and TLS handshake each time.
+"""
+
+import os
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from .engine import UnderwritingEngine, default_llm_settings
+from .rate_limit import RateLimiter, get_rate_limiter
+from .resilience import ResilientLLMCaller, RetryPolicy, get_circuit_breaker
+from .rules_registry import resolve_rules_path
+from ..ai.cache import ResponseCache
+from ..ai.client import DEFAULT_MAX_CONNECTIONS, create_chat_model, create_http_client
+from ..ai.prompts import PromptTemplateFactory, PromptVariant
+
+# Pool key used when an engine runs the engine's default prompt
+DEFAULT_PROMPT_KEY = "default"
+
+
+class EnginePool:
+    """Thread-safe cache of UnderwritingEngines sharing one LLM client."""
+
+    def __init__(self, llm_settings: Optional[Dict[str, Any]] = None,
+                 response_cache: Optional[ResponseCache] = None,
+                 max_connections: int = DEFAULT_MAX_CONNECTIONS,
+                 rule_precheck: bool = True, streaming: bool = False,
+                 structured_output: bool = False, prune_rules: bool = False,
+                 resilience: Optional[ResilientLLMCaller] = None,
+                 rate_limiter: Optional[RateLimiter] = None):
+        """
+        Initialize the pool.
+
+        Args:
+            llm_settings: Model settings shared by every pooled engine
+            response_cache: Response cache shared by every pooled engine
+            max_connections: Size of the shared HTTP connection pool
+            rule_precheck: Whether pooled engines decide clear hard stops locally
+            streaming: Whether pooled engines stream and stop at the decision block
+            structured_output: Whether pooled engines request JSON responses
+            prune_rules: Whether pooled engines omit rules that cannot apply
+            resilience: Retry, circuit breaker and hedging policy shared by pooled engines
+            rate_limiter: RPM/TPM budget shared by pooled engines; the
+                process-wide limiter from the environment by default
+        """
+        self.llm_settings = dict(llm_settings or default_llm_settings())
+        self.response_cache = response_cache if response_cache is not None else ResponseCache.from_env()
+        self.max_connections = max_connections
+        self.rule_precheck = rule_precheck
+        self.streaming = streaming
+        self.structured_output = structured_output
+        self.prune_rules = prune_rules
+        self.resilience = resilience if resilience is not None else ResilientLLMCaller(
+            retry=RetryPolicy(),
+            breaker=get_circuit_breaker(self.llm_settings.get("base_url")),
+            model=self.llm_settings.get("model")
+        )
+        self.rate_limiter = rate_limiter if rate_limiter is not None else get_rate_limiter()
+
+        self._engines: Dict[Tuple[str, str], UnderwritingEngine] = {}
+        self._lock = threading.Lock()
+        self._llm = None
+        self._http_client = None
+
+    def get_llm(self):
+        """Return the shared chat model, creating it on first use."""
+        if self._llm is None:
+            with self._lock:
+                if self._llm is None:
+                    self._http_client = create_http_client(max_connections=self.max_connections)
+                    self._llm = create_chat_model(
+                        self.llm_settings,
+                        api_key=os.getenv("OPENAI_API_KEY"),
+                        http_client=self._http_client,
+                        max_retries=0
+                    )
+        return self._llm
+
+    def get(self, rules_file: str, prompt_variant: Optional[str] = None) -> UnderwritingEngine:
+        """Return the warm engine for a rules file and prompt variant."""
+        key = (str(resolve_rules_path(rules_file)), prompt_variant or DEFAULT_PROMPT_KEY)
+
+        engine = self._engines.get(key)
+        if engine is None:
+            with self._lock:
+                engine = self._engines.get(key)
+                if engine is None:
+                    engine = self._create_engine(rules_file, prompt_variant)
+                    self._engines[key] = engine
+        else:
+            # Cheap mtime check; picks up edited rules files
+            engine.refresh_rules()
+
+        return engine
+
+    def _create_engine(self, rules_file: str, prompt_variant: Optional[str]) -> UnderwritingEngine:
+        """Build an engine wired to the shared client and cache."""
+        prompt_template = None
+        if prompt_variant:
+            prompt_template = PromptTemplateFactory.get_prompt_template(PromptVariant(prompt_variant))
+
+        engine = UnderwritingEngine(
+            rules_file=rules_file,
+            prompt_template=prompt_template,
+            rule_precheck=self.rule_precheck,
+            response_cache=self.response_cache,
+            llm_factory=self.get_llm,
+            streaming=self.streaming,
+            structured_output=self.structured_output,
+            prune_rules=self.prune_rules,
+            resilience=self.resilience,
+            rate_limiter=self.rate_limiter
+        )
+        engine.llm_settings = dict(self.llm_settings)
+        return engine
+
+    def __len__(self) -> int:
+        return len(self._engines)
+
+    def close(self) -> None:
+        """Release pooled engines and close the shared HTTP client."""
+        with self._lock:
+            self._engines.clear()
+            self._llm = None
+            if self._http_client is not None:
+                self._http_client.close()
+                self._http_client = None
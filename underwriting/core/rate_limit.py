@@ -0,0 +1,225 @@
+"""
+Request and token rate limiting for LLM calls.
+
+OpenAI enforces requests-per-minute (RPM) and tokens-per-minute (TPM)
+limits per organisation, so every engine in a process, and every worker
+process on a host, has to draw from one budget. ``RateLimiter`` keeps two
+token buckets that refill continuously. Each call reserves one request and
+an estimate of its tokens up front, sleeps off any deficit, and reconciles
+the estimate with the actual usage afterwards. Throughput then settles
+just under the limit instead of oscillating on 429 responses.
+
+The bucket state lives in a backend: ``MemoryBucketBackend`` shares it
+across threads, and ``FileBucketBackend`` keeps it in a small file guarded
+by an exclusive ``flock`` so several processes can share it. The async
+methods take that file lock in a worker thread so they never block the
+event loop.
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+from .exceptions import ConfigurationError
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+# Environment variables configuring the process-wide limiter
+RPM_ENV_VAR = "UNDERWRITING_LLM_RPM"
+TPM_ENV_VAR = "UNDERWRITING_LLM_TPM"
+RATE_LIMIT_FILE_ENV_VAR = "UNDERWRITING_RATE_LIMIT_FILE"
+
+# Rough characters-per-token ratio for English prompts
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate for a piece of text."""
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+@dataclass(frozen=True)
+class Reservation:
+    """Capacity taken for one call, used to reconcile actual usage."""
+    tokens: int
+    wait_seconds: float
+
+
+class MemoryBucketBackend:
+    """Bucket state shared by the threads of one process."""
+
+    # Updates hold a lock only for a few arithmetic operations
+    blocking = False
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._state: Optional[Tuple[float, float, float]] = None
+
+    def update(self, apply) -> float:
+        """Atomically replace the ``(requests, tokens, updated_at)`` state via ``apply``."""
+        with self._lock:
+            self._state, result = apply(self._state)
+            return result
+
+
+class FileBucketBackend:
+    """Bucket state in a file, shared by processes through an exclusive flock."""
+
+    # Updates wait for other processes holding the flock
+    blocking = True
+
+    def __init__(self, path: Union[str, Path]):
+        if fcntl is None:
+            raise ConfigurationError("File-backed rate limiting requires fcntl (POSIX)",
+                                     config_key=RATE_LIMIT_FILE_ENV_VAR)
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._thread_lock = threading.Lock()
+
+    def update(self, apply) -> float:
+        """Atomically replace the ``(requests, tokens, updated_at)`` state via ``apply``."""
+        with self._thread_lock, open(self.path, "a+") as handle:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+            try:
+                handle.seek(0)
+                raw = handle.read()
+                state = tuple(json.loads(raw)) if raw else None
+                state, result = apply(state)
+                handle.seek(0)
+                handle.truncate()
+                handle.write(json.dumps(state))
+                handle.flush()
+                return result
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+class RateLimiter:
+    """Continuous-refill token buckets for requests and tokens per minute."""
+
+    def __init__(self, requests_per_minute: Optional[float] = None,
+                 tokens_per_minute: Optional[float] = None,
+                 backend: Optional[Union[MemoryBucketBackend, FileBucketBackend]] = None):
+        """
+        Initialize the limiter; a limit of None is not enforced.
+
+        Args:
+            requests_per_minute: Request budget (RPM)
+            tokens_per_minute: Token budget (TPM)
+            backend: Where bucket state lives; in-process memory by default
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.backend = backend or MemoryBucketBackend()
+
+    def _refill(self, state, now: float) -> Tuple[float, float]:
+        """Bucket levels at ``now``; a missing state starts full."""
+        request_capacity = self.requests_per_minute or 0.0
+        token_capacity = self.tokens_per_minute or 0.0
+        if state is None:
+            return request_capacity, token_capacity
+
+        requests, tokens, updated_at = state
+        elapsed = max(now - updated_at, 0.0)
+        requests = min(request_capacity, requests + elapsed * request_capacity / 60)
+        tokens = min(token_capacity, tokens + elapsed * token_capacity / 60)
+        return requests, tokens
+
+    async def _aupdate(self, apply) -> float:
+        """Run a backend update without blocking the event loop on a file lock."""
+        if getattr(self.backend, "blocking", True):
+            return await asyncio.to_thread(self.backend.update, apply)
+        return self.backend.update(apply)
+
+    def _reserve_update(self, tokens: int):
+        """Backend update debiting one request and ``tokens``; yields seconds to wait for the deficit."""
+
+        def apply(state):
+            now = time.time()
+            requests, token_level = self._refill(state, now)
+            requests -= 1
+            token_level -= tokens
+
+            wait = 0.0
+            if self.requests_per_minute and requests < 0:
+                wait = max(wait, -requests * 60 / self.requests_per_minute)
+            if self.tokens_per_minute and token_level < 0:
+                wait = max(wait, -token_level * 60 / self.tokens_per_minute)
+            return (requests, token_level, now), wait
+
+        return apply
+
+    def acquire(self, tokens: int) -> Reservation:
+        """Reserve capacity for a call, blocking until it is available."""
+        wait = self.backend.update(self._reserve_update(tokens))
+        if wait > 0:
+            time.sleep(wait)
+        return Reservation(tokens=tokens, wait_seconds=wait)
+
+    async def aacquire(self, tokens: int) -> Reservation:
+        """Async counterpart of ``acquire``."""
+        wait = await self._aupdate(self._reserve_update(tokens))
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return Reservation(tokens=tokens, wait_seconds=wait)
+
+    def _reconcile_update(self, reservation: Reservation, actual_tokens: int):
+        """Backend update settling ``reservation`` against ``actual_tokens``."""
+
+        def apply(state):
+            now = time.time()
+            requests, token_level = self._refill(state, now)
+            token_level = min(self.tokens_per_minute, token_level + reservation.tokens - actual_tokens)
+            return (requests, token_level, now), 0.0
+
+        return apply
+
+    def reconcile(self, reservation: Reservation, actual_tokens: int) -> None:
+        """Return over-estimated tokens to the bucket, or debit the shortfall."""
+        if not self.tokens_per_minute or actual_tokens == reservation.tokens:
+            return
+        self.backend.update(self._reconcile_update(reservation, actual_tokens))
+
+    async def areconcile(self, reservation: Reservation, actual_tokens: int) -> None:
+        """Async counterpart of ``reconcile``."""
+        if not self.tokens_per_minute or actual_tokens == reservation.tokens:
+            return
+        await self._aupdate(self._reconcile_update(reservation, actual_tokens))
+
+
+_default_limiter: Optional[RateLimiter] = None
+_default_limiter_lock = threading.Lock()
+_default_limiter_loaded = False
+
+
+def get_rate_limiter() -> Optional[RateLimiter]:
+    """Return the process-wide limiter configured from the environment, if any.
+
+    ``UNDERWRITING_LLM_RPM`` and ``UNDERWRITING_LLM_TPM`` set the limits;
+    ``UNDERWRITING_RATE_LIMIT_FILE`` shares the budget between processes.
+    """
+    global _default_limiter, _default_limiter_loaded
+    if _default_limiter_loaded:
+        return _default_limiter
+
+    with _default_limiter_lock:
+        if not _default_limiter_loaded:
+            rpm = os.getenv(RPM_ENV_VAR)
+            tpm = os.getenv(TPM_ENV_VAR)
+            if rpm or tpm:
+                path = os.getenv(RATE_LIMIT_FILE_ENV_VAR)
+                _default_limiter = RateLimiter(
+                    requests_per_minute=float(rpm) if rpm else None,
+                    tokens_per_minute=float(tpm) if tpm else None,
+                    backend=FileBucketBackend(path) if path else None
+                )
+            _default_limiter_loaded = True
+    return _default_limiter
@@ -0,0 +1,358 @@
+"""
+Fault handling around LLM calls.
+
+Provider failures are classified into ``LLMError`` kinds so that transient
+ones (rate limits, timeouts, dropped connections, 5xx) are retried with
+exponential backoff and full jitter, while permanent ones (bad requests,
+authentication) fail immediately. A circuit breaker shared by every engine
+talking to the same endpoint fails fast while the provider is down, and an
+optional hedging policy sends a duplicate request when the first one is
+slower than the observed p95, taking whichever answer arrives first.
+"""
+
+import asyncio
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Deque, Dict, Optional, TypeVar
+
+from .exceptions import LLMError
+
+try:
+    import openai
+except ImportError:  # pragma: no cover - openai ships with langchain-openai
+    openai = None
+
+T = TypeVar("T")
+
+# HTTP statuses that indicate a transient provider-side problem
+RETRYABLE_STATUS_CODES = frozenset({408, 409, 429, 500, 502, 503, 504})
+
+# Error kinds that count against the circuit breaker; rate limits mean
+# "slow down", not "provider is down"
+BREAKER_KINDS = frozenset({"timeout", "connection", "server"})
+
+
+def _retry_after(response) -> Optional[float]:
+    """Read a Retry-After header (seconds) from an HTTP response, if present."""
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+def classify_llm_error(error: BaseException, model: Optional[str] = None) -> LLMError:
+    """Map an exception raised by an LLM call onto an ``LLMError`` kind."""
+    if isinstance(error, LLMError):
+        return error
+
+    status_code = getattr(error, "status_code", None)
+    retry_after = _retry_after(getattr(error, "response", None))
+
+    if openai is not None and isinstance(error, openai.APITimeoutError):
+        kind = "timeout"
+    elif openai is not None and isinstance(error, openai.APIConnectionError):
+        kind = "connection"
+    elif isinstance(error, (TimeoutError, asyncio.TimeoutError)):
+        kind = "timeout"
+    elif isinstance(error, ConnectionError):
+        kind = "connection"
+    elif status_code == 429:
+        kind = "rate_limit"
+    elif status_code in RETRYABLE_STATUS_CODES or (status_code or 0) >= 500:
+        kind = "server"
+    elif status_code is not None:
+        kind = "client"
+    else:
+        kind = "unknown"
+
+    return LLMError(
+        f"{type(error).__name__}: {error}",
+        provider="openai",
+        model=model,
+        kind=kind,
+        status_code=status_code,
+        retry_after=retry_after
+    )
+
+
+@dataclass
+class RetryPolicy:
+    """Exponential backoff with full jitter."""
+    max_attempts: int = 4
+    base_delay: float = 0.5
+    max_delay: float = 20.0
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Seconds to wait before retry number ``attempt`` (1-based)."""
+        backoff = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+        if retry_after is not None:
+            return min(max(backoff, retry_after), self.max_delay)
+        return backoff
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker with a single half-open probe."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """
+        Initialize the breaker.
+
+        Args:
+            failure_threshold: Consecutive provider failures that open the circuit
+            reset_timeout: Seconds to stay open before letting a probe through
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def before_call(self) -> None:
+        """Raise ``LLMError(kind="circuit_open")`` instead of calling a failing provider."""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return
+            if self.state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                self._probe_in_flight = False
+            if self.state == self.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return
+            raise LLMError("Circuit open: LLM provider is failing, not sending request",
+                           kind="circuit_open")
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = self.CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self, error: LLMError) -> None:
+        with self._lock:
+            if error.kind not in BREAKER_KINDS:
+                # Not evidence of an outage; just release a half-open probe
+                self._probe_in_flight = False
+                return
+            self._failures += 1
+            if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._probe_in_flight = False
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(endpoint: Optional[str] = None) -> CircuitBreaker:
+    """Return the process-wide circuit breaker for an endpoint (None = default API)."""
+    key = endpoint or "default"
+    with _breakers_lock:
+        breaker = _breakers.get(key)
+        if breaker is None:
+            breaker = _breakers[key] = CircuitBreaker()
+        return breaker
+
+
+@dataclass
+class HedgePolicy:
+    """When to send a duplicate request for a slow call.
+
+    A fixed ``delay`` (seconds) is used if given; otherwise the hedge fires
+    at the ``percentile`` of recent successful call latencies once
+    ``min_samples`` have been observed.
+    """
+    delay: Optional[float] = None
+    percentile: float = 0.95
+    min_samples: int = 20
+    window: int = 200
+    max_hedges: int = 1
+
+
+@dataclass
+class ResilienceStats:
+    """Counters for a ResilientLLMCaller."""
+    calls: int = 0
+    retries: int = 0
+    failures: int = 0
+    short_circuits: int = 0
+    hedges: int = 0
+    hedge_wins: int = 0
+
+
+class ResilientLLMCaller:
+    """Runs LLM calls with classification, retries, a circuit breaker and hedging."""
+
+    def __init__(self, retry: Optional[RetryPolicy] = None,
+                 breaker: Optional[CircuitBreaker] = None,
+                 hedge: Optional[HedgePolicy] = None,
+                 model: Optional[str] = None):
+        """
+        Initialize the caller.
+
+        Args:
+            retry: Backoff policy; a single attempt when None
+            breaker: Circuit breaker, usually shared per endpoint
+            hedge: Hedging policy; no duplicate requests when None
+            model: Model name recorded on classified errors
+        """
+        self.retry = retry or RetryPolicy(max_attempts=1)
+        self.breaker = breaker
+        self.hedge = hedge
+        self.model = model
+        self.stats = ResilienceStats()
+
+        self._latencies: Deque[float] = deque(maxlen=hedge.window if hedge else 1)
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self.stats, counter, getattr(self.stats, counter) + 1)
+
+    def _record_latency(self, seconds: float) -> None:
+        if self.hedge is not None:
+            with self._lock:
+                self._latencies.append(seconds)
+
+    def hedge_delay(self) -> Optional[float]:
+        """Seconds to wait before hedging, or None when hedging is off or not yet calibrated."""
+        if self.hedge is None:
+            return None
+        if self.hedge.delay is not None:
+            return self.hedge.delay
+        with self._lock:
+            if len(self._latencies) < self.hedge.min_samples:
+                return None
+            ordered = sorted(self._latencies)
+        return ordered[min(int(len(ordered) * self.hedge.percentile), len(ordered) - 1)]
+
+    def _before_attempt(self) -> None:
+        if self.breaker is not None:
+            try:
+                self.breaker.before_call()
+            except LLMError:
+                self._count("short_circuits")
+                raise
+
+    def _after_failure(self, error: BaseException, attempt: int) -> float:
+        """Classify a failure; return the backoff delay or raise when giving up."""
+        llm_error = classify_llm_error(error, self.model)
+        if self.breaker is not None:
+            self.breaker.record_failure(llm_error)
+        if not llm_error.retryable or attempt >= self.retry.max_attempts:
+            self._count("failures")
+            if llm_error is error:
+                raise llm_error
+            raise llm_error from error
+        self._count("retries")
+        return self.retry.delay(attempt, llm_error.retry_after)
+
+    def _after_success(self, started: float) -> None:
+        self._record_latency(time.perf_counter() - started)
+        if self.breaker is not None:
+            self.breaker.record_success()
+
+    def call(self, fn: Callable[[], T]) -> T:
+        """Run a blocking LLM call with retries, circuit breaking and hedging."""
+        self._count("calls")
+        attempt = 0
+        while True:
+            attempt += 1
+            self._before_attempt()
+            started = time.perf_counter()
+            try:
+                result = self._call_hedged(fn)
+            except Exception as e:
+                time.sleep(self._after_failure(e, attempt))
+            else:
+                self._after_success(started)
+                return result
+
+    async def acall(self, fn: Callable[[], Awaitable[T]]) -> T:
+        """Async counterpart of ``call``; ``fn`` returns a new awaitable per attempt."""
+        self._count("calls")
+        attempt = 0
+        while True:
+            attempt += 1
+            self._before_attempt()
+            started = time.perf_counter()
+            try:
+                result = await self._acall_hedged(fn)
+            except Exception as e:
+                await asyncio.sleep(self._after_failure(e, attempt))
+            else:
+                self._after_success(started)
+                return result
+
+    def _call_hedged(self, fn: Callable[[], T]) -> T:
+        delay = self.hedge_delay()
+        if delay is None:
+            return fn()
+
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(thread_name_prefix="llm-hedge")
+
+        primary = self._executor.submit(fn)
+        pending = {primary}
+        hedges_sent = 0
+        while True:
+            timeout = delay if hedges_sent < self.hedge.max_hedges else None
+            done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                # Losing requests run to completion in the background
+                hedges_sent += 1
+                self._count("hedges")
+                pending.add(self._executor.submit(fn))
+                continue
+            for future in done:
+                if future.exception() is None:
+                    if future is not primary:
+                        self._count("hedge_wins")
+                    return future.result()
+            if not pending:
+                return next(iter(done)).result()
+
+    async def _acall_hedged(self, fn: Callable[[], Awaitable[T]]) -> T:
+        delay = self.hedge_delay()
+        if delay is None:
+            return await fn()
+
+        primary = asyncio.ensure_future(fn())
+        pending = {primary}
+        hedges_sent = 0
+        try:
+            while True:
+                timeout = delay if hedges_sent < self.hedge.max_hedges else None
+                done, pending = await asyncio.wait(pending, timeout=timeout,
+                                                   return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    hedges_sent += 1
+                    self._count("hedges")
+                    pending.add(asyncio.ensure_future(fn()))
+                    continue
+                for task in done:
+                    if task.exception() is None:
+                        if task is not primary:
+                            self._count("hedge_wins")
+                        return task.result()
+                if not pending:
+                    return next(iter(done)).result()
+        finally:
+            for task in pending:
+                task.cancel()
@@ -0,0 +1,111 @@
+"""
+Validation of structured (JSON) model responses.
+
+Structured prompts (see ``underwriting.ai.structured``) ask the model for
+one compact JSON object. It is parsed and schema-checked in a single pass
+by pydantic, and the cited rule IDs are checked against the loaded rules,
+so a malformed response fails loudly instead of silently becoming an
+ADJUDICATE decision.
+"""
+
+import json
+from typing import Collection, Dict, List, Optional
+
+from pydantic import BaseModel, ConfigDict, ValidationError, field_validator
+
+from .exceptions import LLMError
+from .models import UnderwritingDecision
+
+
+class StructuredDecision(BaseModel):
+    """Schema of a structured underwriting response."""
+    model_config = ConfigDict(extra="ignore")
+
+    decision: UnderwritingDecision
+    reason: str
+    triggered_rules: List[str] = []
+    risk_factors: List[str] = []
+
+    @field_validator("decision", mode="before")
+    @classmethod
+    def normalize_decision(cls, value):
+        return value.strip().lower() if isinstance(value, str) else value
+
+
+class PackedDecision(StructuredDecision):
+    """One applicant's entry in a packed structured response."""
+    applicant_id: str
+
+
+def parse_structured_response(response_text: str,
+                              valid_rule_ids: Optional[Collection[str]] = None) -> StructuredDecision:
+    """
+    Parse and validate a structured response.
+
+    Args:
+        response_text: Raw model output; code fences around the object are tolerated
+        valid_rule_ids: Rule IDs of the loaded rules; unknown IDs are rejected
+
+    Raises:
+        LLMError: If the response is not a valid decision object
+    """
+    start = response_text.find("{")
+    end = response_text.rfind("}")
+    if start < 0 or end < start:
+        raise LLMError("Structured response contains no JSON object",
+                       response_text=response_text, kind="invalid_response")
+
+    try:
+        decision = StructuredDecision.model_validate_json(response_text[start:end + 1])
+    except ValidationError as e:
+        raise LLMError(f"Invalid structured response: {e.error_count()} validation error(s)",
+                       response_text=response_text, kind="invalid_response")
+
+    if valid_rule_ids is not None:
+        unknown = [rule_id for rule_id in decision.triggered_rules if rule_id not in valid_rule_ids]
+        if unknown:
+            raise LLMError(f"Structured response cites unknown rule IDs: {', '.join(unknown)}",
+                           response_text=response_text, kind="invalid_response")
+
+    return decision
+
+
+def parse_packed_structured_response(response_text: str,
+                                     valid_rule_ids: Optional[Collection[str]] = None
+                                     ) -> Dict[str, StructuredDecision]:
+    """
+    Parse a packed structured response into decisions keyed by applicant ID.
+
+    Entries that fail validation or cite unknown rules are left out, as is
+    any repeated applicant ID after its first entry, so callers can retry
+    just those applicants.
+
+    Args:
+        response_text: Raw model output containing a JSON array of decisions
+        valid_rule_ids: Rule IDs of the loaded rules; entries citing others are dropped
+
+    Raises:
+        LLMError: If the response contains no JSON array
+    """
+    start = response_text.find("[")
+    end = response_text.rfind("]")
+    try:
+        entries = json.loads(response_text[start:end + 1]) if 0 <= start < end else None
+    except ValueError:
+        entries = None
+    if not isinstance(entries, list):
+        raise LLMError("Packed structured response contains no JSON array",
+                       response_text=response_text, kind="invalid_response")
+
+    decisions: Dict[str, StructuredDecision] = {}
+    for entry in entries:
+        try:
+            decision = PackedDecision.model_validate(entry)
+        except ValidationError:
+            continue
+        if decision.applicant_id in decisions:
+            continue
+        if valid_rule_ids is not None and not all(r in valid_rule_ids for r in decision.triggered_rules):
+            continue
+        decisions[decision.applicant_id] = decision
+    return decisions
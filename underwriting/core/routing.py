@@ -0,0 +1,177 @@
+"""
+Tiered model routing.
+
+Most applicants are clear-cut, so a small, fast model can make the first
+pass and the large model is only consulted when the first answer is not
+good enough to act on: an ADJUDICATE decision, a response that could not
+be parsed, a failed call, or triggered rules that contradict the
+decision. A sample of first-tier decisions that were not escalated is
+re-evaluated by the large model as an agreement audit, so the saving can
+be shown not to cost accuracy. Audits run in the background after the
+first-tier result has been returned, so they add no latency to the
+decision they check.
+"""
+
+import concurrent.futures
+import random
+import threading
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, List, Optional
+
+from .models import UnderwritingDecision, UnderwritingResult
+from .rules import CompiledRuleSet
+
+# Escalation reasons
+ESCALATE_ADJUDICATE = "adjudicate"
+ESCALATE_PARSE_FAILURE = "parse_failure"
+ESCALATE_CONFLICT = "conflict"
+ESCALATE_ERROR = "error"
+
+
+@dataclass
+class RoutingPolicy:
+    """Which models to use and when to escalate from the first to the second."""
+    first_model: str = "gpt-4o-mini"
+    escalation_model: str = "gpt-4"
+    escalate_on_adjudicate: bool = True
+    escalate_on_parse_failure: bool = True
+    escalate_on_conflict: bool = True
+    escalate_on_error: bool = True
+    audit_rate: float = 0.05
+    audit_sample_size: int = 500
+    seed: Optional[int] = None
+
+    def escalation_reason(self, result: UnderwritingResult,
+                          compiled_rules: CompiledRuleSet) -> Optional[str]:
+        """Why a parsed first-tier result needs the escalation model, or None."""
+        if self.escalate_on_adjudicate and result.decision == UnderwritingDecision.ADJUDICATE:
+            return ESCALATE_ADJUDICATE
+        if self.escalate_on_conflict and rules_conflict(result, compiled_rules):
+            return ESCALATE_CONFLICT
+        return None
+
+
+def rules_conflict(result: UnderwritingResult, compiled_rules: CompiledRuleSet) -> bool:
+    """True when the cited rules are unknown or imply a different decision."""
+    if any(rule_id not in compiled_rules.rules for rule_id in result.triggered_rules):
+        return True
+    implied = compiled_rules.decision_for(result.triggered_rules)
+    return implied is not None and implied != result.decision
+
+
+@dataclass
+class TierStats:
+    """Calls and latency for one model tier."""
+    calls: int = 0
+    errors: int = 0
+    total_ms: float = 0.0
+
+    @property
+    def avg_ms(self) -> float:
+        return self.total_ms / self.calls if self.calls else 0.0
+
+
+@dataclass
+class AuditRecord:
+    """A first-tier decision re-evaluated by the escalation model."""
+    applicant_id: str
+    first_decision: UnderwritingDecision
+    escalation_decision: UnderwritingDecision
+    first_rules: List[str]
+    escalation_rules: List[str]
+
+    @property
+    def agrees(self) -> bool:
+        return self.first_decision == self.escalation_decision
+
+
+@dataclass
+class RoutingStats:
+    """Per-tier counters, escalation reasons and the agreement audit sample."""
+    tiers: Dict[str, TierStats] = field(default_factory=dict)
+    decisions: int = 0
+    escalations: Counter = field(default_factory=Counter)
+    audits: Deque[AuditRecord] = field(default_factory=deque)
+
+    @property
+    def escalation_rate(self) -> float:
+        return sum(self.escalations.values()) / self.decisions if self.decisions else 0.0
+
+    @property
+    def agreement_rate(self) -> Optional[float]:
+        """Share of audited first-tier decisions the escalation model agreed with."""
+        if not self.audits:
+            return None
+        return sum(record.agrees for record in self.audits) / len(self.audits)
+
+    def to_dict(self) -> Dict:
+        return {
+            "decisions": self.decisions,
+            "escalation_rate": self.escalation_rate,
+            "escalations": dict(self.escalations),
+            "tiers": {model: {"calls": tier.calls, "errors": tier.errors, "avg_ms": tier.avg_ms}
+                      for model, tier in self.tiers.items()},
+            "audited": len(self.audits),
+            "agreement_rate": self.agreement_rate
+        }
+
+
+class ModelRouter:
+    """Applies a RoutingPolicy and records what it did."""
+
+    def __init__(self, policy: RoutingPolicy):
+        self.policy = policy
+        self.stats = RoutingStats(audits=deque(maxlen=policy.audit_sample_size))
+        self._rng = random.Random(policy.seed)
+        self._lock = threading.Lock()
+        self._pending_audits = set()
+
+    def record_call(self, model: str, elapsed_ms: float, failed: bool = False) -> None:
+        with self._lock:
+            tier = self.stats.tiers.setdefault(model, TierStats())
+            tier.calls += 1
+            tier.errors += failed
+            tier.total_ms += elapsed_ms
+
+    def record_decision(self, escalation_reason: Optional[str]) -> None:
+        with self._lock:
+            self.stats.decisions += 1
+            if escalation_reason is not None:
+                self.stats.escalations[escalation_reason] += 1
+
+    def should_audit(self) -> bool:
+        """Draw whether a non-escalated decision joins the audit sample."""
+        with self._lock:
+            return self._rng.random() < self.policy.audit_rate
+
+    def track_audit(self, future: concurrent.futures.Future) -> None:
+        """Keep a background audit's future until it finishes; see ``wait_for_audits``."""
+        with self._lock:
+            self._pending_audits.add(future)
+        future.add_done_callback(self._audit_done)
+
+    def _audit_done(self, future: concurrent.futures.Future) -> None:
+        with self._lock:
+            self._pending_audits.discard(future)
+
+    @property
+    def pending_audits(self) -> int:
+        return len(self._pending_audits)
+
+    def wait_for_audits(self, timeout: Optional[float] = None) -> bool:
+        """Block until running audits have been recorded; False if some are still running at ``timeout``."""
+        with self._lock:
+            pending = list(self._pending_audits)
+        _, not_done = concurrent.futures.wait(pending, timeout)
+        return not not_done
+
+    def record_audit(self, first: UnderwritingResult, escalation: UnderwritingResult) -> None:
+        with self._lock:
+            self.stats.audits.append(AuditRecord(
+                applicant_id=first.applicant_id,
+                first_decision=first.decision,
+                escalation_decision=escalation.decision,
+                first_rules=list(first.triggered_rules),
+                escalation_rules=list(escalation.triggered_rules)
+            ))
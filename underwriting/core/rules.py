@@ -0,0 +1,427 @@
+"""
+Deterministic evaluation of structured underwriting rule criteria.
+
+Every rule in the rules JSON carries a machine-readable ``criteria`` block
+alongside its prose description. This module compiles those blocks into
+plain Python predicates so that triggered rules can be computed in-process,
+without a round trip to the LLM.
+
+Criteria keys are interpreted according to the section they appear in:
+in ``hard_stops`` and ``adjudication_triggers`` a numeric value is a
+threshold the applicant must reach for the rule to fire, while in
+``acceptance_criteria`` the same value is a ceiling the applicant must stay
+within. ``*_min``/``*_max`` bounds are strict in trigger sections, whose
+rules are phrased as "over" or "below" a limit, and inclusive in
+``acceptance_criteria``. Only the primary driver is considered, matching the applicant data
+that is rendered into the LLM prompt.
+"""
+
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+from .exceptions import RuleValidationError
+from .features import DEFAULT_MAJOR_VIOLATIONS, ApplicantFeatures
+from .models import Applicant, ClaimType, UnderwritingDecision, UnderwritingResult
+
+# Rule sections in evaluation order, with the decision each one produces
+RULE_SECTIONS: Tuple[Tuple[str, UnderwritingDecision], ...] = (
+    ("hard_stops", UnderwritingDecision.DENY),
+    ("adjudication_triggers", UnderwritingDecision.ADJUDICATE),
+    ("acceptance_criteria", UnderwritingDecision.ACCEPT),
+)
+
+# Sections whose non-matching rules can be left out of a prompt; acceptance
+# criteria are always kept because they define what an ACCEPT looks like
+PRUNABLE_SECTIONS = frozenset({"hard_stops", "adjudication_triggers"})
+
+# Criteria keys that describe the rule rather than a condition
+METADATA_KEYS = frozenset({"action", "reason", "lookback_years"})
+
+DEFAULT_LOOKBACK_YEARS = 5
+
+Condition = Callable[[ApplicantFeatures], bool]
+
+
+@dataclass(frozen=True)
+class CompiledRule:
+    """A single rule whose criteria have been compiled into predicates."""
+    rule_id: str
+    name: str
+    section: str
+    action: str
+    reason: str
+    conditions: Tuple[Condition, ...]
+    unsupported_criteria: Tuple[str, ...] = ()
+
+    @property
+    def is_exact(self) -> bool:
+        """True when every criterion of the rule could be compiled."""
+        return not self.unsupported_criteria and bool(self.conditions)
+
+    def could_apply(self, facts: ApplicantFeatures) -> bool:
+        """Return False only when a compiled condition rules the applicant out.
+        
+        Criteria that could not be compiled are assumed to hold, so rules
+        that cannot be evaluated are always considered applicable.
+        """
+        for condition in self.conditions:
+            if not condition(facts):
+                return False
+        return True
+
+    def matches(self, facts: ApplicantFeatures) -> bool:
+        """Return True when all compiled conditions hold for the applicant."""
+        if not self.conditions:
+            return False
+        for condition in self.conditions:
+            if not condition(facts):
+                return False
+        return True
+
+
+@dataclass
+class RuleEvaluation:
+    """Triggered rules for one applicant, grouped by rule section."""
+    applicant_id: str
+    hard_stops: List[str] = field(default_factory=list)
+    adjudication_triggers: List[str] = field(default_factory=list)
+    acceptance_criteria: List[str] = field(default_factory=list)
+    reasons: Dict[str, str] = field(default_factory=dict)
+    exact_hard_stops: List[str] = field(default_factory=list)
+
+    @property
+    def triggered_rules(self) -> List[str]:
+        """All triggered rule IDs in section order."""
+        return self.hard_stops + self.adjudication_triggers + self.acceptance_criteria
+
+    @property
+    def decision(self) -> Optional[UnderwritingDecision]:
+        """Decision implied by the rules alone, or None when no rule fired."""
+        if self.hard_stops:
+            return UnderwritingDecision.DENY
+        if self.adjudication_triggers:
+            return UnderwritingDecision.ADJUDICATE
+        if self.acceptance_criteria:
+            return UnderwritingDecision.ACCEPT
+        return None
+
+    def to_hard_stop_result(self) -> Optional[UnderwritingResult]:
+        """Build a DENY result when an exactly-evaluated hard stop fired."""
+        if not self.exact_hard_stops:
+            return None
+
+        return UnderwritingResult(
+            applicant_id=self.applicant_id,
+            decision=UnderwritingDecision.DENY,
+            reason=self.reasons[self.exact_hard_stops[0]],
+            triggered_rules=list(self.exact_hard_stops),
+            risk_factors=[self.reasons[rule_id] for rule_id in self.exact_hard_stops]
+        )
+
+
+class CompiledRuleSet:
+    """In-process evaluator for a compiled rules configuration."""
+
+    def __init__(self, rules_by_section: Dict[str, List[CompiledRule]]):
+        self.rules_by_section = rules_by_section
+        self.rules: Dict[str, CompiledRule] = {
+            rule.rule_id: rule
+            for section_rules in rules_by_section.values()
+            for rule in section_rules
+        }
+
+    @property
+    def rule_ids(self) -> List[str]:
+        """All rule IDs known to this rule set."""
+        return list(self.rules)
+
+    def decision_for(self, rule_ids: Iterable[str]) -> Optional[UnderwritingDecision]:
+        """Decision implied by the most severe section among known ``rule_ids``, if any."""
+        cited = {self.rules[rule_id].section for rule_id in rule_ids if rule_id in self.rules}
+        for section, decision in RULE_SECTIONS:
+            if section in cited:
+                return decision
+        return None
+
+    def evaluate(self, applicant: Union[Applicant, ApplicantFeatures],
+                 as_of: Optional[date] = None) -> RuleEvaluation:
+        """Evaluate every rule against the applicant or its precomputed features."""
+        facts = ApplicantFeatures.of(applicant, as_of)
+        evaluation = RuleEvaluation(applicant_id=facts.applicant_id)
+
+        for section, _ in RULE_SECTIONS:
+            triggered = getattr(evaluation, section)
+            for rule in self.rules_by_section.get(section, ()):
+                if rule.matches(facts):
+                    triggered.append(rule.rule_id)
+                    evaluation.reasons[rule.rule_id] = rule.reason
+                    if section == "hard_stops" and rule.is_exact:
+                        evaluation.exact_hard_stops.append(rule.rule_id)
+
+        return evaluation
+
+    def triggered_rule_ids(self, applicant: Union[Applicant, ApplicantFeatures],
+                           as_of: Optional[date] = None) -> List[str]:
+        """Return the IDs of all rules triggered by the applicant."""
+        return self.evaluate(applicant, as_of).triggered_rules
+
+    def relevant_rule_ids(self, applicant: Union[Applicant, ApplicantFeatures],
+                          as_of: Optional[date] = None) -> frozenset:
+        """Return the IDs of rules worth showing the LLM for this applicant.
+        
+        Rules in ``PRUNABLE_SECTIONS`` are kept only when they could apply;
+        every rule in the other sections is kept.
+        """
+        facts = ApplicantFeatures.of(applicant, as_of)
+        return frozenset(
+            rule.rule_id
+            for section, section_rules in self.rules_by_section.items()
+            for rule in section_rules
+            if section not in PRUNABLE_SECTIONS or rule.could_apply(facts)
+        )
+
+
+class RuleCompiler:
+    """Compile the ``criteria`` blocks of a rules configuration into predicates."""
+
+    def __init__(self, rules: Mapping[str, Any], rules_file: Optional[str] = None):
+        """
+        Initialize the compiler.
+
+        Args:
+            rules: The ``underwriting_rules`` object from a rules JSON file
+            rules_file: Source path, used for error reporting only
+        """
+        self.rules = rules
+        self.rules_file = rules_file
+
+        parameters = rules.get("evaluation_parameters", {})
+        severity = parameters.get("violation_severity", {})
+        self.major_violations = frozenset(severity.get("major", DEFAULT_MAJOR_VIOLATIONS))
+        self.vehicle_groups: Dict[str, List[str]] = parameters.get("vehicle_categories", {})
+        lookbacks = parameters.get("lookback_periods", {})
+        self.violation_lookback = lookbacks.get("violations", DEFAULT_LOOKBACK_YEARS)
+        self.claim_lookback = lookbacks.get("claims", DEFAULT_LOOKBACK_YEARS)
+
+    def compile(self) -> CompiledRuleSet:
+        """Compile every rule section into a CompiledRuleSet."""
+        rules_by_section: Dict[str, List[CompiledRule]] = {}
+
+        for section, _ in RULE_SECTIONS:
+            section_rules = self.rules.get(section, {}).get("rules", [])
+            rules_by_section[section] = [
+                self.compile_rule(rule, section) for rule in section_rules
+            ]
+
+        return CompiledRuleSet(rules_by_section)
+
+    def compile_rule(self, rule: Mapping[str, Any], section: str) -> CompiledRule:
+        """Compile a single rule definition."""
+        rule_id = rule.get("rule_id")
+        if not rule_id:
+            raise RuleValidationError("Rule is missing a rule_id", rule_file=self.rules_file)
+
+        criteria = rule.get("criteria", {})
+        if not isinstance(criteria, Mapping):
+            raise RuleValidationError("Rule criteria must be an object",
+                                      rule_id=rule_id, rule_file=self.rules_file)
+
+        trigger = section != "acceptance_criteria"
+        conditions: List[Condition] = []
+        unsupported: List[str] = []
+        handled = set(METADATA_KEYS)
+
+        for keys, builder in self._builders():
+            if all(key in criteria for key in keys):
+                try:
+                    conditions.append(builder(criteria, trigger))
+                except (TypeError, ValueError) as e:
+                    raise RuleValidationError(f"Invalid criteria {list(keys)}: {e}",
+                                              rule_id=rule_id, rule_file=self.rules_file)
+                handled.update(keys)
+
+        for key in criteria:
+            if key not in handled:
+                unsupported.append(key)
+
+        return CompiledRule(
+            rule_id=rule_id,
+            name=rule.get("name", rule_id),
+            section=section,
+            action=criteria.get("action", ""),
+            reason=criteria.get("reason", rule.get("description", rule_id)),
+            conditions=tuple(conditions),
+            unsupported_criteria=tuple(unsupported)
+        )
+
+    def _builders(self) -> List[Tuple[Tuple[str, ...], Callable[[Mapping[str, Any], bool], Condition]]]:
+        """Map criteria key combinations to condition builders.
+
+        Multi-key combinations are listed before the single keys they
+        contain so that a key is consumed by the most specific builder.
+        """
+        return [
+            (("violation_type", "count_threshold"), self._typed_violation_count),
+            (("claim_type", "count_threshold"), self._typed_claim_count),
+            (("violation_types", "major_violation_count"), self._listed_violation_count),
+            (("license_status",), self._license_status),
+            (("fraud_conviction",), self._fraud_conviction),
+            (("violations_count",), self._violations_count),
+            (("minor_violations_count",), self._minor_violations_count),
+            (("minor_violations_max",), self._minor_violations_max),
+            (("major_violation_count",), self._major_violation_count),
+            (("at_fault_claims_count",), self._at_fault_claims_count),
+            (("at_fault_claims_max",), self._at_fault_claims_max),
+            (("any_violations",), self._any_violations),
+            (("major_violations",), self._major_violations),
+            (("driver_age_min",), self._bound("age", "driver_age_min", minimum=True)),
+            (("driver_age_max",), self._bound("age", "driver_age_max", minimum=False)),
+            (("credit_score_min",), self._bound("credit_score", "credit_score_min", minimum=True)),
+            (("credit_score_max",), self._bound("credit_score", "credit_score_max", minimum=False)),
+            (("coverage_lapse_days",), self._coverage_lapse_days),
+            (("coverage_lapse_days_min",), self._bound("lapse_days", "coverage_lapse_days_min", minimum=True)),
+            (("coverage_lapse_days_max",), self._bound("lapse_days", "coverage_lapse_days_max", minimum=False)),
+            (("vehicle_category",), self._vehicle_category),
+            (("vehicle_value_min",), self._vehicle_value_min),
+        ]
+
+    # Helpers
+
+    def _lookback(self, criteria: Mapping[str, Any], default: int) -> int:
+        return int(criteria.get("lookback_years", default))
+
+    @staticmethod
+    def _count_check(value: int, trigger: bool) -> Callable[[int], bool]:
+        """Threshold in trigger sections, ceiling in acceptance sections."""
+        limit = int(value)
+        if trigger:
+            return lambda count: count >= limit
+        return lambda count: count <= limit
+
+    # Condition builders
+
+    def _typed_violation_count(self, criteria: Mapping[str, Any], trigger: bool) -> Condition:
+        types = frozenset([str(criteria["violation_type"])])
+        lookback = self._lookback(criteria, self.violation_lookback)
+        check = self._count_check(criteria["count_threshold"], trigger)
+        return lambda facts: check(facts.violation_count(types, lookback))
+
+    def _typed_claim_count(self, criteria: Mapping[str, Any], trigger: bool) -> Condition:
+        claim_type = ClaimType(criteria["claim_type"]).value
+        lookback = self._lookback(criteria, self.claim_lookback)
+        check = self._count_check(criteria["count_threshold"], trigger)
+        return lambda facts: check(facts.claim_count(claim_type, lookback))
+
+    def _listed_violation_count(self, criteria: Mapping[str, Any], trigger: bool) -> Condition:
+        types = frozenset(criteria["violation_types"])
+        lookback = self._lookback(criteria, self.violation_lookback)
+        check = self._count_check(criteria["major_violation_count"], trigger)
+        return lambda facts: check(facts.violation_count(types, lookback))
+
+    def _license_status(self, criteria: Mapping[str, Any], trigger: bool) -> Condition:
+        statuses = criteria["license_status"]
+        if isinstance(statuses, str):
+            statuses = [statuses]
+        allowed = frozenset(statuses)
+        return lambda facts: facts.license_status in allowed
+
+    def _fraud_conviction(self, criteria: Mapping[str, Any], trigger: bool) -> Condition:
+        expected = bool(criteria["fraud_conviction"])
+        return lambda facts: facts.fraud_history == expected
+
+    def _violations_count(self, criteria: Mapping[str, Any], trigger: bool) -> Condition:
+        lookback = self._lookback(criteria, self.violation_lookback)
+        check = self._count_check(criteria["violations_count"], trigger)
+        return lambda facts: check(facts.violation_count(None, lookback))
+
+    def _minor_violations_count(self, criteria: Mapping[str, Any], trigger: bool) -> Condition:
+        # Anything that is not a major violation counts as minor
+        majors = self.major_violations
+        lookback = self._lookback(criteria, self.violation_lookback)
+        check = self._count_check(criteria["minor_violations_count"], trigger)
+        return lambda facts: check(facts.violation_count(majors, lookback, exclude=True))
+
+    def _minor_violations_max(self, criteria: Mapping[str, Any], trigger: bool) -> Condition:
+        majors = self.major_violations
+        lookback = self._lookback(criteria, self.violation_lookback)
+        limit = int(criteria["minor_violations_max"])
+        return lambda facts: facts.violation_count(majors, lookback, exclude=True) <= limit
+
+    def _major_violation_count(self, criteria: Mapping[str, Any], trigger: bool) -> Condition:
+        majors = self.major_violations
+        lookback = self._lookback(criteria, self.violation_lookback)
+        check = self._count_check(criteria["major_violation_count"], trigger)
+        return lambda facts: check(facts.violation_count(majors, lookback))
+
+    def _at_fault_claims_count(self, criteria: Mapping[str, Any], trigger: bool) -> Condition:
+        lookback = self._lookback(criteria, self.claim_lookback)
+        check = self._count_check(criteria["at_fault_claims_count"], trigger)
+        at_fault = ClaimType.AT_FAULT.value
+        return lambda facts: check(facts.claim_count(at_fault, lookback))
+
+    def _at_fault_claims_max(self, criteria: Mapping[str, Any], trigger: bool) -> Condition:
+        lookback = self._lookback(criteria, self.claim_lookback)
+        limit = int(criteria["at_fault_claims_max"])
+        at_fault = ClaimType.AT_FAULT.value
+        return lambda facts: facts.claim_count(at_fault, lookback) <= limit
+
+    def _any_violations(self, criteria: Mapping[str, Any], trigger: bool) -> Condition:
+        expected = bool(criteria["any_violations"])
+        lookback = self._lookback(criteria, self.violation_lookback)
+        return lambda facts: (facts.violation_count(None, lookback) > 0) == expected
+
+    def _major_violations(self, criteria: Mapping[str, Any], trigger: bool) -> Condition:
+        expected = bool(criteria["major_violations"])
+        majors = self.major_violations
+        lookback = self._lookback(criteria, self.violation_lookback)
+        return lambda facts: (facts.violation_count(majors, lookback) > 0) == expected
+
+    def _bound(self, attribute: str, key: str, minimum: bool) -> Callable[[Mapping[str, Any], bool], Condition]:
+        """Build a lower or upper bound on a scalar fact, strict in trigger sections."""
+
+        def builder(criteria: Mapping[str, Any], trigger: bool) -> Condition:
+            limit = float(criteria[key])
+
+            def condition(facts: ApplicantFeatures) -> bool:
+                value = getattr(facts, attribute)
+                if value is None:
+                    return False
+                if trigger:
+                    return value > limit if minimum else value < limit
+                return value >= limit if minimum else value <= limit
+
+            return condition
+
+        return builder
+
+    def _coverage_lapse_days(self, criteria: Mapping[str, Any], trigger: bool) -> Condition:
+        limit = int(criteria["coverage_lapse_days"])
+        if trigger:
+            # Hard stops are phrased as a lapse "exceeding" the limit
+            return lambda facts: facts.lapse_days > limit
+        return lambda facts: facts.lapse_days <= limit
+
+    def _vehicle_category(self, criteria: Mapping[str, Any], trigger: bool) -> Condition:
+        categories = criteria["vehicle_category"]
+        if isinstance(categories, str):
+            categories = [categories]
+
+        # Category names may refer to groups in evaluation_parameters
+        expanded = set()
+        for category in categories:
+            expanded.update(self.vehicle_groups.get(category, [category]))
+        flagged = frozenset(expanded)
+
+        return lambda facts: not flagged.isdisjoint(facts.vehicle_types)
+
+    def _vehicle_value_min(self, criteria: Mapping[str, Any], trigger: bool) -> Condition:
+        limit = float(criteria["vehicle_value_min"])
+        if trigger:
+            return lambda facts: any(value > limit for value in facts.vehicle_values)
+        return lambda facts: any(value >= limit for value in facts.vehicle_values)
+
+
+def compile_rules(rules: Mapping[str, Any], rules_file: Optional[str] = None) -> CompiledRuleSet:
+    """Compile a rules configuration into a CompiledRuleSet."""
+    return RuleCompiler(rules, rules_file).compile()
@@ -0,0 +1,222 @@
+"""
+Process-wide registry of parsed and compiled underwriting rules.
+
+Engines are constructed per web request and several times per A/B run, so
+parsing the rules JSON in every constructor is wasted work. The registry
+parses each rules file once, precomputes the prompt text and the rule
+index, compiles the criteria, and hands out the same immutable snapshot to
+every caller. A file is reloaded only when its modification time changes
+and its content hash differs from the cached snapshot.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from dataclasses import dataclass, replace
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Container, Dict, Mapping, Optional, Tuple
+
+from .exceptions import RuleValidationError
+from .rules import CompiledRuleSet, RuleCompiler
+
+# Directory holding the bundled rules files
+RULES_DIR = Path("config") / "rules"
+
+# Project root, used when the working directory is elsewhere
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# Legacy names still used by forms and CLI defaults
+RULES_FILE_ALIASES = {
+    "underwriting_rules.json": "underwriting_rules_standard.json",
+}
+
+# Prompt headings for each rule section, in prompt order
+SECTION_HEADINGS = (
+    ("hard_stops", "HARD STOPS (Automatic Denial):"),
+    ("adjudication_triggers", "ADJUDICATION TRIGGERS (Manual Review Required):"),
+    ("acceptance_criteria", "ACCEPTANCE CRITERIA (Automatic Approval):"),
+)
+
+
+def freeze(value: Any) -> Any:
+    """Recursively convert dicts and lists into read-only equivalents."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+# Line rendered under a section whose rules were all pruned
+NO_APPLICABLE_RULES = "- None applicable to this applicant\n"
+
+
+def format_rules_text(rules: Mapping[str, Any], include: Optional[Container[str]] = None) -> str:
+    """Render the rules sections as the text block inserted into prompts.
+
+    When ``include`` is given, only rules whose IDs it contains are rendered.
+    """
+
+    rules_text = ""
+
+    for index, (section, heading) in enumerate(SECTION_HEADINGS):
+        if section in rules:
+            if index:
+                rules_text += "\n"
+            rules_text += f"{heading}\n"
+            rendered = 0
+            for rule in rules[section].get('rules', []):
+                if include is None or rule['rule_id'] in include:
+                    rules_text += f"- {rule['rule_id']}: {rule['name']} - {rule['description']}\n"
+                    rendered += 1
+            if include is not None and not rendered:
+                rules_text += NO_APPLICABLE_RULES
+
+    return rules_text
+
+
+def resolve_rules_path(rules_file: str, allow_paths: bool = True) -> Path:
+    """Locate a rules file given a bare name or a path.
+
+    Bare names are looked up in ``config/rules`` under the working
+    directory and then under the project root. With ``allow_paths`` False,
+    as for names taken from request input, only names and aliases of files
+    in ``config/rules`` are accepted, optionally prefixed with that
+    directory.
+
+    Raises:
+        ValueError: ``rules_file`` is a path and paths are not allowed
+        FileNotFoundError: No such rules file exists
+    """
+    candidate = Path(rules_file.replace("\\", "/"))
+    if not allow_paths:
+        if candidate.parent not in (Path("."), RULES_DIR) or candidate.name in ("", ".", ".."):
+            raise ValueError(f"Rules file must be a file name in {RULES_DIR.as_posix()}: {rules_file}")
+    elif candidate.is_file():
+        return candidate.resolve()
+
+    name = RULES_FILE_ALIASES.get(candidate.name, candidate.name)
+    for base in (Path.cwd(), PROJECT_ROOT):
+        path = base / RULES_DIR / name
+        if path.is_file():
+            return path.resolve()
+
+    raise FileNotFoundError(f"Rules file not found: {rules_file}")
+
+
+@dataclass(frozen=True)
+class RulesSnapshot:
+    """Immutable, pre-processed view of one version of a rules file."""
+    path: str
+    mtime_ns: int
+    content_hash: str
+    rules: Mapping[str, Any]
+    rules_text: str
+    rules_by_id: Mapping[str, Mapping[str, Any]]
+    compiled: CompiledRuleSet
+
+    @property
+    def version(self) -> str:
+        """Version string declared in the rules file."""
+        return self.rules.get("version", "")
+
+
+class RulesRegistry:
+    """Thread-safe cache of RulesSnapshots keyed by resolved file path."""
+
+    def __init__(self):
+        self._snapshots: Dict[str, RulesSnapshot] = {}
+        self._lock = threading.Lock()
+        self.loads = 0
+
+    def get(self, rules_file: str) -> RulesSnapshot:
+        """Return the current snapshot for a rules file, reloading if it changed."""
+        path = resolve_rules_path(rules_file)
+        key = str(path)
+        mtime_ns = os.stat(path).st_mtime_ns
+
+        snapshot = self._snapshots.get(key)
+        if snapshot is not None and snapshot.mtime_ns == mtime_ns:
+            return snapshot
+
+        with self._lock:
+            snapshot = self._snapshots.get(key)
+            if snapshot is not None and snapshot.mtime_ns == mtime_ns:
+                return snapshot
+
+            raw = path.read_bytes()
+            content_hash = hashlib.sha256(raw).hexdigest()
+
+            if snapshot is not None and snapshot.content_hash == content_hash:
+                # Touched but unchanged: keep the compiled snapshot
+                snapshot = replace(snapshot, mtime_ns=mtime_ns)
+            else:
+                snapshot = self._build_snapshot(key, raw, mtime_ns, content_hash)
+
+            self._snapshots[key] = snapshot
+            return snapshot
+
+    def _build_snapshot(self, path: str, raw: bytes, mtime_ns: int, content_hash: str) -> RulesSnapshot:
+        """Parse, index and compile one version of a rules file."""
+        try:
+            data = json.loads(raw)
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            raise ValueError(f"Invalid JSON in rules file {path}: {e}")
+
+        rules = freeze(self._validate_layout(data, path))
+        # Compiling first reports rules without a rule_id
+        compiled = RuleCompiler(rules, path).compile()
+        rules_by_id = MappingProxyType({
+            rule['rule_id']: rule
+            for section, _ in SECTION_HEADINGS
+            for rule in rules.get(section, {}).get('rules', ())
+        })
+        self.loads += 1
+
+        return RulesSnapshot(
+            path=path,
+            mtime_ns=mtime_ns,
+            content_hash=content_hash,
+            rules=rules,
+            rules_text=format_rules_text(rules),
+            rules_by_id=rules_by_id,
+            compiled=compiled
+        )
+
+    @staticmethod
+    def _validate_layout(data: Any, path: str) -> Mapping[str, Any]:
+        """Return the ``underwriting_rules`` object, checking the shape the registry relies on."""
+        rules = data.get('underwriting_rules', {}) if isinstance(data, dict) else None
+        if not isinstance(rules, dict):
+            raise RuleValidationError("Rules file must contain an 'underwriting_rules' object", rule_file=path)
+
+        for section, _ in SECTION_HEADINGS:
+            if section not in rules:
+                continue
+            section_rules = rules[section].get('rules', []) if isinstance(rules[section], dict) else None
+            if not isinstance(section_rules, list) or not all(isinstance(rule, dict) for rule in section_rules):
+                raise RuleValidationError(f"Rules section '{section}' must be an object with a list of rules",
+                                          rule_file=path)
+        return rules
+
+    def invalidate(self, rules_file: Optional[str] = None) -> None:
+        """Drop one cached snapshot, or all of them."""
+        with self._lock:
+            if rules_file is None:
+                self._snapshots.clear()
+            else:
+                self._snapshots.pop(str(resolve_rules_path(rules_file)), None)
+
+    def cached_paths(self) -> Tuple[str, ...]:
+        """Paths that currently have a cached snapshot."""
+        return tuple(self._snapshots)
+
+
+_default_registry = RulesRegistry()
+
+
+def get_rules_registry() -> RulesRegistry:
+    """Return the process-wide rules registry."""
+    return _default_registry
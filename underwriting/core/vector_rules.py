@@ -0,0 +1,186 @@
+"""
+Vectorized rule evaluation over an applicant population.
+
+``VectorRuleCompiler`` compiles the same ``criteria`` blocks as
+``RuleCompiler``, but each condition maps a ``PopulationFeatures`` (see
+``underwriting.data.columnar``) to a boolean array with one entry per
+applicant. Conditions that are plain comparisons on counts and scalar
+features are shared with ``RuleCompiler``. Membership, optional-value and
+vehicle conditions are overridden with array versions. Evaluating a rules
+file is then one pass per rule, plus three passes to combine the per-rule
+masks into the rule-implied decision for every applicant.
+"""
+
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+import numpy as np
+
+from .models import UnderwritingDecision
+from .rules import RULE_SECTIONS, CompiledRule, RuleCompiler
+
+# Decision codes in VectorEvaluation.decisions; NO_DECISION when no rule fired
+DECISION_CODES = (UnderwritingDecision.ACCEPT, UnderwritingDecision.DENY, UnderwritingDecision.ADJUDICATE)
+NO_DECISION = -1
+
+VectorCondition = Callable[[Any], np.ndarray]
+
+
+def decision_code(decision: Optional[UnderwritingDecision]) -> int:
+    return NO_DECISION if decision is None else DECISION_CODES.index(decision)
+
+
+@dataclass
+class VectorEvaluation:
+    """Per-rule masks and rule-implied decisions for a population.
+
+    ``masks`` has one row per rule in ``rule_ids`` (section order) and one
+    column per applicant.
+    """
+    applicant_ids: np.ndarray
+    rule_ids: List[str]
+    sections: Dict[str, List[str]]
+    masks: np.ndarray
+    decisions: np.ndarray
+    exact_hard_stops: np.ndarray
+
+    def rule_mask(self, rule_id: str) -> np.ndarray:
+        return self.masks[self.rule_ids.index(rule_id)]
+
+    def triggered_rules(self, index: int) -> List[str]:
+        """Triggered rule IDs for the applicant at ``index``, in section order."""
+        return [rule_id for rule_id, fired in zip(self.rule_ids, self.masks[:, index]) if fired]
+
+    def decision(self, index: int) -> Optional[UnderwritingDecision]:
+        code = int(self.decisions[index])
+        return None if code == NO_DECISION else DECISION_CODES[code]
+
+    def decision_counts(self) -> Dict[str, int]:
+        """Applicants per rule-implied decision; ``none`` when no rule fired."""
+        counts = np.bincount(self.decisions.astype(np.int64) + 1, minlength=len(DECISION_CODES) + 1)
+        result = {"none": int(counts[0])}
+        result.update({decision.value: int(counts[code + 1]) for code, decision in enumerate(DECISION_CODES)})
+        return result
+
+    def trigger_rates(self) -> Dict[str, float]:
+        """Share of applicants triggering each rule."""
+        rates = self.masks.mean(axis=1) if self.masks.shape[1] else np.zeros(len(self.rule_ids))
+        return {rule_id: float(rate) for rule_id, rate in zip(self.rule_ids, rates)}
+
+
+class VectorRuleSet:
+    """Population-wide evaluator for rules compiled by VectorRuleCompiler."""
+
+    def __init__(self, rules_by_section: Dict[str, List[CompiledRule]]):
+        self.rules_by_section = rules_by_section
+
+    @property
+    def rule_ids(self) -> List[str]:
+        return [rule.rule_id for section, _ in RULE_SECTIONS for rule in self.rules_by_section.get(section, ())]
+
+    def evaluate(self, population, as_of: Optional[date] = None) -> VectorEvaluation:
+        """Evaluate every rule for every applicant.
+
+        Args:
+            population: An ApplicantStore, or PopulationFeatures already extracted from one
+            as_of: Evaluation date when a store is given (default: today)
+        """
+        facts = population.features(as_of) if hasattr(population, "features") else population
+        count = len(facts)
+
+        rule_ids: List[str] = []
+        sections: Dict[str, List[str]] = {}
+        rows: List[np.ndarray] = []
+        fired: Dict[str, np.ndarray] = {}
+        exact_hard_stops = np.zeros(count, dtype=bool)
+
+        for section, _ in RULE_SECTIONS:
+            section_fired = np.zeros(count, dtype=bool)
+            sections[section] = []
+            for rule in self.rules_by_section.get(section, ()):
+                mask = self._match(rule, facts, count)
+                rule_ids.append(rule.rule_id)
+                sections[section].append(rule.rule_id)
+                rows.append(mask)
+                section_fired |= mask
+                if section == "hard_stops" and rule.is_exact:
+                    exact_hard_stops |= mask
+            fired[section] = section_fired
+
+        # Later assignments win: DENY over ADJUDICATE over ACCEPT
+        decisions = np.full(count, NO_DECISION, dtype=np.int8)
+        for section, decision in reversed(RULE_SECTIONS):
+            decisions[fired[section]] = decision_code(decision)
+
+        return VectorEvaluation(
+            applicant_ids=facts.applicant_id,
+            rule_ids=rule_ids,
+            sections=sections,
+            masks=np.vstack(rows) if rows else np.zeros((0, count), dtype=bool),
+            decisions=decisions,
+            exact_hard_stops=exact_hard_stops
+        )
+
+    @staticmethod
+    def _match(rule: CompiledRule, facts, count: int) -> np.ndarray:
+        # Same as CompiledRule.matches: a rule without conditions never fires
+        mask = np.zeros(count, dtype=bool)
+        if rule.conditions:
+            mask[:] = True
+            for condition in rule.conditions:
+                mask &= condition(facts)
+        return mask
+
+
+class VectorRuleCompiler(RuleCompiler):
+    """Compile rule criteria into conditions over PopulationFeatures arrays."""
+
+    def compile(self) -> VectorRuleSet:
+        return VectorRuleSet(super().compile().rules_by_section)
+
+    # Condition builders that are not plain comparisons
+
+    def _license_status(self, criteria: Mapping[str, Any], trigger: bool) -> VectorCondition:
+        statuses = criteria["license_status"]
+        if isinstance(statuses, str):
+            statuses = [statuses]
+        allowed = tuple(statuses)
+        return lambda facts: np.isin(facts.license_status, facts.store.codes("license_status", allowed))
+
+    def _bound(self, attribute: str, key: str, minimum: bool) -> Callable[[Mapping[str, Any], bool], VectorCondition]:
+        def builder(criteria: Mapping[str, Any], trigger: bool) -> VectorCondition:
+            limit = float(criteria[key])
+
+            def condition(facts) -> np.ndarray:
+                values = getattr(facts, attribute)
+                # Negative values stand for a missing credit score
+                present = values >= 0
+                if trigger:
+                    return present & ((values > limit) if minimum else (values < limit))
+                return present & ((values >= limit) if minimum else (values <= limit))
+
+            return condition
+
+        return builder
+
+    def _vehicle_category(self, criteria: Mapping[str, Any], trigger: bool) -> VectorCondition:
+        categories = criteria["vehicle_category"]
+        if isinstance(categories, str):
+            categories = [categories]
+
+        expanded = set()
+        for category in categories:
+            expanded.update(self.vehicle_groups.get(category, [category]))
+        flagged = tuple(sorted(expanded))
+
+        return lambda facts: facts.vehicle_count(types=flagged) > 0
+
+    def _vehicle_value_min(self, criteria: Mapping[str, Any], trigger: bool) -> VectorCondition:
+        limit = float(criteria["vehicle_value_min"])
+        return lambda facts: facts.vehicle_count(value_min=limit, strict=trigger) > 0
+
+
+def compile_vector_rules(rules: Mapping[str, Any], rules_file: Optional[str] = None) -> VectorRuleSet:
+    """Compile a rules configuration into a VectorRuleSet."""
+    return VectorRuleCompiler(rules, rules_file).compile()
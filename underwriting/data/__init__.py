@@ -6,12 +6,27 @@ test samples, and handling data validation. It serves as the data layer
 for the underwriting system.
 """
 
+from .columnar import ApplicantStore, ApplicantStoreBuilder
+from .loader import (
+    iter_applicant_chunks,
+    iter_applicants,
+    load_applicants,
+    validate_applicants,
+    write_applicants
+)
 from .sample_generator import (
     create_sample_applicants,
     print_applicant_summary
 )
 
 __all__ = [
+    "ApplicantStore",
+    "ApplicantStoreBuilder",
+    "iter_applicant_chunks",
+    "iter_applicants",
+    "load_applicants",
+    "validate_applicants",
+    "write_applicants",
     "create_sample_applicants",
     "print_applicant_summary"
 ]
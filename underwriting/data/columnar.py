@@ -0,0 +1,333 @@
+"""
+Columnar applicant store.
+
+``ApplicantStore`` holds an applicant population as NumPy arrays: one
+entry per applicant for the primary driver's numeric, date and
+enum-coded fields, and flat arrays with offsets for the variable-length
+violations, claims and vehicles (applicant ``i`` owns entries
+``offsets[i]:offsets[i + 1]``). Each applicant's JSON is kept in a byte
+column so an ``Applicant`` can be materialised on demand.
+
+Saved stores are a directory of ``.npy`` files plus ``store.json`` with
+the category tables, and open memory-mapped, so a population larger than
+memory can be scanned without loading it. ``PopulationFeatures`` is the
+array counterpart of ``ApplicantFeatures`` that vectorized rules read.
+"""
+
+import json
+from array import array
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from ..core.features import years_before
+from ..core.models import Applicant, ClaimType, LicenseStatus, VehicleCategory, ViolationType
+
+STORE_VERSION = 1
+STORE_METADATA_FILE = "store.json"
+
+# Integer columns use this for a missing value
+MISSING = -1
+
+# Ragged groups: the offsets column and the columns it indexes
+RAGGED_COLUMNS = {
+    "vehicle": ("vehicle_type", "vehicle_category", "vehicle_year", "vehicle_value"),
+    "violation": ("violation_type", "violation_date"),
+    "claim": ("claim_type", "claim_date", "claim_amount"),
+}
+
+# Enum-coded columns and the category table each is coded against
+CODED_COLUMNS = {
+    "license_status": "license_status",
+    "license_state": "license_state",
+    "territory": "territory",
+    "vehicle_type": "vehicle_type",
+    "vehicle_category": "vehicle_type",
+    "violation_type": "violation_type",
+    "claim_type": "claim_type",
+}
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def _day(value: date) -> int:
+    """Days since 1970-01-01, the datetime64[D] representation."""
+    return value.toordinal() - _EPOCH_ORDINAL
+
+
+def full_years(dates: np.ndarray, as_of: date) -> np.ndarray:
+    """Whole calendar years from each of ``dates`` (datetime64[D]) to ``as_of``."""
+    years = dates.astype("datetime64[Y]")
+    months = dates.astype("datetime64[M]")
+    year = years.astype(np.int64) + 1970
+    month_day = ((months - years.astype("datetime64[M]")).astype(np.int64) + 1) * 100 \
+        + (dates - months.astype("datetime64[D]")).astype(np.int64) + 1
+    return as_of.year - year - (as_of.month * 100 + as_of.day < month_day)
+
+
+class ApplicantStoreBuilder:
+    """Accumulates applicants into compact arrays; ``build()`` returns the store."""
+
+    def __init__(self):
+        self.categories: Dict[str, List[str]] = {
+            "license_status": [status.value for status in LicenseStatus],
+            "vehicle_type": [category.value for category in VehicleCategory],
+            "violation_type": [violation.value for violation in ViolationType],
+            "claim_type": [claim.value for claim in ClaimType],
+            "license_state": [],
+            "territory": [],
+        }
+        self._codes = {name: {value: code for code, value in enumerate(values)}
+                       for name, values in self.categories.items()}
+        self.applicant_ids: List[str] = []
+        self._columns: Dict[str, array] = {
+            "date_of_birth": array("i"), "license_issue_date": array("i"),
+            "license_expiration_date": array("i"), "license_status": array("b"),
+            "license_state": array("h"), "years_licensed": array("h"),
+            "credit_score": array("h"), "lapse_days": array("i"),
+            "fraud_history": array("b"), "territory": array("h"),
+            "driver_count": array("h"),
+            "vehicle_type": array("b"), "vehicle_category": array("b"),
+            "vehicle_year": array("h"), "vehicle_value": array("d"),
+            "violation_type": array("b"), "violation_date": array("i"),
+            "claim_type": array("b"), "claim_date": array("i"), "claim_amount": array("d"),
+        }
+        self._offsets = {group: array("q", [0]) for group in RAGGED_COLUMNS}
+        self._records = bytearray()
+        self._record_offsets = array("q", [0])
+
+    def _code(self, category: str, value: str) -> int:
+        codes = self._codes[category]
+        if value not in codes:
+            codes[value] = len(self.categories[category])
+            self.categories[category].append(value)
+        return codes[value]
+
+    def add(self, applicant: Applicant) -> None:
+        columns = self._columns
+        driver = applicant.primary_driver
+        self.applicant_ids.append(applicant.applicant_id)
+
+        columns["date_of_birth"].append(_day(driver.date_of_birth))
+        columns["license_issue_date"].append(_day(driver.license_issue_date))
+        columns["license_expiration_date"].append(_day(driver.license_expiration_date))
+        columns["license_status"].append(self._code("license_status", driver.license_status.value))
+        columns["license_state"].append(self._code("license_state", driver.license_state))
+        columns["years_licensed"].append(MISSING if driver.years_licensed is None else driver.years_licensed)
+        columns["credit_score"].append(MISSING if applicant.credit_score is None else applicant.credit_score)
+        columns["lapse_days"].append(applicant.prior_insurance_lapse_days)
+        columns["fraud_history"].append(applicant.fraud_history)
+        columns["territory"].append(self._code("territory", applicant.territory))
+        columns["driver_count"].append(len(applicant.all_drivers))
+
+        for vehicle in applicant.vehicles:
+            columns["vehicle_type"].append(self._code("vehicle_type", vehicle.vehicle_type.value))
+            columns["vehicle_category"].append(self._code("vehicle_type", vehicle.category.value))
+            columns["vehicle_year"].append(vehicle.year)
+            columns["vehicle_value"].append(np.nan if vehicle.value is None else vehicle.value)
+        for violation in driver.violations:
+            columns["violation_type"].append(self._code("violation_type", violation.violation_type.value))
+            columns["violation_date"].append(_day(violation.violation_date))
+        for claim in driver.claims:
+            columns["claim_type"].append(self._code("claim_type", claim.claim_type.value))
+            columns["claim_date"].append(_day(claim.claim_date))
+            columns["claim_amount"].append(claim.claim_amount)
+
+        self._offsets["vehicle"].append(len(columns["vehicle_type"]))
+        self._offsets["violation"].append(len(columns["violation_type"]))
+        self._offsets["claim"].append(len(columns["claim_type"]))
+
+        self._records += applicant.model_dump_json().encode()
+        self._record_offsets.append(len(self._records))
+
+    def extend(self, applicants: Iterable[Applicant]) -> "ApplicantStoreBuilder":
+        for applicant in applicants:
+            self.add(applicant)
+        return self
+
+    def build(self) -> "ApplicantStore":
+        columns = {name: np.frombuffer(values, dtype=values.typecode) if len(values)
+                   else np.array([], dtype=values.typecode)
+                   for name, values in self._columns.items()}
+        for name in ("date_of_birth", "license_issue_date", "license_expiration_date",
+                     "violation_date", "claim_date"):
+            columns[name] = columns[name].astype("datetime64[D]")
+        columns["fraud_history"] = columns["fraud_history"].astype(bool)
+        columns["applicant_id"] = np.array(self.applicant_ids, dtype=str)
+        for group, offsets in self._offsets.items():
+            columns[f"{group}_offsets"] = np.array(offsets, dtype=np.int64)
+        columns["record_offsets"] = np.array(self._record_offsets, dtype=np.int64)
+        columns["records"] = np.frombuffer(bytes(self._records), dtype=np.uint8)
+        return ApplicantStore(columns, {name: list(values) for name, values in self.categories.items()})
+
+
+class ApplicantStore:
+    """An applicant population as NumPy columns.
+
+    Args:
+        columns: Arrays by column name, as produced by ``ApplicantStoreBuilder``
+        categories: Category tables the coded columns index into
+    """
+
+    def __init__(self, columns: Dict[str, np.ndarray], categories: Dict[str, List[str]]):
+        self.columns = columns
+        self.categories = categories
+        self._owners: Dict[str, np.ndarray] = {}
+
+    @classmethod
+    def from_applicants(cls, applicants: Iterable[Applicant]) -> "ApplicantStore":
+        return ApplicantStoreBuilder().extend(applicants).build()
+
+    @classmethod
+    def open(cls, directory: Union[str, Path], mmap: bool = True) -> "ApplicantStore":
+        """Open a saved store, memory-mapping its columns unless ``mmap`` is False."""
+        directory = Path(directory)
+        metadata = json.loads((directory / STORE_METADATA_FILE).read_text(encoding="utf-8"))
+        if metadata.get("version") != STORE_VERSION:
+            raise ValueError(f"Unsupported applicant store version: {metadata.get('version')}")
+        columns = {name: np.load(directory / f"{name}.npy", mmap_mode="r" if mmap else None)
+                   for name in metadata["columns"]}
+        return cls(columns, metadata["categories"])
+
+    def save(self, directory: Union[str, Path]) -> None:
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        for name, values in self.columns.items():
+            np.save(directory / f"{name}.npy", values)
+        metadata = {
+            "version": STORE_VERSION,
+            "count": len(self),
+            "columns": sorted(self.columns),
+            "categories": self.categories,
+        }
+        (directory / STORE_METADATA_FILE).write_text(json.dumps(metadata, indent=2), encoding="utf-8")
+
+    def __len__(self) -> int:
+        return len(self.columns["applicant_id"])
+
+    def __iter__(self) -> Iterator[Applicant]:
+        for index in range(len(self)):
+            yield self.applicant(index)
+
+    @property
+    def applicant_ids(self) -> np.ndarray:
+        return self.columns["applicant_id"]
+
+    @property
+    def nbytes(self) -> int:
+        return sum(values.nbytes for values in self.columns.values())
+
+    def applicant(self, index: int) -> Applicant:
+        """Materialise the applicant at ``index``."""
+        offsets = self.columns["record_offsets"]
+        return Applicant.model_validate_json(
+            self.columns["records"][offsets[index]:offsets[index + 1]].tobytes()
+        )
+
+    def features(self, as_of: Optional[date] = None) -> "PopulationFeatures":
+        return PopulationFeatures(self, as_of)
+
+    def codes(self, category: str, values: Sequence[str]) -> np.ndarray:
+        """Codes of ``values`` in a category table; unknown values are left out."""
+        table = self.categories[category]
+        return np.array([table.index(value) for value in values if value in table], dtype=np.int16)
+
+    def owners(self, group: str) -> np.ndarray:
+        """Applicant index of every entry in a ragged group (vehicle, violation or claim)."""
+        if group not in self._owners:
+            offsets = np.asarray(self.columns[f"{group}_offsets"])
+            self._owners[group] = np.repeat(np.arange(len(self), dtype=np.int64), np.diff(offsets))
+        return self._owners[group]
+
+    def count_per_applicant(self, group: str, mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """Entries of a ragged group per applicant, counting only ``mask`` when given."""
+        owners = self.owners(group)
+        return np.bincount(owners if mask is None else owners[mask], minlength=len(self))
+
+    def ages(self, as_of: Optional[date] = None) -> np.ndarray:
+        return full_years(self.columns["date_of_birth"], as_of or date.today())
+
+    def years_licensed(self, as_of: Optional[date] = None) -> np.ndarray:
+        """Entered years licensed, derived from the issue date where none was entered."""
+        entered = self.columns["years_licensed"]
+        derived = full_years(self.columns["license_issue_date"], as_of or date.today())
+        return np.where(entered != MISSING, entered, derived)
+
+    def violation_counts(self, lookback_years: int, types: Optional[Sequence[str]] = None,
+                         exclude: bool = False, as_of: Optional[date] = None) -> np.ndarray:
+        """Violations per applicant within the lookback window, optionally filtered by type."""
+        cutoff = np.datetime64(years_before(as_of or date.today(), lookback_years), "D")
+        mask = self.columns["violation_date"] >= cutoff
+        if types is not None:
+            mask &= np.isin(self.columns["violation_type"], self.codes("violation_type", types)) != exclude
+        return self.count_per_applicant("violation", mask)
+
+    def claim_counts(self, claim_type: str, lookback_years: int,
+                     as_of: Optional[date] = None) -> np.ndarray:
+        """Claims of one type per applicant within the lookback window."""
+        cutoff = np.datetime64(years_before(as_of or date.today(), lookback_years), "D")
+        mask = (self.columns["claim_date"] >= cutoff) \
+            & np.isin(self.columns["claim_type"], self.codes("claim_type", [claim_type]))
+        return self.count_per_applicant("claim", mask)
+
+
+class PopulationFeatures:
+    """``ApplicantFeatures`` for a whole store as of one date, one array entry per applicant.
+
+    Scalar attributes and the count methods mirror ApplicantFeatures, so
+    conditions written as comparisons on them work on either. Coded fields
+    (license status) hold codes, and vehicle conditions go through
+    ``vehicle_count``. Counts are memoised per window.
+    """
+
+    def __init__(self, store: ApplicantStore, as_of: Optional[date] = None):
+        as_of = as_of or date.today()
+        columns = store.columns
+        self.store = store
+        self.as_of = as_of
+        self.applicant_id = store.applicant_ids
+        self.age = store.ages(as_of)
+        self.years_licensed = store.years_licensed(as_of)
+        self.license_status = np.asarray(columns["license_status"])
+        self.credit_score = np.asarray(columns["credit_score"])
+        self.lapse_days = np.asarray(columns["lapse_days"])
+        self.fraud_history = np.asarray(columns["fraud_history"])
+        self._counts: Dict[Tuple[str, Any, Any], np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self.store)
+
+    def violation_count(self, types: Optional[Iterable[str]], lookback_years: int,
+                        exclude: bool = False) -> np.ndarray:
+        types = None if types is None else tuple(sorted(types))
+        key = ("violations", (types, exclude), lookback_years)
+        if key not in self._counts:
+            self._counts[key] = self.store.violation_counts(lookback_years, types, exclude, self.as_of)
+        return self._counts[key]
+
+    def claim_count(self, claim_type: str, lookback_years: int) -> np.ndarray:
+        key = ("claims", claim_type, lookback_years)
+        if key not in self._counts:
+            self._counts[key] = self.store.claim_counts(claim_type, lookback_years, self.as_of)
+        return self._counts[key]
+
+    def vehicle_count(self, types: Optional[Iterable[str]] = None,
+                      value_min: Optional[float] = None, strict: bool = False) -> np.ndarray:
+        """Vehicles per applicant of the given types and/or worth at least ``value_min``.
+
+        With ``strict``, vehicles must be worth more than ``value_min``.
+        """
+        types = None if types is None else tuple(sorted(types))
+        key = ("vehicles", types, value_min, strict)
+        if key not in self._counts:
+            columns = self.store.columns
+            mask = np.ones(len(columns["vehicle_type"]), dtype=bool)
+            if types is not None:
+                mask &= np.isin(columns["vehicle_type"], self.store.codes("vehicle_type", types))
+            if value_min is not None:
+                values = np.asarray(columns["vehicle_value"])
+                mask &= (values > value_min) if strict else (values >= value_min)
+            self._counts[key] = self.store.count_per_applicant("vehicle", mask)
+        return self._counts[key]
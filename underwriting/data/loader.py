@@ -0,0 +1,295 @@
+"""
+Bulk applicant loading.
+
+Reads applicants from JSON arrays, JSONL and CSV files in chunks. Each
+chunk is validated with one call to a shared ``TypeAdapter``, so the
+nested ``Driver``, ``Violation``, ``Claim`` and ``Vehicle`` models are
+built by pydantic-core without a Python round trip per record. A chunk
+that fails validation is re-validated record by record to name the bad
+line, which then raises ``ApplicantValidationError`` or is skipped.
+
+CSV files hold one applicant per row: applicant fields as columns, the
+primary driver's fields prefixed with ``driver_``, ``coverage_requested``
+separated by ``;`` and the nested lists (violations, claims, vehicles,
+additional drivers) as JSON cells.
+"""
+
+import csv
+import gc
+import json
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from pydantic import TypeAdapter, ValidationError
+
+from ..core.exceptions import ApplicantValidationError
+from ..core.models import Applicant, Driver
+
+DEFAULT_CHUNK_SIZE = 1000
+
+# One adapter for whole chunks; building it compiles the nested schema once
+APPLICANT_LIST_ADAPTER = TypeAdapter(List[Applicant])
+
+JSONL_SUFFIXES = (".jsonl", ".ndjson")
+CSV_DRIVER_PREFIX = "driver_"
+CSV_JSON_COLUMNS = ("vehicles", "additional_drivers")
+CSV_DRIVER_JSON_COLUMNS = ("violations", "claims")
+CSV_LIST_SEPARATOR = ";"
+CSV_COLUMNS = (
+    ["applicant_id", "territory", "credit_score", "prior_insurance_lapse_days", "fraud_history",
+     "coverage_requested"]
+    + [CSV_DRIVER_PREFIX + name for name in Driver.model_fields]
+    + list(CSV_JSON_COLUMNS)
+)
+
+# A chunk of raw records with the line (or row) each came from
+Chunk = List[Tuple[int, Any]]
+
+
+@contextmanager
+def paused_gc():
+    """Pause the cyclic garbage collector while building many objects.
+
+    Every nested model and list is a tracked container, so a bulk load
+    triggers collections that rescan everything allocated so far; on a
+    large load those passes cost several times the validation itself.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def validate_applicants(records: Iterable[Union[Dict[str, Any], Applicant]]) -> List[Applicant]:
+    """Validate in-memory applicant records with one adapter call."""
+    with paused_gc():
+        return APPLICANT_LIST_ADAPTER.validate_python(list(records))
+
+
+def iter_applicant_chunks(path: Union[str, Path], chunk_size: int = DEFAULT_CHUNK_SIZE,
+                          skip_invalid: bool = False, skip: int = 0) -> Iterator[List[Applicant]]:
+    """Stream applicants from a JSON, JSONL or CSV file in validated chunks.
+
+    Args:
+        path: Applicant file; the format is chosen by suffix (.json, .jsonl/.ndjson, .csv)
+        chunk_size: Records validated per adapter call
+        skip_invalid: Drop records that fail validation instead of raising
+        skip: Number of leading records to pass over without validating them
+
+    Raises:
+        ApplicantValidationError: A record failed validation and skip_invalid is False
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix in JSONL_SUFFIXES:
+        chunks, validate = _jsonl_chunks(path, chunk_size), _validate_json_chunk
+    elif suffix == ".csv":
+        chunks, validate = _csv_chunks(path, chunk_size), _validate_json_chunk
+    else:
+        chunks, validate = _json_array_chunks(path, chunk_size), _validate_python_chunk
+
+    for chunk in chunks:
+        if skip:
+            dropped = min(skip, len(chunk))
+            chunk, skip = chunk[dropped:], skip - dropped
+            if not chunk:
+                continue
+        with paused_gc():
+            applicants = validate(chunk, path, skip_invalid)
+        if applicants:
+            yield applicants
+
+
+def iter_applicants(path: Union[str, Path], chunk_size: int = DEFAULT_CHUNK_SIZE,
+                    skip_invalid: bool = False, skip: int = 0) -> Iterator[Applicant]:
+    """Stream applicants one at a time; see ``iter_applicant_chunks``."""
+    for chunk in iter_applicant_chunks(path, chunk_size, skip_invalid, skip):
+        yield from chunk
+
+
+def load_applicants(path: Union[str, Path], chunk_size: int = DEFAULT_CHUNK_SIZE,
+                    skip_invalid: bool = False) -> List[Applicant]:
+    """Load every applicant in a file; see ``iter_applicant_chunks``."""
+    applicants: List[Applicant] = []
+    # Paused across chunks too: the growing list would otherwise be rescanned
+    with paused_gc():
+        for chunk in iter_applicant_chunks(path, chunk_size, skip_invalid):
+            applicants.extend(chunk)
+    return applicants
+
+
+def write_applicants(applicants: Iterable[Applicant], path: Union[str, Path]) -> int:
+    """Write applicants as a JSON array, JSONL or CSV file chosen by suffix.
+
+    Returns:
+        Number of applicants written
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+    count = 0
+    with open(path, "w", encoding="utf-8", newline="" if suffix == ".csv" else None) as handle:
+        if suffix == ".csv":
+            writer = csv.DictWriter(handle, fieldnames=CSV_COLUMNS)
+            writer.writeheader()
+            for applicant in applicants:
+                writer.writerow(applicant_to_csv_row(applicant))
+                count += 1
+        elif suffix in JSONL_SUFFIXES:
+            for applicant in applicants:
+                handle.write(applicant.model_dump_json() + "\n")
+                count += 1
+        else:
+            records = [applicant.model_dump(mode="json") for applicant in applicants]
+            json.dump(records, handle)
+            count = len(records)
+    return count
+
+
+def applicant_to_csv_row(applicant: Applicant) -> Dict[str, Any]:
+    """Flatten an applicant into a CSV row."""
+    record = applicant.model_dump(mode="json")
+    driver = record.pop("primary_driver")
+    row = {name: record[name] for name in CSV_COLUMNS if name in record}
+    row["coverage_requested"] = CSV_LIST_SEPARATOR.join(record["coverage_requested"])
+    for name in CSV_JSON_COLUMNS:
+        row[name] = json.dumps(record[name])
+    for name, value in driver.items():
+        row[CSV_DRIVER_PREFIX + name] = json.dumps(value) if name in CSV_DRIVER_JSON_COLUMNS else value
+    return {name: "" if value is None else value for name, value in row.items()}
+
+
+def csv_row_parser(header: List[str]):
+    """Return a function turning a CSV row with this header into applicant JSON.
+
+    Scalars are emitted as JSON strings for validation to coerce, JSON
+    cells are spliced in undecoded and empty cells are left out so model
+    defaults apply.
+    """
+    applicant_columns = []
+    driver_columns = []
+    for index, name in enumerate(header):
+        columns = applicant_columns
+        if name.startswith(CSV_DRIVER_PREFIX):
+            name = name[len(CSV_DRIVER_PREFIX):]
+            columns = driver_columns
+            raw = name in CSV_DRIVER_JSON_COLUMNS
+        else:
+            raw = name in CSV_JSON_COLUMNS
+        split = name == "coverage_requested"
+        columns.append((index, json.dumps(name) + ":", raw, split))
+
+    def fields(row: List[str], columns) -> str:
+        parts = []
+        for index, key, raw, split in columns:
+            value = row[index] if index < len(row) else ""
+            if not value:
+                continue
+            if raw:
+                parts.append(key + value)
+            elif split:
+                parts.append(key + json.dumps(value.split(CSV_LIST_SEPARATOR)))
+            else:
+                parts.append(key + json.dumps(value))
+        return ",".join(parts)
+
+    def parse(row: List[str]) -> bytes:
+        applicant = fields(row, applicant_columns)
+        driver = '"primary_driver":{' + fields(row, driver_columns) + "}"
+        return ("{" + applicant + ("," if applicant else "") + driver + "}").encode()
+
+    return parse
+
+
+def _jsonl_chunks(path: Path, chunk_size: int) -> Iterator[Chunk]:
+    chunk: Chunk = []
+    with open(path, "rb") as handle:
+        for line_number, line in enumerate(handle, 1):
+            line = line.strip()
+            if not line:
+                continue
+            chunk.append((line_number, line))
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+
+def _csv_chunks(path: Path, chunk_size: int) -> Iterator[Chunk]:
+    chunk: Chunk = []
+    with open(path, encoding="utf-8", newline="") as handle:
+        reader = csv.reader(handle)
+        header = next(reader, None)
+        if header is None:
+            return
+        parse = csv_row_parser(header)
+        for row in reader:
+            if not row:
+                continue
+            chunk.append((reader.line_num, parse(row)))
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+
+def _json_array_chunks(path: Path, chunk_size: int) -> Iterator[Chunk]:
+    # A JSON array has to be decoded whole; validation is still chunked
+    with open(path, encoding="utf-8") as handle:
+        records = json.load(handle)
+    if not isinstance(records, list):
+        raise ApplicantValidationError(f"{path}: expected a JSON array of applicants")
+    for start in range(0, len(records), chunk_size):
+        yield [(start + offset + 1, record)
+               for offset, record in enumerate(records[start:start + chunk_size])]
+
+
+def _validate_json_chunk(chunk: Chunk, path: Path, skip_invalid: bool) -> List[Applicant]:
+    try:
+        return APPLICANT_LIST_ADAPTER.validate_json(b"[" + b",".join(line for _, line in chunk) + b"]")
+    except ValidationError:
+        # Also raised for malformed JSON, including a bad CSV JSON cell
+        return _validate_records(chunk, path, skip_invalid, Applicant.model_validate_json)
+
+
+def _validate_python_chunk(chunk: Chunk, path: Path, skip_invalid: bool) -> List[Applicant]:
+    try:
+        return APPLICANT_LIST_ADAPTER.validate_python([record for _, record in chunk])
+    except ValidationError:
+        return _validate_records(chunk, path, skip_invalid, Applicant.model_validate)
+
+
+def _validate_records(chunk: Chunk, path: Path, skip_invalid: bool, validate) -> List[Applicant]:
+    """Validate a failed chunk one record at a time to locate the bad ones."""
+    applicants = []
+    for line_number, record in chunk:
+        try:
+            applicants.append(validate(record))
+        except ValidationError as e:
+            if skip_invalid:
+                continue
+            raise ApplicantValidationError(
+                f"{path}:{line_number}: invalid applicant: {e}",
+                applicant_id=_record_id(record),
+                field_name=_error_field(e)
+            ) from e
+    return applicants
+
+
+def _record_id(record: Any) -> Optional[str]:
+    if isinstance(record, bytes):
+        try:
+            record = json.loads(record)
+        except ValueError:
+            return None
+    return record.get("applicant_id") if isinstance(record, dict) else None
+
+
+def _error_field(error: ValidationError) -> Optional[str]:
+    errors = error.errors()
+    return ".".join(str(part) for part in errors[0]["loc"]) if errors else None
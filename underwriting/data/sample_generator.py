@@ -1,4 +1,5 @@
 from datetime import date, timedelta
+from underwriting.core.features import ApplicantFeatures
 from underwriting.core.models import (
     Applicant, Driver, Vehicle, Violation, Claim,
     LicenseStatus, ViolationType, ClaimType, VehicleCategory
@@ -313,17 +314,16 @@ def create_sample_applicants():
 def print_applicant_summary(applicant: Applicant):
     """Print a summary of an applicant for review."""
     driver = applicant.primary_driver
+    features = ApplicantFeatures(applicant)
     print(f"\n=== {applicant.applicant_id}: {driver.first_name} {driver.last_name} ===")
-    print(f"Age: {driver.age}")
-    print(f"License Status: {driver.license_status.value}")
-    print(f"Violations: {len(driver.violations)}")
-    for v in driver.violations:
-        years_ago = (date.today() - v.violation_date).days // 365
-        print(f"  - {v.violation_type.value} ({years_ago} years ago)")
-    print(f"Claims: {len(driver.claims)}")
-    for c in driver.claims:
-        years_ago = (date.today() - c.claim_date).days // 365
-        print(f"  - {c.claim_type.value}: ${c.claim_amount:,.0f} ({years_ago} years ago)")
+    print(f"Age: {features.age}")
+    print(f"License Status: {features.license_status}")
+    print(f"Violations: {len(features.violations)}")
+    for violation_type, _, years_ago in features.violations:
+        print(f"  - {violation_type} ({years_ago} years ago)")
+    print(f"Claims: {len(features.claims)}")
+    for claim_type, _, amount, years_ago in features.claims:
+        print(f"  - {claim_type}: ${amount:,.0f} ({years_ago} years ago)")
     print(f"Credit Score: {applicant.credit_score}")
     print(f"Coverage Lapse: {applicant.prior_insurance_lapse_days} days")
     print(f"Vehicles: {len(applicant.vehicles)}")
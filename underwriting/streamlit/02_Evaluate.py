@@ -156,7 +156,8 @@ def create_applicant_form():
             last_name = sample_applicant.primary_driver.last_name
             age = sample_applicant.primary_driver.age
             license_status = sample_applicant.primary_driver.license_status.value
-            years_licensed = sample_applicant.primary_driver.years_licensed
+            years_licensed = (sample_applicant.primary_driver.years_licensed
+                              or sample_applicant.primary_driver.years_licensed_calc)
             email = sample_applicant.primary_driver.email
             driver_id = sample_applicant.primary_driver.id
             date_of_birth = sample_applicant.primary_driver.date_of_birth
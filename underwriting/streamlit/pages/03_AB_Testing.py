@@ -6,6 +6,7 @@ comparing different underwriting rules and strategies.
 """
 
 import streamlit as st
+import os
 import sys
 from pathlib import Path
 import plotly.graph_objects as go
@@ -19,6 +20,7 @@ project_root = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from underwriting.testing.ab_engine import ABTestEngine, TestConfiguration
+from underwriting.testing.results_store import RESULTS_DB_ENV_VAR, SQLiteResultsBackend
 from underwriting.testing.statistical_analysis import StatisticalAnalyzer
 from underwriting.data.sample_generator import create_sample_applicants 
 from underwriting.utils.env_loader import load_environment_variables
@@ -243,28 +245,29 @@ def run_ab_test_analysis():
     
     # Real A/B test
     try:
-        with st.spinner(" Running A/B test analysis..."):
-            # Initialize A/B testing engine
-            ab_engine = ABTestEngine()
-            
-            # Get sample applicants
-            sample_applicants = create_sample_applicants()
-            
-            # Run comparison
-            if config['test_type'] == "Rule Comparison":
-                results = ab_engine.run_batch_comparison(
-                    sample_applicants,
-                    config['variant_a'], 
-                    config['variant_b']
-                )
-            else:
-                results = ab_engine.run_batch_comparison(
-                    sample_applicants,
-                    config['variant_a'], 
-                    config['variant_b']
-                )
-            
-            display_ab_results(results, config)
+        # Initialize A/B testing engine
+        ab_engine = ABTestEngine()
+        
+        # Get sample applicants
+        sample_applicants = create_sample_applicants()
+        
+        # Stream the comparison, refreshing running metrics as results arrive
+        variants = [config['variant_a'], config['variant_b']]
+        total = len(sample_applicants) * len(variants)
+        resolved_a = ab_engine.resolve_variant(config['variant_a'])
+        progress = st.progress(0.0, text=" Running A/B test analysis...")
+        live_panel = st.empty()
+        pairs = [[None, None] for _ in sample_applicants]
+        for completed, (index, test_result) in enumerate(ab_engine.stream_comparison(sample_applicants, variants), 1):
+            # Both sides may be the same variant; then the first result is A's
+            side = 1 if test_result.variant_id != resolved_a or pairs[index][0] is not None else 0
+            pairs[index][side] = test_result
+            progress.progress(completed / total, text=f" Evaluated {completed}/{total}")
+            show_live_metrics(live_panel, ab_engine.live_comparison_metrics(*variants), config)
+        progress.empty()
+        results = [tuple(pair) for pair in pairs]
+        
+        display_ab_results(results, config)
     
     except Exception as e:
         st.error(f" Error running A/B test: {str(e)}")
@@ -410,36 +413,54 @@ def show_mock_ab_results(config):
         • Consider adjusting criteria if growth is priority
         """)
 
+def show_live_metrics(placeholder, metrics, config):
+    """Render running accept rates and agreement for an A/B test in progress."""
+    with placeholder.container():
+        col1, col2, col3 = st.columns(3)
+        col1.metric(f"Accept Rate ({config['variant_a'].title()})", f"{metrics.accept_rate_a:.1f}%")
+        col2.metric(f"Accept Rate ({config['variant_b'].title()})", f"{metrics.accept_rate_b:.1f}%",
+                    f"{metrics.accept_rate_b - metrics.accept_rate_a:+.1f}%")
+        col3.metric("Agreement", f"{metrics.agreement_rate:.1f}%", help=f"Over {metrics.total_tests} applicants")
+
 def display_ab_results(results, config):
     """Display real A/B test results."""
     show_mock_ab_results(config)
 
+# Most recent run/variant rows shown in the history table
+HISTORY_LIMIT = 200
+
 def show_test_history():
-    """Show historical A/B test results."""
+    """Show historical A/B test results, aggregated by the results store."""
     st.markdown("##  Test History")
     
+    if not os.environ.get(RESULTS_DB_ENV_VAR):
+        st.info(f"Set {RESULTS_DB_ENV_VAR} to a SQLite file to keep A/B test results across sessions.")
+        return
+    
+    store = SQLiteResultsBackend.from_env()
+    try:
+        history = store.history(limit=HISTORY_LIMIT)
+    finally:
+        store.close()
+    
+    if not history:
+        st.info("No A/B test results recorded yet.")
+        return
+    
     history_data = [
         {
-            "Date": "2024-01-15",
-            "Test": "Conservative vs Standard",
-            "Winner": "Standard",
-            "Improvement": "+12%",
-            "Significance": "High"
-        },
-        {
-            "Date": "2024-01-10",
-            "Test": "Standard vs Liberal",
-            "Winner": "Liberal",
-            "Improvement": "+8%",
-            "Significance": "Medium"
-        },
-        {
-            "Date": "2024-01-05",
-            "Test": "Prompt A vs Prompt B",
-            "Winner": "Prompt B",
-            "Improvement": "+5%",
-            "Significance": "Low"
+            "Started": summary.started_at[:19].replace("T", " "),
+            "Run": summary.run_id,
+            "Variant": summary.variant_id,
+            "Configuration": summary.config_fingerprint or "",
+            "Applicants": summary.applicants,
+            "Accept": f"{summary.accept_rate:.1f}%",
+            "Deny": f"{summary.deny_rate:.1f}%",
+            "Adjudicate": f"{summary.adjudicate_rate:.1f}%",
+            "Errors": f"{summary.error_rate:.1f}%",
+            "Avg Time (ms)": round(summary.avg_processing_time_ms, 1)
         }
+        for summary in history
     ]
     
     df = pd.DataFrame(history_data)
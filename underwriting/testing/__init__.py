@@ -13,7 +13,24 @@ from .ab_engine import (
     ABTestEngine,
     TestConfiguration,
     TestResult,
-    ComparisonMetrics
+    ComparisonMetrics,
+    NWayComparison
+)
+
+from .results_store import (
+    ResultsBackend,
+    SQLiteResultsBackend,
+    VariantSummary
+)
+
+from .accumulators import (
+    LiveMetrics,
+    RunningMoments
+)
+
+from .sequential import (
+    SequentialOutcome,
+    SequentialTest
 )
 
 from .statistical_analysis import (
@@ -23,18 +40,47 @@ from .statistical_analysis import (
     BusinessImpactAnalysis
 )
 
+from .stub_llm import (
+    LatencyModel,
+    ModelProfile,
+    StubLLMConfig,
+    StubLLMServer,
+    complete_batch_file
+)
+
 __all__ = [
     # A/B Testing Engine
     "ABTestEngine",
     "TestConfiguration", 
     "TestResult",
     "ComparisonMetrics",
+    "NWayComparison",
+    
+    # Results store
+    "ResultsBackend",
+    "SQLiteResultsBackend",
+    "VariantSummary",
+    
+    # Live metrics
+    "LiveMetrics",
+    "RunningMoments",
+    
+    # Sequential testing
+    "SequentialOutcome",
+    "SequentialTest",
     
     # Statistical Analysis
     "StatisticalAnalyzer",
     "BusinessImpactCalculator",
     "StatisticalTest",
     "BusinessImpactAnalysis",
+    
+    # Stub LLM server
+    "LatencyModel",
+    "ModelProfile",
+    "StubLLMConfig",
+    "StubLLMServer",
+    "complete_batch_file",
 
     # Underwriting Rules and Prompts
     "underwriting_rules_standard",
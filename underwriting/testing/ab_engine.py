@@ -1,13 +1,21 @@
-from typing import Dict, List, Any, Optional, Tuple
-from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Sequence, Tuple
+from datetime import date, datetime
 from dataclasses import dataclass
+from itertools import combinations
+import asyncio
+import concurrent.futures
 import json
 import time
 import os
+import uuid
 from enum import Enum
 
-from underwriting.core.engine import UnderwritingEngine
+from underwriting.core.engine import DEFAULT_MAX_CONCURRENCY, UnderwritingEngine, submit_coroutine
+from underwriting.core.features import ApplicantFeatures
 from underwriting.core.models import Applicant, UnderwritingResult, UnderwritingDecision
+from .accumulators import LiveMetrics
+from .results_store import ResultsBackend, SQLiteResultsBackend, VariantSummary
+from .sequential import SequentialOutcome, SequentialTest
 
 class TestVariant(str, Enum):
     """Test variant identifiers."""
@@ -38,6 +46,10 @@ class TestResult:
     processing_time_ms: float
     timestamp: datetime
     error: Optional[str] = None
+    time_to_decision_ms: Optional[float] = None
+    config_fingerprint: Optional[str] = None
+    # Time spent waiting for a concurrency slot, excluded from processing_time_ms
+    queue_time_ms: Optional[float] = None
 
 @dataclass
 class ComparisonMetrics:
@@ -64,21 +76,100 @@ class ComparisonMetrics:
     # Agreement metrics
     agreement_rate: float
     disagreement_details: List[Dict[str, Any]]
+    
+    # Time until the decision was parsed (streaming stops early)
+    avg_time_to_decision_a: float = 0.0
+    avg_time_to_decision_b: float = 0.0
+    
+    # Time waiting for a concurrency slot (concurrent runs only)
+    avg_queue_time_a: float = 0.0
+    avg_queue_time_b: float = 0.0
+
+@dataclass
+class NWayComparison:
+    """All pairwise comparisons of several variants evaluated in one pass."""
+    variant_ids: List[str]
+    total_applicants: int
+    
+    # Percentage agreement, agreement_matrix[i][j] between variant_ids[i] and [j]
+    agreement_matrix: List[List[float]]
+    pairwise: Dict[Tuple[str, str], ComparisonMetrics]
+    
+    def metrics(self, variant_a: str, variant_b: str) -> ComparisonMetrics:
+        """Comparison metrics for a pair, in either order of the variants' registration."""
+        if (variant_a, variant_b) in self.pairwise:
+            return self.pairwise[variant_a, variant_b]
+        return self.pairwise[variant_b, variant_a]
+
+# Rule-file variants every ABTestEngine starts with, and the short names they answer to
+DEFAULT_TEST_CONFIGURATIONS = (
+    TestConfiguration(
+        variant_id="underwriting_rules_standard",
+        name="Standard Underwriting Rules",
+        description="Default underwriting rules for standard evaluation.",
+        rules_file="underwriting_rules_standard.json"
+    ),
+    TestConfiguration(
+        variant_id="underwriting_rules_conservative",
+        name="Conservative Underwriting Rules",
+        description="More conservative underwriting rules for risk-averse evaluation.",
+        rules_file="underwriting_rules_conservative.json"
+    ),
+    TestConfiguration(
+        variant_id="underwriting_rules_liberal",
+        name="Liberal Underwriting Rules",
+        description="Liberal automobile insurance underwriting rules for risk-tolerant evaluation.",
+        rules_file="underwriting_rules_liberal.json"
+    ),
+)
+
+VARIANT_ALIASES = {
+    "standard": "underwriting_rules_standard",
+    "conservative": "underwriting_rules_conservative",
+    "liberal": "underwriting_rules_liberal"
+}
+
+def new_run_id() -> str:
+    """Sortable, unique identifier for a run of A/B test results."""
+    return f"{datetime.now():%Y%m%d-%H%M%S}-{uuid.uuid4().hex[:6]}"
 
 class ABTestEngine:
     """A/B testing engine for underwriting rule comparisons."""
     
-    def __init__(self):
-        """Initialize the A/B testing engine."""
+    def __init__(self, results_backend: Optional[ResultsBackend] = None, run_id: Optional[str] = None,
+                 register_defaults: bool = True):
+        """
+        Initialize the A/B testing engine.
+        
+        Args:
+            results_backend: Where results are stored; by default the SQLite file named
+                by UNDERWRITING_AB_RESULTS_DB, or an in-memory database when it is unset
+            run_id: Run to record results under (default: a new run)
+            register_defaults: Register the standard, conservative and liberal rule variants
+        """
         print("Initializing A/B Test Engine...")
         self.test_configurations: Dict[str, TestConfiguration] = {}
-        self.test_results: List[TestResult] = []
+        self.results = results_backend or SQLiteResultsBackend.from_env()
+        self.run_id = run_id or new_run_id()
+        self.live = LiveMetrics()
         self.engines: Dict[str, UnderwritingEngine] = {}
+        self.aliases: Dict[str, str] = dict(VARIANT_ALIASES)
+        
+        if register_defaults:
+            for config in DEFAULT_TEST_CONFIGURATIONS:
+                self.register_test_configuration(config)
     
-    def register_test_configuration(self, config: TestConfiguration):
-        """Register a test configuration."""
+    def register_test_configuration(self, config: TestConfiguration, aliases: Tuple[str, ...] = ()):
+        """Register a test configuration and build its engine once, up front.
+        
+        Args:
+            config: Variant to register; replaces any variant with the same ID
+            aliases: Extra names the variant can be addressed by
+        """
         print("Registering test configuration:")
         self.test_configurations[config.variant_id] = config
+        for alias in aliases:
+            self.aliases[alias] = config.variant_id
         
         # Create underwriting engine for this configuration
         if config.rules_file:
@@ -90,92 +181,190 @@ class ABTestEngine:
             
             self.engines[config.variant_id] = engine
     
+    def resolve_variant(self, variant_id: str) -> str:
+        """Return the registered variant ID for an ID or alias.
+        
+        Raises:
+            ValueError: Neither a registered variant nor an alias of one
+        """
+        if variant_id in self.engines:
+            return variant_id
+        resolved = self.aliases.get(variant_id)
+        if resolved not in self.engines:
+            raise ValueError(f"Variant {variant_id} is not registered in the test configurations.")
+        return resolved
+    
+    @staticmethod
+    def _test_result(variant_id: str, fingerprint: str, applicant: Applicant,
+                     underwriting_result: Optional[UnderwritingResult], processing_time: float,
+                     error: Optional[Exception] = None,
+                     queue_time: Optional[float] = None) -> TestResult:
+        """Build the TestResult for one evaluation, or for one that raised ``error``."""
+        if underwriting_result is None:
+            return TestResult(
+                applicant_id=applicant.applicant_id,
+                variant_id=variant_id,
+                decision=UnderwritingDecision.ADJUDICATE,
+                reason=f"Error: {str(error)}",
+                triggered_rules=[],
+                risk_factors=["System Error"],
+                processing_time_ms=processing_time,
+                timestamp=datetime.now(),
+                error=str(error),
+                config_fingerprint=fingerprint,
+                queue_time_ms=queue_time
+            )
+        
+        return TestResult(
+            applicant_id=applicant.applicant_id,
+            variant_id=variant_id,
+            decision=underwriting_result.decision,
+            reason=underwriting_result.reason,
+            triggered_rules=underwriting_result.triggered_rules,
+            risk_factors=underwriting_result.risk_factors,
+            processing_time_ms=processing_time,
+            timestamp=datetime.now(),
+            error=underwriting_result.error,
+            time_to_decision_ms=underwriting_result.time_to_decision_ms,
+            config_fingerprint=fingerprint,
+            queue_time_ms=queue_time
+        )
+    
     def run_single_comparison(self, applicant: Applicant, variant_a: str, variant_b: str) -> Tuple[TestResult, TestResult]:
-        """Run a single applicant through two variants and return results."""
+        """Run a single applicant through two registered variants (IDs or aliases) and return results."""
         
         results = []
-        self.__init__()
-        self.register_test_configuration(TestConfiguration(
-            variant_id="underwriting_rules_standard",
-            name="Standard Underwriting Rules",
-            description="Default underwriting rules for standard evaluation.",
-            rules_file="underwriting_rules_standard.json"
-        ))
-        self.register_test_configuration(TestConfiguration(
-            variant_id="underwriting_rules_conservative",
-            name="Conservative Underwriting Rules",
-            description="More conservative underwriting rules for risk-averse evaluation.",
-            rules_file="underwriting_rules_conservative.json"
-        ))
-        self.register_test_configuration(TestConfiguration(
-            variant_id="underwriting_rules_liberal",
-            name="Liberal Underwriting Rules",
-            description="Liberal automobile insurance underwriting rules for risk-tolerant evaluation.",
-            rules_file="underwriting_rules_liberal.json"
-        ))
-
-        variant_map = {
-            "standard": "underwriting_rules_standard",
-            "conservative": "underwriting_rules_conservative",
-            "liberal": "underwriting_rules_liberal"
-        }
-        variant_a = variant_map.get(variant_a, variant_a)
-        variant_b = variant_map.get(variant_b, variant_b)
+        variant_a = self.resolve_variant(variant_a)
+        variant_b = self.resolve_variant(variant_b)
 
         for variant_id in [variant_a, variant_b]:
             print(f"\nRunning evaluation for variant: {variant_id}")
-            if variant_id not in self.engines:
-                raise ValueError(f"Variant {variant_id} is not registered in the test configurations.")
-            
             engine = self.engines[variant_id]
-            start_time = time.time()
+            fingerprint = engine.config_fingerprint()
+            start_time = time.perf_counter()
             
             try:
-                # Run evaluation
                 underwriting_result = engine.evaluate_applicant(applicant)
-                processing_time = (time.time() - start_time) * 1000  # Convert to milliseconds
-                
-                # Create test result
-                test_result = TestResult(
-                    applicant_id=applicant.applicant_id,
-                    variant_id=variant_id,
-                    decision=underwriting_result.decision,
-                    reason=underwriting_result.reason,
-                    triggered_rules=underwriting_result.triggered_rules,
-                    risk_factors=underwriting_result.risk_factors,
-                    processing_time_ms=processing_time,
-                    timestamp=datetime.now(),
-                    error=None
-                )
-                
+                processing_time = (time.perf_counter() - start_time) * 1000  # Convert to milliseconds
+                test_result = self._test_result(variant_id, fingerprint, applicant,
+                                                underwriting_result, processing_time)
             except Exception as e:
-                processing_time = (time.time() - start_time) * 1000
-                
-                test_result = TestResult(
-                    applicant_id=applicant.applicant_id,
-                    variant_id=variant_id,
-                    decision=UnderwritingDecision.ADJUDICATE,
-                    reason=f"Error: {str(e)}",
-                    triggered_rules=[],
-                    risk_factors=["System Error"],
-                    processing_time_ms=processing_time,
-                    timestamp=datetime.now(),
-                    error=str(e)
-                )
+                processing_time = (time.perf_counter() - start_time) * 1000
+                test_result = self._test_result(variant_id, fingerprint, applicant, None, processing_time, e)
             
             results.append(test_result)
-            self.test_results.append(test_result)
+            self._record(test_result)
         
         return results[0], results[1]
     
-    def run_batch_comparison(self, applicants: List[Applicant], variant_a: str, variant_b: str) -> List[Tuple[TestResult, TestResult]]:
-        """Run a batch of applicants through two variants."""
+    def _record(self, test_result: TestResult) -> None:
+        """Store a result and fold it into the run's live metrics."""
+        self.results.add(self.run_id, test_result)
+        self.live.add(test_result)
+    
+    async def _aevaluate_pair(self, semaphore: asyncio.Semaphore, applicant: Applicant, variant_id: str,
+                              fingerprint: str, prepared: Tuple[ApplicantFeatures, str],
+                              submitted: float) -> TestResult:
+        """Evaluate one (applicant, variant) pair once a concurrency slot is free."""
+        features, applicant_data = prepared
+        async with semaphore:
+            start_time = time.perf_counter()
+            queue_time = (start_time - submitted) * 1000
+            try:
+                underwriting_result = await self.engines[variant_id].aevaluate_applicant(
+                    applicant, features=features, applicant_data=applicant_data
+                )
+                processing_time = (time.perf_counter() - start_time) * 1000
+                return self._test_result(variant_id, fingerprint, applicant, underwriting_result,
+                                         processing_time, queue_time=queue_time)
+            except Exception as e:
+                processing_time = (time.perf_counter() - start_time) * 1000
+                return self._test_result(variant_id, fingerprint, applicant, None, processing_time, e,
+                                         queue_time=queue_time)
+    
+    def stream_comparison(self, applicants: Iterable[Applicant], variants: Sequence[str],
+                          max_concurrency: int = DEFAULT_MAX_CONCURRENCY) -> Iterator[Tuple[int, TestResult]]:
+        """Evaluate every (applicant, variant) pair concurrently, yielding ``(applicant index, result)`` as each completes.
+        
+        All pairs share one pool of ``max_concurrency`` evaluation slots on
+        the engines' background event loop, so a slow variant does not hold
+        up the others. A few pairs beyond that are kept queued so a freed
+        slot is refilled at once. Each result's ``processing_time_ms``
+        covers only its own evaluation; the wait for a slot is recorded in
+        ``queue_time_ms``. Results are stored as they arrive.
+        
+        Each applicant's features and prompt data block are prepared once
+        and shared by every variant evaluating it as of the same date.
+        """
+        
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        
+        variant_ids = [self.resolve_variant(variant_id) for variant_id in variants]
+        fingerprints = {variant_id: self.engines[variant_id].config_fingerprint() for variant_id in variant_ids}
+        
+        def prepare(applicant: Applicant) -> Dict[Optional[date], Tuple[ApplicantFeatures, str]]:
+            prepared = {}
+            for variant_id in variant_ids:
+                engine = self.engines[variant_id]
+                if engine.as_of not in prepared:
+                    features = engine.extract_features(applicant)
+                    prepared[engine.as_of] = (features, engine._format_applicant_data(applicant, features))
+            return prepared
+        
+        def iter_pairs():
+            for index, applicant in enumerate(applicants):
+                prepared = prepare(applicant)
+                for variant_id in variant_ids:
+                    yield index, applicant, variant_id, prepared[self.engines[variant_id].as_of]
+        
+        pairs = iter_pairs()
+        
+        # Created on first use inside the loop; bounds evaluations, not submissions
+        semaphore = asyncio.Semaphore(max_concurrency)
+        pending: Dict[concurrent.futures.Future, int] = {}
+        
+        def submit_next() -> None:
+            pair = next(pairs, None)
+            if pair is not None:
+                index, applicant, variant_id, prepared = pair
+                coroutine = self._aevaluate_pair(semaphore, applicant, variant_id, fingerprints[variant_id],
+                                                 prepared, time.perf_counter())
+                pending[submit_coroutine(coroutine)] = index
+        
+        try:
+            for _ in range(2 * max_concurrency):
+                submit_next()
+            while pending:
+                done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    index = pending.pop(future)
+                    test_result = future.result()
+                    self._record(test_result)
+                    yield index, test_result
+                    submit_next()
+        finally:
+            for future in pending:
+                future.cancel()
+            self.results.flush()
+    
+    def run_batch_comparison(self, applicants: List[Applicant], variant_a: str, variant_b: str,
+                             max_concurrency: Optional[int] = None) -> List[Tuple[TestResult, TestResult]]:
+        """Run a batch of applicants through two variants.
+        
+        Applicants are evaluated one variant at a time unless ``max_concurrency``
+        is given, in which case every (applicant, variant) pair runs through
+        ``stream_comparison`` with that many evaluations in flight.
+        """
         
         print(f"\n{'='*80}")
         print(f"A/B TEST: {variant_a.upper()} vs {variant_b.upper()}")
         print(f"{'='*80}")
         print(f"Testing {len(applicants)} applicants...")
         
+        if max_concurrency is not None:
+            return self._run_concurrent_batch(applicants, variant_a, variant_b, max_concurrency)
+        
         batch_results = []
         
         for i, applicant in enumerate(applicants):
@@ -183,101 +372,236 @@ class ABTestEngine:
             
             result_a, result_b = self.run_single_comparison(applicant, variant_a, variant_b)
             batch_results.append((result_a, result_b))
-            
-            # Show quick comparison
-            agreement = "✓" if result_a.decision == result_b.decision else "✗"
-            print(f"  {variant_a}: {result_a.decision.value.upper()}")
-            print(f"  {variant_b}: {result_b.decision.value.upper()}")
-            print(f"  Agreement: {agreement}")
+            self._print_pair(variant_a, variant_b, result_a, result_b)
         
+        self.results.flush()
         return batch_results
     
-    def calculate_comparison_metrics(self, variant_a: str, variant_b: str) -> ComparisonMetrics:
-        """Calculate comparison metrics between two variants."""
-        
-        # Filter results for the two variants
-        results_a = [r for r in self.test_results if r.variant_id == variant_a]
-        results_b = [r for r in self.test_results if r.variant_id == variant_b]
+    def _run_concurrent_batch(self, applicants: List[Applicant], variant_a: str, variant_b: str,
+                              max_concurrency: int) -> List[Tuple[TestResult, TestResult]]:
+        """Pair up streamed results by applicant, reporting each applicant once both are in."""
+        
+        resolved_a = self.resolve_variant(variant_a)
+        by_applicant: Dict[int, List[Optional[TestResult]]] = {}
+        batch_results: List[Optional[Tuple[TestResult, TestResult]]] = [None] * len(applicants)
+        completed = 0
+        
+        for index, test_result in self.stream_comparison(applicants, [variant_a, variant_b], max_concurrency):
+            # Both sides may be the same variant; then the first result is A's
+            pair = by_applicant.setdefault(index, [None, None])
+            side = 1 if test_result.variant_id != resolved_a or pair[0] is not None else 0
+            pair[side] = test_result
+            if None not in pair:
+                result_a, result_b = by_applicant.pop(index)
+                batch_results[index] = (result_a, result_b)
+                completed += 1
+                print(f"\nCompleted applicant {completed}/{len(applicants)}: {applicants[index].applicant_id}")
+                self._print_pair(variant_a, variant_b, result_a, result_b)
         
-        # Ensure we have matching applicants
-        applicant_ids_a = {r.applicant_id for r in results_a}
-        applicant_ids_b = {r.applicant_id for r in results_b}
-        common_applicants = applicant_ids_a.intersection(applicant_ids_b)
+        return batch_results
+    
+    def run_sequential_comparison(self, applicants: List[Applicant], variant_a: str, variant_b: str,
+                                  sequential_test: SequentialTest,
+                                  max_concurrency: int = DEFAULT_MAX_CONCURRENCY) -> List[Tuple[TestResult, TestResult]]:
+        """Compare two variants, stopping as soon as ``sequential_test`` reaches a conclusion.
+        
+        Each applicant's pair of results is fed to the test as it completes.
+        On a significant or futile outcome the stream is closed, which
+        cancels evaluations still queued or in flight, so at most about
+        ``max_concurrency`` evaluations beyond the stopping point are paid
+        for. Applicants should be in random order, since the ones evaluated
+        before stopping stand for the whole batch.
+        
+        Returns:
+            The completed pairs in completion order; metrics and exports cover only these
+        """
         
-        if not common_applicants:
-            raise ValueError("No common applicants found between variants")
+        print(f"\n{'='*80}")
+        print(f"SEQUENTIAL A/B TEST: {variant_a.upper()} vs {variant_b.upper()}")
+        print(f"{'='*80}")
+        print(f"Testing up to {len(applicants)} applicants "
+              f"({sequential_test.decision.value} rate, {sequential_test.confidence_level:.0%} confidence)...")
+        
+        resolved_a = self.resolve_variant(variant_a)
+        by_applicant: Dict[int, List[Optional[TestResult]]] = {}
+        batch_results: List[Tuple[TestResult, TestResult]] = []
+        
+        stream = self.stream_comparison(applicants, [variant_a, variant_b], max_concurrency)
+        try:
+            for index, test_result in stream:
+                # Both sides may be the same variant; then the first result is A's
+                pair = by_applicant.setdefault(index, [None, None])
+                side = 1 if test_result.variant_id != resolved_a or pair[0] is not None else 0
+                pair[side] = test_result
+                if None in pair:
+                    continue
+                result_a, result_b = by_applicant.pop(index)
+                batch_results.append((result_a, result_b))
+                outcome = sequential_test.add_pair(result_a, result_b)
+                print(f"\rCompleted {len(batch_results)}/{len(applicants)} applicants "
+                      f"(p={sequential_test.p_value:.4f})", end="", flush=True)
+                if outcome is not SequentialOutcome.CONTINUE:
+                    break
+        finally:
+            stream.close()
+        print()
+        
+        if sequential_test.outcome is SequentialOutcome.CONTINUE:
+            print(f"Evaluated all {len(applicants)} applicants without reaching a conclusion")
+        else:
+            print(f"Stopped after {len(batch_results)} of {len(applicants)} applicants: "
+                  f"{sequential_test.outcome.value}")
+        print(f"  {sequential_test.interpretation()}")
         
-        # Filter to common applicants only
-        results_a = [r for r in results_a if r.applicant_id in common_applicants]
-        results_b = [r for r in results_b if r.applicant_id in common_applicants]
+        return batch_results
+    
+    def _print_pair(self, variant_a: str, variant_b: str, result_a: TestResult, result_b: TestResult) -> None:
+        """Show a quick comparison of one applicant's two results and the run so far."""
+        agreement = "✓" if result_a.decision == result_b.decision else "✗"
+        running = self.live_comparison_metrics(variant_a, variant_b)
+        print(f"  {variant_a}: {result_a.decision.value.upper()}")
+        print(f"  {variant_b}: {result_b.decision.value.upper()}")
+        print(f"  Agreement: {agreement} (running {running.agreement_rate:.1f}% over {running.total_tests})")
+    
+    def variant_results(self, variant_id: str) -> List[TestResult]:
+        """Load the current run's results for one variant, e.g. for statistical tests."""
+        return list(self.results.results(run_id=self.run_id, variant_id=self.resolve_variant(variant_id)))
+    
+    def calculate_comparison_metrics(self, variant_a: str, variant_b: str) -> ComparisonMetrics:
+        """Calculate comparison metrics between two variants over the current run.
         
-        total_tests = len(common_applicants)
+        Only applicants evaluated by both variants are compared; agreement
+        uses each applicant's latest result. Failed evaluations are counted
+        in the error rate rather than as ADJUDICATE decisions.
+        """
         
-        # Calculate decision distributions
-        def calculate_rates(results):
-            total = len(results)
-            if total == 0:
-                return 0.0, 0.0, 0.0
-            
-            accept_count = sum(1 for r in results if r.decision == UnderwritingDecision.ACCEPT)
-            deny_count = sum(1 for r in results if r.decision == UnderwritingDecision.DENY)
-            adjudicate_count = sum(1 for r in results if r.decision == UnderwritingDecision.ADJUDICATE)
-            
-            return (accept_count / total * 100, 
-                   deny_count / total * 100, 
-                   adjudicate_count / total * 100)
-        
-        accept_rate_a, deny_rate_a, adjudicate_rate_a = calculate_rates(results_a)
-        accept_rate_b, deny_rate_b, adjudicate_rate_b = calculate_rates(results_b)
-        
-        # Calculate performance metrics
-        avg_processing_time_a = sum(r.processing_time_ms for r in results_a) / len(results_a) if results_a else 0
-        avg_processing_time_b = sum(r.processing_time_ms for r in results_b) / len(results_b) if results_b else 0
-        
-        error_rate_a = sum(1 for r in results_a if r.error) / len(results_a) * 100 if results_a else 0
-        error_rate_b = sum(1 for r in results_b if r.error) / len(results_b) * 100 if results_b else 0
-        
-        # Calculate agreement metrics
-        agreements = 0
-        disagreement_details = []
-        
-        # Create lookup for results_b
-        results_b_lookup = {r.applicant_id: r for r in results_b}
-        
-        for result_a in results_a:
-            result_b = results_b_lookup.get(result_a.applicant_id)
-            if result_b:
-                if result_a.decision == result_b.decision:
-                    agreements += 1
-                else:
-                    disagreement_details.append({
-                        'applicant_id': result_a.applicant_id,
-                        f'{variant_a}_decision': result_a.decision.value,
-                        f'{variant_b}_decision': result_b.decision.value,
-                        f'{variant_a}_reason': result_a.reason,
-                        f'{variant_b}_reason': result_b.reason
-                    })
-        
-        agreement_rate = (agreements / total_tests * 100) if total_tests > 0 else 0
+        variant_a = self.resolve_variant(variant_a)
+        variant_b = self.resolve_variant(variant_b)
+        total_tests, agreements = self.results.agreement(self.run_id, variant_a, variant_b)
+        if not total_tests:
+            raise ValueError("No common applicants found between variants")
         
+        summary_a = self.results.variant_summary(self.run_id, variant_a, common_with=variant_b)
+        summary_b = self.results.variant_summary(self.run_id, variant_b, common_with=variant_a)
+        
+        disagreement_details = [
+            {
+                'applicant_id': applicant_id,
+                f'{variant_a}_decision': decision_a,
+                f'{variant_b}_decision': decision_b,
+                f'{variant_a}_reason': reason_a,
+                f'{variant_b}_reason': reason_b
+            }
+            for applicant_id, decision_a, decision_b, reason_a, reason_b
+            in self.results.disagreements(self.run_id, variant_a, variant_b)
+        ]
+        
+        return self._comparison_metrics(summary_a, summary_b, total_tests, agreements, disagreement_details)
+    
+    def live_comparison_metrics(self, variant_a: str, variant_b: str) -> ComparisonMetrics:
+        """Comparison metrics from the run's running totals, in constant time.
+        
+        Meant for progress displays while a run is in flight. Rates cover
+        every result of each variant so far, and agreement the applicants
+        both have evaluated; once every applicant has been evaluated by both
+        variants they equal ``calculate_comparison_metrics``. Disagreement
+        details are left empty; use ``calculate_comparison_metrics`` for them.
+        """
+        
+        variant_a = self.resolve_variant(variant_a)
+        variant_b = self.resolve_variant(variant_b)
+        total_tests, agreements = self.live.agreement(variant_a, variant_b)
+        return self._comparison_metrics(self.live.summary(variant_a), self.live.summary(variant_b),
+                                        total_tests, agreements, [])
+    
+    @staticmethod
+    def _comparison_metrics(summary_a: VariantSummary, summary_b: VariantSummary, total_tests: int,
+                            agreements: int, disagreement_details: List[Dict[str, Any]]) -> ComparisonMetrics:
         return ComparisonMetrics(
-            variant_a_id=variant_a,
-            variant_b_id=variant_b,
+            variant_a_id=summary_a.variant_id,
+            variant_b_id=summary_b.variant_id,
             total_tests=total_tests,
-            accept_rate_a=accept_rate_a,
-            deny_rate_a=deny_rate_a,
-            adjudicate_rate_a=adjudicate_rate_a,
-            accept_rate_b=accept_rate_b,
-            deny_rate_b=deny_rate_b,
-            adjudicate_rate_b=adjudicate_rate_b,
-            avg_processing_time_a=avg_processing_time_a,
-            avg_processing_time_b=avg_processing_time_b,
-            error_rate_a=error_rate_a,
-            error_rate_b=error_rate_b,
-            agreement_rate=agreement_rate,
-            disagreement_details=disagreement_details
+            accept_rate_a=summary_a.accept_rate,
+            deny_rate_a=summary_a.deny_rate,
+            adjudicate_rate_a=summary_a.adjudicate_rate,
+            accept_rate_b=summary_b.accept_rate,
+            deny_rate_b=summary_b.deny_rate,
+            adjudicate_rate_b=summary_b.adjudicate_rate,
+            avg_processing_time_a=summary_a.avg_processing_time_ms,
+            avg_processing_time_b=summary_b.avg_processing_time_ms,
+            error_rate_a=summary_a.error_rate,
+            error_rate_b=summary_b.error_rate,
+            agreement_rate=agreements / total_tests * 100 if total_tests else 0.0,
+            disagreement_details=disagreement_details,
+            avg_time_to_decision_a=summary_a.avg_time_to_decision_ms,
+            avg_time_to_decision_b=summary_b.avg_time_to_decision_ms,
+            avg_queue_time_a=summary_a.avg_queue_time_ms,
+            avg_queue_time_b=summary_b.avg_queue_time_ms
         )
     
+    def run_nway_comparison(self, applicants: List[Applicant], variants: Optional[Sequence[str]] = None,
+                            max_concurrency: int = DEFAULT_MAX_CONCURRENCY) -> NWayComparison:
+        """Evaluate every applicant under every variant exactly once and compare all pairs.
+        
+        Args:
+            applicants: Applicants to evaluate
+            variants: Variant IDs or aliases (default: every registered variant)
+            max_concurrency: Evaluations in flight at once, across all variants
+        """
+        
+        variant_ids = list(dict.fromkeys(self.resolve_variant(v) for v in (variants or self.engines)))
+        
+        print(f"\n{'='*80}")
+        print(f"N-WAY A/B TEST: {len(variant_ids)} VARIANTS")
+        print(f"{'='*80}")
+        print(f"Testing {len(applicants)} applicants x {len(variant_ids)} variants...")
+        
+        outstanding: Dict[int, int] = {}
+        completed = 0
+        for index, _ in self.stream_comparison(applicants, variant_ids, max_concurrency):
+            outstanding[index] = outstanding.get(index, len(variant_ids)) - 1
+            if not outstanding[index]:
+                del outstanding[index]
+                completed += 1
+                print(f"\rCompleted {completed}/{len(applicants)} applicants", end="", flush=True)
+        print()
+        
+        return self.calculate_nway_metrics(variant_ids)
+    
+    def calculate_nway_metrics(self, variants: Sequence[str]) -> NWayComparison:
+        """Derive every pairwise ComparisonMetrics and the agreement matrix from the current run."""
+        
+        variant_ids = list(dict.fromkeys(self.resolve_variant(v) for v in variants))
+        tallies = self.results.agreement_matrix(self.run_id, variant_ids)
+        
+        agreement_matrix = []
+        for variant_a in variant_ids:
+            row = []
+            for variant_b in variant_ids:
+                common, agreements = tallies.get((variant_a, variant_b), (0, 0))
+                row.append(100.0 if variant_a == variant_b else (agreements / common * 100 if common else 0.0))
+            agreement_matrix.append(row)
+        
+        pairwise = {
+            (variant_a, variant_b): self.calculate_comparison_metrics(variant_a, variant_b)
+            for variant_a, variant_b in combinations(variant_ids, 2)
+            if tallies.get((variant_a, variant_b), (0, 0))[0]
+        }
+        
+        total_applicants = max((common for common, _ in tallies.values()), default=0)
+        return NWayComparison(variant_ids, total_applicants, agreement_matrix, pairwise)
+    
+    def print_agreement_matrix(self, comparison: NWayComparison):
+        """Print the percentage of applicants on which each pair of variants agrees."""
+        
+        width = max(10, *(len(variant_id) for variant_id in comparison.variant_ids)) + 4
+        print(f"\n{'-'*50}")
+        print(f"AGREEMENT MATRIX ({comparison.total_applicants} applicants)")
+        print(f"{'-'*50}")
+        print(" " * width + "".join(f"{index + 1:>8}" for index in range(len(comparison.variant_ids))))
+        for index, (variant_id, row) in enumerate(zip(comparison.variant_ids, comparison.agreement_matrix)):
+            print(f"{index + 1:>2} {variant_id:<{width - 3}}" + "".join(f"{rate:>7.1f}%" for rate in row))
+    
     def print_comparison_report(self, metrics: ComparisonMetrics):
         """Print a detailed comparison report."""
         
@@ -311,6 +635,15 @@ class ABTestEngine:
         print(f"  Variant B: {metrics.avg_processing_time_b:.1f}ms")
         print(f"  Difference: {metrics.avg_processing_time_b - metrics.avg_processing_time_a:+.1f}ms")
         
+        print(f"\nAverage Time to Decision:")
+        print(f"  Variant A: {metrics.avg_time_to_decision_a:.1f}ms")
+        print(f"  Variant B: {metrics.avg_time_to_decision_b:.1f}ms")
+        
+        if metrics.avg_queue_time_a or metrics.avg_queue_time_b:
+            print(f"\nAverage Queue Time (not included above):")
+            print(f"  Variant A: {metrics.avg_queue_time_a:.1f}ms")
+            print(f"  Variant B: {metrics.avg_queue_time_b:.1f}ms")
+        
         print(f"\nError Rates:")
         print(f"  Variant A: {metrics.error_rate_a:.1f}%")
         print(f"  Variant B: {metrics.error_rate_b:.1f}%")
@@ -330,43 +663,45 @@ class ABTestEngine:
         
         print(f"\n{'='*80}")
     
-    def export_results(self, filename: str):
-        """Export test results to JSON file."""
-        
-        export_data = {
-            'test_configurations': {
-                variant_id: {
-                    'name': config.name,
-                    'description': config.description,
-                    'rules_file': config.rules_file,
-                    'parameters': config.parameters
-                }
-                for variant_id, config in self.test_configurations.items()
-            },
-            'test_results': [
-                {
-                    'applicant_id': result.applicant_id,
-                    'variant_id': result.variant_id,
-                    'decision': result.decision.value,
-                    'reason': result.reason,
-                    'triggered_rules': result.triggered_rules,
-                    'risk_factors': result.risk_factors,
-                    'processing_time_ms': result.processing_time_ms,
-                    'timestamp': result.timestamp.isoformat(),
-                    'error': result.error
-                }
-                for result in self.test_results
-            ],
-            'export_timestamp': datetime.now().isoformat()
+    def export_results(self, filename: str, all_runs: bool = False):
+        """Export test results to a JSON file, streaming them from the results store.
+        
+        Args:
+            filename: JSON file to write
+            all_runs: Export every stored run instead of only the current one
+        """
+        
+        test_configurations = {
+            variant_id: {
+                'name': config.name,
+                'description': config.description,
+                'rules_file': config.rules_file,
+                'parameters': config.parameters
+            }
+            for variant_id, config in self.test_configurations.items()
         }
         
         with open(filename, 'w') as f:
-            json.dump(export_data, f, indent=2)
+            f.write('{\n  "test_configurations": ')
+            f.write(json.dumps(test_configurations))
+            f.write(',\n  "test_results": [')
+            separator = '\n    '
+            for row in self.results.export_rows(None if all_runs else self.run_id):
+                f.write(separator)
+                f.write(row)
+                separator = ',\n    '
+            f.write('\n  ],\n  "export_timestamp": ')
+            f.write(json.dumps(datetime.now().isoformat()))
+            f.write('\n}\n')
         
         print(f"\nResults exported to: {filename}")
     
     def clear_results(self):
-        """Clear all test results."""
-        self.test_results.clear()
+        """Start a new run; later metrics and exports no longer include earlier results.
+        
+        Earlier runs stay in the results store and remain in its history.
+        """
+        self.results.flush()
+        self.run_id = new_run_id()
+        self.live = LiveMetrics()
         print("Test results cleared.")
-
@@ -0,0 +1,136 @@
+"""
+Streaming accumulators for live A/B test metrics.
+
+``LiveMetrics`` is updated with each TestResult as it arrives and keeps
+what ``ComparisonMetrics`` needs in running form: decision and error
+counts, latency moments (Welford's algorithm, so the mean and variance
+are numerically stable) and, for every pair of variants, how many
+applicants both have evaluated and how many of those they agree on.
+Each update costs time proportional to the number of variants, and
+reading the metrics for a pair costs constant time, however many
+results the run holds.
+"""
+
+import math
+from dataclasses import dataclass, field
+from typing import Dict, Tuple
+
+from underwriting.core.models import UnderwritingDecision
+
+from .results_store import VariantSummary
+
+
+@dataclass
+class RunningMoments:
+    """Count, mean and variance of a stream of values (Welford)."""
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    @property
+    def variance(self) -> float:
+        """Sample variance; zero until there are two values."""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+
+@dataclass
+class VariantAccumulator:
+    """Running totals for one variant's results.
+
+    Decision counts exclude failed evaluations, which are counted in
+    ``errors`` instead, matching the results store's aggregates.
+    """
+    variant_id: str
+    results: int = 0
+    errors: int = 0
+    decisions: Dict[UnderwritingDecision, int] = field(
+        default_factory=lambda: {decision: 0 for decision in UnderwritingDecision}
+    )
+    processing_time: RunningMoments = field(default_factory=RunningMoments)
+    time_to_decision: RunningMoments = field(default_factory=RunningMoments)
+    queue_time: RunningMoments = field(default_factory=RunningMoments)
+
+    def add(self, result) -> None:
+        self.results += 1
+        if result.error:
+            self.errors += 1
+        else:
+            self.decisions[result.decision] += 1
+        self.processing_time.add(result.processing_time_ms)
+        if result.time_to_decision_ms is not None:
+            self.time_to_decision.add(result.time_to_decision_ms)
+        if result.queue_time_ms is not None:
+            self.queue_time.add(result.queue_time_ms)
+
+    def summary(self) -> VariantSummary:
+        return VariantSummary(
+            variant_id=self.variant_id,
+            results=self.results,
+            errors=self.errors,
+            accept=self.decisions[UnderwritingDecision.ACCEPT],
+            deny=self.decisions[UnderwritingDecision.DENY],
+            adjudicate=self.decisions[UnderwritingDecision.ADJUDICATE],
+            avg_processing_time_ms=self.processing_time.mean,
+            avg_time_to_decision_ms=self.time_to_decision.mean,
+            avg_queue_time_ms=self.queue_time.mean
+        )
+
+
+class LiveMetrics:
+    """Per-variant accumulators and a paired agreement tally for one run.
+
+    Agreement follows the results store: each applicant's latest result
+    per variant counts, so re-evaluating an applicant replaces its earlier
+    decision in the tally rather than adding to it.
+    """
+
+    def __init__(self):
+        self.variants: Dict[str, VariantAccumulator] = {}
+        # Latest decision per applicant and variant
+        self._decisions: Dict[str, Dict[str, UnderwritingDecision]] = {}
+        # (variant, variant) -> [applicants both evaluated, applicants they agree on]
+        self._pairs: Dict[Tuple[str, str], list] = {}
+
+    def add(self, result) -> None:
+        """Fold one TestResult into the running metrics."""
+        variant_id = result.variant_id
+        if variant_id not in self.variants:
+            self.variants[variant_id] = VariantAccumulator(variant_id)
+        self.variants[variant_id].add(result)
+
+        decisions = self._decisions.setdefault(result.applicant_id, {})
+        previous = decisions.get(variant_id)
+        for other_id, other_decision in decisions.items():
+            if other_id == variant_id:
+                continue
+            tally = self._pairs.setdefault(tuple(sorted((variant_id, other_id))), [0, 0])
+            if previous is None:
+                tally[0] += 1
+            else:
+                tally[1] -= previous == other_decision
+            tally[1] += result.decision == other_decision
+        decisions[variant_id] = result.decision
+
+    def summary(self, variant_id: str) -> VariantSummary:
+        accumulator = self.variants.get(variant_id) or VariantAccumulator(variant_id)
+        return accumulator.summary()
+
+    def agreement(self, variant_a: str, variant_b: str) -> Tuple[int, int]:
+        """Return ``(common applicants, agreements)`` so far for two variants."""
+        common, agreements = self._pairs.get(tuple(sorted((variant_a, variant_b))), (0, 0))
+        return common, agreements
+
+    @property
+    def applicants(self) -> int:
+        """Applicants with at least one result."""
+        return len(self._decisions)
@@ -0,0 +1,402 @@
+"""
+Append-only storage for A/B test results.
+
+``ABTestEngine`` writes every evaluation to a results backend instead of
+keeping a Python list. ``SQLiteResultsBackend`` is the implementation: a
+table in a SQLite file in WAL mode, so the CLI, the web app and the
+Streamlit pages can read one history while a test is still writing to it.
+Inserts are buffered and written in batches. Comparison metrics, history
+and exports are computed with SQL aggregates and streamed cursors, so
+they cost the same however many results have accumulated.
+
+Results are grouped into runs (one per ``ABTestEngine`` session or
+``clear_results`` call). Each row also carries the engine configuration
+fingerprint of the variant that produced it, so results from the same
+rules, prompt and model settings can be found across runs.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from underwriting.core.models import UnderwritingDecision
+
+# Environment variable naming the SQLite file for the default results store
+RESULTS_DB_ENV_VAR = "UNDERWRITING_AB_RESULTS_DB"
+
+# Results buffered before they are written in one transaction
+DEFAULT_BATCH_SIZE = 256
+
+# Rows fetched per round trip when streaming results
+FETCH_SIZE = 1000
+
+_COLUMNS = ("run_id", "variant_id", "applicant_id", "config_fingerprint", "decision", "reason",
+            "triggered_rules", "risk_factors", "processing_time_ms", "time_to_decision_ms",
+            "timestamp", "error", "queue_time_ms")
+
+# Columns added after the table was first created, added to older files on open
+_ADDED_COLUMNS = (("queue_time_ms", "REAL"),)
+
+
+@dataclass
+class VariantSummary:
+    """Aggregate results of one variant, as computed by the results backend.
+
+    Decision counts exclude failed evaluations, which are counted in
+    ``errors`` instead; rates are percentages like ComparisonMetrics.
+    """
+    variant_id: str
+    results: int
+    errors: int
+    accept: int
+    deny: int
+    adjudicate: int
+    avg_processing_time_ms: float
+    avg_time_to_decision_ms: float
+    avg_queue_time_ms: float = 0.0
+    run_id: Optional[str] = None
+    config_fingerprint: Optional[str] = None
+    started_at: Optional[str] = None
+    applicants: Optional[int] = None
+
+    @property
+    def decided(self) -> int:
+        return self.accept + self.deny + self.adjudicate
+
+    def _rate(self, count: int) -> float:
+        return count / self.decided * 100 if self.decided else 0.0
+
+    @property
+    def accept_rate(self) -> float:
+        return self._rate(self.accept)
+
+    @property
+    def deny_rate(self) -> float:
+        return self._rate(self.deny)
+
+    @property
+    def adjudicate_rate(self) -> float:
+        return self._rate(self.adjudicate)
+
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.results * 100 if self.results else 0.0
+
+
+class ResultsBackend(ABC):
+    """Interface ABTestEngine uses to store and aggregate its results."""
+
+    @abstractmethod
+    def add(self, run_id: str, result) -> None:
+        """Append one TestResult to a run."""
+
+    @abstractmethod
+    def flush(self) -> None:
+        """Write any buffered results."""
+
+    @abstractmethod
+    def results(self, run_id: Optional[str] = None, variant_id: Optional[str] = None,
+                config_fingerprint: Optional[str] = None) -> Iterator:
+        """Stream stored TestResults in insertion order, optionally filtered."""
+
+    @abstractmethod
+    def variant_summary(self, run_id: str, variant_id: str,
+                        common_with: Optional[str] = None) -> VariantSummary:
+        """Aggregate a variant's results in a run, optionally only for applicants another variant also saw."""
+
+    @abstractmethod
+    def agreement(self, run_id: str, variant_a: str, variant_b: str) -> Tuple[int, int]:
+        """Return ``(common applicants, applicants with the same decision)`` for two variants."""
+
+    @abstractmethod
+    def disagreements(self, run_id: str, variant_a: str, variant_b: str,
+                      limit: Optional[int] = None) -> List[Tuple[str, str, str, str, str]]:
+        """Return ``(applicant_id, decision_a, decision_b, reason_a, reason_b)`` where two variants differ."""
+
+    @abstractmethod
+    def agreement_matrix(self, run_id: str, variant_ids: Sequence[str]) -> Dict[Tuple[str, str], Tuple[int, int]]:
+        """Return ``(common applicants, agreements)`` for every pair of variants, keyed both ways round."""
+
+    @abstractmethod
+    def export_rows(self, run_id: Optional[str] = None) -> Iterator[str]:
+        """Stream results as compact JSON objects, one string per result."""
+
+    @abstractmethod
+    def history(self, limit: Optional[int] = None) -> List[VariantSummary]:
+        """Per-run, per-variant summaries, most recent run first."""
+
+    def close(self) -> None:
+        """Flush and release the backend."""
+
+
+class SQLiteResultsBackend(ResultsBackend):
+    """Results in a SQLite table (WAL mode), written in batches."""
+
+    def __init__(self, path: Union[str, Path] = ":memory:", batch_size: int = DEFAULT_BATCH_SIZE):
+        """
+        Initialize the store, creating the table and indexes if needed.
+
+        Args:
+            path: SQLite file; ":memory:" keeps results for this process only
+            batch_size: Results buffered before they are written together
+        """
+        self.path = str(path)
+        self.batch_size = batch_size
+        self._pending: List[tuple] = []
+        self._lock = threading.Lock()
+
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS ab_test_results ("
+            " id INTEGER PRIMARY KEY,"
+            " run_id TEXT NOT NULL,"
+            " variant_id TEXT NOT NULL,"
+            " applicant_id TEXT NOT NULL,"
+            " config_fingerprint TEXT,"
+            " decision TEXT NOT NULL,"
+            " reason TEXT NOT NULL,"
+            " triggered_rules TEXT NOT NULL,"
+            " risk_factors TEXT NOT NULL,"
+            " processing_time_ms REAL NOT NULL,"
+            " time_to_decision_ms REAL,"
+            " timestamp TEXT NOT NULL,"
+            " error TEXT,"
+            " queue_time_ms REAL)"
+        )
+        existing = {row[1] for row in self._connection.execute("PRAGMA table_info(ab_test_results)")}
+        for column, column_type in _ADDED_COLUMNS:
+            if column not in existing:
+                self._connection.execute(f"ALTER TABLE ab_test_results ADD COLUMN {column} {column_type}")
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS idx_ab_test_results_variant_applicant"
+            " ON ab_test_results (variant_id, applicant_id)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS idx_ab_test_results_fingerprint"
+            " ON ab_test_results (config_fingerprint)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS idx_ab_test_results_run"
+            " ON ab_test_results (run_id, variant_id, applicant_id)"
+        )
+        self._connection.commit()
+
+    @classmethod
+    def from_env(cls) -> "SQLiteResultsBackend":
+        """Open the store named by UNDERWRITING_AB_RESULTS_DB, or an in-memory one if unset."""
+        return cls(os.getenv(RESULTS_DB_ENV_VAR) or ":memory:")
+
+    @property
+    def persistent(self) -> bool:
+        return self.path != ":memory:"
+
+    def add(self, run_id: str, result) -> None:
+        """Buffer one TestResult, writing the buffer once it reaches ``batch_size``."""
+        row = (
+            run_id, result.variant_id, result.applicant_id, result.config_fingerprint,
+            result.decision.value, result.reason,
+            json.dumps(result.triggered_rules), json.dumps(result.risk_factors),
+            result.processing_time_ms, result.time_to_decision_ms,
+            result.timestamp.isoformat(), result.error or None, result.queue_time_ms
+        )
+        with self._lock:
+            self._pending.append(row)
+            if len(self._pending) >= self.batch_size:
+                self._write_pending()
+
+    def _write_pending(self) -> None:
+        """Insert buffered rows in one transaction (lock must be held)."""
+        if self._pending:
+            with self._connection:
+                self._connection.executemany(
+                    f"INSERT INTO ab_test_results ({', '.join(_COLUMNS)})"
+                    f" VALUES ({', '.join('?' * len(_COLUMNS))})",
+                    self._pending
+                )
+            self._pending.clear()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._write_pending()
+
+    def _query(self, sql: str, parameters: tuple = ()) -> List[tuple]:
+        with self._lock:
+            self._write_pending()
+            return self._connection.execute(sql, parameters).fetchall()
+
+    def _stream(self, sql: str, parameters: tuple = ()) -> Iterator[tuple]:
+        """Yield rows in batches without holding the lock between them.
+
+        Every use of the shared connection, including the execute, happens
+        under the lock so concurrent writers cannot interleave with it.
+        """
+        with self._lock:
+            self._write_pending()
+            cursor = self._connection.cursor()
+            cursor.execute(sql, parameters)
+        try:
+            while True:
+                with self._lock:
+                    rows = cursor.fetchmany(FETCH_SIZE)
+                if not rows:
+                    return
+                yield from rows
+        finally:
+            cursor.close()
+
+    @staticmethod
+    def _filters(**conditions) -> Tuple[str, tuple]:
+        used = {column: value for column, value in conditions.items() if value is not None}
+        where = " AND ".join(f"{column} = ?" for column in used)
+        return (f" WHERE {where}" if where else ""), tuple(used.values())
+
+    def results(self, run_id: Optional[str] = None, variant_id: Optional[str] = None,
+                config_fingerprint: Optional[str] = None) -> Iterator:
+        from .ab_engine import TestResult
+
+        where, parameters = self._filters(run_id=run_id, variant_id=variant_id,
+                                          config_fingerprint=config_fingerprint)
+        sql = f"SELECT {', '.join(_COLUMNS[1:])} FROM ab_test_results{where} ORDER BY id"
+        for (variant, applicant_id, fingerprint, decision, reason, triggered_rules, risk_factors,
+             processing_time_ms, time_to_decision_ms, timestamp, error,
+             queue_time_ms) in self._stream(sql, parameters):
+            yield TestResult(
+                applicant_id=applicant_id,
+                variant_id=variant,
+                decision=UnderwritingDecision(decision),
+                reason=reason,
+                triggered_rules=json.loads(triggered_rules),
+                risk_factors=json.loads(risk_factors),
+                processing_time_ms=processing_time_ms,
+                timestamp=datetime.fromisoformat(timestamp),
+                error=error,
+                time_to_decision_ms=time_to_decision_ms,
+                config_fingerprint=fingerprint,
+                queue_time_ms=queue_time_ms
+            )
+
+    # Aggregates; decisions of failed evaluations are not counted as decisions
+    _SUMMARY_COLUMNS = (
+        "COUNT(*), COUNT(error),"
+        " SUM(error IS NULL AND decision = 'accept'),"
+        " SUM(error IS NULL AND decision = 'deny'),"
+        " SUM(error IS NULL AND decision = 'adjudicate'),"
+        " AVG(processing_time_ms), AVG(time_to_decision_ms), AVG(queue_time_ms)"
+    )
+
+    @staticmethod
+    def _summary(variant_id: str, row: tuple, **extra) -> VariantSummary:
+        results, errors, accept, deny, adjudicate, processing_time, time_to_decision, queue_time = row
+        return VariantSummary(
+            variant_id=variant_id,
+            results=results,
+            errors=errors,
+            accept=accept or 0,
+            deny=deny or 0,
+            adjudicate=adjudicate or 0,
+            avg_processing_time_ms=processing_time or 0.0,
+            avg_time_to_decision_ms=time_to_decision or 0.0,
+            avg_queue_time_ms=queue_time or 0.0,
+            **extra
+        )
+
+    def variant_summary(self, run_id: str, variant_id: str,
+                        common_with: Optional[str] = None) -> VariantSummary:
+        sql = f"SELECT {self._SUMMARY_COLUMNS} FROM ab_test_results WHERE run_id = ? AND variant_id = ?"
+        parameters: tuple = (run_id, variant_id)
+        if common_with is not None:
+            sql += (" AND applicant_id IN (SELECT applicant_id FROM ab_test_results"
+                    " WHERE run_id = ? AND variant_id = ?)")
+            parameters += (run_id, common_with)
+        return self._summary(variant_id, self._query(sql, parameters)[0], run_id=run_id)
+
+    # The latest result of each applicant for one variant of a run
+    _LATEST = ("SELECT applicant_id, decision, reason, id FROM ab_test_results WHERE id IN ("
+               " SELECT MAX(id) FROM ab_test_results WHERE run_id = ? AND variant_id = ?"
+               " GROUP BY applicant_id)")
+
+    def agreement(self, run_id: str, variant_a: str, variant_b: str) -> Tuple[int, int]:
+        (common, agreements), = self._query(
+            f"SELECT COUNT(*), COALESCE(SUM(a.decision = b.decision), 0)"
+            f" FROM ({self._LATEST}) a JOIN ({self._LATEST}) b USING (applicant_id)",
+            (run_id, variant_a, run_id, variant_b)
+        )
+        return common, agreements
+
+    def disagreements(self, run_id: str, variant_a: str, variant_b: str,
+                      limit: Optional[int] = None) -> List[Tuple[str, str, str, str, str]]:
+        return self._query(
+            f"SELECT applicant_id, a.decision, b.decision, a.reason, b.reason"
+            f" FROM ({self._LATEST}) a JOIN ({self._LATEST}) b USING (applicant_id)"
+            f" WHERE a.decision != b.decision ORDER BY a.id LIMIT ?",
+            (run_id, variant_a, run_id, variant_b, -1 if limit is None else limit)
+        )
+
+    def agreement_matrix(self, run_id: str, variant_ids: Sequence[str]) -> Dict[Tuple[str, str], Tuple[int, int]]:
+        # One self-join over every variant's latest result per applicant
+        placeholders = ", ".join("?" * len(variant_ids))
+        rows = self._query(
+            "WITH latest AS (SELECT variant_id, applicant_id, decision FROM ab_test_results WHERE id IN ("
+            f" SELECT MAX(id) FROM ab_test_results WHERE run_id = ? AND variant_id IN ({placeholders})"
+            " GROUP BY variant_id, applicant_id))"
+            " SELECT a.variant_id, b.variant_id, COUNT(*), SUM(a.decision = b.decision)"
+            " FROM latest a JOIN latest b ON a.applicant_id = b.applicant_id AND a.variant_id < b.variant_id"
+            " GROUP BY a.variant_id, b.variant_id",
+            (run_id, *variant_ids)
+        )
+        matrix = {}
+        for variant_a, variant_b, common, agreements in rows:
+            matrix[variant_a, variant_b] = matrix[variant_b, variant_a] = (common, agreements)
+        return matrix
+
+    def export_rows(self, run_id: Optional[str] = None) -> Iterator[str]:
+        where, parameters = self._filters(run_id=run_id)
+        sql = (
+            "SELECT json_object("
+            " 'applicant_id', applicant_id, 'variant_id', variant_id,"
+            " 'decision', decision, 'reason', reason,"
+            " 'triggered_rules', json(triggered_rules), 'risk_factors', json(risk_factors),"
+            " 'processing_time_ms', processing_time_ms, 'time_to_decision_ms', time_to_decision_ms,"
+            " 'queue_time_ms', queue_time_ms,"
+            " 'timestamp', timestamp, 'error', error,"
+            " 'run_id', run_id, 'config_fingerprint', config_fingerprint)"
+            f" FROM ab_test_results{where} ORDER BY id"
+        )
+        for (row,) in self._stream(sql, parameters):
+            yield row
+
+    def history(self, limit: Optional[int] = None) -> List[VariantSummary]:
+        rows = self._query(
+            f"SELECT run_id, variant_id, config_fingerprint, MIN(timestamp),"
+            f" COUNT(DISTINCT applicant_id), {self._SUMMARY_COLUMNS}"
+            f" FROM ab_test_results GROUP BY run_id, variant_id, config_fingerprint"
+            f" ORDER BY MAX(id) DESC LIMIT ?",
+            (-1 if limit is None else limit,)
+        )
+        history = []
+        for row in rows:
+            run_id, variant_id, fingerprint, started_at, applicants = row[:5]
+            history.append(self._summary(variant_id, row[5:], run_id=run_id, config_fingerprint=fingerprint,
+                                         started_at=started_at, applicants=applicants))
+        return history
+
+    def __len__(self) -> int:
+        (count,), = self._query("SELECT COUNT(*) FROM ab_test_results")
+        return count
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._write_pending()
+                self._connection.close()
+                self._connection = None
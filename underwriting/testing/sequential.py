@@ -0,0 +1,145 @@
+"""
+Sequential testing for paired A/B comparisons.
+
+Both variants evaluate the same applicants, so the comparison is paired:
+only applicants on which exactly one variant reaches the tested decision
+carry information about which variant reaches it more often (McNemar).
+Under the null hypothesis each such discordant pair is equally likely
+to favour either variant.
+
+``SequentialTest`` runs two one-sided Wald sequential probability ratio
+tests on the discordant pairs, one per direction, each at half the
+significance level. Rejection uses the bound ``2 / alpha`` on the
+likelihood ratio. That ratio is a non-negative martingale under the null,
+so by Ville's inequality the chance of ever crossing it is at most
+``alpha / 2`` per direction, however often the test is checked and
+whenever the run is stopped. A direction is dropped for futility once
+its ratio falls below Wald's lower bound. Dropping a direction can only
+lower the false-positive rate, so the test as a whole keeps its type I
+error within ``1 - confidence_level``.
+"""
+
+import math
+from enum import Enum
+
+from underwriting.core.models import UnderwritingDecision
+
+
+class SequentialOutcome(Enum):
+    """Where a sequential test stands after the pairs seen so far."""
+    CONTINUE = "continue"
+    SIGNIFICANT = "significant"
+    FUTILE = "futile"
+
+
+class SequentialTest:
+    """Two-sided SPRT on discordant pairs for one decision type.
+
+    Args:
+        confidence_level: One minus the type I error rate the test guarantees
+        power: Chance of stopping as significant when the true odds ratio is ``odds_ratio``
+        decision_type: Decision whose rate is compared ("accept", "deny" or "adjudicate")
+        odds_ratio: Smallest effect worth detecting, as the ratio of discordant pairs
+            favouring one variant to those favouring the other
+
+    Raises:
+        ValueError: A parameter is out of range
+    """
+
+    def __init__(self, confidence_level: float = 0.95, power: float = 0.8,
+                 decision_type: str = "accept", odds_ratio: float = 2.0):
+        if not 0 < confidence_level < 1:
+            raise ValueError("confidence_level must be between 0 and 1")
+        if not 0 < power < 1:
+            raise ValueError("power must be between 0 and 1")
+        if odds_ratio <= 1:
+            raise ValueError("odds_ratio must be greater than 1")
+
+        self.confidence_level = confidence_level
+        self.power = power
+        self.decision = UnderwritingDecision(decision_type)
+        self.odds_ratio = odds_ratio
+
+        alpha = (1 - confidence_level) / 2
+        self.upper_bound = math.log(1 / alpha)
+        self.lower_bound = math.log((1 - power) / (1 - alpha))
+
+        # Log likelihood-ratio steps for a discordant pair favouring the tested direction, and against it
+        favoured = odds_ratio / (1 + odds_ratio)
+        self._step_for = math.log(2 * favoured)
+        self._step_against = math.log(2 * (1 - favoured))
+
+        self.pairs = 0
+        self.skipped = 0
+        self.favour_a = 0
+        self.favour_b = 0
+        # Per direction (A higher, B higher): current and peak log likelihood ratio, still being tested
+        self._log_lr = [0.0, 0.0]
+        self._peak = [0.0, 0.0]
+        self._active = [True, True]
+        self.outcome = SequentialOutcome.CONTINUE
+
+    def add_pair(self, result_a, result_b) -> SequentialOutcome:
+        """Fold one applicant's pair of TestResults into the test and return the outcome so far.
+
+        Pairs with a failed evaluation on either side are skipped. Pairs
+        added after the test has stopped do not change its outcome.
+        """
+        if self.outcome is not SequentialOutcome.CONTINUE:
+            return self.outcome
+        if result_a.error or result_b.error:
+            self.skipped += 1
+            return self.outcome
+
+        self.pairs += 1
+        hit_a = result_a.decision == self.decision
+        hit_b = result_b.decision == self.decision
+        if hit_a == hit_b:
+            return self.outcome
+
+        if hit_a:
+            self.favour_a += 1
+        else:
+            self.favour_b += 1
+        for direction, favoured in enumerate((hit_a, hit_b)):
+            if not self._active[direction]:
+                continue
+            self._log_lr[direction] += self._step_for if favoured else self._step_against
+            self._peak[direction] = max(self._peak[direction], self._log_lr[direction])
+            if self._log_lr[direction] >= self.upper_bound:
+                self.outcome = SequentialOutcome.SIGNIFICANT
+                return self.outcome
+            if self._log_lr[direction] <= self.lower_bound:
+                self._active[direction] = False
+
+        if not any(self._active):
+            self.outcome = SequentialOutcome.FUTILE
+        return self.outcome
+
+    @property
+    def discordant(self) -> int:
+        return self.favour_a + self.favour_b
+
+    @property
+    def p_value(self) -> float:
+        """Always-valid two-sided p-value; at most ``1 - confidence_level`` exactly when significant."""
+        return min(1.0, 2 * math.exp(-max(self._peak)))
+
+    @property
+    def higher_variant(self) -> str:
+        """Which variant ("A" or "B") reached the decision more often in discordant pairs; empty on a tie."""
+        if self.favour_a == self.favour_b:
+            return ""
+        return "A" if self.favour_a > self.favour_b else "B"
+
+    def interpretation(self) -> str:
+        decision = self.decision.value
+        counts = (f"{self.discordant} of {self.pairs} pairs discordant "
+                  f"({self.favour_a} only A, {self.favour_b} only B {decision})")
+        if self.outcome is SequentialOutcome.SIGNIFICANT:
+            return (f"Variant {self.higher_variant} reaches {decision} more often "
+                    f"(p={self.p_value:.4f}, {counts}); stopped early")
+        if self.outcome is SequentialOutcome.FUTILE:
+            return (f"No {decision} rate difference of odds ratio {self.odds_ratio:g} or more "
+                    f"(p={self.p_value:.4f}, {counts}); stopped for futility")
+        return f"Inconclusive so far (p={self.p_value:.4f}, {counts})"
@@ -4,6 +4,7 @@ from dataclasses import dataclass
 #from scipy import stats
 #import numpy as np
 from .ab_engine import ComparisonMetrics, TestResult
+from .sequential import SequentialOutcome, SequentialTest
 
 @dataclass
 class StatisticalTest:
@@ -226,6 +227,27 @@ class StatisticalAnalyzer:
         
         return math.ceil(n)
     
+    def sequential_test(self, decision_type: str = "accept", power: float = 0.8,
+                        odds_ratio: float = 2.0) -> SequentialTest:
+        """Create a sequential test for streamed results at this analyzer's confidence level."""
+        return SequentialTest(self.confidence_level, power, decision_type, odds_ratio)
+    
+    def sequential_result(self, test: SequentialTest) -> StatisticalTest:
+        """Summarise a sequential test; unlike the fixed-horizon tests it stays valid after early stopping."""
+        
+        # Effect size: share of discordant pairs favouring variant A
+        effect_size = test.favour_a / test.discordant if test.discordant else None
+        
+        return StatisticalTest(
+            test_name=f"Sequential Probability Ratio Test ({test.decision.value})",
+            statistic=test.discordant,
+            p_value=test.p_value,
+            is_significant=test.outcome is SequentialOutcome.SIGNIFICANT,
+            confidence_level=test.confidence_level,
+            effect_size=effect_size,
+            interpretation=test.interpretation()
+        )
+    
     def _interpret_chi_square(self, p_value: float, cramers_v: float, is_significant: bool) -> str:
         """Interpret chi-square test results."""
         
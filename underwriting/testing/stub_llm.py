@@ -0,0 +1,536 @@
+"""
+Local OpenAI-compatible stub LLM server.
+
+Serves ``POST /v1/chat/completions`` (blocking and streaming) so that the
+engine, the A/B engine and the Flask API can be load tested without
+spending model quota. The stub reads the applicant section of the prompt
+back into an ``Applicant``, evaluates the compiled criteria of whichever
+bundled rules file the prompt lists, and replies in the format the prompt
+asks for (lines or JSON, one decision per applicant block for packed
+prompts). Latency distribution, server errors and 429
+responses are configurable.
+
+Point the engine at a running stub with::
+
+    UNDERWRITING_LLM_BASE_URL=http://127.0.0.1:8099/v1 OPENAI_API_KEY=stub
+
+``complete_batch_file`` stands in for a provider batch job, turning a
+request JSONL into a result JSONL offline.
+"""
+
+import json
+import math
+import random
+import re
+import threading
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterator, List, Optional, Tuple, Union
+
+from ..core.models import (
+    Applicant, Claim, ClaimType, Driver, LicenseStatus, UnderwritingDecision,
+    Vehicle, VehicleCategory, Violation, ViolationType
+)
+from ..core.features import years_before
+from ..core.rules_registry import PROJECT_ROOT, RULES_DIR, RulesSnapshot, get_rules_registry
+from ..ai.packing import APPLICANT_HEADER_PATTERN
+
+
+@dataclass
+class LatencyModel:
+    """Response latency distribution.
+
+    ``distribution`` is ``fixed``, ``uniform`` (median +/- spread ms) or
+    ``lognormal`` (median with shape ``spread``).
+    """
+    distribution: str = "lognormal"
+    median_ms: float = 400.0
+    spread: float = 0.5
+    chunk_delay_ms: float = 5.0
+
+    def sample(self, rng: random.Random) -> float:
+        """Draw a latency in seconds."""
+        if self.distribution == "fixed":
+            ms = self.median_ms
+        elif self.distribution == "uniform":
+            ms = rng.uniform(self.median_ms - self.spread, self.median_ms + self.spread)
+        elif self.distribution == "lognormal":
+            ms = rng.lognormvariate(math.log(self.median_ms), self.spread) if self.median_ms > 0 else 0.0
+        else:
+            raise ValueError(f"Unknown latency distribution: {self.distribution}")
+        return max(ms, 0.0) / 1000
+
+
+@dataclass
+class ModelProfile:
+    """Behaviour of one requested model name, e.g. to imitate a small model.
+
+    ``latency_scale`` multiplies sampled latencies. ``adjudicate_rate`` is
+    the share of decisions answered ADJUDICATE instead, and
+    ``wrong_decision_rate`` the share answered with a different decision
+    while still citing the rules that actually fired.
+    """
+    latency_scale: float = 1.0
+    adjudicate_rate: float = 0.0
+    wrong_decision_rate: float = 0.0
+
+
+@dataclass
+class StubLLMConfig:
+    """Behaviour of the stub server."""
+    latency: LatencyModel = field(default_factory=LatencyModel)
+    models: Dict[str, ModelProfile] = field(default_factory=dict)
+    error_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    retry_after_seconds: float = 1.0
+    decision: str = "rules"
+    notes_words: int = 60
+    chunk_chars: int = 12
+    seed: Optional[int] = None
+
+
+@dataclass
+class StubStats:
+    """Request counters for a stub server."""
+    requests: int = 0
+    completions: int = 0
+    streamed: int = 0
+    server_errors: int = 0
+    rate_limited: int = 0
+
+
+def _enum_member(enum_cls, text: str):
+    """Parse ``Enum.NAME`` or a bare value into an enum member."""
+    token = text.strip().split(".")[-1]
+    try:
+        return enum_cls[token]
+    except KeyError:
+        return enum_cls(token)
+
+
+def _section(prompt: str, heading: str) -> List[str]:
+    """Return the ``- `` lines that follow a heading in the applicant data."""
+    match = re.search(rf"^{heading}:\s*$", prompt, re.MULTILINE)
+    if not match:
+        return []
+    lines = []
+    for line in prompt[match.end():].lstrip("\n").split("\n"):
+        if not line.startswith("- "):
+            break
+        lines.append(line[2:])
+    return lines
+
+
+def _field(prompt: str, label: str) -> Optional[str]:
+    match = re.search(rf"^-?\s*{label}:\s*(.+)$", prompt, re.MULTILINE)
+    return match.group(1).strip() if match else None
+
+
+def applicant_from_prompt(prompt: str, as_of: Optional[date] = None) -> Applicant:
+    """Rebuild an Applicant from the applicant section of a rendered prompt.
+
+    Dates are reconstructed from ages and "N years ago" offsets, which is
+    precise enough for rule evaluation.
+    """
+    as_of = as_of or date.today()
+
+    def years_back(years: int) -> date:
+        # "N years ago" means at least N full years before as_of
+        return years_before(as_of, years) - timedelta(days=1)
+
+    age = int(_field(prompt, "Age") or 40)
+    years_licensed_text = _field(prompt, "Years Licensed") or ""
+    years_licensed = int(years_licensed_text) if years_licensed_text.isdigit() else max(age - 16, 0)
+
+    violations = []
+    for line in _section(prompt, "VIOLATIONS"):
+        match = re.match(r"(\S+) \((\d+) years ago\)", line)
+        if match:
+            violations.append(Violation(
+                violation_type=_enum_member(ViolationType, match.group(1)),
+                violation_date=years_back(int(match.group(2)))
+            ))
+
+    claims = []
+    for line in _section(prompt, "CLAIMS HISTORY"):
+        match = re.match(r"(\S+): \$([\d,.]+) \((\d+) years ago\)", line)
+        if match:
+            claims.append(Claim(
+                claim_type=_enum_member(ClaimType, match.group(1)),
+                claim_amount=float(match.group(2).replace(",", "")),
+                claim_date=years_back(int(match.group(3)))
+            ))
+
+    vehicles = []
+    for line in _section(prompt, "VEHICLES"):
+        match = re.match(r"(\d{4}) (\S+) (.+) \((\S+)\)$", line)
+        if match:
+            category = _enum_member(VehicleCategory, match.group(4))
+            vehicles.append(Vehicle(vin="", year=int(match.group(1)), make=match.group(2),
+                                    model=match.group(3), category=category, vehicle_type=category))
+
+    name = (_field(prompt, "Name") or "Stub Applicant").split(" ", 1)
+    driver = Driver(
+        driver_id="STUB",
+        first_name=name[0],
+        last_name=name[-1],
+        date_of_birth=years_back(age),
+        license_number="",
+        license_state=_field(prompt, "License State") or "",
+        license_status=_enum_member(LicenseStatus, _field(prompt, "License Status") or "VALID"),
+        license_issue_date=years_back(years_licensed),
+        license_expiration_date=as_of + timedelta(days=365),
+        violations=violations,
+        claims=claims,
+        years_licensed=years_licensed
+    )
+
+    credit = _field(prompt, "CREDIT SCORE")
+    lapse = re.match(r"(\d+)", _field(prompt, "COVERAGE LAPSE") or "0")
+    return Applicant(
+        applicant_id="STUB",
+        primary_driver=driver,
+        vehicles=vehicles,
+        credit_score=int(credit) if credit and credit.isdigit() else None,
+        prior_insurance_lapse_days=int(lapse.group(1)) if lapse else 0,
+        territory=_field(prompt, "TERRITORY") or ""
+    )
+
+
+class StubDecider:
+    """Produces completions by evaluating the rules listed in a prompt."""
+
+    def __init__(self, config: StubLLMConfig):
+        self.config = config
+        self._rng = random.Random(config.seed)
+        registry = get_rules_registry()
+        self._candidates: List[Tuple[RulesSnapshot, FrozenSet[str]]] = []
+        for path in sorted((PROJECT_ROOT / RULES_DIR).glob("*.json")):
+            snapshot = registry.get(str(path))
+            self._candidates.append((snapshot, frozenset(snapshot.rules_text.splitlines())))
+
+    def snapshot_for(self, prompt: str) -> RulesSnapshot:
+        """Pick the bundled rules file whose rule lines best match the prompt."""
+        lines = set(prompt.splitlines())
+        return max(self._candidates, key=lambda candidate: len(candidate[1] & lines))[0]
+
+    def decide(self, prompt: str, applicant_text: Optional[str] = None, model: Optional[str] = None) -> Dict:
+        """Return the decision fields for a prompt, or for one applicant block of it."""
+        if self.config.decision != "rules":
+            return {"decision": self.config.decision.upper(), "reason": "Stub decision",
+                    "triggered_rules": [], "risk_factors": []}
+
+        try:
+            applicant = applicant_from_prompt(applicant_text or prompt)
+            evaluation = self.snapshot_for(prompt).compiled.evaluate(applicant)
+        except Exception as e:
+            return {"decision": "ADJUDICATE", "reason": f"Stub could not read applicant: {e}",
+                    "triggered_rules": [], "risk_factors": []}
+
+        decision = self._degrade(evaluation.decision or UnderwritingDecision.ADJUDICATE, model)
+        triggered = evaluation.triggered_rules
+        return {
+            "decision": decision.value.upper(),
+            "reason": evaluation.reasons[triggered[0]] if triggered else "No rule criteria met",
+            "triggered_rules": triggered,
+            "risk_factors": [evaluation.reasons[rule_id] for rule_id in triggered
+                             if rule_id not in evaluation.acceptance_criteria]
+        }
+
+    def _degrade(self, decision: UnderwritingDecision, model: Optional[str]) -> UnderwritingDecision:
+        """Apply the requested model's profile to a correct decision."""
+        profile = self.config.models.get(model) if model else None
+        if profile is None:
+            return decision
+        roll = self._rng.random()
+        if roll < profile.adjudicate_rate:
+            return UnderwritingDecision.ADJUDICATE
+        if roll < profile.adjudicate_rate + profile.wrong_decision_rate:
+            return self._rng.choice([d for d in UnderwritingDecision if d != decision])
+        return decision
+
+    def respond(self, prompt: str, model: Optional[str] = None) -> str:
+        """Render a completion in the response format the prompt requests."""
+        headers = list(APPLICANT_HEADER_PATTERN.finditer(prompt))
+        if headers:
+            return self.respond_packed(prompt, headers, model)
+
+        fields = self.decide(prompt, model=model)
+        if '"decision":' in prompt:
+            return json.dumps(fields, separators=(",", ":"))
+
+        notes = " ".join(["Stub"] * self.config.notes_words)
+        return (f"Decision: {fields['decision']}\n"
+                f"Primary Reason: {fields['reason']}\n"
+                f"Triggered Rules: {', '.join(fields['triggered_rules']) or 'None'}\n"
+                f"Risk Factors: {', '.join(fields['risk_factors']) or 'None'}\n"
+                f"Additional Notes: {notes}")
+
+    def respond_packed(self, prompt: str, headers: List[re.Match], model: Optional[str] = None) -> str:
+        """Render one decision per applicant block of a packed prompt."""
+        decisions = []
+        for header, following in zip(headers, headers[1:] + [None]):
+            applicant_text = prompt[header.end():following.start() if following else len(prompt)]
+            decisions.append({"applicant_id": header.group(1), **self.decide(prompt, applicant_text, model)})
+
+        if '"decision":' in prompt:
+            return json.dumps(decisions, separators=(",", ":"))
+        return "\n\n".join(
+            f"Applicant ID: {fields['applicant_id']}\n"
+            f"Decision: {fields['decision']}\n"
+            f"Primary Reason: {fields['reason']}\n"
+            f"Triggered Rules: {', '.join(fields['triggered_rules']) or 'None'}\n"
+            f"Risk Factors: {', '.join(fields['risk_factors']) or 'None'}"
+            for fields in decisions
+        )
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "_StubHTTPServer"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status: int, payload: Dict, headers: Optional[Dict[str, str]] = None) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            # The client gave up, e.g. a cancelled hedged request
+            self.close_connection = True
+
+    def do_GET(self):
+        if self.path.rstrip("/").endswith("/models"):
+            self._send_json(200, {"object": "list", "data": [{"id": "stub", "object": "model"}]})
+        else:
+            self._send_json(404, {"error": {"message": "Not found", "type": "invalid_request_error"}})
+
+    def do_POST(self):
+        stub = self.server.stub
+        length = int(self.headers.get("Content-Length", 0))
+        request = json.loads(self.rfile.read(length) or b"{}")
+
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self._send_json(404, {"error": {"message": "Not found", "type": "invalid_request_error"}})
+            return
+
+        outcome = stub.draw_outcome()
+        if outcome == "rate_limited":
+            self._send_json(429, {"error": {"message": "Rate limit reached (stub)", "type": "rate_limit_error"}},
+                            {"Retry-After": str(stub.config.retry_after_seconds)})
+            return
+        if outcome == "server_error":
+            self._send_json(500, {"error": {"message": "Internal server error (stub)", "type": "server_error"}})
+            return
+
+        prompt = "\n".join(str(message.get("content", "")) for message in request.get("messages", []))
+        model = request.get("model", "stub")
+        text = stub.decider.respond(prompt, model)
+        time.sleep(stub.sample_latency(model))
+
+        if request.get("stream"):
+            stub.count("streamed")
+            self._stream(text, model)
+        else:
+            self._send_json(200, stub.completion(text, model, prompt))
+
+    def _stream(self, text: str, model: str) -> None:
+        stub = self.server.stub
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        try:
+            for chunk in stub.stream_chunks(text, model):
+                self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode("utf-8"))
+                self.wfile.flush()
+                time.sleep(stub.config.latency.chunk_delay_ms / 1000)
+            self.wfile.write(b"data: [DONE]\n\n")
+            self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            # The client closed the stream early
+            pass
+        self.close_connection = True
+
+
+class _StubHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    stub: "StubLLMServer"
+
+
+class StubLLMServer:
+    """OpenAI-compatible chat completions server backed by the rules."""
+
+    def __init__(self, config: Optional[StubLLMConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        """
+        Initialize the server; port 0 picks a free port.
+
+        Args:
+            config: Latency, error and decision behaviour
+            host: Interface to bind
+            port: Port to bind
+        """
+        self.config = config or StubLLMConfig()
+        self.decider = StubDecider(self.config)
+        self.stats = StubStats()
+        self._rng = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._httpd = _StubHTTPServer((host, port), _Handler)
+        self._httpd.stub = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        """Base URL to use as the engine's ``base_url`` setting."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self.stats, counter, getattr(self.stats, counter) + 1)
+
+    def draw_outcome(self) -> str:
+        """Decide whether a request succeeds, is rate limited or fails."""
+        with self._lock:
+            self.stats.requests += 1
+            roll = self._rng.random()
+            if roll < self.config.rate_limit_rate:
+                self.stats.rate_limited += 1
+                return "rate_limited"
+            if roll < self.config.rate_limit_rate + self.config.error_rate:
+                self.stats.server_errors += 1
+                return "server_error"
+            self.stats.completions += 1
+            return "ok"
+
+    def sample_latency(self, model: Optional[str] = None) -> float:
+        profile = self.config.models.get(model) if model else None
+        with self._lock:
+            latency = self.config.latency.sample(self._rng)
+        return latency * profile.latency_scale if profile else latency
+
+    @staticmethod
+    def completion(text: str, model: str, prompt: str) -> Dict:
+        """Build a chat.completion response body."""
+        prompt_tokens = len(prompt) // 4
+        completion_tokens = len(text) // 4
+        return {
+            "id": f"chatcmpl-stub-{uuid.uuid4().hex[:12]}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": text},
+                "finish_reason": "stop"
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens
+            }
+        }
+
+    def stream_chunks(self, text: str, model: str) -> Iterator[Dict]:
+        """Yield chat.completion.chunk bodies for a streamed response."""
+        completion_id = f"chatcmpl-stub-{uuid.uuid4().hex[:12]}"
+        created = int(time.time())
+
+        def chunk(delta: Dict, finish_reason: Optional[str] = None) -> Dict:
+            return {"id": completion_id, "object": "chat.completion.chunk", "created": created,
+                    "model": model, "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}]}
+
+        yield chunk({"role": "assistant", "content": ""})
+        size = max(self.config.chunk_chars, 1)
+        for start in range(0, len(text), size):
+            yield chunk({"content": text[start:start + size]})
+        yield chunk({}, "stop")
+
+    def start(self) -> "StubLLMServer":
+        """Serve requests on a background thread."""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve requests on the calling thread."""
+        self._httpd.serve_forever()
+
+    def stop(self) -> None:
+        """Stop serving and release the port."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def stats_dict(self) -> Dict[str, int]:
+        with self._lock:
+            return asdict(self.stats)
+
+    def __enter__(self) -> "StubLLMServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+def complete_batch_file(requests_path: Union[str, Path], results_path: Union[str, Path],
+                        config: Optional[StubLLMConfig] = None) -> StubStats:
+    """Answer a batch request JSONL the way a provider batch job would.
+
+    Each request line gets a result line with the same ``custom_id``; the
+    configured error and rate-limit rates produce failed result lines.
+    Latency settings are ignored.
+    """
+    config = config or StubLLMConfig()
+    decider = StubDecider(config)
+    rng = random.Random(config.seed)
+    stats = StubStats()
+
+    with open(requests_path, encoding="utf-8") as requests_file, \
+            open(results_path, "w", encoding="utf-8") as results_file:
+        for line in requests_file:
+            if not line.strip():
+                continue
+            request = json.loads(line)
+            body = request.get("body", {})
+            stats.requests += 1
+
+            roll = rng.random()
+            if roll < config.rate_limit_rate + config.error_rate:
+                if roll < config.rate_limit_rate:
+                    stats.rate_limited += 1
+                    status, error_type = 429, "rate_limit_error"
+                else:
+                    stats.server_errors += 1
+                    status, error_type = 500, "server_error"
+                response = {"status_code": status, "request_id": uuid.uuid4().hex,
+                            "body": {"error": {"message": f"Stub batch request failed ({status})",
+                                               "type": error_type}}}
+            else:
+                stats.completions += 1
+                prompt = "\n".join(str(m.get("content", "")) for m in body.get("messages", []))
+                model = body.get("model", "stub")
+                completion = StubLLMServer.completion(decider.respond(prompt, model), model, prompt)
+                response = {"status_code": 200, "request_id": uuid.uuid4().hex, "body": completion}
+
+            results_file.write(json.dumps({
+                "id": f"batch_req_stub_{uuid.uuid4().hex[:12]}",
+                "custom_id": request.get("custom_id"),
+                "response": response,
+                "error": None
+            }) + "\n")
+    return stats
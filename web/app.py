@@ -30,6 +30,13 @@ def create_app(config=None):
     if config:
         app.config.update(config)
     
+    # Warm engines shared by all requests and threads of this app
+    from underwriting.core.pool import EnginePool
+    app.extensions['engine_pool'] = EnginePool(
+        max_connections=app.config.get('LLM_MAX_CONNECTIONS', 32),
+        streaming=app.config.get('LLM_STREAMING', False)
+    )
+    
     # Register blueprints
     from .routes import main_bp, api_bp
     app.register_blueprint(main_bp)
@@ -5,16 +5,20 @@ Flask routes for the underwriting web interface.
 import json
 import os
 from datetime import datetime
+from pydantic import ValidationError
 from flask import (
     Blueprint, render_template, request, jsonify, 
     flash, redirect, url_for, current_app
 )
 
-from underwriting.core.engine import UnderwritingEngine
+from underwriting.ai.prompts import PromptVariant
+from underwriting.core.exceptions import RuleValidationError
+from underwriting.core.features import ApplicantFeatures
 from underwriting.core.models import (
     Applicant, Driver, Vehicle, Violation, Claim,
     LicenseStatus, ViolationType, ClaimType, VehicleCategory
 )
+from underwriting.core.rules_registry import resolve_rules_path
 from underwriting.data.sample_generator import create_sample_applicants
 from underwriting.testing.ab_engine import ABTestEngine
 from underwriting.testing.statistical_analysis import StatisticalAnalyzer
@@ -42,8 +46,8 @@ def evaluate():
             # Create applicant from form data
             applicant = create_applicant_from_form(form)
             
-            # Initialize engine with selected rules
-            engine = UnderwritingEngine(rules_file=form.rules_file.data)
+            # Get the warm engine for the selected rules
+            engine = get_engine(form.rules_file.data)
             
             # Evaluate applicant
             result = engine.evaluate_applicant(applicant)
@@ -81,17 +85,15 @@ def quick_test():
             else:
                 applicants = sample_applicants  # All applicants
             
-            # Initialize engine
-            engine = UnderwritingEngine(rules_file=form.rules_file.data)
+            # Get the warm engine for the selected rules
+            engine = get_engine(form.rules_file.data)
             
-            # Evaluate all applicants
-            results = []
-            for applicant in applicants:
-                result = engine.evaluate_applicant(applicant)
-                results.append({
-                    'applicant': applicant,
-                    'result': result
-                })
+            # Evaluate all applicants concurrently
+            evaluations = engine.evaluate_batch(applicants)
+            results = [
+                {'applicant': applicant, 'result': result}
+                for applicant, result in zip(applicants, evaluations)
+            ]
             
             return render_template('quick_test_results.html', 
                                  results=results,
@@ -202,11 +204,30 @@ def api_evaluate():
                 return jsonify({'error': f'Missing required field: {field}'}), 400
         
         # Create applicant from JSON data
-        applicant = create_applicant_from_json(data)
+        try:
+            applicant = create_applicant_from_json(data)
+        except ValidationError as e:
+            return jsonify({'error': 'Invalid applicant', 'details': e.errors(include_url=False)}), 400
+        
+        # Unknown prompt variants and rules files are client errors
+        prompt_variant = data.get('prompt_variant')
+        variants = [variant.value for variant in PromptVariant]
+        if prompt_variant and prompt_variant not in variants:
+            return jsonify({'error': f'Unknown prompt_variant: {prompt_variant}',
+                            'allowed': variants}), 400
         
-        # Initialize engine
-        rules_file = data.get('rules_file', 'config/rules/underwriting_rules.json')
-        engine = UnderwritingEngine(rules_file=rules_file)
+        # Only bundled rules files may be named, which also bounds the engine pool
+        rules_file = data.get('rules_file', 'underwriting_rules.json')
+        try:
+            rules_path = resolve_rules_path(str(rules_file), allow_paths=False)
+        except (FileNotFoundError, ValueError) as e:
+            return jsonify({'error': str(e)}), 400
+        
+        # Get the warm engine for the requested rules and prompt
+        try:
+            engine = get_engine(str(rules_path), prompt_variant)
+        except (ValueError, RuleValidationError) as e:
+            return jsonify({'error': f'Invalid rules file: {e}'}), 400
         
         # Evaluate applicant
         result = engine.evaluate_applicant(applicant)
@@ -235,21 +256,23 @@ def api_sample_applicants():
         # Convert to JSON-serializable format
         applicants_data = []
         for applicant in applicants:
+            features = ApplicantFeatures(applicant)
             applicants_data.append({
                 'applicant_id': applicant.applicant_id,
                 'driver': {
                     'first_name': applicant.primary_driver.first_name,
                     'last_name': applicant.primary_driver.last_name,
-                    'age': applicant.primary_driver.age,
+                    'age': features.age,
                     'license_status': applicant.primary_driver.license_status.value,
-                    'years_licensed': applicant.primary_driver.years_licensed
+                    'years_licensed': features.years_licensed
                 },
                 'credit_score': applicant.credit_score,
                 'prior_insurance_lapse_days': applicant.prior_insurance_lapse_days,
                 'territory': applicant.territory,
                 'violations_count': len(applicant.primary_driver.violations),
                 'claims_count': len(applicant.primary_driver.claims),
-                'vehicles_count': len(applicant.vehicles)
+                'vehicles_count': len(applicant.vehicles),
+                'features': features.summary()
             })
         
         return jsonify({'applicants': applicants_data})
@@ -260,6 +283,11 @@ def api_sample_applicants():
 
 
 # Helper functions
+def get_engine(rules_file, prompt_variant=None):
+    """Get a pooled engine for the given rules file and prompt variant."""
+    return current_app.extensions['engine_pool'].get(rules_file, prompt_variant)
+
+
 def create_applicant_from_form(form):
     """Create an Applicant object from form data."""
     
@@ -301,10 +329,15 @@ def create_applicant_from_form(form):
 
 
 def create_applicant_from_json(data):
-    """Create an Applicant object from JSON data."""
-    # Implementation would parse JSON and create Applicant object
-    # This is a simplified version
-    pass
+    """Create an Applicant object from JSON data.
+
+    Accepts the Applicant schema, with the primary driver under either
+    ``primary_driver`` or ``driver``; request options are ignored.
+    """
+    record = dict(data)
+    if 'primary_driver' not in record:
+        record['primary_driver'] = record.pop('driver', None)
+    return Applicant.model_validate(record)
 
 
 def run_rule_comparison(ab_engine, applicants, variant_a, variant_b, confidence_level, monthly_apps):